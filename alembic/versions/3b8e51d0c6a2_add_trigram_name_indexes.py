@@ -0,0 +1,52 @@
+"""add trigram name indexes
+
+Revision ID: 3b8e51d0c6a2
+Revises: e7ca4990c359
+Create Date: 2026-10-16 19:20:11.402318
+
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "3b8e51d0c6a2"
+down_revision: Union[str, None] = "e7ca4990c359"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.execute("CREATE EXTENSION IF NOT EXISTS pg_trgm")
+    op.create_index(
+        "ix_virtual_lab_name_trgm",
+        "virtual_lab",
+        ["name"],
+        unique=False,
+        postgresql_using="gin",
+        postgresql_ops={"name": "gin_trgm_ops"},
+    )
+    op.create_index(
+        "ix_project_name_trgm",
+        "project",
+        ["name"],
+        unique=False,
+        postgresql_using="gin",
+        postgresql_ops={"name": "gin_trgm_ops"},
+    )
+
+
+def downgrade() -> None:
+    op.drop_index(
+        "ix_project_name_trgm",
+        table_name="project",
+        postgresql_using="gin",
+        postgresql_ops={"name": "gin_trgm_ops"},
+    )
+    op.drop_index(
+        "ix_virtual_lab_name_trgm",
+        table_name="virtual_lab",
+        postgresql_using="gin",
+        postgresql_ops={"name": "gin_trgm_ops"},
+    )
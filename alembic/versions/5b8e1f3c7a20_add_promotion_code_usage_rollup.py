@@ -0,0 +1,71 @@
+"""add promotion code usage rollup
+
+Revision ID: 5b8e1f3c7a20
+Revises: c41e7b9a2d58
+Create Date: 2026-10-16 21:12:44.118203
+
+"""
+
+from typing import Sequence, Union
+
+import sqlalchemy as sa
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "5b8e1f3c7a20"
+down_revision: Union[str, None] = "c41e7b9a2d58"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_table(
+        "promotion_code_usage_rollup",
+        sa.Column("promotion_code_id", sa.UUID(), nullable=False),
+        sa.Column("total_redemptions", sa.Integer(), nullable=False),
+        sa.Column("completed", sa.Integer(), nullable=False),
+        sa.Column("pending", sa.Integer(), nullable=False),
+        sa.Column("failed", sa.Integer(), nullable=False),
+        sa.Column("total_credits_distributed", sa.BigInteger(), nullable=False),
+        sa.Column("unique_users", sa.Integer(), nullable=False),
+        sa.Column("unique_virtual_labs", sa.Integer(), nullable=False),
+        sa.Column("updated_at", sa.DateTime(timezone=True), nullable=False),
+        sa.ForeignKeyConstraint(
+            ["promotion_code_id"],
+            ["promotion_code.id"],
+            ondelete="CASCADE",
+        ),
+        sa.PrimaryKeyConstraint("promotion_code_id"),
+    )
+    op.execute(
+        """
+        INSERT INTO promotion_code_usage_rollup (
+            promotion_code_id,
+            total_redemptions,
+            completed,
+            pending,
+            failed,
+            total_credits_distributed,
+            unique_users,
+            unique_virtual_labs,
+            updated_at
+        )
+        SELECT
+            promotion_code_id,
+            count(*),
+            count(*) FILTER (WHERE status = 'COMPLETED'),
+            count(*) FILTER (WHERE status = 'PENDING'),
+            count(*) FILTER (WHERE status = 'FAILED'),
+            coalesce(sum(credits_granted) FILTER (WHERE status = 'COMPLETED'), 0),
+            count(DISTINCT user_id),
+            count(DISTINCT virtual_lab_id),
+            now()
+        FROM promotion_code_usage
+        GROUP BY promotion_code_id
+        """
+    )
+
+
+def downgrade() -> None:
+    op.drop_table("promotion_code_usage_rollup")
@@ -0,0 +1,39 @@
+"""add keyset pagination indexes
+
+Revision ID: 8d2f4a7c1e90
+Revises: 3b8e51d0c6a2
+Create Date: 2026-10-16 19:44:52.118203
+
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "8d2f4a7c1e90"
+down_revision: Union[str, None] = "3b8e51d0c6a2"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_index(
+        "ix_subscription_created_at_id",
+        "subscription",
+        ["created_at", "id"],
+        unique=False,
+    )
+    op.create_index(
+        "ix_subscription_payment_payment_date_id",
+        "subscription_payment",
+        ["payment_date", "id"],
+        unique=False,
+    )
+
+
+def downgrade() -> None:
+    op.drop_index(
+        "ix_subscription_payment_payment_date_id", table_name="subscription_payment"
+    )
+    op.drop_index("ix_subscription_created_at_id", table_name="subscription")
@@ -0,0 +1,63 @@
+"""add outbox message
+
+Revision ID: c41e7b9a2d58
+Revises: 8d2f4a7c1e90
+Create Date: 2026-10-16 20:31:07.402915
+
+"""
+
+from typing import Sequence, Union
+
+import sqlalchemy as sa
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "c41e7b9a2d58"
+down_revision: Union[str, None] = "8d2f4a7c1e90"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_table(
+        "outbox_message",
+        sa.Column("id", sa.BigInteger(), autoincrement=True, nullable=False),
+        sa.Column("effect", sa.String(length=64), nullable=False),
+        sa.Column("payload", sa.JSON(), nullable=False),
+        sa.Column("idempotency_key", sa.String(length=255), nullable=False),
+        sa.Column("ordering_key", sa.String(length=255), nullable=True),
+        sa.Column(
+            "status",
+            sa.Enum("PENDING", "DONE", "DEAD", name="outboxstatus"),
+            nullable=False,
+        ),
+        sa.Column("attempts", sa.Integer(), nullable=False),
+        sa.Column("available_at", sa.DateTime(timezone=True), nullable=False),
+        sa.Column("last_error", sa.Text(), nullable=True),
+        sa.Column("created_at", sa.DateTime(timezone=True), nullable=False),
+        sa.Column("processed_at", sa.DateTime(timezone=True), nullable=True),
+        sa.PrimaryKeyConstraint("id"),
+        sa.UniqueConstraint("idempotency_key"),
+    )
+    op.create_index(
+        "ix_outbox_message_pending",
+        "outbox_message",
+        ["available_at"],
+        unique=False,
+        postgresql_where=sa.text("status = 'PENDING'"),
+    )
+    op.create_index(
+        "ix_outbox_message_pending_ordering_key",
+        "outbox_message",
+        ["ordering_key", "id"],
+        unique=False,
+        postgresql_where=sa.text("status = 'PENDING'"),
+    )
+
+
+def downgrade() -> None:
+    op.drop_index("ix_outbox_message_pending_ordering_key", table_name="outbox_message")
+    op.drop_index("ix_outbox_message_pending", table_name="outbox_message")
+    op.drop_table("outbox_message")
+    sa.Enum(name="outboxstatus").drop(op.get_bind(), checkfirst=True)
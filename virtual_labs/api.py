@@ -1,6 +1,7 @@
-from contextlib import asynccontextmanager
+import asyncio
+from contextlib import asynccontextmanager, suppress
 from http import HTTPStatus
-from typing import Any, Generator, Optional
+from typing import Any, Generator
 
 from fastapi import FastAPI, Request
 from fastapi.encoders import jsonable_encoder
@@ -11,7 +12,6 @@ from fastapi.openapi.utils import get_openapi
 from fastapi.responses import JSONResponse
 from fastapi.routing import APIRouter
 from loguru import logger
-from redis.asyncio import Redis
 
 from virtual_labs.core.exceptions.api_error import (
     VliError,
@@ -19,10 +19,19 @@ from virtual_labs.core.exceptions.api_error import (
     VlmValidationError,
 )
 from virtual_labs.core.schemas import api
+from virtual_labs.external.accounting.client import (
+    close_accounting_client,
+    open_accounting_client,
+)
+from virtual_labs.infrastructure.cache import listen_for_invalidations
 from virtual_labs.infrastructure.db.config import session_pool
-from virtual_labs.infrastructure.redis import get_redis
+from virtual_labs.infrastructure.email.mailer import mailer
+from virtual_labs.infrastructure.email.queue import email_queue
+from virtual_labs.infrastructure.kc.blocking import install_blocking_call_detector
+from virtual_labs.infrastructure.redis import close_redis, open_redis
 from virtual_labs.infrastructure.sentry import init_sentry
 from virtual_labs.infrastructure.settings import settings
+from virtual_labs.infrastructure.stripe.outbox import outbox_drainer
 from virtual_labs.routes.accounting import router as accounting_router
 from virtual_labs.routes.admin import router as admin_router
 from virtual_labs.routes.admin.deps import PLATFORM_ADMIN_TAG_PREFIX
@@ -31,6 +40,7 @@ from virtual_labs.routes.bookmarks import router as bookmarks_router
 from virtual_labs.routes.common import router as common_router
 from virtual_labs.routes.config import router as config_router
 from virtual_labs.routes.course import router as course_router
+from virtual_labs.routes.emails import router as emails_router
 from virtual_labs.routes.institution import router as institution_router
 from virtual_labs.routes.invites import router as invite_router
 from virtual_labs.routes.labs import router as virtual_lab_router
@@ -43,23 +53,34 @@ from virtual_labs.routes.subscription import router as subscription_router
 from virtual_labs.routes.user import router as user_router
 from virtual_labs.scheduler import start_scheduler, stop_scheduler
 
-_redis_client: Optional[Redis] = None
-
 
 @asynccontextmanager  # type: ignore
 async def lifespan(app: FastAPI) -> Generator[None, Any, None]:  # type: ignore
-    global _redis_client
-    _redis_client = await get_redis()
+    await open_redis()
+    await open_accounting_client()
+    cache_invalidation_listener = asyncio.create_task(listen_for_invalidations())
+    webhook_outbox_drainer = asyncio.create_task(outbox_drainer.run())
+    email_queue_consumer = asyncio.create_task(email_queue.run())
     start_scheduler()
     yield
     stop_scheduler()
+    for background_task in (
+        email_queue_consumer,
+        webhook_outbox_drainer,
+        cache_invalidation_listener,
+    ):
+        background_task.cancel()
+        with suppress(asyncio.CancelledError):
+            await background_task
+    await close_accounting_client()
+    await mailer.close()
     if session_pool._engine is not None:
         await session_pool.close()
-    if _redis_client is not None:
-        await _redis_client.close()
+    await close_redis()
 
 
 init_sentry()
+install_blocking_call_detector()
 
 app = FastAPI(
     title=settings.APP_NAME,
@@ -197,5 +218,6 @@ base_router.include_router(config_router)
 base_router.include_router(institution_router)
 base_router.include_router(course_router)
 base_router.include_router(seat_router)
+base_router.include_router(emails_router)
 
 app.include_router(base_router)
@@ -44,7 +44,7 @@ def verify_service_admin(allowed_groups: List[str]) -> Callable[..., Any]:
                 _, token = auth
 
                 try:
-                    user_info = kc_auth.userinfo(token=token)
+                    user_info = await kc_auth.a_userinfo(token=token)
                 except KeycloakError as kc_error:
                     logger.error(
                         f"Keycloak error while fetching user info: CODE: {kc_error.response_code} "
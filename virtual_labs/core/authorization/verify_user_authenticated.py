@@ -22,7 +22,7 @@ def verify_user_authenticated(f: Callable[..., Any]) -> Callable[..., Any]:
 
             user_repo = UserQueryRepository()
             user_id = get_user_id_from_auth(auth)
-            user_repo.retrieve_user_from_kc(str(user_id))
+            await user_repo.a_retrieve_user_from_kc(str(user_id))
         except Exception as error:
             logger.exception(
                 f"Unknown error when checking for user_authentication: {error}"
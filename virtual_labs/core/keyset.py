@@ -0,0 +1,198 @@
+"""Keyset (cursor) pagination for the list endpoints.
+
+OFFSET pagination makes the database produce and discard every row in
+front of the requested page, so deep pages get linearly slower. A
+keyset page starts right after the last row of the previous one
+instead: every page carries an opaque `next_cursor` encoding that row's
+sort-key values, and passing it back as `cursor` adds
+`WHERE (sort keys) > (cursor values)` in the ordering's direction. With
+an index matching the ordering a page costs the same at any depth.
+
+Orderings must be total and over non-null expressions: the stable
+cascades of `core.ordering.order_clauses` plus the `id` tiebreaker the
+listings append qualify. Offset pages (`page`) keep working and also
+hand out a `next_cursor`, so clients can switch at any point. The total
+is optional (`CountMode`): an exact `count(*)`, the planner's row
+estimate, or skipped.
+"""
+
+import base64
+import binascii
+import hashlib
+import json
+from dataclasses import dataclass
+from datetime import datetime
+from http import HTTPStatus
+from typing import Any, Generic, Sequence, TypeVar
+from uuid import UUID
+
+from sqlalchemy import and_, func, literal, or_, select, tuple_
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.ext.compiler import compiles
+from sqlalchemy.orm import noload
+from sqlalchemy.sql import ColumnElement, Select, operators
+from sqlalchemy.sql.base import Executable
+from sqlalchemy.sql.elements import ClauseElement, UnaryExpression
+
+from virtual_labs.core.exceptions.api_error import VliError, VliErrorCode
+from virtual_labs.domain.common import CountMode
+
+R = TypeVar("R")
+
+# (sort expression, descending)
+_SortKey = tuple[ColumnElement[Any], bool]
+
+
+@dataclass(frozen=True, slots=True)
+class KeysetPage(Generic[R]):
+    items: list[R]
+    total: int | None
+    next_cursor: str | None
+
+
+class _Explain(Executable, ClauseElement):
+    inherit_cache = False
+
+    def __init__(self, statement: Select[Any]) -> None:
+        self.statement = statement
+
+
+@compiles(_Explain, "postgresql")
+def _compile_explain(element: _Explain, compiler: Any, **kw: Any) -> str:
+    return f"EXPLAIN (FORMAT JSON) {compiler.process(element.statement, **kw)}"
+
+
+def _sort_keys(order_by: Sequence[ColumnElement[Any]]) -> list[_SortKey]:
+    keys: list[_SortKey] = []
+    for clause in order_by:
+        if isinstance(clause, UnaryExpression) and clause.modifier in (
+            operators.asc_op,
+            operators.desc_op,
+        ):
+            keys.append((clause.element, clause.modifier is operators.desc_op))
+        else:
+            keys.append((clause, False))
+    return keys
+
+
+def _fingerprint(keys: list[_SortKey]) -> str:
+    # binds a cursor to the ordering it was issued for
+    signature = "|".join(f"{expression}:{desc}" for expression, desc in keys)
+    return hashlib.sha1(signature.encode()).hexdigest()[:12]
+
+
+def _dump(value: Any) -> Any:
+    if isinstance(value, datetime):
+        return ["dt", value.isoformat()]
+    if isinstance(value, UUID):
+        return ["uuid", str(value)]
+    return value
+
+
+def _load(value: Any) -> Any:
+    if isinstance(value, list):
+        tag, raw = value
+        return datetime.fromisoformat(raw) if tag == "dt" else UUID(raw)
+    return value
+
+
+def encode_cursor(keys: list[_SortKey], values: Sequence[Any]) -> str:
+    payload = json.dumps(
+        {"o": _fingerprint(keys), "v": [_dump(value) for value in values]},
+        separators=(",", ":"),
+    )
+    return base64.urlsafe_b64encode(payload.encode()).decode().rstrip("=")
+
+
+def decode_cursor(keys: list[_SortKey], cursor: str) -> list[Any]:
+    try:
+        padded = cursor + "=" * (-len(cursor) % 4)
+        payload = json.loads(base64.urlsafe_b64decode(padded))
+        values = [_load(value) for value in payload["v"]]
+        valid = payload["o"] == _fingerprint(keys) and len(values) == len(keys)
+    except (binascii.Error, ValueError, TypeError, KeyError):
+        valid = False
+    if not valid:
+        raise VliError(
+            error_code=VliErrorCode.INVALID_PARAMETER,
+            http_status_code=HTTPStatus.BAD_REQUEST,
+            message="Invalid pagination cursor",
+            details="Pass back the `next_cursor` of a page with the same ordering",
+        )
+    return values
+
+
+def after_cursor(keys: list[_SortKey], values: Sequence[Any]) -> ColumnElement[bool]:
+    """Rows sorting strictly after `values` under `keys`."""
+    bounds = [
+        literal(value, type_=expression.type)
+        for (expression, _), value in zip(keys, values)
+    ]
+    if len({desc for _, desc in keys}) == 1:
+        # one direction: a row comparison the matching index can range-scan
+        left = tuple_(*(expression for expression, _ in keys))
+        right = tuple_(*bounds)
+        return left < right if keys[0][1] else left > right
+
+    branches = []
+    for index, (expression, desc) in enumerate(keys):
+        ties = [keys[tie][0] == bounds[tie] for tie in range(index)]
+        beyond = expression < bounds[index] if desc else expression > bounds[index]
+        branches.append(and_(*ties, beyond))
+    return or_(*branches)
+
+
+async def count_rows(
+    session: AsyncSession, statement: Select[Any], mode: CountMode
+) -> int | None:
+    if mode is CountMode.NONE:
+        return None
+    if mode is CountMode.ESTIMATED:
+        plan = await session.scalar(_Explain(statement))
+        if isinstance(plan, str):
+            plan = json.loads(plan)
+        return int(plan[0]["Plan"]["Plan Rows"])
+    counted = select(func.count()).select_from(
+        statement.options(noload("*")).subquery()
+    )
+    return (await session.scalar(counted)) or 0
+
+
+async def paginate(
+    session: AsyncSession,
+    statement: Select[Any],
+    *,
+    order_by: Sequence[ColumnElement[Any]],
+    cursor: str | None,
+    offset: int,
+    limit: int,
+    count: CountMode,
+) -> KeysetPage[Any]:
+    """Run one page of the unordered `statement` in `order_by` order.
+
+    Continues after `cursor` when given, else skips `offset` rows.
+    Items are the statement's entity for single-entity selects and
+    tuples of its columns otherwise.
+    """
+    keys = _sort_keys(order_by)
+    width = len(statement.column_descriptions)
+
+    total = await count_rows(session, statement, count)
+
+    paged = statement.add_columns(
+        *(expression.label(f"_keyset_{i}") for i, (expression, _) in enumerate(keys))
+    ).order_by(*order_by)
+    if cursor is not None:
+        paged = paged.where(after_cursor(keys, decode_cursor(keys, cursor)))
+    else:
+        paged = paged.offset(offset)
+
+    rows = (await session.execute(paged.limit(limit + 1))).all()
+
+    next_cursor = None
+    if len(rows) > limit:
+        rows = rows[:limit]
+        next_cursor = encode_cursor(keys, rows[-1][width:])
+
+    items = [row[0] if width == 1 else tuple(row[:width]) for row in rows]
+    return KeysetPage(items=items, total=total, next_cursor=next_cursor)
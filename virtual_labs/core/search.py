@@ -0,0 +1,37 @@
+"""Substring name search for the list and search endpoints.
+
+`virtual_lab.name` and `project.name` carry pg_trgm GIN indexes
+(`gin_trgm_ops`). Those serve `name ILIKE '%term%'` directly, which
+neither the btree index on `name` nor a `lower(name) LIKE ...` filter
+can. Every name filter builds its clause here so it stays
+index-friendly; endpoints without a caller-chosen ordering rank their
+matches by trigram similarity to the term.
+"""
+
+from typing import Any
+
+from sqlalchemy import func
+from sqlalchemy.sql import ColumnElement
+
+_LIKE_ESCAPE = "\\"
+
+
+def _escape_like(term: str) -> str:
+    return (
+        term.replace(_LIKE_ESCAPE, _LIKE_ESCAPE * 2)
+        .replace("%", f"{_LIKE_ESCAPE}%")
+        .replace("_", f"{_LIKE_ESCAPE}_")
+    )
+
+
+def name_contains(column: Any, term: str) -> ColumnElement[bool]:
+    """Case-insensitive substring match of `term` (taken literally)."""
+    clause: ColumnElement[bool] = column.ilike(
+        f"%{_escape_like(term.strip())}%", escape=_LIKE_ESCAPE
+    )
+    return clause
+
+
+def name_relevance(column: Any, term: str) -> ColumnElement[Any]:
+    """Ordering clause putting the closest matches of `term` first."""
+    return func.similarity(column, term.strip()).desc()
@@ -1,7 +1,8 @@
 """Request/response models for the platform-admin (`/admin`) namespace.
 
 List endpoints paginate with `PaginationRequest` query params and
-respond with `PaginatedResponse[T]`. Detail models extend the
+respond with `PaginatedResponse[T]`; the DB-backed ones also accept a
+keyset `cursor` and a `count` mode (`CursorPaginationRequest`). Detail models extend the
 user-facing domain models with the operator-only columns (ownership,
 soft-delete state) that member-scoped endpoints deliberately omit.
 """
@@ -13,7 +14,13 @@ from uuid import UUID
 
 from pydantic import UUID4, BaseModel, ConfigDict, Field
 
-from virtual_labs.domain.common import OrderBy, OrderDirection, PaginationRequest
+from virtual_labs.domain.common import (
+    CursorPaginationRequest,
+    CursorParams,
+    OrderBy,
+    OrderDirection,
+    PaginationRequest,
+)
 from virtual_labs.domain.labs import VirtualLabDetails
 from virtual_labs.domain.payment import PaymentFilter
 from virtual_labs.domain.project import Project
@@ -29,7 +36,7 @@ from virtual_labs.infrastructure.kc.models import UserRepresentation
 # ---------------------------------------------------------------------------
 
 
-class DeletedScopedQuery(PaginationRequest):
+class DeletedScopedQuery(CursorPaginationRequest):
     """Soft-delete visibility axis shared by lab/project listings.
 
     Default surfaces live rows only; `include_deleted` widens to both;
@@ -132,7 +139,7 @@ class AdminUserDetails(BaseModel):
 # ---------------------------------------------------------------------------
 
 
-class AdminSubscriptionsListQuery(PaginationRequest):
+class AdminSubscriptionsListQuery(CursorPaginationRequest):
     status: SubscriptionStatus | None = None
     subscription_type: str | None = Field(
         default=None, description="Subscription type: `free` or `paid`"
@@ -147,8 +154,9 @@ class AdminSubscriptionDetails(SubscriptionDetails):
     tier: str | None = None
 
 
-class AdminPaymentsListQuery(PaymentFilter):
-    """`PaymentFilter` plus a user filter, as one query model.
+class AdminPaymentsListQuery(PaymentFilter, CursorParams):
+    """`PaymentFilter` plus a user filter and keyset paging, as one
+    query model.
 
     A single model on purpose: FastAPI silently stops exploding a
     query-parameter model when a plain scalar query param sits next to
@@ -226,3 +234,41 @@ class AdminCreditRateUpdate(BaseModel):
     discount_pct: int | None = Field(default=None, ge=0, le=100)
     max_credits: int | None = Field(default=None, gt=0)
     active: bool | None = None
+
+
+# ---------------------------------------------------------------------------
+# Runtime
+# ---------------------------------------------------------------------------
+
+
+class AdminConnectionPoolStats(BaseModel):
+    max_connections: int
+    connections: int
+    idle_connections: int
+    active_connections: int
+    queued_requests: int
+
+
+class AdminRedisPoolStats(BaseModel):
+    max_connections: int
+    connections: int
+    idle_connections: int
+    active_connections: int
+    healthy: bool
+    last_ping_ms: float | None
+    failed_pings: int
+
+
+class AdminCacheStats(BaseModel):
+    hits: int
+    misses: int
+    size: int
+    hit_ratio: float
+
+
+class AdminRuntimeStats(BaseModel):
+    """Per-worker runtime figures; each API worker answers for itself."""
+
+    accounting_pool: AdminConnectionPoolStats
+    redis_pool: AdminRedisPoolStats
+    caches: dict[str, AdminCacheStats]
@@ -44,12 +44,35 @@ class PaginationRequest(BaseModel):
         return (self.page - 1) * self.page_size
 
 
+class CountMode(str, Enum):
+    """How a list endpoint computes its total: an exact `count(*)`, the
+    query planner's row estimate (cheap on large tables), or not at all."""
+
+    EXACT = "exact"
+    ESTIMATED = "estimated"
+    NONE = "none"
+
+
+class CursorParams(BaseModel):
+    """Keyset paging for the listings built on `core.keyset`: pass the
+    `next_cursor` of the previous page as `cursor` to continue right
+    after its last row (`page` is then ignored)."""
+
+    cursor: str | None = Field(default=None, min_length=1, max_length=2048)
+    count: CountMode = CountMode.EXACT
+
+
+class CursorPaginationRequest(PaginationRequest, CursorParams):
+    pass
+
+
 class PaginationResponse(BaseModel):
     model_config = ConfigDict(from_attributes=True)
 
     page: int
     page_size: int
-    total_items: int
+    total_items: int | None
+    next_cursor: str | None = None
 
 
 class ListResponse(BaseModel, Generic[M]):
@@ -85,9 +108,10 @@ class Pagination(BaseModel):
     page: int
     size: int
     page_size: int
-    total: int
+    total: int | None
     has_next: bool
     has_previous: bool
+    next_cursor: str | None = None
 
 
 class PaginatedResponse(BaseModel, Generic[T]):
@@ -116,6 +140,28 @@ class PaginatedResponse(BaseModel, Generic[T]):
             ),
         )
 
+    @classmethod
+    def build_keyset(
+        cls,
+        *,
+        items: list[T],
+        total: int | None,
+        next_cursor: str | None,
+        request: CursorPaginationRequest,
+    ) -> "PaginatedResponse[T]":
+        return cls(
+            data=items,
+            pagination=Pagination(
+                page=request.page,
+                size=request.page_size,
+                page_size=len(items),
+                total=total,
+                has_next=next_cursor is not None,
+                has_previous=request.cursor is not None or request.page > 1,
+                next_cursor=next_cursor,
+            ),
+        )
+
 
 class DbPagination(BaseModel, Generic[T]):
     total: int
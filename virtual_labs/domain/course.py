@@ -96,6 +96,7 @@ class SeatAssignmentResult(BaseModel):
     project_id: UUID4 | None = None
     credit_transferred_amount: float = 0
     email_sent: bool = True
+    email_job_id: UUID4 | None = None
     error: str | None = None
 
 
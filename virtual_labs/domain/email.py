@@ -1,3 +1,4 @@
+from datetime import datetime
 from enum import Enum
 from typing import Annotated
 from uuid import UUID
@@ -58,3 +59,22 @@ class VerificationCodeEmailResponseData(BaseModel):
 class VerificationCodeEmailResponse(BaseModel):
     message: str
     data: VerificationCodeEmailResponseData
+
+
+class EmailJobStatus(str, Enum):
+    QUEUED = "queued"
+    SENDING = "sending"
+    RETRYING = "retrying"
+    SENT = "sent"
+    DEAD = "dead"
+
+
+class EmailJobOut(BaseModel):
+    id: UUID
+    kind: str
+    recipient: str
+    status: EmailJobStatus
+    attempts: int
+    last_error: str | None
+    created_at: datetime
+    updated_at: datetime
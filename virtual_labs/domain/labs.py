@@ -164,6 +164,7 @@ class AllPlans(BaseModel):
 
 class InvitationResponse(BaseModel):
     id: UUID4
+    email_job_id: UUID4 | None = None
 
 
 class ProjectVirtualLabMapping(BaseModel):
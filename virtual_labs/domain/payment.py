@@ -80,13 +80,14 @@ class PaymentListResponse(BaseModel):
     Response model for payment listing
     """
 
-    total_count: int
-    total_pages: int
+    total_count: Optional[int]
+    total_pages: Optional[int]
     current_page: int
     page_size: int
     has_next: bool
     has_previous: bool
     payments: List[PaymentDetails]
+    next_cursor: Optional[str] = None
 
     @classmethod
     def build(
@@ -109,6 +110,32 @@ class PaymentListResponse(BaseModel):
             payments=payments,
         )
 
+    @classmethod
+    def build_keyset(
+        cls,
+        payments: List[PaymentDetails],
+        *,
+        total: Optional[int],
+        next_cursor: Optional[str],
+        cursor: Optional[str],
+        page: int,
+        page_size: int,
+    ) -> "PaymentListResponse":
+        """Envelope for a keyset page: `has_next` comes from the cursor
+        and the totals are omitted when they were not counted."""
+        return cls(
+            total_count=total,
+            total_pages=(
+                (total + page_size - 1) // page_size if total is not None else None
+            ),
+            current_page=page,
+            page_size=page_size,
+            has_next=next_cursor is not None,
+            has_previous=cursor is not None or page > 1,
+            payments=payments,
+            next_cursor=next_cursor,
+        )
+
 
 class CreateStandalonePaymentRequest(BaseModel):
     """
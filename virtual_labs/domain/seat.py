@@ -122,6 +122,21 @@ class SeatBatchOut(BaseModel):
     seats: list[SeatOut]
 
 
+class SeatBatchSummaryOut(BaseModel):
+    """A batch of seats with its seat counts, without the seats."""
+
+    batch_id: UUID4
+    course_id: UUID4
+    virtual_lab_id: UUID4
+    virtual_lab_name: str
+    institution_id: UUID4
+    institution_name: str
+    created_at: datetime
+    expiry_date: datetime
+    number_of_seats: int
+    consumed_seats: int
+
+
 class SeatBatchSearchResponse(BaseModel):
     """Response for searching seat batches."""
 
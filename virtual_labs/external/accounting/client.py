@@ -0,0 +1,85 @@
+"""Application-lifetime HTTP client for the accounting service.
+
+Every accounting call shares one `httpx.AsyncClient`, so requests reuse
+pooled keep-alive (and, when enabled, multiplexed HTTP/2) connections
+instead of paying TCP+TLS setup each time. The client is opened and
+closed by the API lifespan; code running outside of it (scripts, the
+scheduler in a one-off process) gets a lazily created client instead.
+"""
+
+from dataclasses import dataclass
+
+import httpx
+
+from virtual_labs.infrastructure.settings import settings
+
+_client: httpx.AsyncClient | None = None
+_transport: httpx.AsyncHTTPTransport | None = None
+
+
+@dataclass(frozen=True, slots=True)
+class AccountingPoolStats:
+    max_connections: int
+    connections: int
+    idle_connections: int
+    active_connections: int
+    queued_requests: int
+
+
+def _build_client() -> tuple[httpx.AsyncClient, httpx.AsyncHTTPTransport]:
+    transport = httpx.AsyncHTTPTransport(
+        retries=3,
+        verify=False,
+        http2=settings.ACCOUNTING_HTTP2,
+        limits=httpx.Limits(
+            max_connections=settings.ACCOUNTING_MAX_CONNECTIONS,
+            max_keepalive_connections=settings.ACCOUNTING_MAX_KEEPALIVE_CONNECTIONS,
+            keepalive_expiry=settings.ACCOUNTING_KEEPALIVE_EXPIRY_SECONDS,
+        ),
+    )
+    client = httpx.AsyncClient(
+        transport=transport,
+        timeout=httpx.Timeout(
+            settings.ACCOUNTING_READ_TIMEOUT_SECONDS,
+            connect=settings.ACCOUNTING_CONNECT_TIMEOUT_SECONDS,
+            pool=settings.ACCOUNTING_POOL_TIMEOUT_SECONDS,
+        ),
+    )
+    return client, transport
+
+
+def get_accounting_client() -> httpx.AsyncClient:
+    global _client, _transport
+    if _client is None or _client.is_closed:
+        _client, _transport = _build_client()
+    return _client
+
+
+async def open_accounting_client() -> None:
+    get_accounting_client()
+
+
+async def close_accounting_client() -> None:
+    global _client, _transport
+    if _client is not None:
+        await _client.aclose()
+    _client = None
+    _transport = None
+
+
+def accounting_pool_stats() -> AccountingPoolStats:
+    # httpx and httpcore keep the pool and its request queue private; read
+    # them defensively so an upgrade that moves them only zeroes the stats
+    pool = getattr(_transport, "_pool", None)
+    connections = list(getattr(pool, "connections", ()))
+    requests = list(getattr(pool, "_requests", ()))
+    idle = sum(1 for connection in connections if connection.is_idle())
+    return AccountingPoolStats(
+        max_connections=settings.ACCOUNTING_MAX_CONNECTIONS,
+        connections=len(connections),
+        idle_connections=idle,
+        active_connections=len(connections) - idle,
+        queued_requests=sum(
+            1 for request in requests if getattr(request, "is_queued", bool)()
+        ),
+    )
@@ -1,9 +1,9 @@
-import httpx
 from pydantic import UUID4
 
+from virtual_labs.external.accounting.client import get_accounting_client
 from virtual_labs.external.accounting.interfaces.report_interface import ReportInterface
 from virtual_labs.external.accounting.models import VirtualLabReportsResponse
-from virtual_labs.infrastructure.kc.auth import get_client_token
+from virtual_labs.infrastructure.kc.client_token import a_get_client_token
 
 
 async def get_virtual_lab_reports(
@@ -11,13 +11,10 @@ async def get_virtual_lab_reports(
     page: int,
     page_size: int,
 ) -> VirtualLabReportsResponse:
-    transport = httpx.AsyncHTTPTransport(retries=3)
-
-    async with httpx.AsyncClient(transport=transport, verify=False) as httpx_client:
-        client_token = get_client_token()
-        report_interface = ReportInterface(httpx_client, client_token)
-        return await report_interface.get_virtual_lab_reports(
-            virtual_lab_id=virtual_lab_id,
-            page=page,
-            page_size=page_size,
-        )
+    client_token = await a_get_client_token()
+    report_interface = ReportInterface(get_accounting_client(), client_token)
+    return await report_interface.get_virtual_lab_reports(
+        virtual_lab_id=virtual_lab_id,
+        page=page,
+        page_size=page_size,
+    )
@@ -0,0 +1,14 @@
+from virtual_labs.infrastructure.cache.memory import CacheStats, TTLCache
+from virtual_labs.infrastructure.cache.tiered import (
+    TieredCache,
+    listen_for_invalidations,
+    tiered_cache_stats,
+)
+
+__all__ = [
+    "CacheStats",
+    "TTLCache",
+    "TieredCache",
+    "listen_for_invalidations",
+    "tiered_cache_stats",
+]
@@ -0,0 +1,98 @@
+"""Bounded in-process LRU cache with per-entry expiry.
+
+Meant for small, hot, per-worker lookups (token introspection results,
+userinfo payloads, ...) where a Redis round-trip would cost as much as
+the call being cached. Entries are evicted least-recently-used once
+`maxsize` is reached, and lazily on read once their deadline passes.
+
+The cache is not thread-safe: it is only ever touched from the event
+loop, which serializes access between `await` points.
+"""
+
+from collections import OrderedDict
+from dataclasses import dataclass
+from time import monotonic
+from typing import Callable, Generic, Hashable, TypeVar
+
+K = TypeVar("K", bound=Hashable)
+V = TypeVar("V")
+
+
+@dataclass(frozen=True, slots=True)
+class CacheStats:
+    hits: int
+    misses: int
+    size: int
+
+    @property
+    def hit_ratio(self) -> float:
+        total = self.hits + self.misses
+        return self.hits / total if total else 0.0
+
+
+class TTLCache(Generic[K, V]):
+    __slots__ = ("_entries", "_maxsize", "_ttl", "_hits", "_misses")
+
+    def __init__(self, *, maxsize: int, ttl: float) -> None:
+        if maxsize <= 0:
+            raise ValueError("maxsize must be positive")
+        self._entries: OrderedDict[K, tuple[float, V]] = OrderedDict()
+        self._maxsize = maxsize
+        self._ttl = ttl
+        self._hits = 0
+        self._misses = 0
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def get(self, key: K) -> V | None:
+        entry = self._entries.get(key)
+        if entry is None:
+            self._misses += 1
+            return None
+
+        expires_at, value = entry
+        if expires_at <= monotonic():
+            del self._entries[key]
+            self._misses += 1
+            return None
+
+        self._entries.move_to_end(key)
+        self._hits += 1
+        return value
+
+    def set(self, key: K, value: V, ttl: float | None = None) -> None:
+        """Store `value` for `ttl` seconds (the cache default when omitted).
+
+        A non-positive `ttl` is a no-op, so callers can pass a deadline
+        derived from e.g. a token `exp` without special-casing the
+        already-expired case.
+        """
+        ttl = self._ttl if ttl is None else min(ttl, self._ttl)
+        if ttl <= 0:
+            return
+
+        self._entries[key] = (monotonic() + ttl, value)
+        self._entries.move_to_end(key)
+        while len(self._entries) > self._maxsize:
+            self._entries.popitem(last=False)
+
+    def pop(self, key: K) -> V | None:
+        entry = self._entries.pop(key, None)
+        return entry[1] if entry is not None else None
+
+    def discard_where(self, predicate: Callable[[K, V], bool]) -> int:
+        """Drop every entry matching `predicate`; returns how many were
+        dropped. Linear in the cache size, meant for rare invalidations."""
+        matching = [
+            key for key, (_, value) in self._entries.items() if predicate(key, value)
+        ]
+        for key in matching:
+            del self._entries[key]
+        return len(matching)
+
+    def clear(self) -> None:
+        self._entries.clear()
+
+    def stats(self) -> CacheStats:
+        return CacheStats(hits=self._hits, misses=self._misses, size=len(self))
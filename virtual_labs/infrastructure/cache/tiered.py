@@ -0,0 +1,216 @@
+"""Two-tier cache: an in-process `TTLCache` in front of Redis.
+
+Reads hit the local LRU first, then Redis (one pipelined GET + PTTL);
+a miss in both tiers returns `None` and the caller goes to the source
+of truth. Values must be JSON-serializable.
+
+Every entry belongs to a *tag* (typically a user id). `invalidate_tag`
+drops the tag's entries from Redis and publishes the tag on
+`INVALIDATION_CHANNEL`; each worker runs `listen_for_invalidations`
+(started from the API lifespan) and evicts the tag from its own local
+tier, so an invalidation reaches every process within one pub/sub hop.
+
+Redis is an accelerator here, never a dependency: every Redis error is
+logged and treated as a miss, and the caller falls through to the
+source of truth.
+"""
+
+import asyncio
+import json
+from typing import Any
+
+from loguru import logger
+from redis.asyncio import Redis
+
+from virtual_labs.infrastructure.cache.memory import CacheStats, TTLCache
+from virtual_labs.infrastructure.redis import get_redis
+
+INVALIDATION_CHANNEL = "cache:invalidate"
+
+_registry: dict[str, "TieredCache"] = {}
+
+
+class TieredCache:
+    __slots__ = ("_namespace", "_ttl", "_local", "_hits", "_misses")
+
+    def __init__(self, namespace: str, *, maxsize: int, ttl: float) -> None:
+        if namespace in _registry:
+            raise ValueError(f"Cache namespace {namespace!r} is already registered")
+        self._namespace = namespace
+        self._ttl = ttl
+        self._local: TTLCache[str, tuple[str, Any]] = TTLCache(maxsize=maxsize, ttl=ttl)
+        self._hits = 0
+        self._misses = 0
+        _registry[namespace] = self
+
+    def _redis_key(self, tag: str, key: str) -> str:
+        return f"cache:{self._namespace}:{tag}:{key}"
+
+    def _tag_index_key(self, tag: str) -> str:
+        return f"cache:{self._namespace}:tag:{tag}"
+
+    async def get(self, tag: str, key: str) -> Any | None:
+        local = self._local.get(key)
+        if local is not None and local[0] == tag:
+            self._hits += 1
+            return local[1]
+
+        try:
+            redis = await get_redis()
+            async with redis.pipeline(transaction=False) as pipe:
+                pipe.get(self._redis_key(tag, key))
+                pipe.pttl(self._redis_key(tag, key))
+                raw, pttl = await pipe.execute()
+        except Exception as error:
+            logger.warning(f"Cache {self._namespace}: redis read failed ({error})")
+            self._misses += 1
+            return None
+
+        if raw is None:
+            self._misses += 1
+            return None
+
+        self._hits += 1
+        value = json.loads(raw)
+        if pttl and pttl > 0:
+            self._local.set(key, (tag, value), ttl=pttl / 1000)
+        return value
+
+    async def get_many(self, entries: list[tuple[str, str]]) -> list[Any | None]:
+        """`get` for many `(tag, key)` pairs; local misses are read from
+        Redis in a single pipeline. Results follow the order of `entries`."""
+        values: list[Any | None] = [None] * len(entries)
+        remote: list[int] = []
+        for index, (tag, key) in enumerate(entries):
+            local = self._local.get(key)
+            if local is not None and local[0] == tag:
+                self._hits += 1
+                values[index] = local[1]
+            else:
+                remote.append(index)
+        if not remote:
+            return values
+
+        try:
+            redis = await get_redis()
+            async with redis.pipeline(transaction=False) as pipe:
+                for index in remote:
+                    tag, key = entries[index]
+                    pipe.get(self._redis_key(tag, key))
+                    pipe.pttl(self._redis_key(tag, key))
+                replies = await pipe.execute()
+        except Exception as error:
+            logger.warning(f"Cache {self._namespace}: redis read failed ({error})")
+            self._misses += len(remote)
+            return values
+
+        for position, index in enumerate(remote):
+            raw, pttl = replies[2 * position], replies[2 * position + 1]
+            if raw is None:
+                self._misses += 1
+                continue
+            self._hits += 1
+            tag, key = entries[index]
+            values[index] = json.loads(raw)
+            if pttl and pttl > 0:
+                self._local.set(key, (tag, values[index]), ttl=pttl / 1000)
+        return values
+
+    async def set(self, tag: str, key: str, value: Any, *, ttl: float) -> None:
+        """Store `value` in both tiers for at most `ttl` seconds (capped by
+        the cache default)."""
+        ttl = min(ttl, self._ttl)
+        self._local.set(key, (tag, value), ttl=ttl)
+        if ttl < 1:
+            return
+
+        expire = int(ttl)
+        try:
+            redis = await get_redis()
+            index = self._tag_index_key(tag)
+            async with redis.pipeline(transaction=False) as pipe:
+                pipe.set(self._redis_key(tag, key), json.dumps(value), ex=expire)
+                pipe.sadd(index, key)
+                # entries are capped at the cache default ttl, so an index
+                # kept alive that long always outlives its members
+                pipe.expire(index, int(self._ttl))
+                await pipe.execute()
+        except Exception as error:
+            logger.warning(f"Cache {self._namespace}: redis write failed ({error})")
+
+    async def invalidate_tag(self, tag: str) -> None:
+        """Drop every entry of `tag` in Redis and in every worker."""
+        self.evict_local_tag(tag)
+        try:
+            redis = await get_redis()
+            index = self._tag_index_key(tag)
+            keys = await redis.smembers(index)
+            async with redis.pipeline(transaction=False) as pipe:
+                for key in keys:
+                    pipe.delete(self._redis_key(tag, key))
+                pipe.delete(index)
+                pipe.publish(
+                    INVALIDATION_CHANNEL,
+                    json.dumps({"namespace": self._namespace, "tag": tag}),
+                )
+                await pipe.execute()
+        except Exception as error:
+            logger.error(
+                f"Cache {self._namespace}: invalidation of {tag} failed ({error})"
+            )
+
+    def evict_local_tag(self, tag: str) -> int:
+        return self._local.discard_where(lambda _key, entry: entry[0] == tag)
+
+    def clear_local(self) -> None:
+        self._local.clear()
+
+    def stats(self) -> CacheStats:
+        """Hits in either tier against misses in both; `size` is the
+        local tier only."""
+        return CacheStats(hits=self._hits, misses=self._misses, size=len(self._local))
+
+
+def tiered_cache_stats() -> dict[str, CacheStats]:
+    """Stats of every `TieredCache` of this worker, by namespace."""
+    return {namespace: cache.stats() for namespace, cache in _registry.items()}
+
+
+def _dispatch_invalidation(payload: str) -> None:
+    try:
+        message = json.loads(payload)
+        cache = _registry.get(message["namespace"])
+        if cache is not None:
+            cache.evict_local_tag(message["tag"])
+    except (ValueError, KeyError, TypeError):
+        logger.warning(f"Ignoring malformed cache invalidation {payload!r}")
+
+
+async def listen_for_invalidations(retry_seconds: float = 5.0) -> None:
+    """Evict local entries on invalidations published by any worker.
+
+    Runs until cancelled. On connection loss every local tier is
+    flushed (invalidations may have been missed meanwhile) before
+    resubscribing.
+    """
+    while True:
+        try:
+            redis: Redis = await get_redis()
+            async with redis.pubsub() as pubsub:
+                await pubsub.subscribe(INVALIDATION_CHANNEL)
+                while True:
+                    # bounded waits: a blocking read (`listen`) falls back to
+                    # the pool's socket timeout and fails on a quiet channel
+                    message = await pubsub.get_message(
+                        ignore_subscribe_messages=True, timeout=1.0
+                    )
+                    if message is not None and message.get("type") == "message":
+                        _dispatch_invalidation(message["data"])
+        except asyncio.CancelledError:
+            raise
+        except Exception as error:
+            logger.warning(f"Cache invalidation listener disconnected ({error})")
+
+        for cache in _registry.values():
+            cache.clear_local()
+        await asyncio.sleep(retry_seconds)
@@ -0,0 +1,46 @@
+"""Relationship loading profiles.
+
+The relationships between `VirtualLab`, `Course` and `Institution` load
+lazily, so a bare `select(VirtualLab)` or `select(Course)` reads its own
+table only. That is all the authorization gates and the existence or
+id lookups need. Queries whose rows are rendered together with their
+related rows apply the profile of their use case explicitly, with
+`.options(*PROFILE)`:
+
+- `LAB_LIST`: lab pages and searches serialised as `VirtualLabDetails`.
+  The courses of the whole page come from one extra `IN` query, so the
+  paged query stays on `virtual_lab` and its indexes.
+- `LAB_DETAIL`: a single lab with its course, in the same query.
+- `COURSE_ADMIN`: a course with its lab and institution, for the course
+  pages and the seat and enrolment flows.
+- `ENROLMENT_COURSE`: an enrolment with its course, lab and institution.
+
+Apply profiles to a `select`, not to `session.get`. A select also fills
+in the relationships of rows already in the session, for example a lab
+an authorization gate loaded earlier in the request. `session.get`
+returns such a row as it is. Reading a relationship that was not loaded
+needs IO, and an async session cannot do that implicitly, so the read
+fails loudly instead of running a hidden query per row.
+"""
+
+from sqlalchemy.orm import joinedload, selectinload
+from sqlalchemy.orm.interfaces import ORMOption
+
+from virtual_labs.infrastructure.db.models import Course, CourseEnrolment, VirtualLab
+
+LoadProfile = tuple[ORMOption, ...]
+
+LAB_LIST: LoadProfile = (selectinload(VirtualLab.course),)
+
+LAB_DETAIL: LoadProfile = (joinedload(VirtualLab.course),)
+
+COURSE_ADMIN: LoadProfile = (
+    joinedload(Course.virtual_lab),
+    joinedload(Course.institution),
+)
+
+ENROLMENT_COURSE: LoadProfile = (
+    joinedload(CourseEnrolment.course).options(
+        joinedload(Course.virtual_lab), joinedload(Course.institution)
+    ),
+)
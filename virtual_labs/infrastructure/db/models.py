@@ -7,6 +7,7 @@ from uuid import uuid4
 
 from sqlalchemy import (
     JSON,
+    BigInteger,
     Boolean,
     CheckConstraint,
     Column,
@@ -107,9 +108,8 @@ class VirtualLab(Base):
     invites = relationship("VirtualLabInvite", back_populates="virtual_lab")
     payment_methods = relationship("PaymentMethod", back_populates="virtual_lab")
     payments = relationship("SubscriptionPayment", back_populates="virtual_lab")
-    course = relationship(
-        "Course", back_populates="virtual_lab", uselist=False, lazy="joined"
-    )
+    # loaded on demand, see `infrastructure.db.loading`
+    course = relationship("Course", back_populates="virtual_lab", uselist=False)
 
     __table_args__ = (
         Index(
@@ -119,6 +119,12 @@ class VirtualLab(Base):
             unique=True,
             postgresql_where=(not_(deleted)),
         ),
+        Index(
+            "ix_virtual_lab_name_trgm",
+            name,
+            postgresql_using="gin",
+            postgresql_ops={"name": "gin_trgm_ops"},
+        ),
     )
 
     @property
@@ -165,6 +171,12 @@ class Project(Base):
             unique=True,
             postgresql_where=(not_(deleted)),
         ),
+        Index(
+            "ix_project_name_trgm",
+            name,
+            postgresql_using="gin",
+            postgresql_ops={"name": "gin_trgm_ops"},
+        ),
     )
 
 
@@ -415,6 +427,8 @@ class Subscription(Base):
 
     __table_args__ = (
         Index("ix_subscription_status_period_end", "status", "current_period_end"),
+        # admin listing: newest first, keyset-paged
+        Index("ix_subscription_created_at_id", "created_at", "id"),
     )
 
 
@@ -566,6 +580,8 @@ class SubscriptionPayment(Base):
             "NOT standalone OR virtual_lab_id IS NOT NULL",
             name="check_virtual_lab_required_when_standalone",
         ),
+        # admin listing: newest first, keyset-paged
+        Index("ix_subscription_payment_payment_date_id", "payment_date", "id"),
     )
 
 
@@ -920,6 +936,34 @@ class PromotionCodeUsage(Base):
     )
 
 
+class PromotionCodeUsageRollup(Base):
+    """
+    Running usage totals per promotion code.
+    Updated in the same transaction as every usage insert and status change,
+    so unfiltered statistics never have to scan promotion_code_usage.
+    """
+
+    __tablename__ = "promotion_code_usage_rollup"
+
+    promotion_code_id: Mapped[uuid.UUID] = mapped_column(
+        UUID(as_uuid=True),
+        ForeignKey("promotion_code.id", ondelete="CASCADE"),
+        primary_key=True,
+    )
+    total_redemptions: Mapped[int] = mapped_column(Integer, nullable=False, default=0)
+    completed: Mapped[int] = mapped_column(Integer, nullable=False, default=0)
+    pending: Mapped[int] = mapped_column(Integer, nullable=False, default=0)
+    failed: Mapped[int] = mapped_column(Integer, nullable=False, default=0)
+    total_credits_distributed: Mapped[int] = mapped_column(
+        BigInteger, nullable=False, default=0
+    )
+    unique_users: Mapped[int] = mapped_column(Integer, nullable=False, default=0)
+    unique_virtual_labs: Mapped[int] = mapped_column(Integer, nullable=False, default=0)
+    updated_at: Mapped[datetime] = mapped_column(
+        DateTime(timezone=True), default=func.now(), onupdate=func.now(), nullable=False
+    )
+
+
 class PromotionCodeRedemptionAttempt(Base):
     """
     Analytics table tracking all redemption attempts.
@@ -1098,9 +1142,10 @@ class Course(Base):
         DateTime(timezone=True), default=func.now(), onupdate=func.now(), nullable=False
     )
 
-    virtual_lab = relationship("VirtualLab", back_populates="course", lazy="joined")
+    # loaded on demand, see `infrastructure.db.loading`
+    virtual_lab = relationship("VirtualLab", back_populates="course")
     template_project = relationship("Project")
-    institution = relationship("Institution", lazy="joined")
+    institution = relationship("Institution")
 
     def ensure_mutable(self) -> None:
         """Raise if the course is not in draft status."""
@@ -1236,3 +1281,58 @@ class Seat(Base):
     course = relationship("Course")
     institution = relationship("Institution")
     enrolment = relationship("CourseEnrolment", lazy="noload")
+
+
+class OutboxStatus(str, Enum):
+    """Delivery state of an outbox message."""
+
+    PENDING = "pending"
+    DONE = "done"
+    DEAD = "dead"
+
+
+class OutboxMessage(Base):
+    """
+    A side effect (Keycloak, accounting, Stripe) staged in the same
+    transaction as the state change that caused it, and delivered with
+    retries by the outbox drainer (`infrastructure.stripe.outbox`).
+    """
+
+    __tablename__ = "outbox_message"
+
+    # monotonic, so messages sharing an ordering key are delivered in order
+    id: Mapped[int] = mapped_column(BigInteger, primary_key=True, autoincrement=True)
+    effect: Mapped[str] = mapped_column(String(64), nullable=False)
+    payload: Mapped[Dict[str, Any]] = mapped_column(JSON, nullable=False)
+    idempotency_key: Mapped[str] = mapped_column(
+        String(255), nullable=False, unique=True
+    )
+    ordering_key: Mapped[Optional[str]] = mapped_column(String(255), nullable=True)
+    status: Mapped[OutboxStatus] = mapped_column(
+        SAEnum(OutboxStatus), nullable=False, default=OutboxStatus.PENDING
+    )
+    attempts: Mapped[int] = mapped_column(Integer, nullable=False, default=0)
+    available_at: Mapped[datetime] = mapped_column(
+        DateTime(timezone=True), default=func.now(), nullable=False
+    )
+    last_error: Mapped[Optional[str]] = mapped_column(Text, nullable=True)
+    created_at: Mapped[datetime] = mapped_column(
+        DateTime(timezone=True), default=func.now(), nullable=False
+    )
+    processed_at: Mapped[Optional[datetime]] = mapped_column(
+        DateTime(timezone=True), nullable=True
+    )
+
+    __table_args__ = (
+        Index(
+            "ix_outbox_message_pending",
+            "available_at",
+            postgresql_where=text("status = 'PENDING'"),
+        ),
+        Index(
+            "ix_outbox_message_pending_ordering_key",
+            "ordering_key",
+            "id",
+            postgresql_where=text("status = 'PENDING'"),
+        ),
+    )
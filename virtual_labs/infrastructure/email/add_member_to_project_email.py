@@ -1,12 +1,8 @@
-from fastapi_mail import FastMail, MessageSchema, MessageType
 from loguru import logger
-from pydantic import UUID4, BaseModel, NameEmail
+from pydantic import UUID4, BaseModel
 
 from virtual_labs.core.exceptions.email_error import EmailError
-from virtual_labs.infrastructure.email.config import email_config
-from virtual_labs.infrastructure.email.email_utils import (
-    generate_email_to_add_user_to_project,
-)
+from virtual_labs.infrastructure.email.mailer import Email, mailer
 from virtual_labs.infrastructure.settings import settings
 
 
@@ -19,50 +15,41 @@ class EmailDetails(BaseModel):
     project_name: str
 
 
+def _project_link(details: EmailDetails) -> str:
+    return f"{settings.DEPLOYMENT_NAMESPACE}/app/virtual-lab/{details.lab_id}/{details.project_id}"
+
+
+def _add_member_email(details: EmailDetails) -> Email:
+    return Email(
+        recipient=details.recipient,
+        subject=f"You have been given access to OBI's project titled {details.project_name}",
+        html_template="add_member_to_project_template.html",
+        plain_template="add_member_to_project_template.txt",
+        context={
+            "inviter_name": details.inviter_name,
+            "project_name": details.project_name,
+            "lab_name": details.lab_name,
+            "project_link": _project_link(details),
+        },
+    )
+
+
+def _add_member_email_error(details: EmailDetails, error: Exception) -> EmailError:
+    project_link = _project_link(details)
+    logger.error(
+        f"Project link {project_link} could not be emailed to user {details.recipient} because of error {error}"
+    )
+    return EmailError(
+        message=f"Project link {project_link} could not be emailed to user {details.recipient}",
+        detail=str(error),
+    )
+
+
 async def send_add_member_to_project_email(details: EmailDetails) -> str:
+    project_link = _project_link(details)
     try:
-        project_link = f"{settings.DEPLOYMENT_NAMESPACE}/app/virtual-lab/{details.lab_id}/{details.project_id}"
-        body_html = generate_email_to_add_user_to_project(
-            details.project_name, details.lab_name, project_link, details.inviter_name
-        )
-        message = MessageSchema(
-            subject=f"You have been given access to OBI's project titled {details.project_name}",
-            recipients=[NameEmail("", details.recipient)],
-            body=body_html,
-            subtype=MessageType.html,
-            attachments=[
-                {
-                    "file": "virtual_labs/infrastructure/email/assets/logo.png",
-                    "headers": {
-                        "Content-ID": "logo",
-                        "Content-Disposition": 'inline; filename="logo.png"',  # For inline images only
-                    },
-                    "mime_type": "image",
-                    "mime_subtype": "png",
-                    "Content-Type": "multipart/related",
-                },
-            ],
-            template_body={
-                "inviter_name": details.inviter_name,
-                "project_name": details.project_name,
-                "lab_name": details.lab_name,
-                "project_link": project_link,
-            },
-            headers={"X-SES-CONFIGURATION-SET": settings.AWS_SES_CONFIGURATION_SET},
-        )
-        fm = FastMail(email_config)
-        await fm.send_message(
-            message=message,
-            html_template="add_member_to_project_template.html",
-            plain_template="add_member_to_project_template.txt",
-        )
-        logger.debug(f"Project link {project_link} emailed to user {details.recipient}")
-        return project_link
+        await mailer.send(_add_member_email(details))
     except Exception as error:
-        logger.error(
-            f"Project link {project_link} could not be emailed to user {details.recipient} because of error {error}"
-        )
-        raise EmailError(
-            message=f"Project link {project_link} could not be emailed to user {details.recipient}",
-            detail=str(error),
-        ) from error
+        raise _add_member_email_error(details, error) from error
+    logger.debug(f"Project link {project_link} emailed to user {details.recipient}")
+    return project_link
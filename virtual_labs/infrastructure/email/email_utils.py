@@ -5,9 +5,6 @@ from typing import TypedDict, cast
 import jwt
 from pydantic import UUID4
 
-from virtual_labs.domain.email import (
-    VerificationCodeEmailDetails,
-)
 from virtual_labs.infrastructure.settings import settings
 
 InviteToken = TypedDict("InviteToken", {"invite_id": str, "exp": str, "origin": str})
@@ -41,21 +38,6 @@ def generate_invite_link(invite_token: str) -> str:
     return f"{settings.INVITE_LINK_BASE}/invite?token={invite_token}"
 
 
-def generate_invite_html(
-    invite_link: str, lab_name: str, project_name: str | None
-) -> str:
-    if project_name is None:
-        return f"""
-            You have been invited to virtual lab {lab_name}. Please click on the link below to accept the invite:
-            <a href="{invite_link}">{invite_link}</a>
-        """
-    else:
-        return f"""
-            You have been invited to project {project_name} within the {lab_name} virtual lab. Please click on the link below to accept the invite: <br />
-            <a href="{invite_link}">{invite_link}</a>
-        """
-
-
 def get_invite_details_from_token(invite_token: str) -> InviteToken:
     decoded_token = jwt.decode(
         invite_token,
@@ -69,24 +51,3 @@ def get_invite_details_from_token(invite_token: str) -> InviteToken:
 def get_expiry_datetime_from_token(invite_token: InviteToken) -> datetime:
     expiry = float(invite_token["exp"])
     return datetime.fromtimestamp(expiry / 1000)
-
-
-def generate_email_verification_html(details: VerificationCodeEmailDetails) -> str:
-    return f"""
-        Email Verification Required
-        You have requested to validate the administrator email for the virtual lab {details.virtual_lab_name}
-        Please use the verification code {details.code} to complete the process
-        This code will expire in {details.expire_at} minutes.
-
-        If you did not request this verification, please ignore this email or contact support at support@openbraininstitute.org.
-    """
-
-
-def generate_email_to_add_user_to_project(
-    project_name: str, virtual_lab_name: str, project_link: str, inviter_name: str
-) -> str:
-    return f"""
-        {inviter_name} has added you to the project {project_name} in the virtual lab {virtual_lab_name}
-        You can now access the project by clicking on the link below:
-        <a href="{project_link}">{project_link}</a>
-    """
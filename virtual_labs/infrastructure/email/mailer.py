@@ -0,0 +1,204 @@
+"""Pooled SMTP delivery for outgoing email.
+
+`FastMail.send_message` connects and logs into a fresh SMTP session for
+every call. It also builds a new Jinja environment each time, so the
+templates are recompiled, and re-reads every inline image from disk.
+`Mailer` avoids all three:
+- it keeps up to `MAIL_POOL_SIZE` authenticated connections open
+  between sends, reconnecting those idle for longer than
+  `MAIL_POOL_IDLE_SECONDS` or dropped by the server;
+- it compiles each template once;
+- it reads each asset once.
+
+Concurrent sends, such as a batch drained by the email queue, share the
+pooled connections, so hundreds of messages go out over a handful of
+SMTP sessions.
+"""
+
+import asyncio
+import time
+from collections.abc import AsyncIterator, Awaitable, Callable, Mapping
+from contextlib import asynccontextmanager
+from dataclasses import dataclass, field
+from email.encoders import encode_base64
+from email.mime.base import MIMEBase
+from email.mime.multipart import MIMEMultipart
+from email.mime.text import MIMEText
+from email.utils import formataddr, formatdate, make_msgid
+from functools import cache
+from pathlib import Path
+from typing import Any
+
+import aiosmtplib
+from fastapi_mail import ConnectionConfig
+from jinja2 import Environment, FileSystemLoader, select_autoescape
+
+from virtual_labs.infrastructure.email.config import email_config
+from virtual_labs.infrastructure.settings import settings
+
+ASSETS = Path(__file__).parent / "assets"
+
+Connect = Callable[[], Awaitable[aiosmtplib.SMTP]]
+
+
+@dataclass(frozen=True, slots=True)
+class InlineImage:
+    filename: str
+    content_id: str
+
+    @property
+    def subtype(self) -> str:
+        return Path(self.filename).suffix.lstrip(".")
+
+
+LOGO = InlineImage("logo.png", "logo")
+
+
+@dataclass(frozen=True, slots=True)
+class Email:
+    recipient: str
+    subject: str
+    html_template: str
+    plain_template: str
+    context: Mapping[str, Any] = field(default_factory=dict)
+    images: tuple[InlineImage, ...] = (LOGO,)
+
+
+@cache
+def _asset_bytes(filename: str) -> bytes:
+    return (ASSETS / filename).read_bytes()
+
+
+def _connector(config: ConnectionConfig) -> Connect:
+    async def connect() -> aiosmtplib.SMTP:
+        client = aiosmtplib.SMTP(
+            hostname=config.MAIL_SERVER,
+            port=config.MAIL_PORT,
+            timeout=config.TIMEOUT,
+            use_tls=config.MAIL_SSL_TLS,
+            start_tls=config.MAIL_STARTTLS,
+            validate_certs=config.VALIDATE_CERTS,
+            local_hostname=config.LOCAL_HOSTNAME,
+            cert_bundle=config.CERT_BUNDLE,
+        )
+        await client.connect()
+        if config.USE_CREDENTIALS:
+            await client.login(
+                config.MAIL_USERNAME, config.MAIL_PASSWORD.get_secret_value()
+            )
+        return client
+
+    return connect
+
+
+async def _quit(client: aiosmtplib.SMTP) -> None:
+    try:
+        await client.quit()
+    except Exception:  # noqa: BLE001
+        client.close()
+
+
+class SmtpPool:
+    """At most `size` SMTP connections, reused across sends."""
+
+    def __init__(self, connect: Connect, *, size: int, idle_seconds: float) -> None:
+        self._connect = connect
+        self._slots = asyncio.Semaphore(size)
+        self._idle_seconds = idle_seconds
+        # most recently used last, so a quiet pool keeps its warm connections
+        self._idle: list[tuple[aiosmtplib.SMTP, float]] = []
+
+    async def _checkout(self) -> aiosmtplib.SMTP:
+        while self._idle:
+            client, released_at = self._idle.pop()
+            if (
+                client.is_connected
+                and time.monotonic() - released_at < self._idle_seconds
+            ):
+                return client
+            await _quit(client)
+        return await self._connect()
+
+    @asynccontextmanager
+    async def connection(self) -> AsyncIterator[aiosmtplib.SMTP]:
+        async with self._slots:
+            client = await self._checkout()
+            try:
+                yield client
+            except BaseException:
+                # the session may be mid-transaction; never hand it out again
+                await _quit(client)
+                raise
+            self._idle.append((client, time.monotonic()))
+
+    async def close(self) -> None:
+        idle, self._idle = self._idle, []
+        await asyncio.gather(*(_quit(client) for client, _ in idle))
+
+
+class Mailer:
+    def __init__(
+        self,
+        config: ConnectionConfig = email_config,
+        *,
+        connect: Connect | None = None,
+    ) -> None:
+        self._sender = (
+            formataddr((config.MAIL_FROM_NAME, config.MAIL_FROM))
+            if config.MAIL_FROM_NAME
+            else config.MAIL_FROM
+        )
+        self._templates = Environment(
+            loader=FileSystemLoader(config.TEMPLATE_FOLDER or "."),
+            autoescape=select_autoescape(),
+            auto_reload=False,
+        )
+        self._pool = SmtpPool(
+            connect or _connector(config),
+            size=settings.MAIL_POOL_SIZE,
+            idle_seconds=settings.MAIL_POOL_IDLE_SECONDS,
+        )
+
+    def render(self, email: Email) -> MIMEMultipart:
+        html = self._templates.get_template(email.html_template).render(email.context)
+        plain = self._templates.get_template(email.plain_template).render(email.context)
+
+        body = MIMEMultipart("alternative")
+        body.attach(MIMEText(plain, "plain", "utf-8"))
+        body.attach(MIMEText(html, "html", "utf-8"))
+
+        message = MIMEMultipart("related")
+        message.attach(body)
+        for image in email.images:
+            part = MIMEBase("image", image.subtype)
+            part.set_payload(_asset_bytes(image.filename))
+            encode_base64(part)
+            part.add_header("Content-ID", image.content_id)
+            part.add_header("Content-Disposition", "inline", filename=image.filename)
+            message.attach(part)
+
+        message["Date"] = formatdate(localtime=True)
+        message["Message-ID"] = make_msgid()
+        message["To"] = email.recipient
+        message["From"] = self._sender
+        message["Subject"] = email.subject
+        message["X-SES-CONFIGURATION-SET"] = settings.AWS_SES_CONFIGURATION_SET
+        return message
+
+    async def _deliver(self, message: MIMEMultipart) -> None:
+        try:
+            async with self._pool.connection() as client:
+                await client.send_message(message)
+        except aiosmtplib.SMTPServerDisconnected:
+            # a pooled connection the server had already closed
+            async with self._pool.connection() as client:
+                await client.send_message(message)
+
+    async def send(self, email: Email) -> None:
+        await self._deliver(self.render(email))
+
+    async def close(self) -> None:
+        await self._pool.close()
+
+
+mailer = Mailer()
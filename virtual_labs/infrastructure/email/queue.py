@@ -0,0 +1,355 @@
+"""Redis-backed queue for outgoing email.
+
+Request handlers `enqueue` an email job and return. They do not wait on
+SMTP. Each job is a hash under `email_queue:job:<id>` that holds its
+kind, payload and delivery status. The job id sits in the
+`email_queue:schedule` sorted set, scored by the time it is due.
+
+`EmailQueue.run` is started from `api.lifespan`. It claims due jobs
+atomically (`_CLAIM_SCRIPT`) and leases each one by pushing its score
+`EMAIL_QUEUE_LEASE_SECONDS` ahead, so several app instances can consume
+side by side. A worker that dies mid-send only delays its jobs until
+the lease runs out. Each claimed job is sent through the pooled
+`mailer`. A job that fails is retried with exponential backoff until
+`EMAIL_QUEUE_MAX_ATTEMPTS`. After that it is marked dead and pushed
+onto the `email_queue:dead` list. Finished jobs keep their status for
+`EMAIL_QUEUE_RETENTION_SECONDS`, so the API can report it (`get`).
+
+With `EMAIL_QUEUE_ENABLED` off, `enqueue` sends inline but still
+records the job.
+"""
+
+import asyncio
+import json
+from collections.abc import Awaitable, Callable, Mapping, Sequence
+from contextlib import suppress
+from dataclasses import dataclass
+from datetime import datetime, timezone
+from enum import StrEnum
+from time import time
+from typing import Any
+from uuid import UUID, uuid4
+
+from loguru import logger
+from pydantic import BaseModel
+from redis.asyncio import Redis
+
+from virtual_labs.core.exceptions.email_error import EmailError
+from virtual_labs.domain.email import EmailJobOut, EmailJobStatus
+from virtual_labs.infrastructure.email import add_member_to_project_email, invite_email
+from virtual_labs.infrastructure.email.mailer import mailer
+from virtual_labs.infrastructure.email.send_enrolment_claim_email import (
+    EnrolmentClaimEmailDetails,
+    send_enrolment_claim_email,
+)
+from virtual_labs.infrastructure.email.send_welcome_email import (
+    WelcomeEmailDetails,
+    welcome_email,
+)
+from virtual_labs.infrastructure.redis import get_redis
+from virtual_labs.infrastructure.settings import settings
+
+EmailHandler = Callable[[dict[str, Any]], Awaitable[None]]
+
+PREFIX = "email_queue"
+SCHEDULE_KEY = f"{PREFIX}:schedule"
+DEAD_LETTER_KEY = f"{PREFIX}:dead"
+JOB_KEY_PREFIX = f"{PREFIX}:job:"
+
+
+class EmailKind(StrEnum):
+    INVITE = "invite"
+    ENROLMENT_CLAIM = "enrolment_claim"
+    ADD_MEMBER_TO_PROJECT = "add_member_to_project"
+    WELCOME = "welcome"
+
+
+@dataclass(frozen=True, slots=True)
+class EmailJob:
+    kind: EmailKind
+    recipient: str
+    details: BaseModel
+
+
+# Handlers: raise to have the job retried
+
+
+async def _send_invite(payload: dict[str, Any]) -> None:
+    await invite_email.send_invite(invite_email.EmailDetails.model_validate(payload))
+
+
+async def _send_enrolment_claim(payload: dict[str, Any]) -> None:
+    await send_enrolment_claim_email(EnrolmentClaimEmailDetails.model_validate(payload))
+
+
+async def _send_add_member_to_project(payload: dict[str, Any]) -> None:
+    await add_member_to_project_email.send_add_member_to_project_email(
+        add_member_to_project_email.EmailDetails.model_validate(payload)
+    )
+
+
+async def _send_welcome(payload: dict[str, Any]) -> None:
+    details = WelcomeEmailDetails.model_validate(payload)
+    await mailer.send(welcome_email(details.recipient))
+
+
+EMAIL_HANDLERS: Mapping[str, EmailHandler] = {
+    EmailKind.INVITE: _send_invite,
+    EmailKind.ENROLMENT_CLAIM: _send_enrolment_claim,
+    EmailKind.ADD_MEMBER_TO_PROJECT: _send_add_member_to_project,
+    EmailKind.WELCOME: _send_welcome,
+}
+
+
+# KEYS[1] = schedule; ARGV = now (ms), lease (ms), limit, job key prefix.
+# Leases up to `limit` due jobs and returns {id, kind, payload, attempts}
+# for each; ids whose job hash has expired are dropped.
+_CLAIM_SCRIPT = """
+local now = tonumber(ARGV[1])
+local due = redis.call('ZRANGEBYSCORE', KEYS[1], '-inf', now, 'LIMIT', 0, tonumber(ARGV[3]))
+local claimed = {}
+for _, id in ipairs(due) do
+    local job = ARGV[4] .. id
+    local kind = redis.call('HGET', job, 'kind')
+    if kind then
+        redis.call('ZADD', KEYS[1], now + tonumber(ARGV[2]), id)
+        local attempts = redis.call('HINCRBY', job, 'attempts', 1)
+        redis.call('HSET', job, 'status', 'sending', 'updated_at', now)
+        claimed[#claimed + 1] = {id, kind, redis.call('HGET', job, 'payload'), attempts}
+    else
+        redis.call('ZREM', KEYS[1], id)
+    end
+end
+return claimed
+"""
+
+
+def _now_ms() -> int:
+    return int(time() * 1000)
+
+
+def _describe(error: Exception) -> str:
+    if isinstance(error, EmailError):
+        return f"{error.message}: {error.detail}"
+    return f"{type(error).__name__}: {error}"
+
+
+def _backoff_seconds(attempts: int) -> float:
+    delay: float = settings.EMAIL_QUEUE_RETRY_BASE_SECONDS * 2 ** (attempts - 1)
+    return min(delay, settings.EMAIL_QUEUE_RETRY_MAX_SECONDS)
+
+
+def _timestamp(value: str) -> datetime:
+    return datetime.fromtimestamp(int(value) / 1000, tz=timezone.utc)
+
+
+class EmailQueue:
+    def __init__(
+        self,
+        handlers: Mapping[str, EmailHandler] = EMAIL_HANDLERS,
+        redis: Redis | None = None,
+    ) -> None:
+        self.handlers = handlers
+        self._redis = redis
+        self._wakeup = asyncio.Event()
+
+    async def _client(self) -> Redis:
+        return self._redis or await get_redis()
+
+    async def enqueue(self, job: EmailJob, *, requested_by: UUID) -> UUID:
+        """Queue one email; returns its job id. Sent inline (raising on
+        failure) when the queue is disabled."""
+        (job_id,) = await self._record([job], requested_by=requested_by)
+        if not settings.EMAIL_QUEUE_ENABLED:
+            (error,) = await self._send_inline([job_id], [job])
+            if error is not None:
+                raise error
+        return job_id
+
+    async def enqueue_many(
+        self, jobs: Sequence[EmailJob], *, requested_by: UUID
+    ) -> list[UUID]:
+        """Queue a batch of emails in one round-trip; returns their job ids.
+        Failures of an inline send are only recorded on the job."""
+        job_ids = await self._record(jobs, requested_by=requested_by)
+        if not settings.EMAIL_QUEUE_ENABLED:
+            await self._send_inline(job_ids, jobs)
+        return job_ids
+
+    async def _record(
+        self, jobs: Sequence[EmailJob], *, requested_by: UUID
+    ) -> list[UUID]:
+        if not jobs:
+            return []
+        queued = settings.EMAIL_QUEUE_ENABLED
+        now = _now_ms()
+        job_ids = [uuid4() for _ in jobs]
+        async with (await self._client()).pipeline(transaction=True) as pipe:
+            for job_id, job in zip(job_ids, jobs):
+                pipe.hset(
+                    f"{JOB_KEY_PREFIX}{job_id}",
+                    mapping={
+                        "kind": job.kind.value,
+                        "recipient": job.recipient,
+                        "payload": job.details.model_dump_json(),
+                        "requested_by": str(requested_by),
+                        "status": (
+                            EmailJobStatus.QUEUED if queued else EmailJobStatus.SENDING
+                        ).value,
+                        "attempts": 0 if queued else 1,
+                        "last_error": "",
+                        "created_at": now,
+                        "updated_at": now,
+                    },
+                )
+            if queued:
+                pipe.zadd(SCHEDULE_KEY, {str(job_id): now for job_id in job_ids})
+            await pipe.execute()
+        if queued:
+            self.notify()
+        return job_ids
+
+    async def _send_inline(
+        self, job_ids: Sequence[UUID], jobs: Sequence[EmailJob]
+    ) -> list[Exception | None]:
+        async def send(job: EmailJob) -> Exception | None:
+            try:
+                await self.handlers[job.kind](job.details.model_dump(mode="json"))
+            except Exception as error:
+                return error
+            return None
+
+        errors = await asyncio.gather(*(send(job) for job in jobs))
+        async with (await self._client()).pipeline(transaction=True) as pipe:
+            for job_id, error in zip(job_ids, errors):
+                self._settle(
+                    pipe,
+                    str(job_id),
+                    attempts=1,
+                    error=None if error is None else _describe(error),
+                    retry=False,
+                )
+            await pipe.execute()
+        return errors
+
+    async def get(self, job_id: UUID) -> tuple[EmailJobOut, str] | None:
+        """The job's status and who queued it, or None once it expired."""
+        redis = await self._client()
+        job: dict[str, str] = await redis.hgetall(f"{JOB_KEY_PREFIX}{job_id}")  # type: ignore[misc]
+        if not job:
+            return None
+        return (
+            EmailJobOut(
+                id=job_id,
+                kind=job["kind"],
+                recipient=job["recipient"],
+                status=EmailJobStatus(job["status"]),
+                attempts=int(job["attempts"]),
+                last_error=job["last_error"] or None,
+                created_at=_timestamp(job["created_at"]),
+                updated_at=_timestamp(job["updated_at"]),
+            ),
+            job["requested_by"],
+        )
+
+    def notify(self) -> None:
+        """Deliver now instead of at the next poll (new jobs queued)."""
+        self._wakeup.set()
+
+    async def run(self) -> None:
+        """Deliver until cancelled: back-to-back while full batches come
+        in, otherwise on `notify` or every `EMAIL_QUEUE_POLL_INTERVAL_SECONDS`."""
+        while True:
+            try:
+                delivered = await self.drain_once()
+            except asyncio.CancelledError:
+                raise
+            except Exception as error:
+                logger.warning(f"Email queue drain failed ({error})")
+                delivered = 0
+            if delivered >= settings.EMAIL_QUEUE_BATCH_SIZE:
+                continue
+            with suppress(TimeoutError):
+                async with asyncio.timeout(settings.EMAIL_QUEUE_POLL_INTERVAL_SECONDS):
+                    await self._wakeup.wait()
+            self._wakeup.clear()
+
+    async def drain_once(self) -> int:
+        """Deliver one batch of due jobs; returns how many were claimed."""
+        redis = await self._client()
+        claimed = await redis.register_script(_CLAIM_SCRIPT)(
+            keys=[SCHEDULE_KEY],
+            args=[
+                _now_ms(),
+                int(settings.EMAIL_QUEUE_LEASE_SECONDS * 1000),
+                settings.EMAIL_QUEUE_BATCH_SIZE,
+                JOB_KEY_PREFIX,
+            ],
+        )
+        if not claimed:
+            return 0
+
+        errors = await asyncio.gather(
+            *(self._deliver(kind, payload) for _, kind, payload, _ in claimed)
+        )
+
+        async with redis.pipeline(transaction=True) as pipe:
+            for (job_id, kind, _, attempts), error in zip(claimed, errors):
+                if error is not None:
+                    logger.warning(
+                        f"Email job {job_id} ({kind}) attempt {attempts} failed: {error}"
+                    )
+                self._settle(pipe, job_id, attempts=int(attempts), error=error)
+            await pipe.execute()
+        return len(claimed)
+
+    async def _deliver(self, kind: str, payload: str) -> str | None:
+        handler = self.handlers.get(kind)
+        if handler is None:
+            # e.g. queued by a newer release during a rolling deploy
+            return f"No handler for email kind {kind!r}"
+        try:
+            await handler(json.loads(payload))
+        except Exception as error:
+            return _describe(error)
+        return None
+
+    @staticmethod
+    def _settle(
+        pipe: Any, job_id: str, *, attempts: int, error: str | None, retry: bool = True
+    ) -> None:
+        job = f"{JOB_KEY_PREFIX}{job_id}"
+        now = _now_ms()
+        if error is not None and retry and attempts < settings.EMAIL_QUEUE_MAX_ATTEMPTS:
+            pipe.hset(
+                job,
+                mapping={
+                    "status": EmailJobStatus.RETRYING.value,
+                    "last_error": error,
+                    "updated_at": now,
+                },
+            )
+            pipe.zadd(
+                SCHEDULE_KEY,
+                {job_id: now + int(_backoff_seconds(attempts) * 1000)},
+            )
+            return
+
+        status = EmailJobStatus.SENT if error is None else EmailJobStatus.DEAD
+        pipe.hset(
+            job,
+            mapping={
+                "status": status.value,
+                "last_error": error or "",
+                "updated_at": now,
+            },
+        )
+        pipe.zrem(SCHEDULE_KEY, job_id)
+        pipe.expire(job, settings.EMAIL_QUEUE_RETENTION_SECONDS)
+        if status is EmailJobStatus.DEAD:
+            logger.error(f"Email job {job_id} gave up after {attempts} attempts")
+            pipe.lpush(DEAD_LETTER_KEY, job_id)
+            pipe.ltrim(DEAD_LETTER_KEY, 0, settings.EMAIL_QUEUE_DEAD_LETTER_MAX - 1)
+
+
+email_queue = EmailQueue()
@@ -101,7 +101,7 @@ async def test_email_invite_sent_for_project() -> None:
 @pytest.mark.asyncio
 async def test_throws_email_error_if_email_could_not_be_sent() -> None:
     with patch(
-        f"{EmailService}.FastMail.send_message",
+        f"{EmailService}.mailer.send",
         side_effect=Exception("I am going to blow up for no reason"),
         new_callable=AsyncMock,
     ):
@@ -1,48 +1,24 @@
-from fastapi_mail import FastMail, MessageSchema, MessageType
 from loguru import logger
-from pydantic import NameEmail
 
 from virtual_labs.core.exceptions.email_error import EmailError
 from virtual_labs.domain.email import VerificationCodeEmailDetails
-from virtual_labs.infrastructure.email.config import email_config
-from virtual_labs.infrastructure.email.email_utils import (
-    generate_email_verification_html,
-)
-from virtual_labs.infrastructure.settings import settings
+from virtual_labs.infrastructure.email.mailer import Email, mailer
 
 
 async def send_verification_code_email(details: VerificationCodeEmailDetails) -> str:
     try:
-        invite_html = generate_email_verification_html(details)
-        message = MessageSchema(
-            subject=f"Action Required: Verify your email to proceed with your purchase for {details.virtual_lab_name}",
-            recipients=[NameEmail("", details.recipient)],
-            body=invite_html,
-            subtype=MessageType.html,
-            attachments=[
-                {
-                    "file": "virtual_labs/infrastructure/email/assets/logo.png",
-                    "headers": {
-                        "Content-ID": "logo",
-                        "Content-Disposition": 'inline; filename="logo.png"',
-                    },
-                    "mime_type": "image",
-                    "mime_subtype": "png",
-                    "Content-Type": "multipart/related",
+        await mailer.send(
+            Email(
+                recipient=details.recipient,
+                subject=f"Action Required: Verify your email to proceed with your purchase for {details.virtual_lab_name}",
+                html_template="email_verification_code.html",
+                plain_template="email_verification_code.txt",
+                context={
+                    "code": details.code,
+                    "virtual_lab_name": details.virtual_lab_name,
+                    "expire_at": details.expire_at,
                 },
-            ],
-            template_body={
-                "code": details.code,
-                "virtual_lab_name": details.virtual_lab_name,
-                "expire_at": details.expire_at,
-            },
-            headers={"X-SES-CONFIGURATION-SET": settings.AWS_SES_CONFIGURATION_SET},
-        )
-        fm = FastMail(email_config)
-        await fm.send_message(
-            message=message,
-            html_template="email_verification_code.html",
-            plain_template="email_verification_code.txt",
+            )
         )
         return "email sent successfully"
     except Exception as error:
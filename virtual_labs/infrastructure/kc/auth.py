@@ -13,7 +13,9 @@ from loguru import logger
 from virtual_labs.core.exceptions.api_error import VliError, VliErrorCode
 from virtual_labs.core.exceptions.identity_error import IdentityError
 from virtual_labs.infrastructure.kc.config import KeycloakRealm
+from virtual_labs.infrastructure.kc.jwks import a_decode_token as a_decode_token_locally
 from virtual_labs.infrastructure.kc.models import AuthUser, ClientToken
+from virtual_labs.infrastructure.kc.session_cache import a_introspect_cached
 from virtual_labs.infrastructure.settings import settings
 
 from .config import kc_auth
@@ -108,7 +110,11 @@ async def a_verify_jwt(
 
     try:
         token = header.credentials
-        decoded_token = await kc_auth.a_decode_token(token=token, validate=True)
+        decoded_token = (
+            await a_decode_token_locally(token)
+            if settings.KC_TOKEN_VERIFICATION == "local"
+            else await kc_auth.a_decode_token(token=token, validate=True)
+        )
     except KeycloakError as exception:
         logger.error(
             f"Keycloak error while decoding token CODE: {exception.response_code} BODY: {exception.response_body} MESSAGE: {exception.error_message}"
@@ -129,8 +135,10 @@ async def a_verify_jwt(
         )
 
     try:
-        introspected_token = await kc_auth.a_introspect(
-            token=token,
+        introspected_token = (
+            await a_introspect_cached(token, decoded_token)
+            if settings.KC_TOKEN_VERIFICATION == "local"
+            else await kc_auth.a_introspect(token=token)
         )
 
         if introspected_token and introspected_token["active"] is False:
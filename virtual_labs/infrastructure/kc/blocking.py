@@ -0,0 +1,90 @@
+"""Dev-mode detector for blocking Keycloak calls made on the event loop.
+
+Every `python-keycloak` call has a sync and an `a_`-prefixed async
+variant. The sync one performs its HTTP round-trip on the calling
+thread; made from a coroutine, it freezes the whole worker until
+Keycloak answers. Repositories only expose the async variants, and this
+detector catches what slips through: `install_blocking_call_detector`
+wraps the sync twin of every async method on the shared clients and
+reports calls made while an event loop is running on the current
+thread.
+
+Sync calls from worker threads (e.g. sync FastAPI dependencies, which
+run in the threadpool) or from scripts without a loop are not reported.
+"""
+
+import asyncio
+from functools import wraps
+from typing import Any, Callable
+
+from loguru import logger
+
+from virtual_labs.infrastructure.kc.config import KeycloakRealm, kc_auth
+from virtual_labs.infrastructure.settings import settings
+
+_ASYNC_PREFIX = "a_"
+_GUARDED_MARKER = "__blocking_call_guarded__"
+
+
+class BlockingKeycloakCall(RuntimeError):
+    pass
+
+
+def _is_on_event_loop() -> bool:
+    try:
+        asyncio.get_running_loop()
+    except RuntimeError:
+        return False
+    return True
+
+
+def _guard(owner: str, name: str, method: Callable[..., Any]) -> Callable[..., Any]:
+    @wraps(method)
+    def guarded(*args: Any, **kwargs: Any) -> Any:
+        if _is_on_event_loop():
+            message = (
+                f"Blocking Keycloak call {owner}.{name}() on the event loop, "
+                f"use {owner}.{_ASYNC_PREFIX}{name}() instead"
+            )
+            if settings.KC_BLOCKING_CALL_DETECTION == "raise":
+                raise BlockingKeycloakCall(message)
+            logger.opt(depth=1).warning(message)
+        return method(*args, **kwargs)
+
+    setattr(guarded, _GUARDED_MARKER, True)
+    return guarded
+
+
+def guard_blocking_methods(client: Any, owner: str) -> int:
+    """Wrap, on `client` itself, every sync method that has an async twin.
+
+    Returns how many methods were wrapped; calling it twice is a no-op.
+    """
+    guarded = 0
+    for attribute in dir(type(client)):
+        if not attribute.startswith(_ASYNC_PREFIX):
+            continue
+        name = attribute[len(_ASYNC_PREFIX) :]
+        method = getattr(client, name, None)
+        if not callable(method) or getattr(method, _GUARDED_MARKER, False):
+            continue
+        setattr(client, name, _guard(owner, name, method))
+        guarded += 1
+    return guarded
+
+
+def install_blocking_call_detector() -> None:
+    """Guard the shared Keycloak clients according to
+    `KC_BLOCKING_CALL_DETECTION` (`off` leaves them untouched)."""
+    if settings.KC_BLOCKING_CALL_DETECTION == "off":
+        return
+
+    guarded = (
+        guard_blocking_methods(KeycloakRealm, "KeycloakRealm")
+        + guard_blocking_methods(KeycloakRealm.connection, "KeycloakRealm.connection")
+        + guard_blocking_methods(kc_auth, "kc_auth")
+    )
+    logger.info(
+        f"Keycloak blocking-call detection ({settings.KC_BLOCKING_CALL_DETECTION}) "
+        f"installed on {guarded} methods"
+    )
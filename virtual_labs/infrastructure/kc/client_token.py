@@ -0,0 +1,74 @@
+"""Cached service-account (client-credentials) access token.
+
+Calls to other services (accounting, ...) authenticate with this
+service's own Keycloak client. `ClientTokenProvider` keeps the current
+token in memory and only goes back to Keycloak once it is within
+`KC_CLIENT_TOKEN_REFRESH_MARGIN_SECONDS` of its `expires_in`, so a burst
+of outgoing calls shares one token instead of minting one each.
+
+The refresh is async and single-flight: concurrent callers that find
+the token stale wait on the same request instead of each issuing (or
+blocking the event loop on) their own.
+"""
+
+import asyncio
+from time import monotonic
+from typing import cast
+
+from keycloak import KeycloakOpenID  # type: ignore[import-untyped]
+from loguru import logger
+
+from virtual_labs.infrastructure.kc.config import kc_auth
+from virtual_labs.infrastructure.kc.models import ClientToken
+from virtual_labs.infrastructure.settings import settings
+
+
+class ClientTokenProvider:
+    __slots__ = ("_openid", "_refresh_margin", "_token", "_expires_at", "_lock")
+
+    def __init__(self, openid: KeycloakOpenID, refresh_margin: float) -> None:
+        self._openid = openid
+        self._refresh_margin = refresh_margin
+        self._token: str | None = None
+        self._expires_at = 0.0
+        self._lock = asyncio.Lock()
+
+    def _is_fresh(self) -> bool:
+        return self._token is not None and monotonic() < self._expires_at
+
+    async def get_token(self) -> str:
+        if self._is_fresh():
+            return cast(str, self._token)
+
+        async with self._lock:
+            # another waiter may have refreshed while we were queued
+            if self._is_fresh():
+                return cast(str, self._token)
+
+            requested_at = monotonic()
+            response = await self._openid.a_token(grant_type="client_credentials")
+            token = ClientToken.model_validate(response)
+            # never refresh more often than every half lifetime, even
+            # when the margin is misconfigured above the token lifetime
+            margin = min(self._refresh_margin, token.expires_in / 2)
+            self._token = token.access_token
+            self._expires_at = requested_at + token.expires_in - margin
+            logger.debug(f"Refreshed client token (expires in {token.expires_in}s)")
+            return token.access_token
+
+    def clear(self) -> None:
+        self._token = None
+        self._expires_at = 0.0
+
+
+client_token_provider = ClientTokenProvider(
+    kc_auth, refresh_margin=settings.KC_CLIENT_TOKEN_REFRESH_MARGIN_SECONDS
+)
+
+
+async def a_get_client_token() -> str:
+    try:
+        return await client_token_provider.get_token()
+    except Exception as error:
+        logger.error(f"Error retrieving client token {error}")
+        raise error
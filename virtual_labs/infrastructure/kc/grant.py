@@ -49,7 +49,10 @@ from pydantic import ConfigDict
 from virtual_labs.core.exceptions.api_error import VliError, VliErrorCode
 from virtual_labs.infrastructure.kc.auth import auth_header
 from virtual_labs.infrastructure.kc.config import kc_auth
+from virtual_labs.infrastructure.kc.jwks import a_decode_token as a_decode_token_locally
 from virtual_labs.infrastructure.kc.models import AuthUser
+from virtual_labs.infrastructure.kc.session_cache import a_userinfo_groups_cached
+from virtual_labs.infrastructure.settings import settings
 
 ResourceRole = Literal["admin", "member"]
 
@@ -336,6 +339,20 @@ class AuthUserGrants(AuthUser):
         return self.grants.services.is_admin(service)
 
 
+async def _a_resolve_claims(token: str) -> tuple[dict[str, Any], list[str]]:
+    """Verified token claims plus the user's Keycloak group paths."""
+    if settings.KC_TOKEN_VERIFICATION == "local":
+        claims = await a_decode_token_locally(token)
+        return claims, await a_userinfo_groups_cached(token, claims)
+
+    decoded, userinfo = await asyncio.gather(
+        kc_auth.a_decode_token(token=token, validate=True),
+        kc_auth.a_userinfo(token=token),
+    )
+    info = cast(dict[str, Any], userinfo)
+    return cast(dict[str, Any], decoded), list(info.get("groups") or [])
+
+
 # FastAPI dependency
 async def parse_auth_grants(
     header: HTTPAuthorizationCredentials = Depends(auth_header),
@@ -360,6 +377,12 @@ async def parse_auth_grants(
     `/userinfo` for a revoked or inactive token, so we get the same
     safety property as the introspection call in `a_verify_jwt`
     without a separate round-trip.
+
+    With `KC_TOKEN_VERIFICATION="local"` the signature is checked
+    against the cached realm JWKS and the `/userinfo` groups are cached
+    per session (see `session_cache.a_userinfo_groups_cached`), so a
+    revoked session is noticed within `KC_GRANTS_CACHE_SECONDS` and a
+    membership change made through `UserMutationRepository` immediately.
     """
     if not header:
         raise VliError(
@@ -372,10 +395,7 @@ async def parse_auth_grants(
     token = header.credentials
 
     try:
-        decoded, userinfo = await asyncio.gather(
-            kc_auth.a_decode_token(token=token, validate=True),
-            kc_auth.a_userinfo(token=token),
-        )
+        claims, groups = await _a_resolve_claims(token)
     except KeycloakError as exc:
         logger.error(
             "Keycloak rejected token during parse_auth_grants "
@@ -396,11 +416,7 @@ async def parse_auth_grants(
             details=str(exc),
         ) from exc
 
-    claims = cast(dict[str, Any], decoded)
-    info = cast(dict[str, Any], userinfo)
-    groups = info.get("groups") or []
-
-    claims["groups"] = list(groups)
+    claims["groups"] = groups
 
     try:
         user = AuthUserGrants(**claims)
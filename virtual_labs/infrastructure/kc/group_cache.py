@@ -0,0 +1,37 @@
+"""Cached Keycloak group members.
+
+`GroupQueryRepository.a_retrieve_group_users` reads through
+`group_members_cache` (keyed and tagged by group id) instead of going to
+the admin API on every member listing. Anything that changes a group's
+membership must call `invalidate_membership` (or, for whole groups,
+`invalidate_group_members`) once Keycloak has accepted the change: it
+drops the groups' member lists and the affected user's cached grants in
+every worker.
+"""
+
+import asyncio
+from uuid import UUID
+
+from virtual_labs.infrastructure.cache import TieredCache
+from virtual_labs.infrastructure.kc.session_cache import invalidate_user_grants
+from virtual_labs.infrastructure.settings import settings
+
+group_members_cache = TieredCache(
+    "kc-group-members",
+    maxsize=settings.KC_GROUP_MEMBERS_CACHE_MAX_ENTRIES,
+    ttl=settings.KC_GROUP_MEMBERS_CACHE_SECONDS,
+)
+
+
+async def invalidate_group_members(*group_ids: UUID | str) -> None:
+    await asyncio.gather(
+        *(group_members_cache.invalidate_tag(str(group_id)) for group_id in group_ids)
+    )
+
+
+async def invalidate_membership(user_id: UUID | str, *group_ids: UUID | str) -> None:
+    """Forget what changed when `user_id` joined or left `group_ids`."""
+    await asyncio.gather(
+        invalidate_user_grants(user_id),
+        invalidate_group_members(*group_ids),
+    )
@@ -0,0 +1,84 @@
+"""Cached realm JWKS used to verify token signatures locally.
+
+`KeycloakOpenID.a_decode_token(validate=True)` downloads the realm public
+key on every call unless a key is passed in. `JwksCache` keeps the
+realm's JSON Web Key Set in memory and refreshes it every
+`KC_JWKS_REFRESH_SECONDS`, so signature checks cost no network
+round-trip in the steady state.
+
+Key rotation is handled by `a_decode_token` below: a token signed with a
+`kid` we have not seen yet forces one refresh before it is rejected.
+Forced refreshes are throttled so a stream of forged `kid`s cannot turn
+into a stream of requests against Keycloak.
+"""
+
+import asyncio
+import json
+from time import monotonic
+from typing import Any, cast
+
+from jwcrypto.jwk import JWKSet
+from jwcrypto.jwt import JWTMissingKey
+from keycloak import KeycloakOpenID  # type: ignore[import-untyped]
+from loguru import logger
+
+from virtual_labs.infrastructure.kc.config import kc_auth
+from virtual_labs.infrastructure.settings import settings
+
+# Lower bound between two refreshes triggered by an unknown `kid`.
+_MIN_FORCED_REFRESH_SECONDS = 10.0
+
+
+class JwksCache:
+    __slots__ = ("_openid", "_refresh_seconds", "_keyset", "_fetched_at", "_lock")
+
+    def __init__(self, openid: KeycloakOpenID, refresh_seconds: float) -> None:
+        self._openid = openid
+        self._refresh_seconds = refresh_seconds
+        self._keyset: JWKSet | None = None
+        self._fetched_at = 0.0
+        self._lock = asyncio.Lock()
+
+    def _is_fresh(self, max_age: float) -> bool:
+        return self._keyset is not None and monotonic() - self._fetched_at < max_age
+
+    async def get_keyset(self, *, force: bool = False) -> JWKSet:
+        """Return the cached key set, fetching it when stale.
+
+        Concurrent callers that find the cache stale wait on the same
+        fetch instead of each issuing their own.
+        """
+        max_age = _MIN_FORCED_REFRESH_SECONDS if force else self._refresh_seconds
+        if self._is_fresh(max_age):
+            return cast(JWKSet, self._keyset)
+
+        async with self._lock:
+            # another waiter may have refreshed while we were queued
+            if self._is_fresh(max_age):
+                return cast(JWKSet, self._keyset)
+
+            certs = await self._openid.a_certs()
+            keyset = JWKSet.from_json(json.dumps(certs))
+            self._keyset = keyset
+            self._fetched_at = monotonic()
+            logger.debug(f"Refreshed realm JWKS ({len(keyset['keys'])} keys)")
+            return keyset
+
+    def clear(self) -> None:
+        self._keyset = None
+        self._fetched_at = 0.0
+
+
+jwks_cache = JwksCache(kc_auth, refresh_seconds=settings.KC_JWKS_REFRESH_SECONDS)
+
+
+async def a_decode_token(token: str) -> dict[str, Any]:
+    """Validate the token signature and standard claims against the
+    cached realm JWKS and return its payload."""
+    keyset = await jwks_cache.get_keyset()
+    try:
+        decoded = await kc_auth.a_decode_token(token=token, validate=True, key=keyset)
+    except JWTMissingKey:
+        keyset = await jwks_cache.get_keyset(force=True)
+        decoded = await kc_auth.a_decode_token(token=token, validate=True, key=keyset)
+    return cast(dict[str, Any], decoded)
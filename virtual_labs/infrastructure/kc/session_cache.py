@@ -0,0 +1,90 @@
+"""Per-token caches for Keycloak session lookups.
+
+Tokens are never used as cache keys directly: `token_fingerprint`
+hashes them so a heap dump or a debug log of the cache never leaks a
+usable bearer token. Every entry is bounded by the token's own `exp`,
+so a cached answer can never outlive the token it describes.
+"""
+
+from hashlib import sha256
+from time import time
+from typing import Any, cast
+from uuid import UUID
+
+from virtual_labs.infrastructure.cache import TieredCache, TTLCache
+from virtual_labs.infrastructure.kc.config import kc_auth
+from virtual_labs.infrastructure.settings import settings
+
+
+def token_fingerprint(token: str) -> str:
+    return sha256(token.encode("utf-8")).hexdigest()
+
+
+def seconds_until_expiry(claims: dict[str, Any]) -> float:
+    """Remaining lifetime of a decoded token, `0` when `exp` is missing."""
+    exp = claims.get("exp")
+    if not isinstance(exp, (int, float)):
+        return 0.0
+    return max(float(exp) - time(), 0.0)
+
+
+_introspection_cache: TTLCache[str, dict[str, Any]] = TTLCache(
+    maxsize=settings.KC_TOKEN_CACHE_MAX_ENTRIES,
+    ttl=settings.KC_INTROSPECTION_CACHE_SECONDS,
+)
+
+
+async def a_introspect_cached(token: str, claims: dict[str, Any]) -> dict[str, Any]:
+    """`kc_auth.a_introspect` memoized per token for at most
+    `KC_INTROSPECTION_CACHE_SECONDS` (and never past the token `exp`).
+
+    `claims` is the already-verified token payload, used only to bound
+    the entry lifetime.
+    """
+    key = token_fingerprint(token)
+    cached = _introspection_cache.get(key)
+    if cached is not None:
+        return cached
+
+    introspected = cast(dict[str, Any], await kc_auth.a_introspect(token=token))
+    _introspection_cache.set(key, introspected, ttl=seconds_until_expiry(claims))
+    return introspected
+
+
+# Keyed by session (`sid`) and tagged by user (`sub`) so membership
+# changes can drop every cached session of the affected user at once.
+_groups_cache = TieredCache(
+    "kc-groups",
+    maxsize=settings.KC_TOKEN_CACHE_MAX_ENTRIES,
+    ttl=settings.KC_GRANTS_CACHE_SECONDS,
+)
+
+
+def _session_key(token: str, claims: dict[str, Any]) -> str:
+    sid = claims.get("sid")
+    return str(sid) if sid else token_fingerprint(token)
+
+
+async def a_userinfo_groups_cached(token: str, claims: dict[str, Any]) -> list[str]:
+    """Keycloak group paths of the token's user, from `/userinfo`.
+
+    Cached per session for at most `KC_GRANTS_CACHE_SECONDS`, never past
+    the token `exp`, and dropped as soon as `invalidate_user_grants` is
+    called for the user.
+    """
+    sub = str(claims["sub"])
+    key = _session_key(token, claims)
+
+    cached = await _groups_cache.get(sub, key)
+    if cached is not None:
+        return cast(list[str], cached)
+
+    userinfo = cast(dict[str, Any], await kc_auth.a_userinfo(token=token))
+    groups = list(userinfo.get("groups") or [])
+    await _groups_cache.set(sub, key, groups, ttl=seconds_until_expiry(claims))
+    return groups
+
+
+async def invalidate_user_grants(user_id: UUID | str) -> None:
+    """Forget the cached group memberships of every session of a user."""
+    await _groups_cache.invalidate_tag(str(user_id))
@@ -1,46 +1,227 @@
-from typing import Optional, Union, cast
+"""Application-lifetime Redis client.
+
+Every caller shares one client over a bounded `BlockingConnectionPool`
+sized from settings; when the pool is exhausted callers wait up to
+`REDIS_POOL_TIMEOUT_SECONDS` for a connection instead of failing.
+`get_redis` does no I/O, so resolving it costs nothing on the request
+path. Liveness is probed by a background task started from the API
+lifespan (`open_redis`), which pings every
+`REDIS_HEALTH_CHECK_INTERVAL_SECONDS`, records the latency and drops
+idle connections after a failure so they are re-established. Code
+running outside of the lifespan (scripts) gets a lazily created client
+without the health check.
+"""
+
+import asyncio
+from contextlib import suppress
+from dataclasses import dataclass
+from time import monotonic, time
+from typing import Any, Optional, Union, cast
+from uuid import uuid4
 
 from fastapi import Depends
-from redis.asyncio import ConnectionPool, Redis
+from loguru import logger
+from redis.asyncio import BlockingConnectionPool, Redis
+from redis.asyncio.connection import AbstractConnection
 
 from virtual_labs.infrastructure.settings import settings
 
-# Singleton Redis client and connection pool (initialized lazily)
+
+class _CountingPool(BlockingConnectionPool):
+    """Counts the connections it opens and hands out, for the pool stats,
+    through the pool's overridable methods rather than its internals."""
+
+    def __init__(self, **kwargs: Any) -> None:
+        super().__init__(**kwargs)
+        self.created = 0
+        self.in_use = 0
+
+    def make_connection(self) -> AbstractConnection:
+        connection: AbstractConnection = super().make_connection()  # type: ignore[no-untyped-call]
+        self.created += 1
+        return connection
+
+    def get_available_connection(self) -> AbstractConnection:
+        connection: AbstractConnection = super().get_available_connection()  # type: ignore[no-untyped-call]
+        self.in_use += 1
+        return connection
+
+    async def release(self, connection: AbstractConnection) -> None:
+        await super().release(connection)
+        self.in_use -= 1
+
+
 _redis_client: Redis | None = None
-_connection_pool: ConnectionPool | None = None
+_connection_pool: _CountingPool | None = None
+_health_check_task: asyncio.Task[None] | None = None
 
 
-async def get_redis() -> Redis:
-    """Dependency to provide an async Redis client."""
-    global _redis_client, _connection_pool
+@dataclass(slots=True)
+class _Health:
+    healthy: bool = True
+    last_ping_ms: float | None = None
+    failed_pings: int = 0
 
-    redis_host = settings.REDIS_HOST
-    redis_port = settings.REDIS_PORT
 
-    if _connection_pool is None:
-        _connection_pool = ConnectionPool(
-            host=redis_host,
-            port=redis_port,
-            password=None,
-            decode_responses=True,
-        )
+_health = _Health()
+
+
+@dataclass(frozen=True, slots=True)
+class RedisPoolStats:
+    max_connections: int
+    connections: int
+    idle_connections: int
+    active_connections: int
+    healthy: bool
+    last_ping_ms: float | None
+    failed_pings: int
+
+
+def _build_pool() -> _CountingPool:
+    return _CountingPool(
+        host=settings.REDIS_HOST,
+        port=settings.REDIS_PORT,
+        password=None,
+        decode_responses=True,
+        max_connections=settings.REDIS_MAX_CONNECTIONS,
+        timeout=settings.REDIS_POOL_TIMEOUT_SECONDS,
+        socket_timeout=settings.REDIS_SOCKET_TIMEOUT_SECONDS,
+        socket_connect_timeout=settings.REDIS_CONNECT_TIMEOUT_SECONDS,
+    )
 
+
+def _get_client() -> Redis:
+    global _redis_client, _connection_pool
     if _redis_client is None:
-        _redis_client = Redis(
-            connection_pool=_connection_pool,
-            decode_responses=True,
-        )
+        _connection_pool = _build_pool()
+        _redis_client = Redis(connection_pool=_connection_pool)
+    return _redis_client
+
 
+async def get_redis() -> Redis:
+    """Dependency to provide the shared async Redis client."""
+    return _get_client()
+
+
+async def check_redis_health(client: Redis) -> bool:
+    """Ping `client` once and record the outcome in the pool stats."""
+    started = monotonic()
     try:
-        await _redis_client.ping()
-    except Exception:
-        await _redis_client.close()
-        _redis_client = Redis(
-            connection_pool=_connection_pool,
-            decode_responses=True,
+        await client.ping()
+    except Exception as error:  # noqa: BLE001
+        _health.failed_pings += 1
+        if _health.healthy:
+            logger.warning(f"Redis health check failed ({error})")
+        _health.healthy = False
+        if _connection_pool is not None:
+            # idle connections may be stale; in-use ones fail on their own
+            await _connection_pool.disconnect(inuse_connections=False)
+        return False
+
+    _health.last_ping_ms = (monotonic() - started) * 1000
+    if not _health.healthy:
+        logger.info("Redis is reachable again")
+    _health.healthy = True
+    return True
+
+
+async def _run_health_checks(client: Redis, interval: float) -> None:
+    while True:
+        await asyncio.sleep(interval)
+        await check_redis_health(client)
+
+
+async def open_redis() -> None:
+    global _health_check_task
+    client = _get_client()
+    await check_redis_health(client)
+    if _health_check_task is None:
+        _health_check_task = asyncio.create_task(
+            _run_health_checks(client, settings.REDIS_HEALTH_CHECK_INTERVAL_SECONDS)
         )
 
-    return _redis_client
+
+async def close_redis() -> None:
+    global _redis_client, _connection_pool, _health_check_task, _health
+    if _health_check_task is not None:
+        _health_check_task.cancel()
+        with suppress(asyncio.CancelledError):
+            await _health_check_task
+    if _redis_client is not None:
+        await _redis_client.aclose()
+    if _connection_pool is not None:
+        await _connection_pool.disconnect()
+    _redis_client = None
+    _connection_pool = None
+    _health_check_task = None
+    _health = _Health()
+
+
+def redis_pool_stats() -> RedisPoolStats:
+    connections = _connection_pool.created if _connection_pool else 0
+    active = _connection_pool.in_use if _connection_pool else 0
+    return RedisPoolStats(
+        max_connections=settings.REDIS_MAX_CONNECTIONS,
+        connections=connections,
+        idle_connections=connections - active,
+        active_connections=active,
+        healthy=_health.healthy,
+        last_ping_ms=_health.last_ping_ms,
+        failed_pings=_health.failed_pings,
+    )
+
+
+# KEYS[1] = counter; ARGV = limit, window (s).
+# Counts a hit unless the limit is reached; the window starts at the first hit.
+_FIXED_WINDOW_SCRIPT = """
+local count = tonumber(redis.call('GET', KEYS[1]) or '0')
+local allowed = 0
+if count < tonumber(ARGV[1]) then
+    count = redis.call('INCR', KEYS[1])
+    allowed = 1
+end
+local ttl = redis.call('TTL', KEYS[1])
+if allowed == 1 and count == 1 or ttl == -1 then
+    redis.call('EXPIRE', KEYS[1], ARGV[2])
+    ttl = tonumber(ARGV[2])
+end
+return {allowed, count, ttl}
+"""
+
+# KEYS[1] = sorted set of hit timestamps; ARGV = limit, window (ms), now (ms), member.
+# Counts a hit unless `limit` hits fall within the last `window`; the ttl is
+# the time until the oldest of them leaves the window.
+_SLIDING_WINDOW_SCRIPT = """
+local now = tonumber(ARGV[3])
+local window = tonumber(ARGV[2])
+redis.call('ZREMRANGEBYSCORE', KEYS[1], '-inf', now - window)
+local count = redis.call('ZCARD', KEYS[1])
+local allowed = 0
+if count < tonumber(ARGV[1]) then
+    redis.call('ZADD', KEYS[1], now, ARGV[4])
+    redis.call('PEXPIRE', KEYS[1], window)
+    count = count + 1
+    allowed = 1
+end
+local oldest = redis.call('ZRANGE', KEYS[1], 0, 0, 'WITHSCORES')
+local ttl = -2
+if oldest[2] then
+    ttl = math.ceil((tonumber(oldest[2]) + window - now) / 1000)
+end
+return {allowed, count, ttl}
+"""
+
+
+@dataclass(frozen=True, slots=True)
+class RateLimitResult:
+    allowed: bool
+    count: int
+    ttl: Optional[int]
+
+    @classmethod
+    def from_reply(cls, reply: list[int]) -> "RateLimitResult":
+        allowed, count, ttl = (int(value) for value in reply)
+        return cls(allowed=bool(allowed), count=count, ttl=ttl if ttl >= 0 else None)
 
 
 class RateLimiter:
@@ -49,6 +230,28 @@ class RateLimiter:
     def __init__(self, redis: Redis, prefix: str = "rate_limit"):
         self.redis = redis
         self.prefix = prefix
+        self._fixed_window = redis.register_script(_FIXED_WINDOW_SCRIPT)
+        self._sliding_window = redis.register_script(_SLIDING_WINDOW_SCRIPT)
+
+    async def hit_fixed_window(
+        self, key: str, limit: int, window_seconds: int
+    ) -> RateLimitResult:
+        """Count a hit on `key` unless it already has `limit` hits in the
+        window opened by its first hit. One atomic round-trip; the counter
+        stays a plain integer readable with `get_count`."""
+        reply = await self._fixed_window(keys=[key], args=[limit, window_seconds])
+        return RateLimitResult.from_reply(reply)
+
+    async def hit_sliding_window(
+        self, key: str, limit: int, window_seconds: int
+    ) -> RateLimitResult:
+        """Count a hit on `key` unless `limit` hits fall within the last
+        `window_seconds`. One atomic round-trip."""
+        reply = await self._sliding_window(
+            keys=[key],
+            args=[limit, window_seconds * 1000, int(time() * 1000), uuid4().hex],
+        )
+        return RateLimitResult.from_reply(reply)
 
     def build_key_by_email(
         self, action: str, user_id: str, virtual_lab_id: str, email: str
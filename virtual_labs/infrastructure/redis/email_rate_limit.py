@@ -38,14 +38,12 @@ async def rate_limit_initiate(
     user_id = auth[0].sub
     key = rl.build_key_by_email("initiate", user_id, str(virtual_lab_id), payload.email)
 
-    count = await rl.get_count(key)
-
-    if count is None:
-        await rl.set(key, 1, ttl=settings.INITIATE_LOCK_SECONDS)
-        return 1
+    result = await rl.hit_fixed_window(
+        key, settings.MAX_INIT_ATTEMPTS, settings.INITIATE_LOCK_SECONDS
+    )
 
-    if int(count) >= settings.MAX_INIT_ATTEMPTS:
-        remaining_seconds = await rl.get_ttl(key)
+    if not result.allowed:
+        remaining_seconds = result.ttl
         raise VliError(
             error_code=VliErrorCode.RATE_LIMIT_ERROR,
             http_status_code=status.TOO_MANY_REQUESTS,
@@ -60,8 +58,7 @@ async def rate_limit_initiate(
             },
         )
 
-    new_count = await rl.increment(key)
-    return new_count
+    return result.count
 
 
 async def rate_limit_verify(
@@ -76,14 +73,12 @@ async def rate_limit_verify(
         "verify", user_id, str(virtual_lab_id), payload.email
     )
 
-    count = await rl.get_count(verify_key)
-
-    if count is None or count == 0:
-        await rl.set(verify_key, 1, ttl=settings.VERIFY_LOCK_SECONDS)
-        return 1
+    result = await rl.hit_fixed_window(
+        verify_key, settings.MAX_VERIFY_ATTEMPTS, settings.VERIFY_LOCK_SECONDS
+    )
 
-    if int(count) >= settings.MAX_VERIFY_ATTEMPTS:
-        remaining_seconds = await rl.get_ttl(verify_key)
+    if not result.allowed:
+        remaining_seconds = result.ttl
         raise VliError(
             error_code=VliErrorCode.RATE_LIMIT_ERROR,
             http_status_code=status.TOO_MANY_REQUESTS,
@@ -98,5 +93,4 @@ async def rate_limit_verify(
             },
         )
 
-    new_count = await rl.increment(verify_key)
-    return new_count
+    return result.count
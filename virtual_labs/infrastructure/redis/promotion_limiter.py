@@ -23,8 +23,8 @@ def rate_limit_promotion_redemption(
     """
     Decorator to rate limit promotion code redemption attempts.
 
-    Limits users to a specific number of redemption attempts within a time window.
-    Tracks both successful and failed attempts.
+    Limits users to a specific number of redemption attempts within a sliding
+    time window. Tracks both successful and failed attempts.
 
     Args:
         max_attempts: Maximum number of attempts allowed (default: 3)
@@ -50,11 +50,19 @@ def rate_limit_promotion_redemption(
 
             user_id: UUID = get_user_id_from_auth(auth)
 
-            rate_limit_key = rate_limiter.build_universal_key("redeem", str(user_id))
-            current_count = await rate_limiter.get_count(rate_limit_key)
-
-            if current_count is not None and current_count >= max_attempts:
-                ttl = await rate_limiter.get_ttl(rate_limit_key)
+            # the sliding window is a sorted set; the "redeem" key may still
+            # hold a counter from the former fixed window
+            rate_limit_key = rate_limiter.build_universal_key(
+                "redeem_window", str(user_id)
+            )
+            # Every attempt counts, successful or not, so it is recorded
+            # before the redemption runs.
+            attempt = await rate_limiter.hit_sliding_window(
+                rate_limit_key, max_attempts, window_seconds
+            )
+
+            if not attempt.allowed:
+                ttl = attempt.ttl
                 remaining_minutes = (ttl // 60) if ttl is not None else 0
                 raise VliError(
                     error_code=VliErrorCode.LIMIT_EXCEEDED,
@@ -68,23 +76,7 @@ def rate_limit_promotion_redemption(
                     },
                 )
 
-            try:
-                result = await func(*args, **kwargs)
-
-                if current_count is None:
-                    await rate_limiter.set(rate_limit_key, 1, ttl=window_seconds)
-                else:
-                    await rate_limiter.increment(rate_limit_key)
-
-                return result
-
-            except Exception as e:
-                if current_count is None:
-                    await rate_limiter.set(rate_limit_key, 1, ttl=window_seconds)
-                else:
-                    await rate_limiter.increment(rate_limit_key)
-
-                raise e
+            return await func(*args, **kwargs)
 
         return wrapper
 
@@ -21,6 +21,8 @@ load_dotenv("")
 _ENVS = Literal["development", "testing", "staging", "production"]
 _BILLING_TAX_BEHAVIOR = Literal["exclusive"]
 _BILLING_TAX_MISSING_COUNTRY_MODE = Literal["block", "skip"]
+_KC_TOKEN_VERIFICATION = Literal["remote", "local"]
+_KC_BLOCKING_CALL_DETECTION = Literal["off", "warn", "raise"]
 
 
 def _is_valid_env(env: str | None) -> TypeGuard[_ENVS]:
@@ -65,6 +67,26 @@ class Settings(BaseSettings):
     LANDING_NAMESPACE: str = "https://openbraininstitute.org"
     VLAB_ADMIN_PATH: str = "/app/virtual-lab/sync"
 
+    # "remote" fetches the realm key and introspects every token against
+    # Keycloak; "local" verifies signatures against a cached JWKS and only
+    # re-introspects a session once per KC_INTROSPECTION_CACHE_SECONDS.
+    KC_TOKEN_VERIFICATION: _KC_TOKEN_VERIFICATION = "local"
+    KC_JWKS_REFRESH_SECONDS: int = 300
+    KC_INTROSPECTION_CACHE_SECONDS: int = 30
+    KC_GRANTS_CACHE_SECONDS: int = 60
+    KC_TOKEN_CACHE_MAX_ENTRIES: int = 10_000
+    KC_CLIENT_TOKEN_REFRESH_MARGIN_SECONDS: int = 30
+    KC_USER_LOOKUP_CONCURRENCY: int = 10
+    KC_USER_LOOKUP_CACHE_SECONDS: int = 30
+    KC_GROUP_LOOKUP_CONCURRENCY: int = 10
+    KC_GROUP_MEMBERS_CACHE_SECONDS: int = 60
+    KC_GROUP_MEMBERS_CACHE_MAX_ENTRIES: int = 5_000
+    # Flags sync python-keycloak calls made on the event loop (see
+    # infrastructure/kc/blocking.py); on by default outside of deployments.
+    KC_BLOCKING_CALL_DETECTION: _KC_BLOCKING_CALL_DETECTION = (
+        "warn" if _DEPLOYMENT_ENV in ("development", "testing") else "off"
+    )
+
     MAIL_USERNAME: str = "dummyusername"
     MAIL_PASSWORD: SecretStr = SecretStr("dummypassword")
     MAIL_FROM: EmailStr = "obp@bbp.org"
@@ -75,6 +97,19 @@ class Settings(BaseSettings):
     MAIL_SSL_TLS: bool = False
     USE_CREDENTIALS: bool = True
     VALIDATE_CERTS: bool = False
+    MAIL_POOL_SIZE: int = 4
+    MAIL_POOL_IDLE_SECONDS: float = 60.0
+    # Queue emails in Redis (infrastructure/email/queue.py); sent inline
+    # under testing, where tests read invites off the mail server at once.
+    EMAIL_QUEUE_ENABLED: bool = _DEPLOYMENT_ENV != "testing"
+    EMAIL_QUEUE_BATCH_SIZE: int = 50
+    EMAIL_QUEUE_POLL_INTERVAL_SECONDS: float = 2.0
+    EMAIL_QUEUE_LEASE_SECONDS: float = 120.0
+    EMAIL_QUEUE_MAX_ATTEMPTS: int = 6
+    EMAIL_QUEUE_RETRY_BASE_SECONDS: float = 30.0
+    EMAIL_QUEUE_RETRY_MAX_SECONDS: float = 3600.0
+    EMAIL_QUEUE_RETENTION_SECONDS: int = 7 * 24 * 3600
+    EMAIL_QUEUE_DEAD_LETTER_MAX: int = 1000
 
     INVITE_JWT_SECRET: str = "TEST_JWT_SECRET"
     INVITE_WEBHOOK_SECRET: str = ""
@@ -86,6 +121,16 @@ class Settings(BaseSettings):
     STRIPE_WEBHOOK_SECRET: str = getenv("STRIPE_WEBHOOK_SECRET", "")
     STRIPE_API_VERSION: str = "2024-04-10"
     STRIPE_CREDIT_TAX_CODE: str | None = None
+    STRIPE_OBJECT_CACHE_SECONDS: float = 10.0
+    STRIPE_OBJECT_CACHE_MAX_ENTRIES: int = 1000
+    POST_COMMIT_CONCURRENCY: int = 8
+    POST_COMMIT_ACTION_TIMEOUT_SECONDS: float = 30.0
+    OUTBOX_BATCH_SIZE: int = 50
+    OUTBOX_POLL_INTERVAL_SECONDS: float = 5.0
+    OUTBOX_LEASE_SECONDS: float = 300.0
+    OUTBOX_MAX_ATTEMPTS: int = 12
+    OUTBOX_RETRY_BASE_SECONDS: float = 5.0
+    OUTBOX_RETRY_MAX_SECONDS: float = 3600.0
 
     BILLING_TAX_ENABLED: bool = True
     BILLING_TAX_ENABLED_COUNTRIES: str = "CH"
@@ -100,8 +145,20 @@ class Settings(BaseSettings):
     BILLING_BLOCK_CH_COUNTRY_MISMATCH: bool = True
 
     ACCOUNTING_BASE_URL: str | None = None
+    ACCOUNTING_HTTP2: bool = True
+    ACCOUNTING_MAX_CONNECTIONS: int = 50
+    ACCOUNTING_MAX_KEEPALIVE_CONNECTIONS: int = 20
+    ACCOUNTING_KEEPALIVE_EXPIRY_SECONDS: float = 30.0
+    ACCOUNTING_CONNECT_TIMEOUT_SECONDS: float = 5.0
+    ACCOUNTING_READ_TIMEOUT_SECONDS: float = 30.0
+    ACCOUNTING_POOL_TIMEOUT_SECONDS: float = 10.0
     CREDITS_PER_SEAT: int = 200
     SEAT_EXPIRY_DAYS: int = 365
+    SEAT_ASSIGNMENT_CONCURRENCY: int = 8
+    COURSE_EXPIRY_CONCURRENCY: int = 10
+    COURSE_EXPIRY_BATCH_SIZE: int = 200
+    COURSE_EXPIRY_ATTEMPTS: int = 3
+    COURSE_EXPIRY_RETRY_DELAY_SECONDS: float = 1.0
 
     SENTRY_DSN: str | None = None
     SENTRY_TRACES_SAMPLE_RATE: Annotated[float, Field(ge=0, le=1)] = 0.1
@@ -109,6 +166,11 @@ class Settings(BaseSettings):
 
     REDIS_HOST: str = "localhost"
     REDIS_PORT: int = 6379
+    REDIS_MAX_CONNECTIONS: int = 50
+    REDIS_POOL_TIMEOUT_SECONDS: int = 5
+    REDIS_SOCKET_TIMEOUT_SECONDS: float = 5.0
+    REDIS_CONNECT_TIMEOUT_SECONDS: float = 2.0
+    REDIS_HEALTH_CHECK_INTERVAL_SECONDS: float = 15.0
 
     MAX_INIT_ATTEMPTS: int = 3
     MAX_VERIFY_ATTEMPTS: int = 5
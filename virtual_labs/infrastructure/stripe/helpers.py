@@ -89,6 +89,12 @@ def resource_id_from_event(event: stripe.Event) -> str | None:
     return _id_from_expandable(obj) if obj is not None else None
 
 
+def event_created_at(event: stripe.Event) -> int | None:
+    """Unix time (seconds) at which Stripe created the event, if known."""
+    created = _field(event, "created")
+    return int(created) if created is not None else None
+
+
 def is_standalone_event(event: stripe.Event) -> bool:
     """Truthy `metadata.standalone` on the event's primary object.
 
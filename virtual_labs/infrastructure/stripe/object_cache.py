@@ -0,0 +1,80 @@
+"""Short-lived, per-worker cache of Stripe objects retrieved by the webhook.
+
+A renewal produces a burst of events (`customer.subscription.updated`,
+`invoice.paid`, `invoice.payment_succeeded`, ...) whose handlers all
+retrieve the same subscription, invoice and customer. `StripeObjectCache`
+lets them share one retrieval: concurrent requests for an object wait on
+the same in-flight call, and a finished retrieval is reused for
+`STRIPE_OBJECT_CACHE_SECONDS`.
+
+Handlers are resource-first (events can race), so an object is only
+reused for an event when it was requested *after* that event was
+created: it then reflects at least the state the event reports, exactly
+like a fresh retrieval would. Failed retrievals (`None`) are not cached.
+"""
+
+import asyncio
+from time import time
+from typing import Any, Awaitable, Callable, TypeVar, cast
+
+from virtual_labs.infrastructure.cache import CacheStats, TTLCache
+from virtual_labs.infrastructure.settings import settings
+
+T = TypeVar("T")
+
+
+class StripeObjectCache:
+    __slots__ = ("_entries", "_inflight", "_hits", "_misses")
+
+    def __init__(self, *, maxsize: int, ttl: float) -> None:
+        # value: (requested_at, object)
+        self._entries: TTLCache[str, tuple[float, Any]] = TTLCache(
+            maxsize=maxsize, ttl=ttl
+        )
+        self._inflight: dict[str, tuple[float, asyncio.Future[Any]]] = {}
+        self._hits = 0
+        self._misses = 0
+
+    async def get_or_fetch(
+        self,
+        key: str,
+        fetch: Callable[[], Awaitable[T | None]],
+        *,
+        not_before: float,
+    ) -> T | None:
+        """Return the object cached under `key` if it was requested at or
+        after `not_before` (unix time), else retrieve it with `fetch`."""
+        entry = self._entries.get(key)
+        if entry is not None and entry[0] >= not_before:
+            self._hits += 1
+            return cast(T, entry[1])
+
+        inflight = self._inflight.get(key)
+        if inflight is not None and inflight[0] >= not_before:
+            self._hits += 1
+            return cast(T | None, await asyncio.shield(inflight[1]))
+
+        self._misses += 1
+        requested_at = time()
+        future: asyncio.Future[Any] = asyncio.ensure_future(fetch())
+        self._inflight[key] = (requested_at, future)
+        try:
+            value = await asyncio.shield(future)
+        finally:
+            if self._inflight.get(key, (0.0, None))[1] is future:
+                del self._inflight[key]
+        if value is not None:
+            self._entries.set(key, (requested_at, value))
+        return cast(T | None, value)
+
+    def clear(self) -> None:
+        self._entries.clear()
+
+    def stats(self) -> CacheStats:
+        return CacheStats(hits=self._hits, misses=self._misses, size=len(self._entries))
+
+
+stripe_object_cache = StripeObjectCache(
+    maxsize=settings.STRIPE_OBJECT_CACHE_MAX_ENTRIES,
+    ttl=settings.STRIPE_OBJECT_CACHE_SECONDS,
+)
@@ -0,0 +1,285 @@
+"""Transactional outbox for the Stripe webhook's side effects.
+
+Keycloak, accounting and Stripe Tax calls triggered by a webhook event
+are not run inline. `OutboxBatch` stages them as `outbox_message` rows
+in the event's own DB transaction, so they commit (or roll back)
+together with the subscription / payment changes. The webhook then
+acknowledges Stripe without waiting on any of them.
+
+`OutboxDrainer` runs in the background (started from `api.lifespan`).
+It claims due messages under a lease with `FOR UPDATE SKIP LOCKED`, so
+several app instances can drain side by side. Handlers run concurrently
+(`POST_COMMIT_CONCURRENCY`, each bounded by
+`POST_COMMIT_ACTION_TIMEOUT_SECONDS`). A message is then marked done,
+or rescheduled with exponential backoff until `OUTBOX_MAX_ATTEMPTS`,
+after which it is parked as dead for inspection. A crash mid-delivery
+only delays a message until its lease expires.
+
+Delivery is at least once. The idempotency key deduplicates staging, so
+a redelivered event or an invoice seen twice does not queue a second
+accounting top-up. Messages sharing an ordering key (a user's plan or
+tier) are delivered one at a time, in the order they were staged.
+"""
+
+import asyncio
+from collections.abc import Awaitable, Callable, Mapping
+from contextlib import AbstractAsyncContextManager, suppress
+from dataclasses import dataclass, field
+from datetime import datetime, timedelta
+from decimal import Decimal
+from enum import StrEnum
+from typing import Any
+from uuid import UUID
+
+from loguru import logger
+from sqlalchemy import Row, exists, func, select, update
+from sqlalchemy.dialects.postgresql import insert
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import aliased
+from sqlalchemy.sql.dml import Update
+
+import virtual_labs.external.accounting as accounting_service
+from virtual_labs.infrastructure.db.config import session_pool
+from virtual_labs.infrastructure.db.models import OutboxMessage, OutboxStatus
+from virtual_labs.infrastructure.settings import settings
+from virtual_labs.repositories.stripe_repo import StripeRepository
+from virtual_labs.repositories.subscription_repo import SubscriptionRepository
+from virtual_labs.repositories.user_repo import UserMutationRepository
+
+OutboxHandler = Callable[[dict[str, Any]], Awaitable[None]]
+SessionFactory = Callable[[], AbstractAsyncContextManager[AsyncSession]]
+
+
+class OutboxEffect(StrEnum):
+    KEYCLOAK_PLAN = "keycloak_plan"
+    TIER_TRANSITION = "tier_transition"
+    ACCOUNTING_TOP_UP = "accounting_top_up"
+    ACCOUNTING_DISCOUNT = "accounting_discount"
+    STRIPE_TAX_COMMIT = "stripe_tax_commit"
+
+
+@dataclass(slots=True)
+class OutboxBatch:
+    """Side effects of one webhook event, staged with its transaction."""
+
+    source: str
+    messages: list[dict[str, Any]] = field(default_factory=list)
+
+    def add(
+        self,
+        effect: OutboxEffect,
+        payload: dict[str, Any],
+        *,
+        key: str | None = None,
+        ordering_key: str | None = None,
+    ) -> None:
+        """Queue `effect`; `key` identifies it across redeliveries and
+        defaults to the source event."""
+        self.messages.append(
+            {
+                "effect": effect.value,
+                "payload": payload,
+                "idempotency_key": f"{effect.value}:{key or self.source}",
+                "ordering_key": ordering_key,
+                "status": OutboxStatus.PENDING,
+                "attempts": 0,
+            }
+        )
+
+    async def stage(self, db_session: AsyncSession) -> None:
+        """Insert the queued messages; call inside the event's transaction."""
+        if not self.messages:
+            return
+        await db_session.execute(
+            insert(OutboxMessage)
+            .values(self.messages)
+            .on_conflict_do_nothing(index_elements=[OutboxMessage.idempotency_key])
+        )
+
+
+# Effect handlers: raise to have the message retried
+
+
+async def _update_keycloak_plan(payload: dict[str, Any]) -> None:
+    await UserMutationRepository().update_user_custom_properties(
+        user_id=UUID(payload["user_id"]),
+        properties=[("plan", payload["plan"], "multiple")],
+    )
+
+
+async def _transition_tier(payload: dict[str, Any]) -> None:
+    user_id = UUID(payload["user_id"])
+    async with session_pool.session() as session:
+        repository = SubscriptionRepository(session)
+        if payload["downgrade"]:
+            await repository.downgrade_to_free(user_id=user_id)
+        else:
+            await repository.deactivate_free_subscription(user_id=user_id)
+
+
+async def _top_up_budget(payload: dict[str, Any]) -> None:
+    await accounting_service.top_up_virtual_lab_budget(
+        UUID(payload["virtual_lab_id"]), float(payload["amount"])
+    )
+
+
+async def _create_discount(payload: dict[str, Any]) -> None:
+    await accounting_service.create_virtual_lab_discount(
+        virtual_lab_id=UUID(payload["virtual_lab_id"]),
+        discount=Decimal(payload["discount"]),
+        valid_from=datetime.fromisoformat(payload["valid_from"]),
+        valid_to=datetime.fromisoformat(payload["valid_to"]),
+    )
+
+
+async def _commit_tax_transaction(payload: dict[str, Any]) -> None:
+    await StripeRepository().commit_tax_transaction(
+        calculation_id=payload["calculation_id"],
+        reference=payload["reference"],
+    )
+
+
+EFFECT_HANDLERS: Mapping[str, OutboxHandler] = {
+    OutboxEffect.KEYCLOAK_PLAN: _update_keycloak_plan,
+    OutboxEffect.TIER_TRANSITION: _transition_tier,
+    OutboxEffect.ACCOUNTING_TOP_UP: _top_up_budget,
+    OutboxEffect.ACCOUNTING_DISCOUNT: _create_discount,
+    OutboxEffect.STRIPE_TAX_COMMIT: _commit_tax_transaction,
+}
+
+
+def _claim(limit: int) -> Update:
+    """Lease up to `limit` due messages, skipping rows another drainer
+    holds and messages queued behind an older one with the same
+    ordering key."""
+    older = aliased(OutboxMessage)
+    queued_behind = exists().where(
+        older.ordering_key == OutboxMessage.ordering_key,
+        older.status == OutboxStatus.PENDING,
+        older.id < OutboxMessage.id,
+    )
+    due = (
+        select(OutboxMessage.id)
+        .where(
+            OutboxMessage.status == OutboxStatus.PENDING,
+            OutboxMessage.available_at <= func.now(),
+            ~queued_behind,
+        )
+        .order_by(OutboxMessage.available_at)
+        .limit(limit)
+        .with_for_update(skip_locked=True)
+    )
+    return (
+        update(OutboxMessage)
+        .where(OutboxMessage.id.in_(due))
+        .values(
+            attempts=OutboxMessage.attempts + 1,
+            available_at=func.now() + timedelta(seconds=settings.OUTBOX_LEASE_SECONDS),
+        )
+        .returning(
+            OutboxMessage.id,
+            OutboxMessage.effect,
+            OutboxMessage.payload,
+            OutboxMessage.attempts,
+        )
+        .execution_options(synchronize_session=False)
+    )
+
+
+def _backoff_seconds(attempts: int) -> float:
+    delay: float = settings.OUTBOX_RETRY_BASE_SECONDS * 2 ** (attempts - 1)
+    return min(delay, settings.OUTBOX_RETRY_MAX_SECONDS)
+
+
+def _settle(message: Row[Any], error: str | None) -> Update:
+    statement = (
+        update(OutboxMessage)
+        .where(OutboxMessage.id == message.id)
+        .execution_options(synchronize_session=False)
+    )
+    if error is None:
+        return statement.values(
+            status=OutboxStatus.DONE, processed_at=func.now(), last_error=None
+        )
+    if message.attempts >= settings.OUTBOX_MAX_ATTEMPTS:
+        logger.error(
+            f"Outbox message {message.id} ({message.effect}) gave up after "
+            f"{message.attempts} attempts: {error}"
+        )
+        return statement.values(
+            status=OutboxStatus.DEAD, processed_at=func.now(), last_error=error
+        )
+    delay = _backoff_seconds(message.attempts)
+    logger.warning(
+        f"Outbox message {message.id} ({message.effect}) failed, "
+        f"retrying in {delay:.0f}s: {error}"
+    )
+    return statement.values(
+        available_at=func.now() + timedelta(seconds=delay), last_error=error
+    )
+
+
+class OutboxDrainer:
+    def __init__(
+        self,
+        handlers: Mapping[str, OutboxHandler] = EFFECT_HANDLERS,
+        session_factory: SessionFactory | None = None,
+    ) -> None:
+        self.handlers = handlers
+        self.session_factory = session_factory or session_pool.session
+        self._wakeup = asyncio.Event()
+
+    def notify(self) -> None:
+        """Drain now instead of at the next poll (new messages committed)."""
+        self._wakeup.set()
+
+    async def run(self) -> None:
+        """Drain until cancelled: back-to-back while full batches come
+        in, otherwise on `notify` or every `OUTBOX_POLL_INTERVAL_SECONDS`."""
+        while True:
+            try:
+                drained = await self.drain_once()
+            except asyncio.CancelledError:
+                raise
+            except Exception as error:
+                logger.warning(f"Outbox drain failed ({error})")
+                drained = 0
+            if drained >= settings.OUTBOX_BATCH_SIZE:
+                continue
+            with suppress(TimeoutError):
+                async with asyncio.timeout(settings.OUTBOX_POLL_INTERVAL_SECONDS):
+                    await self._wakeup.wait()
+            self._wakeup.clear()
+
+    async def drain_once(self) -> int:
+        """Deliver one batch of due messages; returns how many were claimed."""
+        async with self.session_factory() as session, session.begin():
+            claimed = (await session.execute(_claim(settings.OUTBOX_BATCH_SIZE))).all()
+        if not claimed:
+            return 0
+
+        slots = asyncio.Semaphore(settings.POST_COMMIT_CONCURRENCY)
+        errors = await asyncio.gather(
+            *(self._deliver(message, slots) for message in claimed)
+        )
+
+        async with self.session_factory() as session, session.begin():
+            for message, error in zip(claimed, errors):
+                await session.execute(_settle(message, error))
+        return len(claimed)
+
+    async def _deliver(self, message: Row[Any], slots: asyncio.Semaphore) -> str | None:
+        handler = self.handlers.get(message.effect)
+        if handler is None:
+            # e.g. staged by a newer release during a rolling deploy
+            return f"No handler for outbox effect {message.effect!r}"
+        async with slots:
+            try:
+                async with asyncio.timeout(settings.POST_COMMIT_ACTION_TIMEOUT_SECONDS):
+                    await handler(message.payload)
+            except Exception as exc:
+                return f"{type(exc).__name__}: {exc}"
+        return None
+
+
+outbox_drainer = OutboxDrainer()
@@ -1,9 +1,11 @@
 from __future__ import annotations
 
-from collections.abc import Awaitable
+import asyncio
+import time
+from collections.abc import Awaitable, Hashable, Iterable
 from dataclasses import dataclass, field
 from datetime import datetime
-from typing import Callable
+from typing import Callable, Literal
 from uuid import UUID
 
 from loguru import logger
@@ -12,8 +14,10 @@ from virtual_labs.infrastructure.db.models import (
     SubscriptionStatus,
     SubscriptionType,
 )
+from virtual_labs.infrastructure.settings import settings
 
 PostCommitRunner = Callable[[], Awaitable[None]]
+PostCommitStatus = Literal["ok", "failed", "timed_out"]
 
 
 @dataclass(frozen=True, slots=True)
@@ -110,6 +114,21 @@ class SubscriptionFields:
     default_payment_method: str | None
 
 
+@dataclass(frozen=True, slots=True)
+class PostCommitAction:
+    name: str
+    runner: PostCommitRunner
+    after: tuple[str, ...]
+    timeout: float | None
+
+
+@dataclass(frozen=True, slots=True)
+class PostCommitOutcome:
+    name: str
+    status: PostCommitStatus
+    duration: float
+
+
 @dataclass(slots=True)
 class PostCommitActions:
     """Side-effects to run after the DB transaction commits successfully.
@@ -117,16 +136,108 @@ class PostCommitActions:
     Failures of individual actions are logged but do not roll back the
     already-committed DB state. This matches today's behavior where Keycloak
     and accounting calls are best-effort relative to the DB write.
-    """
 
-    actions: list[PostCommitRunner] = field(default_factory=list)
-
-    def add(self, action: PostCommitRunner) -> None:
-        self.actions.append(action)
+    Actions run concurrently (at most `max_concurrency` at a time), each
+    bounded by its timeout, so the caller waits for the slowest action
+    rather than for the sum of all of them. `after` names actions that
+    must finish first; actions sharing a `serial` key (e.g. the request's
+    DB session, which cannot be used concurrently) run one at a time in
+    the order they were added.
+    """
 
-    async def run(self) -> None:
-        for action in self.actions:
+    actions: list[PostCommitAction] = field(default_factory=list)
+    max_concurrency: int = field(
+        default_factory=lambda: settings.POST_COMMIT_CONCURRENCY
+    )
+    timeout: float | None = field(
+        default_factory=lambda: settings.POST_COMMIT_ACTION_TIMEOUT_SECONDS
+    )
+    _serial_tails: dict[Hashable, str] = field(default_factory=dict, repr=False)
+
+    def add(
+        self,
+        action: PostCommitRunner,
+        *,
+        name: str | None = None,
+        after: Iterable[str] = (),
+        serial: Hashable | None = None,
+        timeout: float | None = None,
+    ) -> str:
+        """Queue `action` and return its name, for use in a later `after`."""
+        known = {queued.name for queued in self.actions}
+        name = (
+            name or f"{len(self.actions)}:{getattr(action, '__qualname__', 'action')}"
+        )
+        if name in known:
+            raise ValueError(f"Duplicate post-commit action {name!r}")
+        # dependencies must already be queued, so the graph is acyclic
+        dependencies = tuple(dict.fromkeys(after))
+        unknown = [dependency for dependency in dependencies if dependency not in known]
+        if unknown:
+            raise ValueError(
+                f"Post-commit action {name!r} depends on unknown {unknown}"
+            )
+
+        if serial is not None:
+            tail = self._serial_tails.get(serial)
+            if tail is not None and tail not in dependencies:
+                dependencies += (tail,)
+            self._serial_tails[serial] = name
+
+        self.actions.append(
+            PostCommitAction(
+                name=name,
+                runner=action,
+                after=dependencies,
+                timeout=self.timeout if timeout is None else timeout,
+            )
+        )
+        return name
+
+    async def run(self) -> list[PostCommitOutcome]:
+        if not self.actions:
+            return []
+
+        finished = {action.name: asyncio.Event() for action in self.actions}
+        slots = asyncio.Semaphore(self.max_concurrency)
+        started = time.perf_counter()
+
+        async def _run_when_ready(action: PostCommitAction) -> PostCommitOutcome:
             try:
-                await action()
-            except Exception as exc:
-                logger.warning(f"Post-commit action failed: {exc}")
+                for dependency in action.after:
+                    await finished[dependency].wait()
+                async with slots:
+                    return await _run_action(action)
+            finally:
+                finished[action.name].set()
+
+        outcomes = await asyncio.gather(
+            *(_run_when_ready(action) for action in self.actions)
+        )
+        logger.debug(
+            f"Post-commit actions finished in {time.perf_counter() - started:.3f}s: "
+            + ", ".join(
+                f"{outcome.name}={outcome.status}/{outcome.duration:.3f}s"
+                for outcome in outcomes
+            )
+        )
+        return list(outcomes)
+
+
+async def _run_action(action: PostCommitAction) -> PostCommitOutcome:
+    status: PostCommitStatus = "ok"
+    started = time.perf_counter()
+    try:
+        async with asyncio.timeout(action.timeout):
+            await action.runner()
+    except TimeoutError:
+        status = "timed_out"
+        logger.warning(
+            f"Post-commit action {action.name} timed out after {action.timeout}s"
+        )
+    except Exception as exc:
+        status = "failed"
+        logger.warning(f"Post-commit action failed: {exc}")
+    return PostCommitOutcome(
+        name=action.name, status=status, duration=time.perf_counter() - started
+    )
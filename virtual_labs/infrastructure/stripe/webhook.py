@@ -1,8 +1,10 @@
 from __future__ import annotations
 
+import asyncio
 from datetime import datetime, timezone
+from time import time
 from typing import Any, Awaitable, Callable, cast
-from uuid import UUID
+from uuid import UUID, uuid4
 
 import stripe
 from loguru import logger
@@ -29,16 +31,20 @@ from virtual_labs.infrastructure.stripe.mapping import (
     apply_subscription_fields,
     map_stripe_subscription_to_db,
 )
+from virtual_labs.infrastructure.stripe.object_cache import stripe_object_cache
+from virtual_labs.infrastructure.stripe.outbox import (
+    OutboxBatch,
+    OutboxEffect,
+    outbox_drainer,
+)
 from virtual_labs.infrastructure.stripe.types import (
     InvoiceAmounts,
     PaymentIntentAmounts,
-    PostCommitActions,
 )
 from virtual_labs.repositories.labs import get_user_virtual_lab
 from virtual_labs.repositories.stripe_repo import StripeRepository
 from virtual_labs.repositories.stripe_user_repo import StripeUserQueryRepository
 from virtual_labs.repositories.subscription_repo import SubscriptionRepository
-from virtual_labs.repositories.user_repo import UserMutationRepository
 from virtual_labs.services.credit_converter import CreditConverter
 from virtual_labs.utils.subscription_type_resolver import resolve_tier
 
@@ -57,6 +63,9 @@ _PAYMENT_INTENT_EXPAND: list[str] = [
     "invoice",
 ]
 
+# (subscription id, payment intent id, customer id) referenced by an invoice
+_InvoiceReferences = tuple[str | None, str | None, str | None]
+
 EventHandler = Callable[[stripe.Event, AsyncSession], Awaitable[dict[str, Any]]]
 
 
@@ -64,8 +73,9 @@ class StripeWebhook:
     """Process Stripe webhook events with typed extraction and per-event atomicity.
 
     Each event handler runs inside a single DB transaction. External side
-    effects (Keycloak, accounting) are queued and executed only after the
-    transaction commits successfully.
+    effects (Keycloak, accounting, Stripe Tax) are staged into the outbox
+    in that same transaction and delivered by the outbox drainer once it
+    commits (see `infrastructure.stripe.outbox`).
     """
 
     subscription_update_events = helpers.SUBSCRIPTION_UPDATE_EVENTS
@@ -87,7 +97,6 @@ class StripeWebhook:
         self.stripe_user_repository = stripe_user_repository
         self.credit_converter = credit_converter
         self.redis = redis
-        self.kc_user = UserMutationRepository()
 
         self._handlers: dict[str, EventHandler] = {
             **{
@@ -185,19 +194,22 @@ class StripeWebhook:
 
         # Fetch *before* opening the DB transaction so the connection
         # isn't held across a Stripe round-trip.
-        stripe_subscription = await self._fetch_subscription(subscription_id)
+        stripe_subscription = await self._fetch_subscription(
+            subscription_id, not_before=_fetch_not_before(event_json)
+        )
         if stripe_subscription is None:
             return {"status": "error", "message": "Subscription not found in Stripe"}
 
-        deferred = PostCommitActions()
+        effects = _outbox_batch(event_json)
         async with db_session.begin():
             staged = await self._stage_subscription_upsert(
                 stripe_subscription=stripe_subscription,
                 event_obj=event_obj,
                 user_id_from_metadata=user_id_from_metadata,
                 db_session=db_session,
-                deferred=deferred,
+                effects=effects,
             )
+            await effects.stage(db_session)
         if staged is None:
             return {
                 "status": "error",
@@ -205,7 +217,7 @@ class StripeWebhook:
                 "subscription_id": subscription_id,
                 "message": "Subscription not staged (missing user_id)",
             }
-        await deferred.run()
+        outbox_drainer.notify()
 
         return {
             "status": "success",
@@ -231,11 +243,13 @@ class StripeWebhook:
             logger.warning(f"No subscription ID found in event: {event_type}")
             return {"status": "error", "message": "No subscription ID in event"}
 
-        stripe_subscription = await self._fetch_subscription(subscription_id)
+        stripe_subscription = await self._fetch_subscription(
+            subscription_id, not_before=_fetch_not_before(event_json)
+        )
         # Stripe may already have purged a deleted subscription; fall back
         # to the inlined event payload for terminal stamping.
         live = stripe_subscription if stripe_subscription is not None else event_obj
-        deferred = PostCommitActions()
+        effects = _outbox_batch(event_json)
         async with db_session.begin():
             subscription = await self._find_local_subscription(
                 db_session, subscription_id, user_id=None
@@ -261,11 +275,12 @@ class StripeWebhook:
                 subscription.canceled_at = canceled_at
 
             self._queue_subscription_keycloak_and_tier(
-                deferred, subscription, is_terminal=True
+                effects, subscription, is_terminal=True
             )
             db_session.add(subscription)
+            await effects.stage(db_session)
 
-        await deferred.run()
+        outbox_drainer.notify()
 
         return {
             "status": "success",
@@ -279,7 +294,7 @@ class StripeWebhook:
         event_obj: stripe.Subscription,
         user_id_from_metadata: str | None,
         db_session: AsyncSession,
-        deferred: PostCommitActions,
+        effects: OutboxBatch,
     ) -> PaidSubscription | None:
         """Single staging path for create / update / pending_* events.
 
@@ -334,7 +349,7 @@ class StripeWebhook:
         # function.
         is_terminal = subscription.status != SubscriptionStatus.ACTIVE
         self._queue_subscription_keycloak_and_tier(
-            deferred, subscription, is_terminal=is_terminal
+            effects, subscription, is_terminal=is_terminal
         )
 
         db_session.add(subscription)
@@ -404,32 +419,29 @@ class StripeWebhook:
 
     def _queue_subscription_keycloak_and_tier(
         self,
-        deferred: PostCommitActions,
+        effects: OutboxBatch,
         subscription: PaidSubscription,
         *,
         is_terminal: bool,
     ) -> None:
-        user_id = subscription.user_id
+        user_id = str(subscription.user_id)
         tier_label: SubscriptionTierEnum | None = (
             SubscriptionTierEnum.FREE
             if is_terminal
             else resolve_tier(subscription.subscription_type)
         )
-        db_action: Callable[..., Awaitable[Any]] = (
-            self.subscription_repository.downgrade_to_free
-            if is_terminal
-            else self.subscription_repository.deactivate_free_subscription
-        )
 
-        deferred.add(
-            _wrap(
-                self.kc_user.update_user_custom_properties,
-                user_id=user_id,
-                properties=[("plan", tier_label, "multiple")],
-                log_label="Failed to update user custom properties in Keycloak",
-            )
+        effects.add(
+            OutboxEffect.KEYCLOAK_PLAN,
+            {"user_id": user_id, "plan": tier_label.value if tier_label else None},
+            ordering_key=f"plan:{user_id}",
+        )
+        # terminal → downgrade to free, otherwise pause the free subscription
+        effects.add(
+            OutboxEffect.TIER_TRANSITION,
+            {"user_id": user_id, "downgrade": is_terminal},
+            ordering_key=f"tier:{user_id}",
         )
-        deferred.add(_wrap(db_action, user_id=user_id))
 
     # Invoice payment events
     async def _handle_invoice_payment_event(
@@ -456,31 +468,30 @@ class StripeWebhook:
 
         # Fetch the authoritative invoice. If Stripe is unreachable we
         # fall back to the event payload — better to record a stale row
-        # than to drop the event entirely.
-        invoice = await self._fetch_invoice(invoice_id) or event_obj
-
-        subscription_id = helpers.get_subscription_id_from_invoice(invoice)
-        payment_intent_id = helpers.get_payment_intent_id_from_invoice(invoice)
+        # than to drop the event entirely. The objects it references are
+        # fetched alongside it, using the ids of the inlined payload.
+        not_before = _fetch_not_before(event_json)
+        speculated = _invoice_references(event_obj)
+        fetched_invoice, related = await asyncio.gather(
+            self._fetch_invoice(invoice_id, not_before=not_before),
+            self._fetch_invoice_references(speculated, not_before=not_before),
+        )
+        invoice = fetched_invoice or event_obj
+
+        references = _invoice_references(invoice)
+        if references != speculated:
+            # the live invoice disagrees with the payload; the references
+            # that did match are served from the object cache
+            related = await self._fetch_invoice_references(
+                references, not_before=not_before
+            )
+        subscription_id, payment_intent_id, _ = references
+        stripe_subscription, payment_intent, customer = related
         user_id = helpers.get_invoice_user_id(invoice) or helpers.get_invoice_user_id(
             event_obj
         )
 
-        stripe_subscription = (
-            await self._fetch_subscription(subscription_id) if subscription_id else None
-        )
-        payment_intent = (
-            await self._fetch_payment_intent(payment_intent_id)
-            if payment_intent_id
-            else None
-        )
-        customer_id = helpers.get_customer_id(invoice)
-        customer = (
-            await self._fetch_customer(customer_id)
-            if customer_id and helpers.get_invoice_customer_address(invoice) is None
-            else None
-        )
-
-        deferred = PostCommitActions()
+        effects = _outbox_batch(event_json)
         async with db_session.begin():
             if stripe_subscription is not None:
                 await self._stage_subscription_upsert(
@@ -488,7 +499,7 @@ class StripeWebhook:
                     event_obj=stripe_subscription,
                     user_id_from_metadata=user_id,
                     db_session=db_session,
-                    deferred=deferred,
+                    effects=effects,
                 )
 
             await self._stage_invoice_payment_record(
@@ -501,10 +512,11 @@ class StripeWebhook:
                 invoice_id=invoice_id,
                 event_type=event_type,
                 db_session=db_session,
-                deferred=deferred,
+                effects=effects,
             )
+            await effects.stage(db_session)
 
-        await deferred.run()
+        outbox_drainer.notify()
 
         return {
             "status": "success",
@@ -523,7 +535,7 @@ class StripeWebhook:
         invoice_id: str,
         event_type: str,
         db_session: AsyncSession,
-        deferred: PostCommitActions,
+        effects: OutboxBatch,
     ) -> SubscriptionPayment:
         """Stage the SubscriptionPayment row from the fetched invoice.
 
@@ -567,7 +579,7 @@ class StripeWebhook:
                 db_session, subscription_id
             )
             await self._queue_subscription_accounting(
-                deferred=deferred,
+                effects=effects,
                 payment=payment,
                 local_subscription=local_subscription,
                 tier_invoice=invoice,
@@ -575,7 +587,7 @@ class StripeWebhook:
                 db_session=db_session,
             )
         else:
-            await self._queue_failed_payment_downgrade(deferred, customer_id)
+            await self._queue_failed_payment_downgrade(effects, customer_id)
 
         db_session.add(payment)
         return payment
@@ -737,7 +749,7 @@ class StripeWebhook:
 
     async def _queue_subscription_accounting(
         self,
-        deferred: PostCommitActions,
+        effects: OutboxBatch,
         payment: SubscriptionPayment,
         local_subscription: PaidSubscription | None,
         tier_invoice: stripe.Invoice,
@@ -760,7 +772,7 @@ class StripeWebhook:
         if not accounting_service.is_enabled or virtual_lab is None:
             return
 
-        virtual_lab_id = UUID(str(virtual_lab.id))
+        virtual_lab_id = str(virtual_lab.id)
         credit_amount = (
             subscription_tier.yearly_credits
             if subscription_tier.stripe_yearly_price_id == price_id
@@ -769,26 +781,27 @@ class StripeWebhook:
         period_start = local_subscription.current_period_start
         period_end = local_subscription.current_period_end
 
-        deferred.add(
-            _wrap(
-                accounting_service.top_up_virtual_lab_budget,
-                virtual_lab_id,
-                float(credit_amount),
-            )
+        # keyed by invoice: however often it is delivered, an invoice
+        # grants its credits once
+        effects.add(
+            OutboxEffect.ACCOUNTING_TOP_UP,
+            {"virtual_lab_id": virtual_lab_id, "amount": float(credit_amount)},
+            key=invoice_id,
         )
-        deferred.add(
-            _wrap(
-                accounting_service.create_virtual_lab_discount,
-                virtual_lab_id=virtual_lab_id,
-                discount=settings.PAID_SUBSCRIPTION_DISCOUNT,
-                valid_from=period_start.replace(tzinfo=timezone.utc),
-                valid_to=period_end.replace(tzinfo=timezone.utc),
-            )
+        effects.add(
+            OutboxEffect.ACCOUNTING_DISCOUNT,
+            {
+                "virtual_lab_id": virtual_lab_id,
+                "discount": str(settings.PAID_SUBSCRIPTION_DISCOUNT),
+                "valid_from": period_start.replace(tzinfo=timezone.utc).isoformat(),
+                "valid_to": period_end.replace(tzinfo=timezone.utc).isoformat(),
+            },
+            key=invoice_id,
         )
 
     async def _queue_failed_payment_downgrade(
         self,
-        deferred: PostCommitActions,
+        effects: OutboxBatch,
         customer_id: str | None,
     ) -> None:
         if not customer_id:
@@ -798,11 +811,12 @@ class StripeWebhook:
         )
         if user is None:
             return
-        deferred.add(
-            _wrap(
-                self.subscription_repository.downgrade_to_free,
-                user_id=UUID(str(user.user_id)),
-            )
+        user_id = str(user.user_id)
+        effects.add(
+            OutboxEffect.TIER_TRANSITION,
+            {"user_id": user_id, "downgrade": True},
+            key=f"{effects.source}:payment_failed",
+            ordering_key=f"tier:{user_id}",
         )
 
     # Standalone payment events
@@ -853,11 +867,14 @@ class StripeWebhook:
         # Resource fetch outside the transaction. Fall back to the event
         # payload if Stripe is unreachable so the event still records.
         payment_intent = (
-            await self._fetch_payment_intent(payment_intent_id) or event_obj
+            await self._fetch_payment_intent(
+                payment_intent_id, not_before=_fetch_not_before(event_json)
+            )
+            or event_obj
         )
 
         try:
-            deferred = PostCommitActions()
+            effects = _outbox_batch(event_json)
             payment_db_id: str | None = None
             async with db_session.begin():
                 payment = await self._stage_standalone_payment_record(
@@ -870,7 +887,7 @@ class StripeWebhook:
                     event_type=event_type,
                     metadata=metadata,
                     db_session=db_session,
-                    deferred=deferred,
+                    effects=effects,
                 )
                 # Capture the id while the session is still attached;
                 # accessing it after the `begin()` block commits would
@@ -878,7 +895,8 @@ class StripeWebhook:
                 if payment is not None:
                     await db_session.flush()
                     payment_db_id = str(payment.id) if payment.id else None
-            await deferred.run()
+                await effects.stage(db_session)
+            outbox_drainer.notify()
 
             return {
                 "status": "success",
@@ -937,7 +955,7 @@ class StripeWebhook:
         event_type: str,
         metadata: dict[str, str],
         db_session: AsyncSession,
-        deferred: PostCommitActions,
+        effects: OutboxBatch,
     ) -> SubscriptionPayment | None:
         # idempotency on the payment intent
         payment, already_succeeded = await self._find_or_create_standalone_payment(
@@ -984,28 +1002,23 @@ class StripeWebhook:
             # tax shows up in the dashboard. Subscriptions get this for free
             # via `automatic_tax`; standalone PaymentIntents must commit
             # explicitly.
-            # Deferred so it runs only after the local DB
+            # Staged in the outbox so it runs only after the local DB
             # transaction commits, keeps Stripe and our DB in sync
             calculation_id = payment.stripe_tax_calculation_id
             if calculation_id:
-                deferred.add(
-                    _wrap(
-                        self.stripe_repository.commit_tax_transaction,
-                        calculation_id=str(calculation_id),
-                        reference=payment_intent_id,
-                        log_label=(
-                            f"Failed to commit standalone tax transaction "
-                            f"for {payment_intent_id}"
-                        ),
-                    )
+                effects.add(
+                    OutboxEffect.STRIPE_TAX_COMMIT,
+                    {
+                        "calculation_id": str(calculation_id),
+                        "reference": payment_intent_id,
+                    },
+                    key=payment_intent_id,
                 )
             if accounting_service.is_enabled:
-                deferred.add(
-                    _wrap(
-                        accounting_service.top_up_virtual_lab_budget,
-                        UUID(virtual_lab_id),
-                        float(credits),
-                    )
+                effects.add(
+                    OutboxEffect.ACCOUNTING_TOP_UP,
+                    {"virtual_lab_id": virtual_lab_id, "amount": float(credits)},
+                    key=payment_intent_id,
                 )
 
         # standalone bookkeeping fields
@@ -1132,48 +1145,122 @@ class StripeWebhook:
         return quote
 
     # Stripe API helpers
+    # Every retrieval goes through `stripe_object_cache`: `not_before` is
+    # the event's `_fetch_not_before`, so an object is only shared with
+    # events created before it was requested.
     async def _fetch_subscription(
-        self, subscription_id: str
+        self, subscription_id: str, *, not_before: float
     ) -> stripe.Subscription | None:
-        try:
-            return await stripe_client.subscriptions.retrieve_async(
-                subscription_id, params={"expand": _SUBSCRIPTION_EXPAND}
-            )
-        except stripe.StripeError as e:
-            logger.exception(
-                f"Error retrieving subscription {subscription_id}: {str(e)}"
-            )
-            return None
+        async def retrieve() -> stripe.Subscription | None:
+            try:
+                return await stripe_client.subscriptions.retrieve_async(
+                    subscription_id, params={"expand": _SUBSCRIPTION_EXPAND}
+                )
+            except stripe.StripeError as e:
+                logger.exception(
+                    f"Error retrieving subscription {subscription_id}: {str(e)}"
+                )
+                return None
 
-    async def _fetch_invoice(self, invoice_id: str) -> stripe.Invoice | None:
-        try:
-            return await stripe_client.invoices.retrieve_async(invoice_id)
-        except stripe.StripeError as e:
-            logger.warning(f"Failed to fetch invoice {invoice_id}: {str(e)}")
-            return None
+        return await stripe_object_cache.get_or_fetch(
+            f"subscription:{subscription_id}", retrieve, not_before=not_before
+        )
+
+    async def _fetch_invoice(
+        self, invoice_id: str, *, not_before: float
+    ) -> stripe.Invoice | None:
+        async def retrieve() -> stripe.Invoice | None:
+            try:
+                return await stripe_client.invoices.retrieve_async(invoice_id)
+            except stripe.StripeError as e:
+                logger.warning(f"Failed to fetch invoice {invoice_id}: {str(e)}")
+                return None
+
+        return await stripe_object_cache.get_or_fetch(
+            f"invoice:{invoice_id}", retrieve, not_before=not_before
+        )
 
     async def _fetch_payment_intent(
-        self, payment_intent_id: str
+        self, payment_intent_id: str, *, not_before: float
     ) -> stripe.PaymentIntent | None:
-        try:
-            return await stripe_client.payment_intents.retrieve_async(
-                payment_intent_id, params={"expand": _PAYMENT_INTENT_EXPAND}
-            )
-        except stripe.StripeError as e:
-            logger.warning(
-                f"Error retrieving payment intent {payment_intent_id}: {str(e)}"
-            )
-            return None
+        async def retrieve() -> stripe.PaymentIntent | None:
+            try:
+                return await stripe_client.payment_intents.retrieve_async(
+                    payment_intent_id, params={"expand": _PAYMENT_INTENT_EXPAND}
+                )
+            except stripe.StripeError as e:
+                logger.warning(
+                    f"Error retrieving payment intent {payment_intent_id}: {str(e)}"
+                )
+                return None
 
-    async def _fetch_customer(self, customer_id: str) -> stripe.Customer | None:
-        try:
-            return await stripe_client.customers.retrieve_async(str(customer_id))
-        except stripe.StripeError as e:
-            logger.warning(f"Failed to fetch customer {customer_id}: {str(e)}")
-            return None
+        return await stripe_object_cache.get_or_fetch(
+            f"payment_intent:{payment_intent_id}", retrieve, not_before=not_before
+        )
+
+    async def _fetch_customer(
+        self, customer_id: str, *, not_before: float
+    ) -> stripe.Customer | None:
+        async def retrieve() -> stripe.Customer | None:
+            try:
+                return await stripe_client.customers.retrieve_async(str(customer_id))
+            except stripe.StripeError as e:
+                logger.warning(f"Failed to fetch customer {customer_id}: {str(e)}")
+                return None
+
+        return await stripe_object_cache.get_or_fetch(
+            f"customer:{customer_id}", retrieve, not_before=not_before
+        )
+
+    async def _fetch_invoice_references(
+        self, references: _InvoiceReferences, *, not_before: float
+    ) -> tuple[
+        stripe.Subscription | None, stripe.PaymentIntent | None, stripe.Customer | None
+    ]:
+        subscription_id, payment_intent_id, customer_id = references
+        return await asyncio.gather(
+            self._fetch_subscription(subscription_id, not_before=not_before)
+            if subscription_id
+            else _nothing(),
+            self._fetch_payment_intent(payment_intent_id, not_before=not_before)
+            if payment_intent_id
+            else _nothing(),
+            self._fetch_customer(customer_id, not_before=not_before)
+            if customer_id
+            else _nothing(),
+        )
 
 
 # Module-level helpers
+def _fetch_not_before(event: stripe.Event) -> float:
+    """Earliest request time (unix) of a Stripe object usable for `event`.
+
+    `created` has second granularity, so objects requested within the
+    event's own second are not trusted to include its change.
+    """
+    created = helpers.event_created_at(event)
+    return float(created + 1) if created is not None else time()
+
+
+def _invoice_references(invoice: stripe.Invoice) -> _InvoiceReferences:
+    """Ids of the subscription, payment intent and customer to fetch for
+    `invoice`; the customer only when the invoice lacks an address."""
+    customer_id = (
+        helpers.get_customer_id(invoice)
+        if helpers.get_invoice_customer_address(invoice) is None
+        else None
+    )
+    return (
+        helpers.get_subscription_id_from_invoice(invoice),
+        helpers.get_payment_intent_id_from_invoice(invoice),
+        customer_id,
+    )
+
+
+async def _nothing() -> None:
+    return None
+
+
 def _set_if(target: object, **fields: Any) -> None:
     """Assign each kwarg to `target` only when its value is not None.
 
@@ -1214,22 +1301,7 @@ def _to_jsonable(value: Any) -> Any:
     return value
 
 
-def _wrap(
-    fn: Callable[..., Awaitable[Any]],
-    *args: Any,
-    log_label: str | None = None,
-    **kwargs: Any,
-) -> Callable[[], Awaitable[None]]:
-    """Bind a coroutine function with args for deferred post-commit execution."""
-
-    async def runner() -> None:
-        try:
-            await fn(*args, **kwargs)
-        except Exception as exc:
-            label = (
-                log_label
-                or f"Post-commit action {getattr(fn, '__name__', '<callable>')} failed"
-            )
-            logger.warning(f"{label}: {exc}")
-
-    return runner
+def _outbox_batch(event: stripe.Event) -> OutboxBatch:
+    """Outbox batch for `event`, keyed by its id so a redelivered event
+    stages nothing new."""
+    return OutboxBatch(source=event.id or f"local_{uuid4().hex}")
@@ -1,4 +1,5 @@
-from typing import Any, Dict, List, cast
+import asyncio
+from typing import Any, Dict, Iterable, List
 
 from keycloak import KeycloakAdmin  # type: ignore
 from loguru import logger
@@ -8,11 +9,16 @@ from virtual_labs.core.exceptions.generic_exceptions import UserNotInList
 from virtual_labs.core.exceptions.identity_error import IdentityError
 from virtual_labs.core.types import UserRoleEnum
 from virtual_labs.infrastructure.kc.config import KeycloakRealm
+from virtual_labs.infrastructure.kc.group_cache import (
+    group_members_cache,
+    invalidate_group_members,
+)
 from virtual_labs.infrastructure.kc.models import (
     CreatedGroup,
     GroupRepresentation,
     UserRepresentation,
 )
+from virtual_labs.infrastructure.settings import settings
 from virtual_labs.shared.group_namespace import (
     make_project_group_name,
     make_virtual_lab_group_name,
@@ -25,41 +31,78 @@ class GroupQueryRepository:
     def __init__(self) -> None:
         self.Kc = KeycloakRealm
 
-    def retrieve_group_users(self, group_id: str) -> List[UserRepresentation]:
-        members = self.Kc.get_group_members(group_id=group_id)
-        return [UserRepresentation(**member) for member in members]
+    async def _fetch_group_members(self, group_id: str) -> List[Dict[str, Any]]:
+        members: List[Dict[str, Any]] = await self.Kc.a_get_group_members(
+            group_id=group_id
+        )
+        await group_members_cache.set(
+            group_id,
+            group_id,
+            members,
+            ttl=settings.KC_GROUP_MEMBERS_CACHE_SECONDS,
+        )
+        return members
 
     async def a_retrieve_group_users(self, group_id: str) -> List[UserRepresentation]:
-        members = await self.Kc.a_get_group_members(group_id=group_id)
+        """Group members, read through `group_members_cache`."""
+        members = await group_members_cache.get(group_id, group_id)
+        if members is None:
+            members = await self._fetch_group_members(group_id)
         return [UserRepresentation(**member) for member in members]
 
     async def a_retrieve_group_user_ids(self, group_id: str) -> List[str]:
-        members = await self.Kc.a_get_group_members(group_id=group_id)
-        return [UserRepresentation(**member).id for member in members]
+        return [user.id for user in await self.a_retrieve_group_users(group_id)]
 
-    def retrieve_user_groups(self, user_id: str) -> List[GroupRepresentation]:
-        groups = self.Kc.get_user_groups(user_id=user_id)
-        return [GroupRepresentation(**group) for group in groups]
+    async def a_retrieve_groups_user_ids(
+        self, group_ids: Iterable[str]
+    ) -> Dict[str, List[str]]:
+        """Member ids of many groups at once, keyed by group id.
+
+        Duplicates are resolved once; cached groups are read in a single
+        pass over `group_members_cache` and the rest fetched concurrently
+        (at most `KC_GROUP_LOOKUP_CONCURRENCY` in flight), so a page of
+        projects costs about one Keycloak round-trip instead of one each.
+        """
+        unique_ids = list(dict.fromkeys(group_ids))
+        cached = await group_members_cache.get_many(
+            [(group_id, group_id) for group_id in unique_ids]
+        )
+        members_by_group: Dict[str, List[Dict[str, Any]]] = {}
+        pending: List[str] = []
+        for group_id, members in zip(unique_ids, cached):
+            if members is None:
+                pending.append(group_id)
+            else:
+                members_by_group[group_id] = members
+
+        semaphore = asyncio.Semaphore(settings.KC_GROUP_LOOKUP_CONCURRENCY)
+
+        async def fetch(group_id: str) -> List[Dict[str, Any]]:
+            async with semaphore:
+                return await self._fetch_group_members(group_id)
+
+        fetched = await asyncio.gather(*(fetch(group_id) for group_id in pending))
+        members_by_group.update(zip(pending, fetched))
+        return {
+            group_id: [UserRepresentation(**member).id for member in members]
+            for group_id, members in members_by_group.items()
+        }
 
     async def a_retrieve_user_groups(self, user_id: str) -> List[GroupRepresentation]:
         groups = await self.Kc.a_get_user_groups(user_id=user_id)
         return [GroupRepresentation(**group) for group in groups]
 
-    def retrieve_group_by_name(self, name: str) -> GroupRepresentation:
-        group = self.Kc.get_group_by_path(name)
-        return GroupRepresentation(**group)
-
     async def a_retrieve_group_by_name(self, name: str) -> GroupRepresentation:
         group = await self.Kc.a_get_group_by_path(name)
         return GroupRepresentation(**group)
 
-    def retrieve_group_by_id(self, group_id: str) -> GroupRepresentation:
-        group = self.Kc.get_group(group_id=group_id)
+    async def a_retrieve_group_by_id(self, group_id: str) -> GroupRepresentation:
+        group = await self.Kc.a_get_group(group_id=group_id)
         return GroupRepresentation(**group)
 
-    def check_user_in_group(self, group_id: str, user_id: str) -> bool:
-        group_users = self.retrieve_group_users(group_id=group_id)
-        if any([cast(Dict[str, object], u)["id"] == user_id for u in group_users]):
+    async def a_check_user_in_group(self, group_id: str, user_id: str) -> bool:
+        group_users = await self.a_retrieve_group_users(group_id=group_id)
+        if any(user.id == user_id for user in group_users):
             return True
         else:
             raise UserNotInList("User not found in the list")
@@ -71,52 +114,6 @@ class GroupMutationRepository:
     def __init__(self) -> None:
         self.Kc = KeycloakRealm
 
-    def create_virtual_lab_group(
-        self,
-        *,
-        vl_id: UUID4,
-        vl_name: str,
-        role: UserRoleEnum,
-    ) -> CreatedGroup:
-        """
-        NOTE: you can not set the ID even in the docs says that is Optional
-        virtual lab group must be following this format
-        vlab/vl-app-id/role
-        """
-        try:
-            group_name = make_virtual_lab_group_name(vl_id, role)
-            group_id = self.Kc.create_group({"name": group_name})
-
-            return {"id": group_id, "name": group_name}
-
-        except Exception as error:
-            logger.error(
-                f"Error when creating {role} group for lab {vl_name} with id {vl_id}: ({error})"
-            )
-            raise IdentityError(
-                message=f"Error when creating {role} group for lab {vl_name} with id {vl_id}: ({error})",
-                detail=str(error),
-            )
-
-    def create_project_group(
-        self,
-        *,
-        virtual_lab_id: UUID4,
-        project_id: UUID4,
-        role: UserRoleEnum,
-    ) -> CreatedGroup | None:
-        """
-        NOTE: you can not set the ID even in the docs says that is Optional
-        project group must be following this format
-        proj/virtual_lab_id/project_id/role
-        """
-        group_name = make_project_group_name(virtual_lab_id, project_id, role)
-        group_id = self.Kc.create_group(
-            {"name": group_name},
-        )
-
-        return {"id": group_id, "name": group_name}
-
     async def a_create_virtual_lab_group(
         self,
         *,
@@ -132,6 +129,7 @@ class GroupMutationRepository:
         try:
             group_name = make_virtual_lab_group_name(vl_id, role)
             group_id = await self.Kc.a_create_group({"name": group_name})
+            await invalidate_group_members(group_id)
 
             return {"id": group_id, "name": group_name}
 
@@ -160,11 +158,11 @@ class GroupMutationRepository:
         group_id = await self.Kc.a_create_group(
             {"name": group_name},
         )
+        await invalidate_group_members(group_id)
 
         return {"id": group_id, "name": group_name}
 
-    def delete_group(self, *, group_id: str) -> Any | Dict[str, str]:
-        return self.Kc.delete_group(group_id=group_id)
-
     async def a_delete_group(self, *, group_id: str) -> Any | Dict[str, str]:
-        return await self.Kc.a_delete_group(group_id=group_id)
+        result = await self.Kc.a_delete_group(group_id=group_id)
+        await invalidate_group_members(group_id)
+        return result
@@ -2,14 +2,20 @@ from typing import Any
 
 from pydantic import UUID4, EmailStr
 from sqlalchemy import exists, false, func, select, update
-from sqlalchemy.exc import NoResultFound
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import noload
 from sqlalchemy.sql import ColumnElement, and_, or_
 
+from virtual_labs.core.keyset import KeysetPage, paginate
+from virtual_labs.core.search import name_contains, name_relevance
 from virtual_labs.core.types import PaginatedDbResult
 from virtual_labs.domain import labs
-from virtual_labs.domain.common import DbPagination, PageParams, PaginationRequest
+from virtual_labs.domain.common import (
+    CursorPaginationRequest,
+    DbPagination,
+    PageParams,
+)
+from virtual_labs.infrastructure.db.loading import LAB_DETAIL, LAB_LIST, LoadProfile
 from virtual_labs.infrastructure.db.models import Project, VirtualLab
 
 
@@ -48,9 +54,8 @@ async def get_paginated_virtual_labs(
     result = (
         (
             await db.execute(
-                statement=paginated_query.order_by(
-                    VirtualLab.created_at.desc(), VirtualLab.updated_at.desc()
-                )
+                statement=paginated_query.options(*LAB_LIST)
+                .order_by(VirtualLab.created_at.desc(), VirtualLab.updated_at.desc())
                 .offset((page_params.page - 1) * page_params.size)
                 .limit(page_params.size)
             )
@@ -72,11 +77,11 @@ async def admin_list_virtual_labs(
     query: str | None,
     include_deleted: bool,
     deleted_only: bool,
-    pagination: PaginationRequest,
+    pagination: CursorPaginationRequest,
     order_by: tuple[ColumnElement[Any], ...],
-) -> tuple[list[VirtualLab], int]:
+) -> KeysetPage[VirtualLab]:
     """Global (non-membership-scoped) paginated listing for the
-    platform-admin namespace. Returns ``(rows, total)``.
+    platform-admin namespace, by offset or keyset (`core.keyset`).
 
     ``VirtualLab.id ASC`` is always appended as a stable tiebreaker so
     pages of same-timestamp rows don't shuffle between requests.
@@ -87,34 +92,32 @@ async def admin_list_virtual_labs(
     elif not include_deleted:
         conditions.append(VirtualLab.deleted.is_(False))
     if query:
-        conditions.append(
-            func.lower(VirtualLab.name).ilike(f"%{query.strip().lower()}%")
-        )
+        conditions.append(name_contains(VirtualLab.name, query))
 
     base = select(VirtualLab)
     if conditions:
         base = base.where(and_(*conditions))
 
-    total = (
-        await db.scalar(
-            select(func.count()).select_from(base.options(noload("*")).subquery())
-        )
-    ) or 0
-
-    rows = (
-        await db.scalars(
-            base.order_by(*order_by, VirtualLab.id.asc())
-            .offset(pagination.offset)
-            .limit(pagination.page_size)
-        )
-    ).all()
-
-    return list(rows), total
+    return await paginate(
+        db,
+        base.options(*LAB_LIST),
+        order_by=(*order_by, VirtualLab.id.asc()),
+        cursor=pagination.cursor,
+        offset=pagination.offset,
+        limit=pagination.page_size,
+        count=pagination.count,
+    )
 
 
-async def get_undeleted_virtual_lab(db: AsyncSession, lab_id: UUID4) -> VirtualLab:
+async def get_undeleted_virtual_lab(
+    db: AsyncSession, lab_id: UUID4, options: LoadProfile = ()
+) -> VirtualLab:
     """Returns non-deleted virtual lab by id. Raises an exception if the lab by id is not found or if it is deleted."""
-    query = select(VirtualLab).where(VirtualLab.id == lab_id, ~VirtualLab.deleted)
+    query = (
+        select(VirtualLab)
+        .where(VirtualLab.id == lab_id, ~VirtualLab.deleted)
+        .options(*options)
+    )
     return (await db.execute(statement=query)).unique().scalar_one()
 
 
@@ -137,19 +140,21 @@ async def get_virtual_lab_by_definition_tuple(
     return result.scalar_one_or_none()
 
 
-async def get_virtual_lab_soft(db: AsyncSession, lab_id: UUID4) -> VirtualLab | None:
-    query = select(VirtualLab).where(VirtualLab.id == lab_id)
+async def get_virtual_lab_soft(
+    db: AsyncSession, lab_id: UUID4, options: LoadProfile = ()
+) -> VirtualLab | None:
+    query = select(VirtualLab).where(VirtualLab.id == lab_id).options(*options)
     return (await db.execute(statement=query)).scalar()
 
 
-async def get_virtual_lab_async(db: AsyncSession, lab_id: UUID4) -> VirtualLab:
+async def get_virtual_lab_async(
+    db: AsyncSession, lab_id: UUID4, options: LoadProfile = ()
+) -> VirtualLab:
     """Returns virtual lab by id. Raises an exception if the lab by id is not found.
     The returned virtual lab might be deleted (i.e. Virtual.deleted might be True).
     """
-    lab = await db.get(VirtualLab, lab_id)
-    if lab is None:
-        raise NoResultFound
-    return lab
+    query = select(VirtualLab).where(VirtualLab.id == lab_id).options(*options)
+    return (await db.execute(statement=query)).scalar_one()
 
 
 async def create_virtual_lab(db: AsyncSession, lab: VirtualLabDbCreate) -> VirtualLab:
@@ -211,7 +216,7 @@ async def update_virtual_lab_compute_cell(
     )
     await db.execute(statement=query)
     await db.commit()
-    return await get_undeleted_virtual_lab(db, lab_id)
+    return await get_undeleted_virtual_lab(db, lab_id, options=LAB_DETAIL)
 
 
 async def update_virtual_lab_email_status(
@@ -274,15 +279,20 @@ async def count_virtual_labs_with_name(db: AsyncSession, name: str) -> int:
 async def get_virtual_labs_with_matching_name(
     db: AsyncSession, term: str, group_ids: list[str]
 ) -> list[VirtualLab]:
-    query = select(VirtualLab).filter(
-        and_(
-            ~VirtualLab.deleted,
-            func.lower(VirtualLab.name).like(f"%{term.strip().lower()}%"),
-            or_(
-                (VirtualLab.admin_group_id.in_(group_ids)),
-                (VirtualLab.member_group_id.in_(group_ids)),
-            ),
+    query = (
+        select(VirtualLab)
+        .filter(
+            and_(
+                ~VirtualLab.deleted,
+                name_contains(VirtualLab.name, term),
+                or_(
+                    (VirtualLab.admin_group_id.in_(group_ids)),
+                    (VirtualLab.member_group_id.in_(group_ids)),
+                ),
+            )
         )
+        .order_by(name_relevance(VirtualLab.name, term))
+        .options(*LAB_LIST)
     )
     result = (await db.execute(statement=query)).unique().scalars().all()
     return list(result)
@@ -336,7 +346,7 @@ async def get_virtual_labs_in_list(
     if query:
         final_filter_conditions = and_(
             base_filter_conditions,
-            func.lower(VirtualLab.name).ilike(f"%{query.strip().lower()}%"),
+            name_contains(VirtualLab.name, query),
         )
         filtered_total_count_query = select(func.count(VirtualLab.id)).where(
             final_filter_conditions
@@ -345,6 +355,7 @@ async def get_virtual_labs_in_list(
 
     paginated_query = (
         select(VirtualLab)
+        .options(*LAB_LIST)
         .where(final_filter_conditions)
         .order_by(VirtualLab.created_at.desc(), VirtualLab.updated_at.desc())
         .offset((page_params.page - 1) * page_params.size)
@@ -374,8 +385,12 @@ async def get_virtual_lab_stats(
     db: AsyncSession,
     virtual_lab_id: UUID4,
 ) -> dict[str, int]:
-    """Get statistics for a virtual lab including total projects and pending invites using a single optimized query."""
-    from sqlalchemy import distinct, func, select
+    """Get statistics for a virtual lab including total projects and pending invites.
+
+    Both counts are independent correlated subqueries served by their
+    `virtual_lab_id` index, instead of one join of projects x invites.
+    """
+    from sqlalchemy import func, select
 
     from virtual_labs.infrastructure.db.models import (
         Project,
@@ -383,28 +398,26 @@ async def get_virtual_lab_stats(
         VirtualLabInvite,
     )
 
-    # Filter VirtualLab first
-    base_query = (
-        select(VirtualLab).where(
-            VirtualLab.id == virtual_lab_id,
-            ~VirtualLab.deleted,
-        )
-    ).subquery()
-
-    stats_query = (
-        select(
-            base_query.c.id,
-            func.count(distinct(Project.id))
-            .filter(~Project.deleted)
-            .label("total_projects"),
-            func.count(distinct(VirtualLabInvite.id))
-            .filter(~VirtualLabInvite.accepted)
-            .label("total_pending_invites"),
+    total_projects = (
+        select(func.count(Project.id))
+        .where(Project.virtual_lab_id == VirtualLab.id, ~Project.deleted)
+        .scalar_subquery()
+    )
+    total_pending_invites = (
+        select(func.count(VirtualLabInvite.id))
+        .where(
+            VirtualLabInvite.virtual_lab_id == VirtualLab.id,
+            ~VirtualLabInvite.accepted,
         )
-        .select_from(base_query)
-        .outerjoin(Project, base_query.c.id == Project.virtual_lab_id)
-        .outerjoin(VirtualLabInvite, base_query.c.id == VirtualLabInvite.virtual_lab_id)
-        .group_by(base_query.c.id)
+        .scalar_subquery()
+    )
+
+    stats_query = select(
+        total_projects.label("total_projects"),
+        total_pending_invites.label("total_pending_invites"),
+    ).where(
+        VirtualLab.id == virtual_lab_id,
+        ~VirtualLab.deleted,
     )
 
     result = await db.execute(stats_query)
@@ -1,10 +1,12 @@
-from typing import List, Optional, Tuple
+from typing import List, Optional, Sequence, Tuple
 from uuid import UUID
 
 from sqlalchemy import and_, false, func, select, true
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.sql import Select
 
+from virtual_labs.core.keyset import KeysetPage, paginate
+from virtual_labs.domain.admin import AdminPaymentsListQuery
 from virtual_labs.domain.payment import PaymentFilter, PaymentType
 from virtual_labs.infrastructure.db.models import SubscriptionPayment
 
@@ -44,35 +46,49 @@ class PaymentRepository:
 
     async def admin_list_payments(
         self,
-        filters: PaymentFilter,
+        filters: AdminPaymentsListQuery,
         customer_id: Optional[str] = None,
-    ) -> Tuple[List[SubscriptionPayment], int]:
+    ) -> KeysetPage[SubscriptionPayment]:
         """`list_payments` without the mandatory customer scope, for
-        the platform-admin namespace. Returns ``(payments, total)``.
+        the platform-admin namespace. Newest first, paged by offset or
+        keyset over ``ix_subscription_payment_payment_date_id``.
         """
         query = select(SubscriptionPayment)
         if customer_id:
             query = query.where(SubscriptionPayment.customer_id == customer_id)
         query = self._apply_filters(query, filters)
 
-        total = (
-            await self.session.scalar(
-                select(func.count()).select_from(query.subquery())
-            )
-        ) or 0
-
-        rows = (
-            (
-                await self.session.execute(
-                    query.order_by(SubscriptionPayment.payment_date.desc())
-                    .offset(filters.offset)
-                    .limit(filters.page_size)
-                )
+        return await paginate(
+            self.session,
+            query,
+            order_by=(
+                SubscriptionPayment.payment_date.desc(),
+                SubscriptionPayment.id.desc(),
+            ),
+            cursor=filters.cursor,
+            offset=filters.offset,
+            limit=filters.page_size,
+            count=filters.count,
+        )
+
+    async def list_by_subscription_ids(
+        self, subscription_ids: Sequence[UUID]
+    ) -> List[SubscriptionPayment]:
+        """
+        payments of all the given subscriptions in one query, newest first
+        """
+        if not subscription_ids:
+            return []
+        query = (
+            select(SubscriptionPayment)
+            .where(SubscriptionPayment.subscription_id.in_(subscription_ids))
+            .order_by(
+                SubscriptionPayment.payment_date.desc(),
+                SubscriptionPayment.id.desc(),
             )
-            .scalars()
-            .all()
         )
-        return list(rows), total
+        result = await self.session.execute(query)
+        return list(result.scalars().all())
 
     async def get_payment_by_id(
         self, payment_id: UUID
@@ -8,8 +8,13 @@ from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import noload
 from sqlalchemy.sql import ColumnElement, and_
 
+from virtual_labs.core.keyset import KeysetPage, paginate
+from virtual_labs.core.search import name_contains, name_relevance
 from virtual_labs.core.types import PaginatedDbResult
-from virtual_labs.domain.common import PageParams, PaginationRequest
+from virtual_labs.domain.common import (
+    CursorPaginationRequest,
+    PageParams,
+)
 from virtual_labs.domain.project import (
     ProjectCreationBody,
     ProjectUpdateBody,
@@ -33,32 +38,33 @@ class ProjectQueryRepository:
         self,
         project_id: UUID,
     ) -> dict[str, int]:
-        """Get statistics for a project using a single optimized query."""
-        from sqlalchemy import distinct, func, select
+        """Get statistics for a project in a single query.
 
-        # Filter Project first
-        base_query = (
-            select(Project).where(
-                Project.id == project_id,
-                ~Project.deleted,
-            )
-        ).subquery()
-
-        stats_query = (
-            select(
-                base_query.c.id,
-                func.count(distinct(ProjectStar.id)).label("total_stars"),
-                func.count(distinct(Bookmark.id)).label("total_bookmarks"),
-                func.count(distinct(ProjectInvite.id))
-                .filter(~ProjectInvite.accepted)
-                .label("total_pending_invites"),
-            )
-            .select_from(base_query)
-            .outerjoin(ProjectStar, base_query.c.id == ProjectStar.project_id)
-            .outerjoin(Bookmark, base_query.c.id == Bookmark.project_id)
-            .outerjoin(ProjectInvite, base_query.c.id == ProjectInvite.project_id)
-            .group_by(base_query.c.id)
+        Each count is an independent correlated subquery served by its
+        `project_id` index, so the cost grows with the number of children
+        rather than with their product (as joining them all would).
+        """
+        total_stars = (
+            select(func.count(ProjectStar.id))
+            .where(ProjectStar.project_id == Project.id)
+            .scalar_subquery()
+        )
+        total_bookmarks = (
+            select(func.count(Bookmark.id))
+            .where(Bookmark.project_id == Project.id)
+            .scalar_subquery()
         )
+        total_pending_invites = (
+            select(func.count(ProjectInvite.id))
+            .where(ProjectInvite.project_id == Project.id, ~ProjectInvite.accepted)
+            .scalar_subquery()
+        )
+
+        stats_query = select(
+            total_stars.label("total_stars"),
+            total_bookmarks.label("total_bookmarks"),
+            total_pending_invites.label("total_pending_invites"),
+        ).where(Project.id == project_id, ~Project.deleted)
 
         result = await self.session.execute(stats_query)
         stats = result.first()
@@ -356,7 +362,7 @@ class ProjectQueryRepository:
         """
         conditions = [
             ~Project.deleted,
-            func.lower(Project.name).like(f"%{query_term.lower()}%"),
+            name_contains(Project.name, query_term),
         ]
         if virtual_lab_id and groups_ids and (len(groups_ids) > 0):
             conditions.append(
@@ -381,7 +387,7 @@ class ProjectQueryRepository:
             select(Project, VirtualLab)
             .join(VirtualLab)
             .filter(*conditions)
-            .order_by(Project.updated_at)
+            .order_by(name_relevance(Project.name, query_term), Project.updated_at)
         )
         result = (await self.session.execute(statement=stmt)).all()
 
@@ -397,12 +403,12 @@ class ProjectQueryRepository:
         virtual_lab_id: UUID4 | None,
         include_deleted: bool,
         deleted_only: bool,
-        pagination: PaginationRequest,
+        pagination: CursorPaginationRequest,
         order_by: tuple[ColumnElement[Any], ...],
-    ) -> tuple[list[Row[Tuple[Project, VirtualLab]]], int]:
-        """Global (non-membership-scoped) paginated listing for the
-        platform-admin namespace. Returns ``((project, virtual_lab)
-        rows, total)``.
+    ) -> KeysetPage[Tuple[Project, VirtualLab]]:
+        """Global (non-membership-scoped) paginated listing of
+        ``(project, virtual_lab)`` pairs for the platform-admin
+        namespace, by offset or keyset (`core.keyset`).
         """
         conditions: list[ColumnElement[bool]] = []
         if deleted_only:
@@ -412,9 +418,7 @@ class ProjectQueryRepository:
         if virtual_lab_id is not None:
             conditions.append(Project.virtual_lab_id == virtual_lab_id)
         if query:
-            conditions.append(
-                func.lower(Project.name).ilike(f"%{query.strip().lower()}%")
-            )
+            conditions.append(name_contains(Project.name, query))
 
         base = select(Project, VirtualLab).join(
             VirtualLab, Project.virtual_lab_id == VirtualLab.id
@@ -422,21 +426,15 @@ class ProjectQueryRepository:
         if conditions:
             base = base.where(and_(*conditions))
 
-        total = (
-            await self.session.scalar(
-                select(func.count()).select_from(base.options(noload("*")).subquery())
-            )
-        ) or 0
-
-        rows = (
-            await self.session.execute(
-                base.order_by(*order_by, Project.id.asc())
-                .offset(pagination.offset)
-                .limit(pagination.page_size)
-            )
-        ).all()
-
-        return list(rows), total
+        return await paginate(
+            self.session,
+            base,
+            order_by=(*order_by, Project.id.asc()),
+            cursor=pagination.cursor,
+            offset=pagination.offset,
+            limit=pagination.page_size,
+            count=pagination.count,
+        )
 
     async def get_project_names(
         self, project_ids: list[UUID4]
@@ -0,0 +1,241 @@
+"""
+Repository for promotion analytics.
+Computes usage statistics with one aggregate per table, using FILTER clauses
+instead of a query per metric, and maintains the per-code usage rollup that
+serves the unfiltered statistics.
+"""
+
+from datetime import datetime, timezone
+from typing import Any, Dict, Optional
+from uuid import UUID
+
+from sqlalchemy import and_, exists, func, select
+from sqlalchemy.dialects.postgresql import insert
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from virtual_labs.domain.promotion import PromotionUsageFilters
+from virtual_labs.infrastructure.db.models import (
+    PromotionCode,
+    PromotionCodeUsage,
+    PromotionCodeUsageRollup,
+    PromotionCodeUsageStatus,
+)
+
+STATUS_COUNTERS = {
+    PromotionCodeUsageStatus.PENDING: "pending",
+    PromotionCodeUsageStatus.COMPLETED: "completed",
+    PromotionCodeUsageStatus.FAILED: "failed",
+}
+
+
+def _has_filters(filters: Optional[PromotionUsageFilters]) -> bool:
+    return filters is not None and any(
+        (filters.start_date, filters.end_date, filters.status)
+    )
+
+
+async def get_promotion_usage_stats(
+    db: AsyncSession,
+    promotion_code_id: UUID,
+    filters: Optional[PromotionUsageFilters] = None,
+) -> Dict[str, Any]:
+    """
+    Get usage statistics for a promotion code.
+    Without date or status filters the totals are read from the rollup row;
+    otherwise every metric is computed in a single pass over the usages.
+
+    Args:
+        db: Database session
+        promotion_code_id: Promotion code UUID
+        filters: Optional filters for date range and status
+
+    Returns:
+        Dictionary with usage statistics
+    """
+    if not _has_filters(filters):
+        rollup = await db.get(PromotionCodeUsageRollup, promotion_code_id)
+        if rollup is not None:
+            return {
+                "total_redemptions": rollup.total_redemptions,
+                "completed": rollup.completed,
+                "pending": rollup.pending,
+                "failed": rollup.failed,
+                "total_credits_distributed": int(rollup.total_credits_distributed),
+                "unique_users": rollup.unique_users,
+                "unique_virtual_labs": rollup.unique_virtual_labs,
+            }
+
+    conditions = [PromotionCodeUsage.promotion_code_id == promotion_code_id]
+
+    if filters:
+        if filters.start_date:
+            conditions.append(PromotionCodeUsage.redeemed_at >= filters.start_date)
+        if filters.end_date:
+            conditions.append(PromotionCodeUsage.redeemed_at <= filters.end_date)
+        if filters.status:
+            conditions.append(PromotionCodeUsage.status == filters.status)
+
+    status = PromotionCodeUsage.status
+    row = (
+        await db.execute(
+            select(
+                func.count().label("total_redemptions"),
+                func.count()
+                .filter(status == PromotionCodeUsageStatus.COMPLETED)
+                .label("completed"),
+                func.count()
+                .filter(status == PromotionCodeUsageStatus.PENDING)
+                .label("pending"),
+                func.count()
+                .filter(status == PromotionCodeUsageStatus.FAILED)
+                .label("failed"),
+                func.coalesce(
+                    func.sum(PromotionCodeUsage.credits_granted).filter(
+                        status == PromotionCodeUsageStatus.COMPLETED
+                    ),
+                    0,
+                ).label("total_credits_distributed"),
+                func.count(func.distinct(PromotionCodeUsage.user_id)).label(
+                    "unique_users"
+                ),
+                func.count(func.distinct(PromotionCodeUsage.virtual_lab_id)).label(
+                    "unique_virtual_labs"
+                ),
+            ).where(and_(*conditions))
+        )
+    ).one()
+
+    stats = dict(row._mapping)
+    stats["total_credits_distributed"] = int(stats["total_credits_distributed"])
+    return stats
+
+
+async def get_system_analytics(db: AsyncSession) -> Dict[str, int]:
+    """
+    Get system-wide promotion totals in one statement: the promotion counts
+    in a single pass over promotion_code, the redemption totals summed from
+    the per-code rollup.
+
+    Args:
+        db: Database session
+
+    Returns:
+        Dictionary with system-wide statistics
+    """
+    now = datetime.now(timezone.utc)
+    promotions = select(
+        func.count().label("total_promotions"),
+        func.count().filter(PromotionCode.active.is_(True)).label("active_promotions"),
+        func.count()
+        .filter(PromotionCode.valid_until < now)
+        .label("expired_promotions"),
+    ).subquery()
+    usage = select(
+        func.coalesce(func.sum(PromotionCodeUsageRollup.completed), 0).label(
+            "total_redemptions"
+        ),
+        func.coalesce(
+            func.sum(PromotionCodeUsageRollup.total_credits_distributed), 0
+        ).label("total_credits_distributed"),
+    ).subquery()
+
+    row = (await db.execute(select(promotions, usage))).one()
+    return {key: int(value) for key, value in row._mapping.items()}
+
+
+async def _apply_rollup_deltas(
+    db: AsyncSession, promotion_code_id: UUID, deltas: Dict[str, int]
+) -> None:
+    columns = PromotionCodeUsageRollup.__table__.c
+    stmt = insert(PromotionCodeUsageRollup).values(
+        promotion_code_id=promotion_code_id,
+        total_redemptions=deltas.get("total_redemptions", 0),
+        completed=deltas.get("completed", 0),
+        pending=deltas.get("pending", 0),
+        failed=deltas.get("failed", 0),
+        total_credits_distributed=deltas.get("total_credits_distributed", 0),
+        unique_users=deltas.get("unique_users", 0),
+        unique_virtual_labs=deltas.get("unique_virtual_labs", 0),
+        updated_at=func.now(),
+    )
+    stmt = stmt.on_conflict_do_update(
+        index_elements=[columns.promotion_code_id],
+        set_={
+            **{name: columns[name] + stmt.excluded[name] for name in deltas},
+            "updated_at": func.now(),
+        },
+    )
+    await db.execute(stmt)
+
+
+async def record_usage_created(
+    db: AsyncSession,
+    promotion_code_id: UUID,
+    user_id: UUID,
+    virtual_lab_id: UUID,
+    credits_granted: int,
+    status: PromotionCodeUsageStatus,
+) -> None:
+    """
+    Count a new usage in the rollup.
+    Must run before the usage row is flushed, so that the first usage of a
+    user or virtual lab for the code is recognised as such. Redemptions lock
+    the promotion code row, so these checks do not race for the same code.
+
+    Args:
+        db: Database session
+        promotion_code_id: Promotion code UUID
+        user_id: User UUID
+        virtual_lab_id: Virtual lab UUID
+        credits_granted: Amount of credits granted
+        status: Initial status of the usage
+    """
+    same_code = PromotionCodeUsage.promotion_code_id == promotion_code_id
+    new_user, new_lab = (
+        await db.execute(
+            select(
+                ~exists().where(same_code, PromotionCodeUsage.user_id == user_id),
+                ~exists().where(
+                    same_code, PromotionCodeUsage.virtual_lab_id == virtual_lab_id
+                ),
+            )
+        )
+    ).one()
+
+    deltas = {
+        "total_redemptions": 1,
+        STATUS_COUNTERS[status]: 1,
+        "unique_users": int(new_user),
+        "unique_virtual_labs": int(new_lab),
+    }
+    if status == PromotionCodeUsageStatus.COMPLETED:
+        deltas["total_credits_distributed"] = credits_granted
+    await _apply_rollup_deltas(db, promotion_code_id, deltas)
+
+
+async def record_status_change(
+    db: AsyncSession,
+    promotion_code_id: UUID,
+    credits_granted: int,
+    old_status: PromotionCodeUsageStatus,
+    new_status: PromotionCodeUsageStatus,
+) -> None:
+    """
+    Move a usage between the status counters of the rollup.
+
+    Args:
+        db: Database session
+        promotion_code_id: Promotion code UUID
+        credits_granted: Amount of credits granted by the usage
+        old_status: Status before the change
+        new_status: Status after the change
+    """
+    if old_status == new_status:
+        return
+
+    deltas = {STATUS_COUNTERS[old_status]: -1, STATUS_COUNTERS[new_status]: 1}
+    if new_status == PromotionCodeUsageStatus.COMPLETED:
+        deltas["total_credits_distributed"] = credits_granted
+    elif old_status == PromotionCodeUsageStatus.COMPLETED:
+        deltas["total_credits_distributed"] = -credits_granted
+    await _apply_rollup_deltas(db, promotion_code_id, deltas)
@@ -268,24 +268,3 @@ async def list_promotions(
     promotions = list(result.scalars().all())
 
     return promotions, total
-
-
-async def get_active_promotions_count(db: AsyncSession) -> int:
-    """Get count of active promotion codes."""
-    result = await db.scalar(
-        select(func.count())
-        .select_from(PromotionCode)
-        .where(PromotionCode.active.is_(True))
-    )
-    return result or 0
-
-
-async def get_expired_promotions_count(db: AsyncSession) -> int:
-    """Get count of expired promotion codes."""
-    now = datetime.now(timezone.utc)
-    result = await db.scalar(
-        select(func.count())
-        .select_from(PromotionCode)
-        .where(PromotionCode.valid_until < now)
-    )
-    return result or 0
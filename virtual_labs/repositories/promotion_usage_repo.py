@@ -4,19 +4,20 @@ Handles recording and tracking promotion code redemptions.
 """
 
 from datetime import datetime, timezone
-from typing import Any, Dict, List, Optional
+from typing import List, Optional
 from uuid import UUID
 
 from sqlalchemy import and_, func, select
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import joinedload
 
-from virtual_labs.domain.promotion import PromotionUsageFilters, UsageHistoryFilters
+from virtual_labs.domain.promotion import UsageHistoryFilters
 from virtual_labs.infrastructure.db.models import (
     PromotionCodeRedemptionAttempt,
     PromotionCodeUsage,
     PromotionCodeUsageStatus,
 )
+from virtual_labs.repositories import promotion_analytics_repo
 
 
 async def create_usage(
@@ -41,6 +42,15 @@ async def create_usage(
     Returns:
         Created PromotionCodeUsage
     """
+    await promotion_analytics_repo.record_usage_created(
+        db,
+        promotion_code_id=promotion_code_id,
+        user_id=user_id,
+        virtual_lab_id=virtual_lab_id,
+        credits_granted=credits_granted,
+        status=status,
+    )
+
     usage = PromotionCodeUsage(
         promotion_code_id=promotion_code_id,
         user_id=user_id,
@@ -79,6 +89,14 @@ async def update_status(
     if usage is None:
         raise ValueError(f"Usage record {usage_id} not found")
 
+    await promotion_analytics_repo.record_status_change(
+        db,
+        promotion_code_id=usage.promotion_code_id,
+        credits_granted=usage.credits_granted,
+        old_status=usage.status,
+        new_status=status,
+    )
+
     usage.status = status
     if accounting_transaction_id:
         usage.accounting_transaction_id = accounting_transaction_id
@@ -183,128 +201,6 @@ async def get_user_usage_history(
     return usages, count
 
 
-async def get_promotion_usage_stats(
-    db: AsyncSession,
-    promotion_code_id: UUID,
-    filters: Optional[PromotionUsageFilters] = None,
-) -> Dict[str, Any]:
-    """
-    Get usage statistics for a promotion code.
-
-    Args:
-        db: Database session
-        promotion_code_id: Promotion code UUID
-        filters: Optional filters for date range and status
-
-    Returns:
-        Dictionary with usage statistics
-    """
-    # Build base conditions
-    conditions = [PromotionCodeUsage.promotion_code_id == promotion_code_id]
-
-    if filters:
-        if filters.start_date:
-            conditions.append(PromotionCodeUsage.redeemed_at >= filters.start_date)
-        if filters.end_date:
-            conditions.append(PromotionCodeUsage.redeemed_at <= filters.end_date)
-        if filters.status:
-            conditions.append(PromotionCodeUsage.status == filters.status)
-
-    total = (
-        await db.scalar(
-            select(func.count())
-            .select_from(PromotionCodeUsage)
-            .where(and_(*conditions))
-        )
-        or 0
-    )
-
-    completed = (
-        await db.scalar(
-            select(func.count())
-            .select_from(PromotionCodeUsage)
-            .where(
-                and_(
-                    *conditions,
-                    PromotionCodeUsage.status == PromotionCodeUsageStatus.COMPLETED,
-                )
-            )
-        )
-        or 0
-    )
-
-    pending = (
-        await db.scalar(
-            select(func.count())
-            .select_from(PromotionCodeUsage)
-            .where(
-                and_(
-                    *conditions,
-                    PromotionCodeUsage.status == PromotionCodeUsageStatus.PENDING,
-                )
-            )
-        )
-        or 0
-    )
-
-    failed = (
-        await db.scalar(
-            select(func.count())
-            .select_from(PromotionCodeUsage)
-            .where(
-                and_(
-                    *conditions,
-                    PromotionCodeUsage.status == PromotionCodeUsageStatus.FAILED,
-                )
-            )
-        )
-        or 0
-    )
-
-    # Total credits distributed
-    total_credits = (
-        await db.scalar(
-            select(func.sum(PromotionCodeUsage.credits_granted))
-            .select_from(PromotionCodeUsage)
-            .where(
-                and_(
-                    *conditions,
-                    PromotionCodeUsage.status == PromotionCodeUsageStatus.COMPLETED,
-                )
-            )
-        )
-        or 0
-    )
-
-    unique_users = (
-        await db.scalar(
-            select(func.count(func.distinct(PromotionCodeUsage.user_id)))
-            .select_from(PromotionCodeUsage)
-            .where(and_(*conditions))
-        )
-        or 0
-    )
-
-    unique_labs = (
-        await db.scalar(
-            select(func.count(func.distinct(PromotionCodeUsage.virtual_lab_id)))
-            .select_from(PromotionCodeUsage)
-            .where(and_(*conditions))
-        )
-        or 0
-    )
-
-    return {
-        "total_redemptions": total,
-        "completed": completed,
-        "pending": pending,
-        "failed": failed,
-        "total_credits_distributed": int(total_credits),
-        "unique_users": unique_users,
-        "unique_virtual_labs": unique_labs,
-    }
-
-
 async def get_recent_redemptions(
     db: AsyncSession, promotion_code_id: UUID, limit: int = 20
 ) -> List[PromotionCodeUsage]:
@@ -393,23 +289,3 @@ async def get_failed_attempts_count(
         )
     )
     return result or 0
-
-
-async def get_total_redemptions_count(db: AsyncSession) -> int:
-    """Get total count of all redemptions (completed only)."""
-    result = await db.scalar(
-        select(func.count())
-        .select_from(PromotionCodeUsage)
-        .where(PromotionCodeUsage.status == PromotionCodeUsageStatus.COMPLETED)
-    )
-    return result or 0
-
-
-async def get_total_credits_distributed(db: AsyncSession) -> int:
-    """Get total credits distributed across all promotions."""
-    result = await db.scalar(
-        select(func.sum(PromotionCodeUsage.credits_granted))
-        .select_from(PromotionCodeUsage)
-        .where(PromotionCodeUsage.status == PromotionCodeUsageStatus.COMPLETED)
-    )
-    return int(result) if result else 0
@@ -2,16 +2,17 @@ from datetime import datetime
 from typing import Literal, Optional, Union, overload
 from uuid import UUID
 
-from sqlalchemy import and_, func, select
+from sqlalchemy import and_, select
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import (
     joinedload,
-    noload,
     selectin_polymorphic,
     with_polymorphic,
 )
 from sqlalchemy.sql import ColumnElement
 
+from virtual_labs.core.keyset import KeysetPage, paginate
+from virtual_labs.domain.common import CursorPaginationRequest
 from virtual_labs.infrastructure.db.models import (
     FreeSubscription,
     PaidSubscription,
@@ -54,12 +55,12 @@ class SubscriptionRepository:
         virtual_lab_id: Optional[UUID] = None,
         status: Optional[SubscriptionStatus] = None,
         subscription_type: Optional[str] = None,
-        offset: int,
-        limit: int,
-    ) -> tuple[list[Subscription], int]:
+        pagination: CursorPaginationRequest,
+    ) -> KeysetPage[Subscription]:
         """Global paginated subscription listing for the platform-admin
-        namespace. Returns ``(rows, total)`` with the tier eagerly
-        loaded. All filter fields live on the polymorphic base table.
+        namespace, with the tier eagerly loaded. All filter fields live
+        on the polymorphic base table. Newest first, paged by offset or
+        keyset over ``ix_subscription_created_at_id``.
         """
         conditions: list[ColumnElement[bool]] = []
         if user_id is not None:
@@ -77,26 +78,31 @@ class SubscriptionRepository:
         if conditions:
             base = base.where(and_(*conditions))
 
-        total = (
-            await self.db_session.scalar(
-                select(func.count()).select_from(base.options(noload("*")).subquery())
-            )
-        ) or 0
-
-        rows = (
-            (
-                await self.db_session.execute(
-                    base.options(joinedload(Subscription.tier))
-                    .order_by(Subscription.created_at.desc(), Subscription.id.asc())
-                    .offset(offset)
-                    .limit(limit)
-                )
-            )
-            .scalars()
-            .all()
+        return await paginate(
+            self.db_session,
+            base.options(joinedload(Subscription.tier)),
+            order_by=(Subscription.created_at.desc(), Subscription.id.desc()),
+            cursor=pagination.cursor,
+            offset=pagination.offset,
+            limit=pagination.page_size,
+            count=pagination.count,
         )
 
-        return list(rows), total
+    async def list_user_paid_subscriptions_page(
+        self, user_id: UUID, pagination: CursorPaginationRequest
+    ) -> KeysetPage[PaidSubscription]:
+        """One page of a user's paid subscriptions, newest first, paged by
+        offset or keyset.
+        """
+        return await paginate(
+            self.db_session,
+            select(PaidSubscription).where(PaidSubscription.user_id == user_id),
+            order_by=(Subscription.created_at.desc(), Subscription.id.desc()),
+            cursor=pagination.cursor,
+            offset=pagination.offset,
+            limit=pagination.page_size,
+            count=pagination.count,
+        )
 
     async def get_subscription_by_id_with_tier(
         self, subscription_id: UUID
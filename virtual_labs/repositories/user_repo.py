@@ -1,4 +1,5 @@
-from typing import Any, Dict, List, Literal, Tuple, cast
+import asyncio
+from typing import Any, Dict, Iterable, List, Literal, Tuple, cast
 from uuid import UUID, uuid4
 
 from keycloak import KeycloakAdmin  # type: ignore[import-untyped]
@@ -6,12 +7,24 @@ from loguru import logger
 from pydantic import UUID4
 
 from virtual_labs.core.exceptions.identity_error import IdentityError
+from virtual_labs.infrastructure.cache import TTLCache
 from virtual_labs.infrastructure.kc.config import KeycloakRealm, kc_auth
+from virtual_labs.infrastructure.kc.group_cache import invalidate_membership
 from virtual_labs.infrastructure.kc.models import (
     GroupRepresentation,
     UserInfo,
     UserRepresentation,
 )
+from virtual_labs.infrastructure.settings import settings
+from virtual_labs.repositories.group_repo import GroupQueryRepository
+
+# Lookups by (lower-cased) email, including misses: a pending invite
+# usually targets an email that has no Keycloak account yet. Entries are
+# 1-tuples so a cached miss is told apart from a cache miss.
+_users_by_email_cache: TTLCache[str, Tuple[UserRepresentation | None]] = TTLCache(
+    maxsize=settings.KC_TOKEN_CACHE_MAX_ENTRIES,
+    ttl=settings.KC_USER_LOOKUP_CACHE_SECONDS,
+)
 
 
 class UserQueryRepository:
@@ -25,14 +38,6 @@ class UserQueryRepository:
         user = await self.Kc.a_get_user(user_id=user_id)
         return cast(Dict[str, Any], user)
 
-    def retrieve_user_from_kc(self, user_id: str) -> UserRepresentation:
-        try:
-            return UserRepresentation(**self.Kc.get_user(user_id))
-        except Exception as error:
-            raise IdentityError(
-                message=f"User with id {user_id} not found", detail=str(error)
-            )
-
     async def a_retrieve_user_from_kc(self, user_id: str) -> UserRepresentation:
         try:
             user = await self.Kc.a_get_user(user_id)
@@ -42,15 +47,8 @@ class UserQueryRepository:
                 message=f"User with id {user_id} not found", detail=str(error)
             )
 
-    def retrieve_user_by_email_soft(
-        self, email: str
-    ) -> List[UserRepresentation] | None:
-        return [
-            UserRepresentation(**user) for user in self.Kc.get_users({"email": email})
-        ]
-
-    def retrieve_user_by_email(self, email: str) -> UserRepresentation | None:
-        users = self.Kc.get_users({"email": email, "exact": "true"})
+    async def a_retrieve_user_by_email(self, email: str) -> UserRepresentation | None:
+        users = await self.Kc.a_get_users({"email": email, "exact": "true"})
         if not isinstance(users, list):
             logger.error(
                 f"Expected a list of users for email {email} but received type {type(users)} : {users}"
@@ -80,26 +78,40 @@ class UserQueryRepository:
                     f"Expected 1 user with email {email} but found {len(users)}"
                 )
 
-    def retrieve_user_groups(self, user_id: UUID4) -> List[GroupRepresentation]:
-        try:
-            groups = [
-                GroupRepresentation(**group)
-                for group in self.Kc.get_user_groups(user_id=user_id)
-            ]
-            return groups
-        except Exception as error:
-            logger.error(f"Error when retrieving groups for user {user_id}: {error}")
-            raise IdentityError(
-                message=f"Permissions for user {user_id} could not be retrieved.",
-                detail=str(error),
-            )
-
-    def is_user_in_group(self, user_id: UUID4, group_id: str) -> bool:
-        current_groups = [group.id for group in self.retrieve_user_groups(user_id)]
-        return group_id in current_groups
+    async def a_retrieve_users_by_emails(
+        self, emails: Iterable[str]
+    ) -> Dict[str, UserRepresentation | None]:
+        """Resolve many emails at once, keyed by lower-cased email.
 
-    def get_all_users_count(self) -> int:
-        return len(self.Kc.get_users())
+        Lookups run concurrently (at most `KC_USER_LOOKUP_CONCURRENCY` in
+        flight) and are cached for `KC_USER_LOOKUP_CACHE_SECONDS`, so a
+        listing costs about one Keycloak round-trip instead of one per
+        email. Raises like `a_retrieve_user_by_email` on ambiguous emails.
+        """
+        resolved: Dict[str, UserRepresentation | None] = {}
+        pending: List[str] = []
+        for email in {email.lower() for email in emails}:
+            cached = _users_by_email_cache.get(email)
+            if cached is not None:
+                resolved[email] = cached[0]
+            else:
+                pending.append(email)
+
+        semaphore = asyncio.Semaphore(settings.KC_USER_LOOKUP_CONCURRENCY)
+
+        async def resolve(email: str) -> UserRepresentation | None:
+            async with semaphore:
+                return await self.a_retrieve_user_by_email(email)
+
+        users = await asyncio.gather(*(resolve(email) for email in pending))
+        for email, user in zip(pending, users):
+            _users_by_email_cache.set(email, (user,))
+            resolved[email] = user
+        return resolved
+
+    async def a_get_all_users_count(self) -> int:
+        count = await self.Kc.a_users_count()
+        return cast(int, count)
 
     async def a_list_users(
         self, *, search: str | None, offset: int, limit: int
@@ -130,8 +142,12 @@ class UserQueryRepository:
                 detail=str(error),
             )
 
+    async def a_is_user_in_group(self, user_id: UUID4, group_id: str) -> bool:
+        current_groups = await self.a_retrieve_user_groups(user_id)
+        return group_id in [group.id for group in current_groups]
+
     async def get_group_user_count(self, group_id: str) -> int:
-        members = await self.Kc.a_get_group_members(group_id=group_id)
+        members = await GroupQueryRepository().a_retrieve_group_users(group_id)
         return len(members)
 
     async def get_user_info(self, token: str) -> UserInfo:
@@ -150,25 +166,6 @@ class UserMutationRepository:
         self.Kc = KeycloakRealm
         self.Kc_auth = kc_auth
 
-    def attach_user_to_group(
-        self,
-        *,
-        user_id: UUID4,
-        group_id: str,
-    ) -> Any | Dict[str, str]:
-        try:
-            return self.Kc.group_user_add(user_id=user_id, group_id=group_id)
-        except Exception as error:
-            logger.error(
-                f"Keycloak error when adding user {user_id} to group {group_id}: {error}"
-            )
-            err = IdentityError(
-                message=f"Could not add user {user_id} to group {group_id}",
-                detail=str(error),
-            )
-            err.add_note("Most likely the user does not exist in keycloak")
-            raise err
-
     async def a_attach_user_to_group(
         self,
         *,
@@ -176,7 +173,7 @@ class UserMutationRepository:
         group_id: str,
     ) -> Any | Dict[str, str]:
         try:
-            return await self.Kc.a_group_user_add(user_id=user_id, group_id=group_id)
+            result = await self.Kc.a_group_user_add(user_id=user_id, group_id=group_id)
         except Exception as error:
             logger.error(
                 f"Keycloak error when adding user {user_id} to group {group_id}: {error}"
@@ -187,14 +184,8 @@ class UserMutationRepository:
             )
             err.add_note("Most likely the user does not exist in keycloak")
             raise err
-
-    def detach_user_from_group(
-        self,
-        *,
-        user_id: UUID4,
-        group_id: str,
-    ) -> Any | Dict[str, str]:
-        return self.Kc.group_user_remove(user_id=user_id, group_id=group_id)
+        await invalidate_membership(user_id, group_id)
+        return result
 
     async def a_detach_user_from_group(
         self,
@@ -202,28 +193,30 @@ class UserMutationRepository:
         user_id: UUID4,
         group_id: str,
     ) -> Any | Dict[str, str]:
-        return await self.Kc.a_group_user_remove(user_id=user_id, group_id=group_id)
+        result = await self.Kc.a_group_user_remove(user_id=user_id, group_id=group_id)
+        await invalidate_membership(user_id, group_id)
+        return result
 
-    def create_user(
+    async def a_create_user(
         self,
         *,
         user_email: str,
     ) -> UUID4:
         # TODO: change the format later, this must be unique for keycloak
         username = user_email.split("@")[0] + "@" + uuid4().hex
-        user_id = self.Kc.create_user(
+        user_id = await self.Kc.a_create_user(
             payload={"email": user_email, "username": username}
         )
         return UUID(user_id)
 
-    def create_test_user(
+    async def a_create_test_user(
         self,
         *,
         user_email: str,
     ) -> UUID4:
         # TODO: change the format later, this must be unique for keycloak
         username = user_email.split("@")[0] + "@" + uuid4().hex
-        user_id = self.Kc.create_user(
+        user_id = await self.Kc.a_create_user(
             payload={
                 "email": user_email,
                 "username": username,
@@ -31,6 +31,7 @@ from virtual_labs.external.accounting.models import (
     VlabBalanceResponse,
 )
 from virtual_labs.infrastructure.db.config import default_session_factory
+from virtual_labs.infrastructure.db.loading import LAB_DETAIL
 from virtual_labs.infrastructure.kc.auth import verify_jwt
 from virtual_labs.infrastructure.kc.config import kc_auth
 from virtual_labs.infrastructure.kc.models import AuthUser
@@ -58,7 +59,7 @@ async def _authorize_budget_operation(
     user_id = str(get_user_id_from_auth(auth))
 
     # Check if the caller is a service admin
-    user_info = kc_auth.userinfo(token=token)
+    user_info = await kc_auth.a_userinfo(token=token)
     user_groups = user_info.get("groups", [])
     is_service_admin = VLAB_SERVICE_ADMIN_GROUP in user_groups
 
@@ -78,7 +79,9 @@ async def _authorize_budget_operation(
             )
 
     # Course vlab restriction: only service admins may operate
-    vlab = await get_undeleted_virtual_lab(session, lab_id=virtual_lab_id)
+    vlab = await get_undeleted_virtual_lab(
+        session, lab_id=virtual_lab_id, options=LAB_DETAIL
+    )
     if vlab.course and not is_service_admin:
         raise VliError(
             error_code=VliErrorCode.NOT_ALLOWED_OP,
@@ -20,6 +20,7 @@ from virtual_labs.routes.admin.labs import router as labs_router
 from virtual_labs.routes.admin.payments import router as payments_router
 from virtual_labs.routes.admin.plans import router as plans_router
 from virtual_labs.routes.admin.projects import router as projects_router
+from virtual_labs.routes.admin.runtime import router as runtime_router
 from virtual_labs.routes.admin.subscriptions import router as subscriptions_router
 from virtual_labs.routes.admin.users import router as users_router
 
@@ -31,3 +32,4 @@ router.include_router(users_router)
 router.include_router(subscriptions_router)
 router.include_router(payments_router)
 router.include_router(plans_router)
+router.include_router(runtime_router)
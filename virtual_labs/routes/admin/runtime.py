@@ -0,0 +1,36 @@
+from dataclasses import asdict
+
+from fastapi import APIRouter
+
+from virtual_labs.domain.admin import (
+    AdminCacheStats,
+    AdminConnectionPoolStats,
+    AdminRedisPoolStats,
+    AdminRuntimeStats,
+)
+from virtual_labs.external.accounting.client import accounting_pool_stats
+from virtual_labs.infrastructure.cache import tiered_cache_stats
+from virtual_labs.infrastructure.redis import redis_pool_stats
+from virtual_labs.infrastructure.stripe.object_cache import stripe_object_cache
+from virtual_labs.routes.admin.deps import PLATFORM_ADMIN_TAG_PREFIX
+
+router = APIRouter(tags=[f"{PLATFORM_ADMIN_TAG_PREFIX} | Runtime"])
+
+
+@router.get(
+    "/runtime",
+    response_model=AdminRuntimeStats,
+    summary="Connection pool and cache figures of the worker serving the request",
+)
+async def get_runtime_stats() -> AdminRuntimeStats:
+    return AdminRuntimeStats(
+        accounting_pool=AdminConnectionPoolStats(**asdict(accounting_pool_stats())),
+        redis_pool=AdminRedisPoolStats(**asdict(redis_pool_stats())),
+        caches={
+            namespace: AdminCacheStats(**asdict(stats), hit_ratio=stats.hit_ratio)
+            for namespace, stats in {
+                **tiered_cache_stats(),
+                "stripe-objects": stripe_object_cache.stats(),
+            }.items()
+        },
+    )
@@ -0,0 +1,27 @@
+from fastapi import APIRouter, Depends
+from pydantic import UUID4
+
+from virtual_labs.core.types import VliAppResponse
+from virtual_labs.domain.email import EmailJobOut
+from virtual_labs.infrastructure.kc.auth import verify_jwt
+from virtual_labs.infrastructure.kc.models import AuthUser
+from virtual_labs.shared.utils.auth import get_user_id_from_auth
+from virtual_labs.usecases import emails as usecases
+
+router = APIRouter(prefix="/emails", tags=["Email Endpoints"])
+
+
+@router.get(
+    "/{job_id}",
+    operation_id="get_email_job",
+    summary="Get the delivery status of a queued email",
+    response_model=VliAppResponse[EmailJobOut],
+)
+async def get_email_job_endpoint(
+    job_id: UUID4,
+    auth: tuple[AuthUser, str] = Depends(verify_jwt),
+) -> VliAppResponse[EmailJobOut]:
+    return VliAppResponse[EmailJobOut](
+        message="Email job found",
+        data=await usecases.get_email_job(job_id, get_user_id_from_auth(auth)),
+    )
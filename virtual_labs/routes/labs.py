@@ -241,14 +241,14 @@ async def invite_user_to_virtual_lab(
     session: AsyncSession = Depends(default_session_factory),
     auth: tuple[AuthUser, str] = Depends(verify_jwt),
 ) -> LabResponse[InvitationResponse]:
-    invite_id = await usecases.invite_user_to_lab(
+    invitation = await usecases.invite_user_to_lab(
         virtual_lab_id,
         inviter_id=get_user_id_from_auth(auth),
         invite_details=invite_details,
         db=session,
     )
     return LabResponse[InvitationResponse](
-        message="Invite sent to user", data=InvitationResponse(id=invite_id)
+        message="Invite sent to user", data=invitation
     )
 
 
@@ -1,5 +1,5 @@
 from datetime import datetime
-from typing import Optional
+from typing import Annotated, Optional
 
 from fastapi import APIRouter, Depends, Query
 from pydantic import UUID4
@@ -18,6 +18,7 @@ from virtual_labs.domain.seat import (
     ProvisionSeatsBody,
     ProvisionSeatsResponse,
     SeatBatchSearchResponse,
+    SeatBatchSummaryOut,
     SeatDetailOut,
     TransferSeatsBody,
     TransferSeatsResponse,
@@ -49,6 +50,22 @@ async def provision_seats_endpoint(
     return await usecases.provision_seats(session, payload)
 
 
+@router.get(
+    "/batches/paginated",
+    operation_id="search_seat_batches_paginated",
+    summary="Search seat batch summaries with filters, paginated",
+    description="Batches newest first with their seat counts; fetch the seats of a batch with `GET /seats/batches/{batch_id}` and continue with the `next_cursor` of the previous page",
+    response_model=ListResponse[SeatBatchSummaryOut],
+)
+@verify_service_admin([VLAB_SERVICE_ADMIN_GROUP])
+async def search_seat_batches_paginated_endpoint(
+    params: Annotated[usecases.SeatBatchSearchQuery, Query()],
+    session: AsyncSession = Depends(default_session_factory),
+    auth: tuple[AuthUser, str] = Depends(verify_jwt),
+) -> ListResponse[SeatBatchSummaryOut]:
+    return await usecases.search_seat_batches_page(session, params)
+
+
 @router.get(
     "/batches/{batch_id}",
     operation_id="get_seat_batch",
@@ -1,11 +1,12 @@
 from datetime import datetime
-from typing import List, Optional, Tuple
+from typing import Annotated, List, Optional, Tuple
 from uuid import UUID
 
 from fastapi import APIRouter, Depends, Query, Response
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from virtual_labs.core.types import VliAppResponse
+from virtual_labs.domain.common import CursorPaginationRequest, PaginatedResponse
 from virtual_labs.domain.payment import PaymentFilter, PaymentListResponse, PaymentType
 from virtual_labs.domain.subscription import (
     CancelSubscriptionRequest,
@@ -14,6 +15,7 @@ from virtual_labs.domain.subscription import (
     SubscriptionDetails,
     SubscriptionStatusResponse,
     SubscriptionTiersListResponse,
+    UserSubscriptionAndPaymentsHistory,
     UserSubscriptionResponse,
     UserSubscriptionsResponse,
 )
@@ -31,6 +33,7 @@ from virtual_labs.usecases.subscription import (
     list_payments_usecase,
     list_subscription_tiers_usecase,
     list_subscriptions_usecase,
+    list_user_subscriptions_history_page_usecase,
     list_user_subscriptions_history_usecase,
 )
 
@@ -258,6 +261,27 @@ async def list_user_subscriptions_with_payments(
     return await list_user_subscriptions_history_usecase(db, auth)
 
 
+@router.get(
+    "/history/paginated",
+    operation_id="list_user_subscriptions_with_payments_paginated",
+    summary="List the current user's subscriptions with payment history, paginated",
+    description="Paginated variant of the subscription history for users with many subscriptions; continue with the `next_cursor` of the previous page",
+    response_model=VliAppResponse[
+        PaginatedResponse[UserSubscriptionAndPaymentsHistory]
+    ],
+)
+async def list_user_subscriptions_with_payments_paginated(
+    pagination: Annotated[CursorPaginationRequest, Query()],
+    db: AsyncSession = Depends(default_session_factory),
+    auth: Tuple[AuthUser, str] = Depends(a_verify_jwt),
+) -> Response:
+    """
+    one page of the authenticated user's subscriptions, newest first, each
+    with its payments.
+    """
+    return await list_user_subscriptions_history_page_usecase(db, auth, pagination)
+
+
 @router.get(
     "/{subscription_id}",
     operation_id="get_subscription",
@@ -23,7 +23,9 @@ async def _run_expire_courses() -> None:
     try:
         logger.info("Running scheduled job: expire_courses")
         async with session_pool.session() as db:
-            summary = await expire_courses(db)
+            # every committed batch extends the lock, so a long run keeps
+            # it for as long as it makes progress
+            summary = await expire_courses(db, on_checkpoint=lock.reacquire)
         logger.info(f"expire_courses finished: {summary}")
     except Exception as ex:  # noqa: BLE001
         logger.error(f"expire_courses job failed: {ex}")
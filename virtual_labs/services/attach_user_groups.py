@@ -17,8 +17,8 @@ from virtual_labs.domain.project import (
 from virtual_labs.infrastructure.db.models import Project, VirtualLab
 from virtual_labs.infrastructure.email.add_member_to_project_email import (
     EmailDetails,
-    send_add_member_to_project_email,
 )
+from virtual_labs.infrastructure.email.queue import EmailJob, EmailKind, email_queue
 from virtual_labs.repositories.group_repo import GroupQueryRepository
 from virtual_labs.repositories.user_repo import UserMutationRepository
 
@@ -312,9 +312,10 @@ async def send_project_emails(
     virtual_lab_id: UUID4,
     virtual_lab_name: str,
     inviter_name: str,
+    requested_by: UUID4,
 ) -> List[EmailFailure]:
     """
-    Send emails to users added to project
+    Queue emails to users added to project
 
     Args:
         user_to_email_map: Dictionary mapping user email to role
@@ -323,37 +324,40 @@ async def send_project_emails(
         virtual_lab_id: Virtual lab ID
         virtual_lab_name: Virtual lab name
         inviter_name: Name of the user who initiated the invitation
+        requested_by: ID of that user, who may query the emails' status
 
     Returns:
-        List of failed email operations
+        List of emails that could not be queued
     """
-    email_failures: List[EmailFailure] = []
-
     try:
-        for email, role in user_to_email_map.items():
-            await send_add_member_to_project_email(
-                EmailDetails(
-                    lab_name=virtual_lab_name,
-                    project_name=project_name,
+        await email_queue.enqueue_many(
+            [
+                EmailJob(
+                    kind=EmailKind.ADD_MEMBER_TO_PROJECT,
                     recipient=email,
-                    inviter_name=inviter_name,
-                    lab_id=virtual_lab_id,
-                    project_id=project_id,
+                    details=EmailDetails(
+                        lab_name=virtual_lab_name,
+                        project_name=project_name,
+                        recipient=email,
+                        inviter_name=inviter_name,
+                        lab_id=virtual_lab_id,
+                        project_id=project_id,
+                    ),
                 )
-            )
-            logger.info(
-                f"Email sent to {email} for project {project_id} with role {role.value}"
-            )
+                for email in user_to_email_map
+            ],
+            requested_by=requested_by,
+        )
     except Exception as email_err:
         logger.error(
-            f"Error sending email to users for project {project_id}: {email_err}"
+            f"Error queueing emails to users for project {project_id}: {email_err}"
         )
-        for email in user_to_email_map.keys():
-            email_failures.append(
-                EmailFailure(
-                    email=email,
-                    error=str(email_err),
-                )
-            )
+        return [
+            EmailFailure(email=email, error=str(email_err))
+            for email in user_to_email_map
+        ]
 
-    return email_failures
+    logger.info(
+        f"Queued emails to {len(user_to_email_map)} users for project {project_id}"
+    )
+    return []
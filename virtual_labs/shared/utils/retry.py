@@ -0,0 +1,24 @@
+import asyncio
+from typing import Awaitable, Callable, TypeVar
+
+from loguru import logger
+
+T = TypeVar("T")
+
+
+async def retry_async(
+    call: Callable[[], Awaitable[T]],
+    *,
+    attempts: int,
+    delay: float,
+    label: str,
+) -> T:
+    """Await `call()` up to `attempts` times, doubling `delay` after each
+    failure; the error of the last attempt propagates."""
+    for attempt in range(1, attempts):
+        try:
+            return await call()
+        except Exception as error:  # noqa: BLE001
+            logger.warning(f"{label} failed (attempt {attempt}/{attempts}): {error}")
+            await asyncio.sleep(delay * 2 ** (attempt - 1))
+    return await call()
@@ -27,8 +27,14 @@ async def test_create_virtual_lab_account() -> None:
     }
 
     with (
-        patch("httpx.AsyncClient") as mock_client,
-        patch("virtual_labs.infrastructure.kc.auth.get_client_token") as mock_token,
+        patch(
+            "virtual_labs.external.accounting.client._client",
+            new_callable=AsyncMock,
+        ) as mock_client,
+        patch(
+            "virtual_labs.infrastructure.kc.client_token.ClientTokenProvider.get_token",
+            new_callable=AsyncMock,
+        ) as mock_token,
     ):
         mock_token.return_value = "test-token"
 
@@ -36,9 +42,9 @@ async def test_create_virtual_lab_account() -> None:
         mock_response.json = lambda: mock_response_data
         mock_response.raise_for_status = lambda: None
 
-        client_instance = AsyncMock()
+        client_instance = mock_client
+        client_instance.is_closed = False
         client_instance.post.return_value = mock_response
-        mock_client.return_value.__aenter__.return_value = client_instance
 
         result = await create_virtual_lab_account(vlab_id, vlab_name)
 
@@ -60,8 +66,14 @@ async def test_create_virtual_lab_account_with_initial_balance() -> None:
     }
 
     with (
-        patch("httpx.AsyncClient") as mock_client,
-        patch("virtual_labs.infrastructure.kc.auth.get_client_token") as mock_token,
+        patch(
+            "virtual_labs.external.accounting.client._client",
+            new_callable=AsyncMock,
+        ) as mock_client,
+        patch(
+            "virtual_labs.infrastructure.kc.client_token.ClientTokenProvider.get_token",
+            new_callable=AsyncMock,
+        ) as mock_token,
     ):
         mock_token.return_value = "test-token"
 
@@ -69,9 +81,9 @@ async def test_create_virtual_lab_account_with_initial_balance() -> None:
         mock_response.json = lambda: mock_response_data
         mock_response.raise_for_status = lambda: None
 
-        client_instance = AsyncMock()
+        client_instance = mock_client
+        client_instance.is_closed = False
         client_instance.post.return_value = mock_response
-        mock_client.return_value.__aenter__.return_value = client_instance
 
         result = await create_virtual_lab_account(vlab_id, vlab_name, Decimal(100))
 
@@ -94,8 +106,14 @@ async def test_create_project_account() -> None:
     }
 
     with (
-        patch("httpx.AsyncClient") as mock_client,
-        patch("virtual_labs.infrastructure.kc.auth.get_client_token") as mock_token,
+        patch(
+            "virtual_labs.external.accounting.client._client",
+            new_callable=AsyncMock,
+        ) as mock_client,
+        patch(
+            "virtual_labs.infrastructure.kc.client_token.ClientTokenProvider.get_token",
+            new_callable=AsyncMock,
+        ) as mock_token,
     ):
         mock_token.return_value = "test-token"
 
@@ -103,9 +121,9 @@ async def test_create_project_account() -> None:
         mock_response.json = lambda: mock_response_data
         mock_response.raise_for_status = lambda: None
 
-        client_instance = AsyncMock()
+        client_instance = mock_client
+        client_instance.is_closed = False
         client_instance.post.return_value = mock_response
-        mock_client.return_value.__aenter__.return_value = client_instance
 
         result = await create_project_account(vlab_id, project_id, project_name)
 
@@ -24,8 +24,14 @@ async def test_top_up() -> None:
     mock_response_data = {"message": "Top-up operation executed", "data": None}
 
     with (
-        patch("httpx.AsyncClient") as mock_client,
-        patch("virtual_labs.infrastructure.kc.auth.get_client_token") as mock_token,
+        patch(
+            "virtual_labs.external.accounting.client._client",
+            new_callable=AsyncMock,
+        ) as mock_client,
+        patch(
+            "virtual_labs.infrastructure.kc.client_token.ClientTokenProvider.get_token",
+            new_callable=AsyncMock,
+        ) as mock_token,
     ):
         mock_token.return_value = "test-token"
 
@@ -33,9 +39,9 @@ async def test_top_up() -> None:
         mock_response.json = lambda: mock_response_data
         mock_response.raise_for_status = lambda: None
 
-        client_instance = AsyncMock()
+        client_instance = mock_client
+        client_instance.is_closed = False
         client_instance.post.return_value = mock_response
-        mock_client.return_value.__aenter__.return_value = client_instance
 
         result = await top_up_virtual_lab_budget(vlab_id, amount)
 
@@ -53,8 +59,14 @@ async def test_assign() -> None:
     }
 
     with (
-        patch("httpx.AsyncClient") as mock_client,
-        patch("virtual_labs.infrastructure.kc.auth.get_client_token") as mock_token,
+        patch(
+            "virtual_labs.external.accounting.client._client",
+            new_callable=AsyncMock,
+        ) as mock_client,
+        patch(
+            "virtual_labs.infrastructure.kc.client_token.ClientTokenProvider.get_token",
+            new_callable=AsyncMock,
+        ) as mock_token,
     ):
         mock_token.return_value = "test-token"
 
@@ -62,9 +74,9 @@ async def test_assign() -> None:
         mock_response.json = lambda: mock_response_data
         mock_response.raise_for_status = lambda: None
 
-        client_instance = AsyncMock()
+        client_instance = mock_client
+        client_instance.is_closed = False
         client_instance.post.return_value = mock_response
-        mock_client.return_value.__aenter__.return_value = client_instance
 
         result = await assign_project_budget(vlab_id, project_id, amount)
 
@@ -82,8 +94,14 @@ async def test_reverse() -> None:
     }
 
     with (
-        patch("httpx.AsyncClient") as mock_client,
-        patch("virtual_labs.infrastructure.kc.auth.get_client_token") as mock_token,
+        patch(
+            "virtual_labs.external.accounting.client._client",
+            new_callable=AsyncMock,
+        ) as mock_client,
+        patch(
+            "virtual_labs.infrastructure.kc.client_token.ClientTokenProvider.get_token",
+            new_callable=AsyncMock,
+        ) as mock_token,
     ):
         mock_token.return_value = "test-token"
 
@@ -91,9 +109,9 @@ async def test_reverse() -> None:
         mock_response.json = lambda: mock_response_data
         mock_response.raise_for_status = lambda: None
 
-        client_instance = AsyncMock()
+        client_instance = mock_client
+        client_instance.is_closed = False
         client_instance.post.return_value = mock_response
-        mock_client.return_value.__aenter__.return_value = client_instance
 
         result = await reverse_project_budget(vlab_id, project_id, amount)
 
@@ -112,8 +130,14 @@ async def test_move() -> None:
     }
 
     with (
-        patch("httpx.AsyncClient") as mock_client,
-        patch("virtual_labs.infrastructure.kc.auth.get_client_token") as mock_token,
+        patch(
+            "virtual_labs.external.accounting.client._client",
+            new_callable=AsyncMock,
+        ) as mock_client,
+        patch(
+            "virtual_labs.infrastructure.kc.client_token.ClientTokenProvider.get_token",
+            new_callable=AsyncMock,
+        ) as mock_token,
     ):
         mock_token.return_value = "test-token"
 
@@ -121,9 +145,9 @@ async def test_move() -> None:
         mock_response.json = lambda: mock_response_data
         mock_response.raise_for_status = lambda: None
 
-        client_instance = AsyncMock()
+        client_instance = mock_client
+        client_instance.is_closed = False
         client_instance.post.return_value = mock_response
-        mock_client.return_value.__aenter__.return_value = client_instance
 
         result = await move_project_budget(vlab_id, debited_from, credited_to, amount)
 
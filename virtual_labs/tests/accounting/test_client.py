@@ -0,0 +1,51 @@
+import pytest
+import pytest_asyncio
+
+from virtual_labs.external.accounting import client as accounting_client
+from virtual_labs.infrastructure.settings import settings
+
+
+@pytest_asyncio.fixture(autouse=True)
+async def reset_client():
+    await accounting_client.close_accounting_client()
+    yield
+    await accounting_client.close_accounting_client()
+
+
+@pytest.mark.asyncio
+async def test_accounting_client_is_shared_until_closed() -> None:
+    await accounting_client.open_accounting_client()
+    first = accounting_client.get_accounting_client()
+
+    assert accounting_client.get_accounting_client() is first
+
+    await accounting_client.close_accounting_client()
+    assert first.is_closed
+
+    second = accounting_client.get_accounting_client()
+    assert second is not first
+    assert not second.is_closed
+
+
+@pytest.mark.asyncio
+async def test_accounting_pool_stats_of_an_idle_pool() -> None:
+    accounting_client.get_accounting_client()
+
+    stats = accounting_client.accounting_pool_stats()
+
+    assert stats.max_connections == settings.ACCOUNTING_MAX_CONNECTIONS
+    assert stats.connections == 0
+    assert stats.active_connections == 0
+    assert stats.queued_requests == 0
+
+
+@pytest.mark.asyncio
+async def test_accounting_pool_stats_without_the_pool_internals(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    accounting_client.get_accounting_client()
+    monkeypatch.setattr(accounting_client, "_transport", object())
+
+    stats = accounting_client.accounting_pool_stats()
+
+    assert (stats.connections, stats.queued_requests) == (0, 0)
@@ -52,8 +52,14 @@ async def test_get_virtual_lab_reports() -> None:
     }
 
     with (
-        patch("httpx.AsyncClient") as mock_client,
-        patch("virtual_labs.infrastructure.kc.auth.get_client_token") as mock_token,
+        patch(
+            "virtual_labs.external.accounting.client._client",
+            new_callable=AsyncMock,
+        ) as mock_client,
+        patch(
+            "virtual_labs.infrastructure.kc.client_token.ClientTokenProvider.get_token",
+            new_callable=AsyncMock,
+        ) as mock_token,
     ):
         mock_token.return_value = "test-token"
 
@@ -61,9 +67,9 @@ async def test_get_virtual_lab_reports() -> None:
         mock_response.json = lambda: mock_response_data
         mock_response.raise_for_status = lambda: None
 
-        client_instance = AsyncMock()
+        client_instance = mock_client
+        client_instance.is_closed = False
         client_instance.get.return_value = mock_response
-        mock_client.return_value.__aenter__.return_value = client_instance
 
         result = await get_virtual_lab_reports(virtual_lab_id, page=1, page_size=10)
 
@@ -111,8 +117,14 @@ async def test_get_project_reports() -> None:
     }
 
     with (
-        patch("httpx.AsyncClient") as mock_client,
-        patch("virtual_labs.infrastructure.kc.auth.get_client_token") as mock_token,
+        patch(
+            "virtual_labs.external.accounting.client._client",
+            new_callable=AsyncMock,
+        ) as mock_client,
+        patch(
+            "virtual_labs.infrastructure.kc.client_token.ClientTokenProvider.get_token",
+            new_callable=AsyncMock,
+        ) as mock_token,
     ):
         mock_token.return_value = "test-token"
 
@@ -120,9 +132,9 @@ async def test_get_project_reports() -> None:
         mock_response.json = lambda: mock_response_data
         mock_response.raise_for_status = lambda: None
 
-        client_instance = AsyncMock()
+        client_instance = mock_client
+        client_instance.is_closed = False
         client_instance.get.return_value = mock_response
-        mock_client.return_value.__aenter__.return_value = client_instance
 
         result = await get_project_reports(project_id, page=1, page_size=10)
 
@@ -157,7 +157,8 @@ async def test_get_virtual_lab_by_project_success_for_entitycore_admin(
 
     with (
         patch(
-            "virtual_labs.core.authorization.verify_service_admin.kc_auth"
+            "virtual_labs.core.authorization.verify_service_admin.kc_auth",
+            new_callable=AsyncMock,
         ) as mock_kc,
         patch(
             "virtual_labs.repositories.labs.get_virtual_lab_id_by_project_id",
@@ -165,7 +166,7 @@ async def test_get_virtual_lab_by_project_success_for_entitycore_admin(
             return_value=fake_project,
         ) as mock_repo,
     ):
-        mock_kc.userinfo.return_value = {
+        mock_kc.a_userinfo.return_value = {
             "groups": [ENTITYCORE_SERVICE_ADMIN_GROUP],
         }
 
@@ -188,9 +189,10 @@ async def test_get_virtual_lab_by_project_forbidden_wrong_group(
     project_id = uuid4()
 
     with patch(
-        "virtual_labs.core.authorization.verify_service_admin.kc_auth"
+        "virtual_labs.core.authorization.verify_service_admin.kc_auth",
+        new_callable=AsyncMock,
     ) as mock_kc:
-        mock_kc.userinfo.return_value = {
+        mock_kc.a_userinfo.return_value = {
             "groups": ["/service/some-other-service/admin"],
         }
 
@@ -214,7 +216,8 @@ async def test_get_virtual_lab_by_project_not_found_for_admin(
 
     with (
         patch(
-            "virtual_labs.core.authorization.verify_service_admin.kc_auth"
+            "virtual_labs.core.authorization.verify_service_admin.kc_auth",
+            new_callable=AsyncMock,
         ) as mock_kc,
         patch(
             "virtual_labs.repositories.labs.get_virtual_lab_id_by_project_id",
@@ -222,7 +225,7 @@ async def test_get_virtual_lab_by_project_not_found_for_admin(
             side_effect=NoResultFound(),
         ),
     ):
-        mock_kc.userinfo.return_value = {
+        mock_kc.a_userinfo.return_value = {
             "groups": [ENTITYCORE_SERVICE_ADMIN_GROUP],
         }
 
@@ -22,8 +22,8 @@ async def test_vlm_project_creation(
 
     group_repo = GroupQueryRepository()
 
-    admin_group = group_repo.retrieve_group_by_name(name=admin_group_name)
-    member_group = group_repo.retrieve_group_by_name(name=member_group_name)
+    admin_group = await group_repo.a_retrieve_group_by_name(name=admin_group_name)
+    member_group = await group_repo.a_retrieve_group_by_name(name=member_group_name)
 
     # Test Kc group creation
     assert admin_group is not None
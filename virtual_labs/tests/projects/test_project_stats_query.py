@@ -0,0 +1,44 @@
+"""The stats queries count each child table independently (no database)."""
+
+from typing import Any
+from uuid import uuid4
+
+import pytest
+from sqlalchemy.dialects import postgresql
+
+from virtual_labs.repositories import labs
+from virtual_labs.repositories.project_repo import ProjectQueryRepository
+
+
+class _Result:
+    def first(self) -> None:
+        return None
+
+
+class CapturingSession:
+    def __init__(self) -> None:
+        self.sql = ""
+
+    async def execute(self, statement: Any) -> _Result:
+        self.sql = str(statement.compile(dialect=postgresql.dialect()))
+        return _Result()
+
+
+@pytest.mark.asyncio
+async def test_project_stats_use_one_subquery_per_child_table() -> None:
+    session = CapturingSession()
+    stats = await ProjectQueryRepository(session).retrieve_project_stats(uuid4())  # type: ignore[arg-type]
+
+    assert stats == {"total_stars": 0, "total_bookmarks": 0, "total_pending_invites": 0}
+    assert "JOIN" not in session.sql
+    assert session.sql.count("(SELECT count(") == 3
+
+
+@pytest.mark.asyncio
+async def test_lab_stats_use_one_subquery_per_child_table() -> None:
+    session = CapturingSession()
+    stats = await labs.get_virtual_lab_stats(session, uuid4())  # type: ignore[arg-type]
+
+    assert stats == {"total_projects": 0, "total_pending_invites": 0}
+    assert "JOIN" not in session.sql
+    assert session.sql.count("(SELECT count(") == 2
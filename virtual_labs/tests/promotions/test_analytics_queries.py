@@ -0,0 +1,122 @@
+"""Promotion statistics: the per-code rollup agrees with the usages."""
+
+from datetime import datetime, timezone
+from typing import Any, Dict
+from uuid import UUID, uuid4
+
+import pytest
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from virtual_labs.domain.promotion import PromotionUsageFilters
+from virtual_labs.infrastructure.db.models import (
+    PromotionCode,
+    PromotionCodeUsageStatus,
+)
+from virtual_labs.repositories import promotion_analytics_repo, promotion_usage_repo
+
+SINCE_2000 = PromotionUsageFilters(start_date=datetime(2000, 1, 1, tzinfo=timezone.utc))
+
+
+@pytest.mark.asyncio
+async def test_rollup_and_filtered_stats_agree_on_the_usages(
+    db_session: AsyncSession,
+    valid_promotion_code: PromotionCode,
+    mock_virtual_lab: Dict[str, Any],
+    test_user_id: UUID,
+) -> None:
+    code_id = valid_promotion_code.id
+    lab_id = UUID(mock_virtual_lab["id"])
+    system_before = await promotion_analytics_repo.get_system_analytics(db_session)
+
+    first = await promotion_usage_repo.create_usage(
+        db_session,
+        promotion_code_id=code_id,
+        user_id=test_user_id,
+        virtual_lab_id=lab_id,
+        credits_granted=100,
+        status=PromotionCodeUsageStatus.PENDING,
+    )
+    await promotion_usage_repo.create_usage(
+        db_session,
+        promotion_code_id=code_id,
+        user_id=test_user_id,
+        virtual_lab_id=lab_id,
+        credits_granted=200,
+        status=PromotionCodeUsageStatus.COMPLETED,
+    )
+    other = await promotion_usage_repo.create_usage(
+        db_session,
+        promotion_code_id=code_id,
+        user_id=uuid4(),
+        virtual_lab_id=lab_id,
+        credits_granted=300,
+        status=PromotionCodeUsageStatus.PENDING,
+    )
+    await promotion_usage_repo.update_status(
+        db_session, first.id, PromotionCodeUsageStatus.COMPLETED
+    )
+    await promotion_usage_repo.update_status(
+        db_session, other.id, PromotionCodeUsageStatus.FAILED
+    )
+    # unchanged status, the counters must not move
+    await promotion_usage_repo.update_status(
+        db_session, other.id, PromotionCodeUsageStatus.FAILED
+    )
+    await db_session.commit()
+
+    expected = {
+        "total_redemptions": 3,
+        "completed": 2,
+        "pending": 0,
+        "failed": 1,
+        "total_credits_distributed": 300,
+        "unique_users": 2,
+        "unique_virtual_labs": 1,
+    }
+    # no filters: read from the rollup, filters: aggregated over the usages
+    assert (
+        await promotion_analytics_repo.get_promotion_usage_stats(db_session, code_id)
+        == expected
+    )
+    assert (
+        await promotion_analytics_repo.get_promotion_usage_stats(
+            db_session, code_id, SINCE_2000
+        )
+        == expected
+    )
+
+    completed = await promotion_analytics_repo.get_promotion_usage_stats(
+        db_session,
+        code_id,
+        PromotionUsageFilters(status=PromotionCodeUsageStatus.COMPLETED),
+    )
+    assert completed["total_redemptions"] == 2
+    assert completed["failed"] == 0
+    assert completed["unique_users"] == 1
+
+    system_after = await promotion_analytics_repo.get_system_analytics(db_session)
+    assert system_after["total_redemptions"] - system_before["total_redemptions"] == 2
+    assert (
+        system_after["total_credits_distributed"]
+        - system_before["total_credits_distributed"]
+        == 300
+    )
+    assert system_after["active_promotions"] >= 1
+
+
+@pytest.mark.asyncio
+async def test_stats_of_an_unused_code_are_zero(
+    db_session: AsyncSession,
+    valid_promotion_code: PromotionCode,
+) -> None:
+    stats = await promotion_analytics_repo.get_promotion_usage_stats(
+        db_session, valid_promotion_code.id
+    )
+
+    assert set(stats.values()) == {0}
+    assert (
+        await promotion_analytics_repo.get_promotion_usage_stats(
+            db_session, valid_promotion_code.id, SINCE_2000
+        )
+        == stats
+    )
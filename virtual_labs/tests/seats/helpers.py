@@ -1,8 +1,15 @@
 """Shared test helpers for seat tests."""
 
+from datetime import datetime, timedelta, timezone
+from uuid import UUID, uuid4
+
 from httpx import AsyncClient
+from sqlalchemy import delete, update
 
+from virtual_labs.infrastructure.db.models import Course, Seat, VirtualLab
+from virtual_labs.infrastructure.settings import settings
 from virtual_labs.tests.seats.conftest import SERVICE_ADMIN_HEADERS
+from virtual_labs.tests.utils import get_headers, session_context_factory
 
 
 async def provision_seats(
@@ -17,3 +24,93 @@ async def provision_seats(
 
     assert response.status_code == 200
     return response.json()["data"]
+
+
+async def delete_seats(*course_ids: str) -> None:
+    async with session_context_factory() as session:
+        await session.execute(
+            delete(Seat).where(Seat.course_id.in_([UUID(cid) for cid in course_ids]))
+        )
+        await session.commit()
+
+
+async def create_active_course(
+    async_test_client: AsyncClient,
+    institution_id: str,
+) -> tuple[str, str]:
+    client = async_test_client
+    headers = get_headers()
+
+    lab_body = {
+        "name": f"Transfer Lab {uuid4()}",
+        "description": "Test transfer lab",
+        "reference_email": "transfer@test.org",
+        "entity": "EPFL, Switzerland",
+        "is_course": True,
+    }
+    lab_response = await client.post("/virtual-labs", json=lab_body, headers=headers)
+    assert lab_response.status_code == 200
+    lab_id = lab_response.json()["id"]
+
+    project_body = {
+        "name": f"Template Project {uuid4()}",
+        "description": "Template",
+    }
+    project_response = await client.post(
+        f"/virtual-labs/{lab_id}/projects", json=project_body, headers=headers
+    )
+    assert project_response.status_code == 200
+    project_id = project_response.json()["id"]
+
+    async with session_context_factory() as session:
+        await session.execute(
+            update(VirtualLab)
+            .where(VirtualLab.id == UUID(lab_id))
+            .values(owner_id=settings.MULTIPLE_VLABS_ALLOWED_USER_ID)
+        )
+        await session.commit()
+
+    course_body = {
+        "virtual_lab_id": lab_id,
+        "template_project_id": project_id,
+        "institution_id": institution_id,
+    }
+    course_response = await client.post(
+        "/courses", json=course_body, headers=SERVICE_ADMIN_HEADERS
+    )
+    assert course_response.status_code == 200
+    course_id = course_response.json()["data"]["id"]
+
+    await client.patch(
+        f"/courses/{course_id}",
+        json={
+            "start_date": "2026-09-01T00:00:00Z",
+            "end_date": "2026-12-15T00:00:00Z",
+            "last_drop_date": "2026-09-14T00:00:00Z",
+        },
+        headers=SERVICE_ADMIN_HEADERS,
+    )
+    activate_response = await client.post(
+        f"/courses/{course_id}/activate", headers=SERVICE_ADMIN_HEADERS
+    )
+    assert activate_response.status_code == 200
+
+    return course_id, lab_id
+
+
+async def open_transfer_window(source_course_id: str, target_course_id: str) -> None:
+    """Put the source course past and the target course before their last
+    drop date, so seats can move from one to the other."""
+    now = datetime.now(timezone.utc)
+    async with session_context_factory() as session:
+        await session.execute(
+            update(Course)
+            .where(Course.id == UUID(source_course_id))
+            .values(last_drop_date=now - timedelta(days=1))
+        )
+        await session.execute(
+            update(Course)
+            .where(Course.id == UUID(target_course_id))
+            .values(last_drop_date=now + timedelta(days=5))
+        )
+        await session.commit()
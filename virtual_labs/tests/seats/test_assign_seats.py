@@ -27,7 +27,7 @@ def mock_assign_accounting(fund_succeeds: bool = True, patch_email: bool = True)
     """Patch accounting + project creation dependencies for the assign-seats flow.
 
     fund_succeeds: whether fund_project returns True or False.
-    patch_email: whether to also patch send_enrolment_claim_email (default: True).
+    patch_email: whether to also patch the claim email queue (default: True).
     """
     patches = [
         patch(
@@ -43,7 +43,7 @@ def mock_assign_accounting(fund_succeeds: bool = True, patch_email: bool = True)
     if patch_email:
         patches.append(
             patch(
-                "virtual_labs.usecases.course.assign_seats.send_enrolment_claim_email",
+                "virtual_labs.usecases.course.assign_seats.email_queue.enqueue_many",
                 new_callable=AsyncMock,
             )
         )
@@ -55,10 +55,11 @@ def mock_assign_accounting(fund_succeeds: bool = True, patch_email: bool = True)
 
 @contextmanager
 def mock_enrolment_email(succeed: bool = True):
-    """Patch send_enrolment_claim_email. Yields the AsyncMock."""
+    """Patch queueing of claim emails. Yields the AsyncMock."""
     with patch(
-        "virtual_labs.usecases.course.assign_seats.send_enrolment_claim_email",
+        "virtual_labs.usecases.course.assign_seats.email_queue.enqueue_many",
         new_callable=AsyncMock,
+        return_value=[uuid4()],
     ) as mock_email:
         if not succeed:
             mock_email.side_effect = Exception("SES unavailable")
@@ -0,0 +1,159 @@
+"""Unit tests for the concurrent seat-provisioning helpers (no database)."""
+
+import asyncio
+from unittest.mock import ANY, AsyncMock, MagicMock, patch
+from uuid import uuid4
+
+import pytest
+
+from virtual_labs.core.ledger import Ledger
+from virtual_labs.domain.course import SeatAssignmentEntry, SeatAssignmentResult
+from virtual_labs.usecases.course.assign_seats import (
+    _provision_seat,
+    _send_claim_emails,
+)
+
+
+def _student() -> SeatAssignmentEntry:
+    return SeatAssignmentEntry(
+        student_id=f"stu-{uuid4().hex[:8]}", email=f"{uuid4().hex[:8]}@uni.org"
+    )
+
+
+def _patch_groups(undone: list[str]):
+    async def ensure_group_creation(*, project_id, comp: Ledger, **_):
+        async def undo() -> None:
+            undone.append(str(project_id))
+
+        comp.push(undo)
+        admin = {"id": f"admin-{project_id}", "name": "admin"}
+        member = {"id": f"member-{project_id}", "name": "member"}
+        return admin, member, []
+
+    return patch(
+        "virtual_labs.usecases.course.assign_seats.ensure_group_creation",
+        ensure_group_creation,
+    )
+
+
+async def _provision(semaphore: asyncio.Semaphore):
+    return await _provision_seat(
+        virtual_lab_id=uuid4(),
+        vlab_admin_group_id="vlab-admin",
+        vlab_member_group_id="vlab-member",
+        credits_per_seat=200,
+        student=_student(),
+        seat=MagicMock(),
+        user_id=uuid4(),
+        semaphore=semaphore,
+    )
+
+
+@pytest.mark.asyncio
+async def test_provision_seat_unwinds_its_own_ledger_when_funding_fails() -> None:
+    undone: list[str] = []
+    with (
+        _patch_groups(undone),
+        patch(
+            "virtual_labs.usecases.course.assign_seats.ensure_accounting_initialization",
+            new_callable=AsyncMock,
+        ),
+        patch(
+            "virtual_labs.usecases.course.assign_seats.accounting_cases.fund_project",
+            new_callable=AsyncMock,
+            return_value=False,
+        ),
+    ):
+        with pytest.raises(RuntimeError, match="Failed to fund project"):
+            await _provision(asyncio.Semaphore(1))
+
+    assert len(undone) == 1
+
+
+@pytest.mark.asyncio
+async def test_provision_seat_hands_back_a_ledger_to_unwind_later() -> None:
+    undone: list[str] = []
+    with (
+        _patch_groups(undone),
+        patch(
+            "virtual_labs.usecases.course.assign_seats.ensure_accounting_initialization",
+            new_callable=AsyncMock,
+        ),
+        patch(
+            "virtual_labs.usecases.course.assign_seats.accounting_cases.fund_project",
+            new_callable=AsyncMock,
+            return_value=True,
+        ),
+        patch(
+            "virtual_labs.usecases.course.assign_seats._make_deplete_compensation",
+            return_value=AsyncMock(),
+        ) as deplete,
+    ):
+        provisioned = await _provision(asyncio.Semaphore(1))
+
+    assert undone == []
+    # groups + deplete
+    assert len(provisioned.ledger) == 2
+    await provisioned.ledger.compensate(reason="test")
+    assert undone == [str(provisioned.project_id)]
+    deplete.return_value.assert_awaited_once()
+
+
+@pytest.mark.asyncio
+async def test_send_claim_emails_queues_one_batch_for_successful_assignments() -> None:
+    results = [
+        SeatAssignmentResult(
+            student_id=f"stu-{index}",
+            email=f"ok{index}@uni.org",
+            seat_id=uuid4(),
+            enrolment_id=uuid4(),
+        )
+        for index in range(3)
+    ]
+    results.append(
+        SeatAssignmentResult(
+            student_id="failed",
+            email="failed@uni.org",
+            assignment_successful=False,
+            seat_id=uuid4(),
+        )
+    )
+    job_ids = [uuid4() for _ in range(3)]
+    requester = uuid4()
+
+    with patch(
+        "virtual_labs.usecases.course.assign_seats.email_queue.enqueue_many",
+        AsyncMock(return_value=job_ids),
+    ) as enqueue:
+        await _send_claim_emails(
+            results, course_name="Neuro 101", requested_by=requester
+        )
+
+    enqueue.assert_awaited_once_with(ANY, requested_by=requester)
+    jobs = enqueue.await_args_list[0].args[0]
+    assert [job.recipient for job in jobs] == [r.email for r in results[:3]]
+    assert {job.details.course_name for job in jobs} == {"Neuro 101"}
+    assert [r.email_job_id for r in results] == [*job_ids, None]
+    assert all(r.email_sent for r in results)
+
+
+@pytest.mark.asyncio
+async def test_send_claim_emails_flags_every_email_when_queueing_fails() -> None:
+    results = [
+        SeatAssignmentResult(
+            student_id=f"stu-{index}",
+            email=f"ok{index}@uni.org",
+            seat_id=uuid4(),
+            enrolment_id=uuid4(),
+        )
+        for index in range(2)
+    ]
+
+    with patch(
+        "virtual_labs.usecases.course.assign_seats.email_queue.enqueue_many",
+        AsyncMock(side_effect=ConnectionError("redis down")),
+    ):
+        await _send_claim_emails(results, course_name="Neuro 101", requested_by=uuid4())
+
+    assert [r.email_sent for r in results] == [False, False]
+    assert [r.email_job_id for r in results] == [None, None]
@@ -31,7 +31,7 @@ def mock_assign_deps():
             return_value=True,
         ),
         patch(
-            "virtual_labs.usecases.course.assign_seats.send_enrolment_claim_email",
+            "virtual_labs.usecases.course.assign_seats.email_queue.enqueue_many",
             new_callable=AsyncMock,
         ),
     ):
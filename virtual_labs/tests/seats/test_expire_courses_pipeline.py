@@ -0,0 +1,118 @@
+"""Unit tests for the batched expire_courses pipeline (no database)."""
+
+from datetime import datetime, timezone
+from typing import Any
+from unittest.mock import AsyncMock, patch
+from uuid import uuid4
+
+import pytest
+from sqlalchemy.sql.dml import Update
+
+from virtual_labs.infrastructure.settings import settings
+from virtual_labs.usecases.course.expire_courses import drop_expired_enrolments
+
+
+class _Rows:
+    def __init__(self, rows: list[tuple[Any, ...]]) -> None:
+        self._rows = rows
+
+    def all(self) -> list[tuple[Any, ...]]:
+        return self._rows
+
+
+class FakeSession:
+    def __init__(self, rows: list[tuple[Any, ...]]) -> None:
+        self.rows = rows
+        self.updates: list[Update] = []
+        self.commits = 0
+
+    async def execute(self, statement: Any) -> _Rows:
+        if isinstance(statement, Update):
+            self.updates.append(statement)
+            return _Rows([])
+        return _Rows(self.rows)
+
+    async def commit(self) -> None:
+        self.commits += 1
+
+
+def _row(*, last_drop_date: datetime | None = None) -> tuple[Any, ...]:
+    return (
+        uuid4(),  # seat id
+        False,  # previously_dropped
+        uuid4(),  # enrolment id
+        uuid4(),  # claimed_by
+        uuid4(),  # project id
+        f"project-{uuid4()}",
+        uuid4(),  # course id
+        uuid4(),  # virtual lab id
+        f"vlab-{uuid4()}",
+        last_drop_date,
+        200,  # credits_per_seat
+    )
+
+
+@pytest.mark.asyncio
+async def test_drop_expired_enrolments_checkpoints_every_batch() -> None:
+    failing = _row()
+    rows = [
+        _row(),
+        _row(),
+        failing,
+        _row(last_drop_date=datetime.max.replace(tzinfo=timezone.utc)),
+    ]
+    session = FakeSession(rows)
+    checkpoint = AsyncMock()
+    clear_calls: list[str] = []
+
+    async def clear(member_group_id: str) -> None:
+        clear_calls.append(member_group_id)
+        if member_group_id == failing[5]:
+            raise RuntimeError("KC unavailable")
+
+    with (
+        patch.object(settings, "COURSE_EXPIRY_BATCH_SIZE", 2),
+        patch.object(settings, "COURSE_EXPIRY_ATTEMPTS", 2),
+        patch.object(settings, "COURSE_EXPIRY_RETRY_DELAY_SECONDS", 0),
+        patch("virtual_labs.usecases.course.drop_seats._clear_project_groups", clear),
+        patch(
+            "virtual_labs.usecases.course.drop_seats._detach_from_vlab",
+            new_callable=AsyncMock,
+        ),
+        patch(
+            "virtual_labs.usecases.course.drop_seats.accounting_cases.deplete_project_budget",
+            new_callable=AsyncMock,
+            return_value=200.0,
+        ),
+    ):
+        summary = await drop_expired_enrolments(
+            session,  # type: ignore[arg-type]
+            on_checkpoint=checkpoint,
+        )
+
+    assert summary == {"enrolments_dropped": 3, "enrolments_failed": 1}
+    # one commit (and lock extension) per batch of 2
+    assert session.commits == 2
+    assert checkpoint.await_count == 2
+    # the failing enrolment was retried, the others were cleared once
+    assert clear_calls.count(failing[5]) == 2
+    assert len(clear_calls) == 5
+    # batch 1: enrolments + consumed seats; batch 2: the early drop's
+    # enrolment + recovered seat (the failed one is left untouched)
+    assert [u.table.name for u in session.updates] == [
+        "course_enrolment",
+        "seat",
+        "course_enrolment",
+        "seat",
+    ]
+    recovered = session.updates[-1].compile().params
+    assert recovered["previously_dropped"] is True
+    assert recovered["is_consumed"] is False
+
+
+@pytest.mark.asyncio
+async def test_drop_expired_enrolments_without_work_does_not_commit() -> None:
+    session = FakeSession([])
+    summary = await drop_expired_enrolments(session)  # type: ignore[arg-type]
+    assert summary == {"enrolments_dropped": 0, "enrolments_failed": 0}
+    assert session.commits == 0
@@ -1,12 +1,16 @@
 """Tests for the provision-seats endpoint (POST /seats/provision)."""
 
-from uuid import uuid4
+from typing import Any
+from uuid import UUID, uuid4
 
 import pytest
 from httpx import AsyncClient
+from sqlalchemy import event, select
 
+from virtual_labs.infrastructure.db.config import session_pool
+from virtual_labs.infrastructure.db.models import Course, Seat
 from virtual_labs.tests.seats.conftest import SERVICE_ADMIN_HEADERS
-from virtual_labs.tests.utils import get_headers
+from virtual_labs.tests.utils import get_headers, session_context_factory
 
 
 def _provision_payload(course_id: str, number_of_seats: int = 3) -> dict:
@@ -86,6 +90,65 @@ async def test_provision_seats_expiry_date_is_one_year(
     assert abs((expiry - expected).total_seconds()) < 60
 
 
+@pytest.mark.asyncio
+async def test_provision_seats_returns_the_stored_batch(
+    async_test_client: AsyncClient,
+    course_for_seats: str,
+) -> None:
+    body = _provision_payload(course_for_seats, number_of_seats=100)
+
+    response = await async_test_client.post(
+        "/seats/provision", json=body, headers=SERVICE_ADMIN_HEADERS
+    )
+
+    assert response.status_code == 200
+    seats = response.json()["data"]["seats"]
+    async with session_context_factory() as session:
+        credits_per_seat = await session.scalar(
+            select(Course.credits_per_seat).where(Course.id == UUID(course_for_seats))
+        )
+        stored = (
+            await session.scalars(
+                select(Seat).where(Seat.batch_id == UUID(seats[0]["batch_id"]))
+            )
+        ).all()
+    assert {seat["id"] for seat in seats} == {str(seat.id) for seat in stored}
+    assert len(stored) == 100
+    assert all(seat.course_id == UUID(course_for_seats) for seat in stored)
+    assert all(seat.credit_value == credits_per_seat for seat in stored)
+    assert not any(seat.is_consumed or seat.previously_dropped for seat in stored)
+
+
+@pytest.mark.asyncio
+async def test_provision_seats_statement_count_does_not_grow_with_the_batch(
+    async_test_client: AsyncClient,
+    course_for_seats: str,
+) -> None:
+    statements: list[str] = []
+
+    def record(_conn: Any, _cursor: Any, statement: str, *_args: Any) -> None:
+        statements.append(statement)
+
+    assert session_pool._engine is not None
+    engine = session_pool._engine.sync_engine
+    event.listen(engine, "before_cursor_execute", record)
+    try:
+        counts = []
+        for number_of_seats in (1, 100):
+            statements.clear()
+            response = await async_test_client.post(
+                "/seats/provision",
+                json=_provision_payload(course_for_seats, number_of_seats),
+                headers=SERVICE_ADMIN_HEADERS,
+            )
+            assert response.status_code == 200
+            counts.append(len(statements))
+    finally:
+        event.remove(engine, "before_cursor_execute", record)
+
+    assert counts[0] == counts[1]
+
+
 # ──────────────────────────────────────────────────────────────────────
 # Error tests
 # ──────────────────────────────────────────────────────────────────────
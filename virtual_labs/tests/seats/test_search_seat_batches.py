@@ -1,13 +1,19 @@
 """Tests for the seat batch search endpoints."""
 
+from typing import Any
 from uuid import uuid4
 
 import pytest
 from httpx import AsyncClient
 
 from virtual_labs.tests.seats.conftest import SERVICE_ADMIN_HEADERS
-from virtual_labs.tests.seats.helpers import provision_seats
-from virtual_labs.tests.utils import get_headers
+from virtual_labs.tests.seats.helpers import (
+    create_active_course,
+    delete_seats,
+    open_transfer_window,
+    provision_seats,
+)
+from virtual_labs.tests.utils import cleanup_course, cleanup_resources, get_headers
 
 # ──────────────────────────────────────────────────────────────────────
 # GET /seats/batches/{batch_id}
@@ -251,3 +257,80 @@ async def test_search_seat_batches_by_created_before_filters_out(
     )
 
     assert response.status_code == 404
+
+
+# ──────────────────────────────────────────────────────────────────────
+# GET /seats/batches/paginated
+# ──────────────────────────────────────────────────────────────────────
+
+
+@pytest.mark.asyncio
+async def test_paginated_batches_walk_every_part_of_a_transferred_batch(
+    async_test_client: AsyncClient,
+    course_for_seats: str,
+    institution_id: str,
+) -> None:
+    source_course_id = course_for_seats
+    target_course_id, lab_id = await create_active_course(
+        async_test_client, institution_id
+    )
+
+    try:
+        await open_transfer_window(source_course_id, target_course_id)
+        split = await provision_seats(
+            async_test_client, source_course_id, number_of_seats=3
+        )
+        transfer_response = await async_test_client.post(
+            "/seats/transfer",
+            json={
+                "source_course_id": source_course_id,
+                "target_course_id": target_course_id,
+                "amount": 1,
+            },
+            headers=SERVICE_ADMIN_HEADERS,
+        )
+        assert transfer_response.status_code == 200
+        whole = await provision_seats(
+            async_test_client, source_course_id, number_of_seats=2
+        )
+        split_batch = split["seats"][0]["batch_id"]
+        whole_batch = whole["seats"][0]["batch_id"]
+
+        # one batch summary per page, so every page boundary is crossed
+        rows: list[dict[str, Any]] = []
+        params = {
+            "institution_id": institution_id,
+            "created_after": min(seat["created_at"] for seat in split["seats"]),
+            "page_size": 1,
+        }
+        for _ in range(20):
+            response = await async_test_client.get(
+                "/seats/batches/paginated",
+                params=params,
+                headers=SERVICE_ADMIN_HEADERS,
+            )
+            assert response.status_code == 200
+            page = response.json()
+            assert len(page["data"]) <= 1
+            rows += page["data"]
+            if page["pagination"]["next_cursor"] is None:
+                break
+            params["cursor"] = page["pagination"]["next_cursor"]
+
+        ours = [
+            (row["batch_id"], row["course_id"], row["number_of_seats"])
+            for row in rows
+            if row["course_id"] in (source_course_id, target_course_id)
+        ]
+        assert ours[0] == (whole_batch, source_course_id, 2)
+        assert sorted(ours[1:]) == sorted(
+            [
+                (split_batch, source_course_id, 2),
+                (split_batch, target_course_id, 1),
+            ]
+        )
+        assert all(row["consumed_seats"] == 0 for row in rows)
+    finally:
+        await delete_seats(source_course_id, target_course_id)
+        await cleanup_course(target_course_id)
+        await cleanup_resources(async_test_client, lab_id)
@@ -3,91 +3,18 @@ from uuid import UUID, uuid4
 
 import pytest
 from httpx import AsyncClient
-from sqlalchemy import delete, select, update
+from sqlalchemy import select
 
-from virtual_labs.infrastructure.db.models import Course, Seat, VirtualLab
-from virtual_labs.infrastructure.settings import settings
+from virtual_labs.infrastructure.db.models import Course, Seat
 from virtual_labs.tests.seats.conftest import SERVICE_ADMIN_HEADERS
+from virtual_labs.tests.seats.helpers import create_active_course, delete_seats
 from virtual_labs.tests.utils import (
     cleanup_course,
     cleanup_resources,
-    get_headers,
     session_context_factory,
 )
 
 
-async def _cleanup_seats(*course_ids: str) -> None:
-    async with session_context_factory() as session:
-        await session.execute(
-            delete(Seat).where(Seat.course_id.in_([UUID(cid) for cid in course_ids]))
-        )
-        await session.commit()
-
-
-async def _create_active_course(
-    async_test_client: AsyncClient,
-    institution_id: str,
-) -> tuple[str, str]:
-    client = async_test_client
-    headers = get_headers()
-
-    lab_body = {
-        "name": f"Transfer Lab {uuid4()}",
-        "description": "Test transfer lab",
-        "reference_email": "transfer@test.org",
-        "entity": "EPFL, Switzerland",
-        "is_course": True,
-    }
-    lab_response = await client.post("/virtual-labs", json=lab_body, headers=headers)
-    assert lab_response.status_code == 200
-    lab_id = lab_response.json()["id"]
-
-    project_body = {
-        "name": f"Template Project {uuid4()}",
-        "description": "Template",
-    }
-    project_response = await client.post(
-        f"/virtual-labs/{lab_id}/projects", json=project_body, headers=headers
-    )
-    assert project_response.status_code == 200
-    project_id = project_response.json()["id"]
-
-    async with session_context_factory() as session:
-        await session.execute(
-            update(VirtualLab)
-            .where(VirtualLab.id == UUID(lab_id))
-            .values(owner_id=settings.MULTIPLE_VLABS_ALLOWED_USER_ID)
-        )
-        await session.commit()
-
-    course_body = {
-        "virtual_lab_id": lab_id,
-        "template_project_id": project_id,
-        "institution_id": institution_id,
-    }
-    course_response = await client.post(
-        "/courses", json=course_body, headers=SERVICE_ADMIN_HEADERS
-    )
-    assert course_response.status_code == 200
-    course_id = course_response.json()["data"]["id"]
-
-    await client.patch(
-        f"/courses/{course_id}",
-        json={
-            "start_date": "2026-09-01T00:00:00Z",
-            "end_date": "2026-12-15T00:00:00Z",
-            "last_drop_date": "2026-09-14T00:00:00Z",
-        },
-        headers=SERVICE_ADMIN_HEADERS,
-    )
-    activate_response = await client.post(
-        f"/courses/{course_id}/activate", headers=SERVICE_ADMIN_HEADERS
-    )
-    assert activate_response.status_code == 200
-
-    return course_id, lab_id
-
-
 @pytest.mark.asyncio
 async def test_transfer_seats_success(
     async_test_client: AsyncClient,
@@ -95,7 +22,7 @@ async def test_transfer_seats_success(
     institution_id: str,
 ) -> None:
     source_course_id = course_for_seats
-    target_course_id, lab_id = await _create_active_course(
+    target_course_id, lab_id = await create_active_course(
         async_test_client, institution_id
     )
 
@@ -146,7 +73,7 @@ async def test_transfer_seats_success(
             transferred_seats = result.scalars().all()
             assert len(transferred_seats) == 2
     finally:
-        await _cleanup_seats(source_course_id, target_course_id)
+        await delete_seats(source_course_id, target_course_id)
         await cleanup_course(target_course_id)
         await cleanup_resources(async_test_client, lab_id)
 
@@ -158,7 +85,7 @@ async def test_transfer_seats_with_int_amount(
     institution_id: str,
 ) -> None:
     source_course_id = course_for_seats
-    target_course_id, lab_id = await _create_active_course(
+    target_course_id, lab_id = await create_active_course(
         async_test_client, institution_id
     )
 
@@ -208,7 +135,7 @@ async def test_transfer_seats_with_int_amount(
             )
             assert len(remaining.scalars().all()) == 2
     finally:
-        await _cleanup_seats(source_course_id, target_course_id)
+        await delete_seats(source_course_id, target_course_id)
         await cleanup_course(target_course_id)
         await cleanup_resources(async_test_client, lab_id)
 
@@ -254,7 +181,7 @@ async def test_transfer_seats_exceeds_available(
     institution_id: str,
 ) -> None:
     source_course_id = course_for_seats
-    target_course_id, lab_id = await _create_active_course(
+    target_course_id, lab_id = await create_active_course(
         async_test_client, institution_id
     )
 
@@ -290,7 +217,7 @@ async def test_transfer_seats_exceeds_available(
         )
         assert transfer_response.status_code == 409
     finally:
-        await _cleanup_seats(source_course_id, target_course_id)
+        await delete_seats(source_course_id, target_course_id)
         await cleanup_course(target_course_id)
         await cleanup_resources(async_test_client, lab_id)
 
@@ -319,7 +246,7 @@ async def test_transfer_seats_source_not_past_drop_date(
     institution_id: str,
 ) -> None:
     source_course_id = course_for_seats
-    target_course_id, lab_id = await _create_active_course(
+    target_course_id, lab_id = await create_active_course(
         async_test_client, institution_id
     )
 
@@ -359,7 +286,7 @@ async def test_transfer_seats_target_past_drop_date(
     institution_id: str,
 ) -> None:
     source_course_id = course_for_seats
-    target_course_id, lab_id = await _create_active_course(
+    target_course_id, lab_id = await create_active_course(
         async_test_client, institution_id
     )
 
@@ -0,0 +1,69 @@
+"""Tests for the webhook's short-lived Stripe object cache."""
+
+from __future__ import annotations
+
+import asyncio
+from time import time
+
+import pytest
+
+from virtual_labs.infrastructure.stripe.object_cache import StripeObjectCache
+
+
+class FakeRetrieve:
+    def __init__(self, value: object | None = "obj") -> None:
+        self.value = value
+        self.calls = 0
+        self.release = asyncio.Event()
+        self.release.set()
+
+    async def __call__(self) -> object | None:
+        self.calls += 1
+        await self.release.wait()
+        return self.value
+
+
+@pytest.mark.asyncio
+async def test_concurrent_requests_share_one_retrieval() -> None:
+    cache = StripeObjectCache(maxsize=10, ttl=60)
+    retrieve = FakeRetrieve()
+    retrieve.release.clear()
+    not_before = time() - 5
+
+    pending = [
+        asyncio.ensure_future(
+            cache.get_or_fetch("invoice:in_1", retrieve, not_before=not_before)
+        )
+        for _ in range(5)
+    ]
+    await asyncio.sleep(0)
+    retrieve.release.set()
+
+    assert await asyncio.gather(*pending) == ["obj"] * 5
+    assert retrieve.calls == 1
+    assert cache.stats().hits == 4
+
+
+@pytest.mark.asyncio
+async def test_object_is_reused_for_events_created_before_it_was_requested() -> None:
+    cache = StripeObjectCache(maxsize=10, ttl=60)
+    retrieve = FakeRetrieve()
+
+    await cache.get_or_fetch("subscription:sub_1", retrieve, not_before=time() - 5)
+    await cache.get_or_fetch("subscription:sub_1", retrieve, not_before=time() - 5)
+    assert retrieve.calls == 1
+
+    # an event created after the retrieval may report a newer state
+    await cache.get_or_fetch("subscription:sub_1", retrieve, not_before=time() + 5)
+    assert retrieve.calls == 2
+
+
+@pytest.mark.asyncio
+async def test_failed_retrievals_are_not_cached() -> None:
+    cache = StripeObjectCache(maxsize=10, ttl=60)
+    retrieve = FakeRetrieve(value=None)
+
+    assert await cache.get_or_fetch("customer:cus_1", retrieve, not_before=0) is None
+    assert await cache.get_or_fetch("customer:cus_1", retrieve, not_before=0) is None
+    assert retrieve.calls == 2
+    assert cache.stats().size == 0
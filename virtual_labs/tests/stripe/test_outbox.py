@@ -0,0 +1,157 @@
+"""Tests for the webhook side-effect outbox (no database)."""
+
+from __future__ import annotations
+
+from contextlib import asynccontextmanager
+from types import SimpleNamespace
+from typing import Any, AsyncIterator
+from unittest.mock import AsyncMock, MagicMock
+from uuid import uuid4
+
+import pytest
+from sqlalchemy.dialects import postgresql
+
+from virtual_labs.infrastructure.db.models import OutboxStatus, PaidSubscription
+from virtual_labs.infrastructure.settings import settings
+from virtual_labs.infrastructure.stripe.outbox import (
+    OutboxBatch,
+    OutboxDrainer,
+    OutboxEffect,
+)
+from virtual_labs.infrastructure.stripe.webhook import StripeWebhook
+
+
+def _compiled(statement: Any) -> Any:
+    return statement.compile(dialect=postgresql.dialect())  # type: ignore[no-untyped-call]
+
+
+class _Result:
+    def __init__(self, rows: list[Any]) -> None:
+        self._rows = rows
+
+    def all(self) -> list[Any]:
+        return self._rows
+
+
+class FakeSession:
+    def __init__(self, claimed: list[Any]) -> None:
+        self.claimed = claimed
+        self.statements: list[Any] = []
+
+    @asynccontextmanager
+    async def begin(self) -> AsyncIterator[None]:
+        yield
+
+    async def execute(self, statement: Any) -> _Result:
+        self.statements.append(statement)
+        rows, self.claimed = self.claimed, []
+        return _Result(rows)
+
+
+def _session_factory(session: FakeSession) -> Any:
+    @asynccontextmanager
+    async def factory() -> AsyncIterator[FakeSession]:
+        yield session
+
+    return factory
+
+
+def _message(effect: str, attempts: int = 1) -> SimpleNamespace:
+    return SimpleNamespace(
+        id=attempts * 100 + len(effect),
+        effect=effect,
+        payload={"user_id": "u1"},
+        attempts=attempts,
+    )
+
+
+def test_webhook_queues_plan_and_tier_behind_earlier_changes_of_the_user() -> None:
+    webhook = StripeWebhook(
+        stripe_repository=MagicMock(),
+        subscription_repository=MagicMock(),
+        stripe_user_repository=MagicMock(),
+        credit_converter=MagicMock(),
+        redis=AsyncMock(),
+    )
+    effects = OutboxBatch("evt_1")
+    user_id = uuid4()
+
+    webhook._queue_subscription_keycloak_and_tier(
+        effects, PaidSubscription(user_id=user_id), is_terminal=True
+    )
+
+    assert [
+        (m["effect"], m["payload"], m["idempotency_key"], m["ordering_key"])
+        for m in effects.messages
+    ] == [
+        (
+            "keycloak_plan",
+            {"user_id": str(user_id), "plan": "free"},
+            "keycloak_plan:evt_1",
+            f"plan:{user_id}",
+        ),
+        (
+            "tier_transition",
+            {"user_id": str(user_id), "downgrade": True},
+            "tier_transition:evt_1",
+            f"tier:{user_id}",
+        ),
+    ]
+
+
+@pytest.mark.asyncio
+async def test_stage_inserts_the_batch_once_per_idempotency_key() -> None:
+    session = AsyncMock()
+    await OutboxBatch("evt_1").stage(session)
+    session.execute.assert_not_called()
+
+    effects = OutboxBatch("evt_1")
+    effects.add(OutboxEffect.ACCOUNTING_TOP_UP, {"amount": 10.0}, key="in_1")
+    await effects.stage(session)
+
+    compiled = _compiled(session.execute.call_args.args[0])
+    assert "ON CONFLICT (idempotency_key) DO NOTHING" in str(compiled)
+    assert compiled.params["idempotency_key_m0"] == "accounting_top_up:in_1"
+
+
+@pytest.mark.asyncio
+async def test_drain_settles_each_message_by_outcome(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    monkeypatch.setattr(settings, "OUTBOX_MAX_ATTEMPTS", 3)
+    delivered = _message("keycloak_plan")
+    retried = _message("tier_transition", attempts=2)
+    exhausted = _message("accounting_top_up", attempts=3)
+    unknown = _message("from_a_newer_release")
+    session = FakeSession([delivered, retried, exhausted, unknown])
+    plan = AsyncMock()
+    drainer = OutboxDrainer(
+        handlers={
+            "keycloak_plan": plan,
+            "tier_transition": AsyncMock(side_effect=RuntimeError("db down")),
+            "accounting_top_up": AsyncMock(side_effect=RuntimeError("503")),
+        },
+        session_factory=_session_factory(session),
+    )
+
+    assert await drainer.drain_once() == 4
+
+    plan.assert_awaited_once_with({"user_id": "u1"})
+    claim, *settled = session.statements
+    assert "FOR UPDATE SKIP LOCKED" in str(_compiled(claim))
+    params = [_compiled(statement).params for statement in settled]
+    assert params[0]["status"] == OutboxStatus.DONE
+    assert "status" not in params[1]
+    assert params[1]["last_error"] == "RuntimeError: db down"
+    assert params[2]["status"] == OutboxStatus.DEAD
+    assert "status" not in params[3]
+    assert "No handler" in params[3]["last_error"]
+
+
+@pytest.mark.asyncio
+async def test_drain_with_nothing_due_opens_no_second_transaction() -> None:
+    session = FakeSession([])
+    drainer = OutboxDrainer(handlers={}, session_factory=_session_factory(session))
+
+    assert await drainer.drain_once() == 0
+    assert len(session.statements) == 1
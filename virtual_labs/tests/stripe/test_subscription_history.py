@@ -0,0 +1,182 @@
+"""Subscription history: every subscription carries only its own payments."""
+
+import json
+from datetime import datetime, timedelta, timezone
+from typing import Any, AsyncGenerator
+from uuid import UUID, uuid4
+
+import pytest
+import pytest_asyncio
+from fastapi import Response
+from sqlalchemy import delete
+
+from virtual_labs.domain.common import CursorPaginationRequest
+from virtual_labs.infrastructure.db.models import (
+    PaidSubscription,
+    PaymentStatus,
+    SubscriptionPayment,
+    SubscriptionStatus,
+    SubscriptionTierEnum,
+    SubscriptionType,
+)
+from virtual_labs.infrastructure.kc.models import AuthUser
+from virtual_labs.tests.utils import _resolve_tier_id, session_context_factory
+from virtual_labs.usecases.subscription.list_user_subscriptions_history import (
+    list_user_subscriptions_history,
+    list_user_subscriptions_history_page,
+)
+
+# payments (amount in cents, status) of the subscriptions, newest first
+PAYMENTS = [
+    [(2000, PaymentStatus.SUCCEEDED), (2000, PaymentStatus.FAILED)],
+    [],
+    [(1500, PaymentStatus.SUCCEEDED)],
+]
+
+
+@pytest_asyncio.fixture
+async def subscription_history() -> AsyncGenerator[
+    tuple[UUID, list[UUID], dict[UUID, set[UUID]]], None
+]:
+    """A user with three paid subscriptions a month apart and their payments."""
+    user_id = uuid4()
+    subscription_ids: list[UUID] = []
+    payment_ids: dict[UUID, set[UUID]] = {}
+    now = datetime.now(timezone.utc)
+
+    async with session_context_factory() as session:
+        tier_id = await _resolve_tier_id(session, SubscriptionTierEnum.PRO)
+        for months_ago, payments in enumerate(PAYMENTS):
+            created = now - timedelta(days=30 * months_ago)
+            period_start = created.replace(tzinfo=None)
+            subscription = PaidSubscription(
+                id=uuid4(),
+                user_id=user_id,
+                tier_id=tier_id,
+                stripe_subscription_id=f"sub_{uuid4().hex}",
+                customer_id="cus_history",
+                stripe_price_id="price_history",
+                status=(
+                    SubscriptionStatus.CANCELED
+                    if months_ago
+                    else SubscriptionStatus.ACTIVE
+                ),
+                amount=2000,
+                interval="month",
+                current_period_start=period_start,
+                current_period_end=period_start + timedelta(days=30),
+                subscription_type=SubscriptionType.PRO,
+                created_at=created,
+                updated_at=created,
+            )
+            session.add(subscription)
+            subscription_ids.append(subscription.id)
+            payment_ids[subscription.id] = set()
+            for amount, status in payments:
+                payment = SubscriptionPayment(
+                    id=uuid4(),
+                    subscription_id=subscription.id,
+                    customer_id="cus_history",
+                    stripe_payment_intent_id=f"pi_{uuid4().hex}",
+                    card_brand="visa",
+                    card_last4="4242",
+                    card_exp_month=12,
+                    card_exp_year=2030,
+                    amount_paid=amount,
+                    currency="usd",
+                    status=status,
+                    period_start=period_start,
+                    period_end=period_start + timedelta(days=30),
+                    payment_date=period_start,
+                    standalone=False,
+                )
+                session.add(payment)
+                payment_ids[subscription.id].add(payment.id)
+        await session.commit()
+
+    try:
+        yield user_id, subscription_ids, payment_ids
+    finally:
+        async with session_context_factory() as session:
+            await session.execute(
+                delete(SubscriptionPayment).where(
+                    SubscriptionPayment.subscription_id.in_(subscription_ids)
+                )
+            )
+            await session.execute(
+                delete(PaidSubscription).where(PaidSubscription.user_id == user_id)
+            )
+            await session.commit()
+
+
+def _auth(user_id: UUID) -> tuple[AuthUser, str]:
+    return (
+        AuthUser(
+            sid="sid",
+            sub=str(user_id),
+            username="user",
+            email="user@uni.org",
+            email_verified=True,
+        ),
+        "token",
+    )
+
+
+def _data(response: Response) -> Any:
+    return json.loads(bytes(response.body))["data"]
+
+
+def _payments_of(item: dict[str, Any]) -> set[UUID]:
+    return {UUID(payment["id"]) for payment in item["payments"]}
+
+
+@pytest.mark.asyncio
+async def test_history_lists_each_subscription_with_its_own_payments(
+    subscription_history: tuple[UUID, list[UUID], dict[UUID, set[UUID]]],
+) -> None:
+    user_id, subscription_ids, payment_ids = subscription_history
+
+    async with session_context_factory() as session:
+        data = _data(await list_user_subscriptions_history(session, _auth(user_id)))
+
+    items = data["subscriptions"]
+    assert data["total_paid"] == 35.0
+    assert [UUID(item["id"]) for item in items] == subscription_ids
+    assert [item["total_paid"] for item in items] == [20.0, 0.0, 15.0]
+    for item in items:
+        assert _payments_of(item) == payment_ids[UUID(item["id"])]
+
+
+@pytest.mark.asyncio
+async def test_history_pages_follow_the_next_cursor(
+    subscription_history: tuple[UUID, list[UUID], dict[UUID, set[UUID]]],
+) -> None:
+    user_id, subscription_ids, payment_ids = subscription_history
+
+    async with session_context_factory() as session:
+        first = _data(
+            await list_user_subscriptions_history_page(
+                session, _auth(user_id), CursorPaginationRequest(page_size=2)
+            )
+        )
+        assert first["pagination"]["total"] == 3
+        assert first["pagination"]["has_next"] is True
+        cursor = first["pagination"]["next_cursor"]
+        assert cursor is not None
+
+        second = _data(
+            await list_user_subscriptions_history_page(
+                session,
+                _auth(user_id),
+                CursorPaginationRequest(page_size=2, cursor=cursor),
+            )
+        )
+        assert second["pagination"]["has_next"] is False
+        assert second["pagination"]["next_cursor"] is None
+
+    items = first["data"] + second["data"]
+    assert [len(first["data"]), len(second["data"])] == [2, 1]
+    assert [UUID(item["id"]) for item in items] == subscription_ids
+    assert [item["total_paid"] for item in items] == [20.0, 0.0, 15.0]
+    for item in items:
+        assert _payments_of(item) == payment_ids[UUID(item["id"])]
@@ -8,6 +8,7 @@ suite that hits the FastAPI route end-to-end.
 
 from __future__ import annotations
 
+import asyncio
 from types import SimpleNamespace
 from typing import Any, cast
 from unittest.mock import AsyncMock, MagicMock
@@ -17,6 +18,7 @@ import stripe
 from stripe import convert_to_stripe_object
 
 from virtual_labs.infrastructure.db.models import SubscriptionPayment
+from virtual_labs.infrastructure.stripe.outbox import OutboxBatch
 from virtual_labs.infrastructure.stripe.types import PostCommitActions
 from virtual_labs.infrastructure.stripe.webhook import StripeWebhook
 
@@ -326,6 +328,86 @@ async def test_empty_post_commit_actions_is_a_noop() -> None:
     await actions.run()  # must not raise
 
 
+@pytest.mark.asyncio
+async def test_post_commit_actions_wait_for_the_slowest_not_the_sum() -> None:
+    actions = PostCommitActions(max_concurrency=8)
+
+    async def slow_call() -> None:
+        await asyncio.sleep(0.05)
+
+    for label in ("keycloak", "top_up", "discount", "tax"):
+        actions.add(slow_call, name=label)
+
+    started = asyncio.get_running_loop().time()
+    outcomes = await actions.run()
+    elapsed = asyncio.get_running_loop().time() - started
+
+    assert elapsed < 0.15  # sequentially this takes 0.2s
+    assert [outcome.name for outcome in outcomes] == [
+        "keycloak",
+        "top_up",
+        "discount",
+        "tax",
+    ]
+    assert all(outcome.status == "ok" for outcome in outcomes)
+    assert all(outcome.duration >= 0.04 for outcome in outcomes)
+
+
+@pytest.mark.asyncio
+async def test_post_commit_actions_respect_dependencies_and_serial_keys() -> None:
+    actions = PostCommitActions()
+    calls: list[str] = []
+    session = object()
+
+    def record(label: str, delay: float) -> Any:
+        async def runner() -> None:
+            await asyncio.sleep(delay)
+            calls.append(label)
+
+        return runner
+
+    first_db = actions.add(record("db:first", 0.03), serial=session)
+    actions.add(record("db:second", 0), serial=session)
+    actions.add(record("after_first_db", 0), after=[first_db])
+    actions.add(record("keycloak", 0))
+    await actions.run()
+
+    assert calls.index("keycloak") < calls.index("db:first")
+    assert calls.index("db:first") < calls.index("db:second")
+    assert calls.index("db:first") < calls.index("after_first_db")
+
+
+@pytest.mark.asyncio
+async def test_post_commit_action_timeout_is_reported_and_others_finish() -> None:
+    actions = PostCommitActions(timeout=0.02)
+    calls: list[str] = []
+
+    async def hangs() -> None:
+        await asyncio.sleep(10)
+
+    async def runs() -> None:
+        calls.append("ran")
+
+    hung = actions.add(hangs)
+    actions.add(runs, after=[hung])
+    failing = actions.add(AsyncMock(side_effect=RuntimeError("kc down")))
+    outcomes = await asyncio.wait_for(actions.run(), 1)
+
+    assert [outcome.status for outcome in outcomes] == ["timed_out", "ok", "failed"]
+    assert outcomes[2].name == failing
+    assert calls == ["ran"]
+
+
+def test_post_commit_actions_reject_unknown_dependencies() -> None:
+    actions = PostCommitActions()
+    actions.add(AsyncMock(), name="known")
+
+    with pytest.raises(ValueError):
+        actions.add(AsyncMock(), after=["missing"])
+    with pytest.raises(ValueError):
+        actions.add(AsyncMock(), name="known")
+
+
 # Idempotency claim
 
 
@@ -402,7 +484,7 @@ async def _stage_standalone(
         event_type="payment_intent.succeeded",
         metadata={},
         db_session=MagicMock(),
-        deferred=PostCommitActions(),
+        effects=OutboxBatch("evt_test_1"),
     )
     return payment
 
@@ -444,3 +526,82 @@ async def test_standalone_credits_fall_back_to_converter_without_quote(
 
     assert payment.credits_purchased == 180
     converter.currency_to_credits.assert_awaited_once()
+
+
+# Invoice fetch phase
+@pytest.mark.asyncio
+async def test_invoice_event_fetches_related_objects_concurrently(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    from virtual_labs.infrastructure.stripe import webhook as webhook_module
+
+    webhook_module.stripe_object_cache.clear()
+    in_flight = 0
+    peak = 0
+    retrieved: list[str] = []
+
+    def retriever(kind: str, live: dict[str, Any]):
+        async def retrieve(object_id: str, **_: Any) -> Any:
+            nonlocal in_flight, peak
+            in_flight += 1
+            peak = max(peak, in_flight)
+            await asyncio.sleep(0.01)
+            in_flight -= 1
+            retrieved.append(f"{kind}:{object_id}")
+            return convert_to_stripe_object({**live, "id": object_id})
+
+        return retrieve
+
+    invoice_payload = {
+        "id": "in_1",
+        "object": "invoice",
+        "subscription": "sub_1",
+        "payment_intent": "pi_1",
+        "customer": "cus_1",
+        "metadata": {},
+    }
+    client = SimpleNamespace(
+        # the live invoice points at another payment intent than the payload
+        invoices=SimpleNamespace(
+            retrieve_async=retriever(
+                "invoice", {**invoice_payload, "payment_intent": "pi_2"}
+            )
+        ),
+        subscriptions=SimpleNamespace(
+            retrieve_async=retriever("subscription", {"object": "subscription"})
+        ),
+        payment_intents=SimpleNamespace(
+            retrieve_async=retriever("payment_intent", {"object": "payment_intent"})
+        ),
+        customers=SimpleNamespace(
+            retrieve_async=retriever("customer", {"object": "customer"})
+        ),
+    )
+    monkeypatch.setattr(webhook_module, "stripe_client", client)
+
+    webhook = _make_webhook()
+    stage_subscription = AsyncMock()
+    stage_invoice = AsyncMock()
+    setattr(webhook, "_stage_subscription_upsert", stage_subscription)
+    setattr(webhook, "_stage_invoice_payment_record", stage_invoice)
+    session = MagicMock()
+    session.begin.return_value.__aenter__ = AsyncMock()
+    session.begin.return_value.__aexit__ = AsyncMock(return_value=False)
+
+    event = _build_event("invoice.payment_succeeded", invoice_payload)
+    result = await webhook._handle_invoice_payment_event(event, session)
+
+    assert result["status"] == "success"
+    assert peak == 4
+    # sub_1 / cus_1 come from the first round; pi_2 is fetched once the
+    # live invoice shows the payload's pi_1 was stale
+    assert sorted(retrieved) == [
+        "customer:cus_1",
+        "invoice:in_1",
+        "payment_intent:pi_1",
+        "payment_intent:pi_2",
+        "subscription:sub_1",
+    ]
+    assert stage_invoice.await_args.kwargs["payment_intent_id"] == "pi_2"
+    assert stage_invoice.await_args.kwargs["payment_intent"]["id"] == "pi_2"
+    stage_subscription.assert_awaited_once()
@@ -0,0 +1,138 @@
+"""Cache invalidation listener against a minimal RESP server.
+
+fakeredis never times out a read, so it cannot show what a quiet
+channel does to a subscriber whose pool has a socket timeout.
+"""
+
+import asyncio
+import json
+from collections.abc import AsyncIterator
+from unittest.mock import AsyncMock, patch
+
+import pytest
+import pytest_asyncio
+from redis.asyncio import BlockingConnectionPool, Redis
+
+from virtual_labs.infrastructure.cache import tiered
+from virtual_labs.infrastructure.cache.tiered import (
+    INVALIDATION_CHANNEL,
+    TieredCache,
+    listen_for_invalidations,
+)
+
+SOCKET_TIMEOUT = 0.2
+
+
+def _bulk(value: str) -> bytes:
+    return f"${len(value.encode())}\r\n{value}\r\n".encode()
+
+
+class RespServer:
+    """Answers every command with +OK and lets the test publish to the
+    subscribers of `INVALIDATION_CHANNEL`."""
+
+    def __init__(self) -> None:
+        self.subscribers: list[asyncio.StreamWriter] = []
+        self.subscribed = asyncio.Event()
+        self._server: asyncio.Server | None = None
+
+    async def start(self) -> int:
+        self._server = await asyncio.start_server(self._serve, "127.0.0.1", 0)
+        return int(self._server.sockets[0].getsockname()[1])
+
+    async def stop(self) -> None:
+        for writer in self.subscribers:
+            writer.close()
+        if self._server is not None:
+            self._server.close()
+            await self._server.wait_closed()
+
+    async def publish(self, payload: str) -> None:
+        message = b"*3\r\n" + b"".join(
+            _bulk(part) for part in ("message", INVALIDATION_CHANNEL, payload)
+        )
+        for writer in self.subscribers:
+            if not writer.is_closing():
+                writer.write(message)
+                await writer.drain()
+
+    async def _command(self, reader: asyncio.StreamReader) -> list[str]:
+        count = int((await reader.readline())[1:])
+        parts = []
+        for _ in range(count):
+            length = int((await reader.readline())[1:])
+            parts.append((await reader.readexactly(length + 2))[:-2].decode())
+        return parts
+
+    async def _serve(
+        self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter
+    ) -> None:
+        try:
+            while True:
+                command = await self._command(reader)
+                if command[0].upper() == "SUBSCRIBE":
+                    writer.write(
+                        b"*3\r\n" + _bulk("subscribe") + _bulk(command[1]) + b":1\r\n"
+                    )
+                    self.subscribers.append(writer)
+                    self.subscribed.set()
+                else:
+                    writer.write(b"+OK\r\n")
+                await writer.drain()
+        except (asyncio.IncompleteReadError, ConnectionError, ValueError):
+            writer.close()
+
+
+@pytest_asyncio.fixture
+async def resp_redis() -> AsyncIterator[tuple[RespServer, Redis]]:
+    server = RespServer()
+    port = await server.start()
+    pool = BlockingConnectionPool(
+        host="127.0.0.1",
+        port=port,
+        decode_responses=True,
+        socket_timeout=SOCKET_TIMEOUT,
+    )
+    client = Redis(connection_pool=pool)
+    try:
+        yield server, client
+    finally:
+        await client.aclose()
+        await pool.disconnect()
+        await server.stop()
+
+
+@pytest.mark.asyncio
+async def test_listener_stays_subscribed_past_the_socket_timeout(
+    resp_redis: tuple[RespServer, Redis],
+) -> None:
+    server, client = resp_redis
+    cache = TieredCache("idle-listener", maxsize=10, ttl=60)
+    listener: asyncio.Task[None] | None = None
+    try:
+        with patch.object(tiered, "get_redis", AsyncMock(return_value=client)):
+            await cache.set("user-1", "grants", ["a"], ttl=60)
+            await cache.set("user-2", "grants-2", ["b"], ttl=60)
+            listener = asyncio.create_task(listen_for_invalidations(retry_seconds=60))
+            await asyncio.wait_for(server.subscribed.wait(), timeout=2)
+
+            # quiet for several socket timeouts
+            await asyncio.sleep(SOCKET_TIMEOUT * 4)
+            await server.publish(
+                json.dumps({"namespace": "idle-listener", "tag": "user-1"})
+            )
+            for _ in range(100):
+                if cache.stats().size < 2:
+                    break
+                await asyncio.sleep(0.01)
+
+            assert not listener.done()
+            # the other tag survives: the local tier was never flushed
+            assert cache.stats().size == 1
+            assert await cache.get("user-2", "grants-2") == ["b"]
+    finally:
+        if listener is not None:
+            listener.cancel()
+            with pytest.raises(asyncio.CancelledError):
+                await listener
+        tiered._registry.pop("idle-listener", None)
@@ -0,0 +1,134 @@
+"""Redis-backed email queue (fake Redis, no SMTP)."""
+
+from typing import Any
+from unittest.mock import AsyncMock
+from uuid import uuid4
+
+import pytest
+from fakeredis.aioredis import FakeRedis
+from pydantic import BaseModel
+
+from virtual_labs.core.exceptions.email_error import EmailError
+from virtual_labs.domain.email import EmailJobStatus
+from virtual_labs.infrastructure.email.queue import (
+    DEAD_LETTER_KEY,
+    JOB_KEY_PREFIX,
+    SCHEDULE_KEY,
+    EmailJob,
+    EmailKind,
+    EmailQueue,
+)
+from virtual_labs.infrastructure.settings import settings
+
+
+class Details(BaseModel):
+    recipient: str
+
+
+def _job(recipient: str = "student@uni.org") -> EmailJob:
+    return EmailJob(
+        kind=EmailKind.WELCOME,
+        recipient=recipient,
+        details=Details(recipient=recipient),
+    )
+
+
+@pytest.fixture
+def queued(monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setattr(settings, "EMAIL_QUEUE_ENABLED", True)
+
+
+@pytest.mark.asyncio
+@pytest.mark.usefixtures("queued")
+async def test_enqueue_returns_before_delivery_and_drain_sends() -> None:
+    redis = FakeRedis(decode_responses=True)
+    handler = AsyncMock()
+    queue = EmailQueue(handlers={EmailKind.WELCOME: handler}, redis=redis)
+    requester = uuid4()
+
+    job_ids = await queue.enqueue_many(
+        [_job("a@uni.org"), _job("b@uni.org")], requested_by=requester
+    )
+
+    handler.assert_not_called()
+    job, owner = await queue.get(job_ids[0]) or (None, None)
+    assert job is not None and job.status is EmailJobStatus.QUEUED
+    assert owner == str(requester)
+
+    assert await queue.drain_once() == 2
+
+    assert sorted(call.args[0]["recipient"] for call in handler.await_args_list) == [
+        "a@uni.org",
+        "b@uni.org",
+    ]
+    for job_id in job_ids:
+        sent, _ = await queue.get(job_id) or (None, None)
+        assert sent is not None
+        assert (sent.status, sent.attempts) == (EmailJobStatus.SENT, 1)
+        assert await redis.ttl(f"{JOB_KEY_PREFIX}{job_id}") > 0
+    assert await redis.zcard(SCHEDULE_KEY) == 0
+    assert await queue.drain_once() == 0
+
+
+@pytest.mark.asyncio
+@pytest.mark.usefixtures("queued")
+async def test_claimed_jobs_are_leased_from_other_consumers() -> None:
+    redis = FakeRedis(decode_responses=True)
+    seen_by_other: list[int] = []
+
+    async def handler(payload: dict[str, Any]) -> None:
+        seen_by_other.append(await other.drain_once())
+
+    queue = EmailQueue(handlers={EmailKind.WELCOME: handler}, redis=redis)
+    other = EmailQueue(handlers={EmailKind.WELCOME: handler}, redis=redis)
+    await queue.enqueue(_job(), requested_by=uuid4())
+
+    assert await queue.drain_once() == 1
+    assert seen_by_other == [0]
+
+
+@pytest.mark.asyncio
+@pytest.mark.usefixtures("queued")
+async def test_failures_back_off_then_land_in_the_dead_letter_list(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    monkeypatch.setattr(settings, "EMAIL_QUEUE_MAX_ATTEMPTS", 2)
+    redis = FakeRedis(decode_responses=True)
+    handler = AsyncMock(side_effect=EmailError(message="refused", detail="550"))
+    queue = EmailQueue(handlers={EmailKind.WELCOME: handler}, redis=redis)
+    job_id = await queue.enqueue(_job(), requested_by=uuid4())
+
+    assert await queue.drain_once() == 1
+    retrying, _ = await queue.get(job_id) or (None, None)
+    assert retrying is not None
+    assert retrying.status is EmailJobStatus.RETRYING
+    assert retrying.last_error == "refused: 550"
+    assert await queue.drain_once() == 0  # backing off
+
+    await redis.zadd(SCHEDULE_KEY, {str(job_id): 0})
+    assert await queue.drain_once() == 1
+    dead, _ = await queue.get(job_id) or (None, None)
+    assert dead is not None
+    assert (dead.status, dead.attempts) == (EmailJobStatus.DEAD, 2)
+    assert await redis.lrange(DEAD_LETTER_KEY, 0, -1) == [str(job_id)]  # type: ignore[misc]
+    assert await redis.zcard(SCHEDULE_KEY) == 0
+
+
+@pytest.mark.asyncio
+async def test_disabled_queue_sends_inline_and_raises(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    monkeypatch.setattr(settings, "EMAIL_QUEUE_ENABLED", False)
+    redis = FakeRedis(decode_responses=True)
+    failure = EmailError(message="refused", detail="550")
+    handler = AsyncMock(side_effect=[None, failure])
+    queue = EmailQueue(handlers={EmailKind.WELCOME: handler}, redis=redis)
+
+    job_id = await queue.enqueue(_job(), requested_by=uuid4())
+    with pytest.raises(EmailError):
+        await queue.enqueue(_job(), requested_by=uuid4())
+
+    sent, _ = await queue.get(job_id) or (None, None)
+    assert sent is not None and sent.status is EmailJobStatus.SENT
+    assert await redis.zcard(SCHEDULE_KEY) == 0
+    assert await queue.get(uuid4()) is None
@@ -0,0 +1,378 @@
+import asyncio
+import json
+import time
+from typing import Any, Iterator
+from unittest.mock import AsyncMock, patch
+from uuid import uuid4
+
+import pytest
+from fakeredis.aioredis import FakeRedis
+from jwcrypto import jwk, jwt
+
+from virtual_labs.infrastructure.cache import TTLCache
+from virtual_labs.infrastructure.kc import blocking, session_cache
+from virtual_labs.infrastructure.kc.client_token import ClientTokenProvider
+from virtual_labs.infrastructure.kc.group_cache import group_members_cache
+from virtual_labs.infrastructure.kc.jwks import JwksCache
+from virtual_labs.repositories.group_repo import GroupQueryRepository
+from virtual_labs.repositories.user_repo import UserMutationRepository
+
+
+def make_key(kid: str) -> jwk.JWK:
+    return jwk.JWK.generate(kty="RSA", size=2048, kid=kid)
+
+
+def make_certs(*keys: jwk.JWK) -> dict[str, Any]:
+    return {"keys": [json.loads(key.export_public()) for key in keys]}
+
+
+def sign(key: jwk.JWK, claims: dict[str, Any]) -> str:
+    token = jwt.JWT(
+        header={"alg": "RS256", "kid": key.get("kid")},
+        claims=claims,
+    )
+    token.make_signed_token(key)
+    return str(token.serialize())
+
+
+class FakeOpenID:
+    def __init__(self, certs: dict[str, Any]) -> None:
+        self.certs = certs
+        self.calls = 0
+
+    async def a_certs(self) -> dict[str, Any]:
+        self.calls += 1
+        return self.certs
+
+
+def test_ttl_cache_evicts_least_recently_used() -> None:
+    cache: TTLCache[str, int] = TTLCache(maxsize=2, ttl=60)
+    cache.set("a", 1)
+    cache.set("b", 2)
+    assert cache.get("a") == 1
+
+    cache.set("c", 3)
+
+    assert cache.get("b") is None
+    assert cache.get("a") == 1
+    assert cache.get("c") == 3
+    assert cache.stats().hits == 3
+    assert cache.stats().misses == 1
+
+
+def test_ttl_cache_expires_entries_and_ignores_non_positive_ttl() -> None:
+    cache: TTLCache[str, int] = TTLCache(maxsize=10, ttl=60)
+    cache.set("expired", 1, ttl=0)
+    assert cache.get("expired") is None
+
+    with patch("virtual_labs.infrastructure.cache.memory.monotonic") as clock:
+        clock.return_value = 100.0
+        cache.set("short", 1, ttl=5)
+        clock.return_value = 104.0
+        assert cache.get("short") == 1
+        clock.return_value = 105.0
+        assert cache.get("short") is None
+
+
+@pytest.mark.asyncio
+async def test_jwks_cache_fetches_once_while_fresh() -> None:
+    openid = FakeOpenID(make_certs(make_key("k1")))
+    cache = JwksCache(openid, refresh_seconds=300)
+
+    first = await cache.get_keyset()
+    second = await cache.get_keyset()
+
+    assert first is second
+    assert openid.calls == 1
+
+
+@pytest.mark.asyncio
+async def test_jwks_cache_picks_up_rotated_key() -> None:
+    old, new = make_key("old"), make_key("new")
+    openid = FakeOpenID(make_certs(old))
+    cache = JwksCache(openid, refresh_seconds=300)
+    await cache.get_keyset()
+
+    openid.certs = make_certs(old, new)
+    with patch(
+        "virtual_labs.infrastructure.kc.jwks.monotonic",
+        return_value=time.monotonic() + 60,
+    ):
+        keyset = await cache.get_keyset(force=True)
+
+    assert keyset.get_key("new") is not None
+    assert openid.calls == 2
+
+    token = jwt.JWT(jwt=sign(new, {"sub": "user"}), key=keyset)
+    assert json.loads(token.claims)["sub"] == "user"
+
+
+class FakeTokenEndpoint:
+    def __init__(self, expires_in: int = 300) -> None:
+        self.expires_in = expires_in
+        self.calls = 0
+
+    async def a_token(self, grant_type: str) -> dict[str, Any]:
+        assert grant_type == "client_credentials"
+        self.calls += 1
+        await asyncio.sleep(0)
+        return {"access_token": f"token-{self.calls}", "expires_in": self.expires_in}
+
+
+@pytest.mark.asyncio
+async def test_client_token_is_shared_by_concurrent_callers() -> None:
+    endpoint = FakeTokenEndpoint()
+    provider = ClientTokenProvider(endpoint, refresh_margin=30)
+
+    tokens = await asyncio.gather(*(provider.get_token() for _ in range(20)))
+
+    assert set(tokens) == {"token-1"}
+    assert endpoint.calls == 1
+
+
+@pytest.mark.asyncio
+async def test_client_token_is_refreshed_before_it_expires() -> None:
+    endpoint = FakeTokenEndpoint(expires_in=300)
+    provider = ClientTokenProvider(endpoint, refresh_margin=30)
+    assert await provider.get_token() == "token-1"
+
+    with patch(
+        "virtual_labs.infrastructure.kc.client_token.monotonic",
+        return_value=time.monotonic() + 260,
+    ):
+        assert await provider.get_token() == "token-1"
+
+    with patch(
+        "virtual_labs.infrastructure.kc.client_token.monotonic",
+        return_value=time.monotonic() + 275,
+    ):
+        assert await provider.get_token() == "token-2"
+
+    assert endpoint.calls == 2
+
+
+@pytest.mark.asyncio
+async def test_introspection_is_cached_until_token_expiry() -> None:
+    session_cache._introspection_cache.clear()
+    introspect = AsyncMock(return_value={"active": True})
+    claims = {"exp": time.time() + 120}
+
+    with patch.object(session_cache.kc_auth, "a_introspect", introspect):
+        await session_cache.a_introspect_cached("token-a", claims)
+        await session_cache.a_introspect_cached("token-a", claims)
+        await session_cache.a_introspect_cached("token-b", claims)
+
+    assert introspect.await_count == 2
+
+
+@pytest.mark.asyncio
+async def test_introspection_of_expired_token_is_not_cached() -> None:
+    session_cache._introspection_cache.clear()
+    introspect = AsyncMock(return_value={"active": False})
+    claims = {"exp": time.time() - 1}
+
+    with patch.object(session_cache.kc_auth, "a_introspect", introspect):
+        await session_cache.a_introspect_cached("token", claims)
+        await session_cache.a_introspect_cached("token", claims)
+
+    assert introspect.await_count == 2
+
+
+@pytest.fixture
+def fake_redis() -> Iterator[FakeRedis]:
+    redis = FakeRedis(decode_responses=True)
+    with patch(
+        "virtual_labs.infrastructure.cache.tiered.get_redis",
+        AsyncMock(return_value=redis),
+    ):
+        yield redis
+
+
+@pytest.mark.asyncio
+async def test_groups_are_cached_per_session_across_tiers(
+    fake_redis: FakeRedis,
+) -> None:
+    session_cache._groups_cache.clear_local()
+    userinfo = AsyncMock(return_value={"groups": ["/vlab/x/admin"]})
+    claims = {"sub": "user-1", "sid": "session-1", "exp": time.time() + 120}
+
+    with patch.object(session_cache.kc_auth, "a_userinfo", userinfo):
+        first = await session_cache.a_userinfo_groups_cached("token", claims)
+        # a fresh worker only has the redis tier
+        session_cache._groups_cache.clear_local()
+        second = await session_cache.a_userinfo_groups_cached("token", claims)
+
+    assert first == second == ["/vlab/x/admin"]
+    assert userinfo.await_count == 1
+
+
+@pytest.mark.asyncio
+async def test_membership_change_invalidates_cached_groups(
+    fake_redis: FakeRedis,
+) -> None:
+    session_cache._groups_cache.clear_local()
+    userinfo = AsyncMock(return_value={"groups": ["/vlab/x/admin"]})
+    claims = {"sub": "user-2", "sid": "session-2", "exp": time.time() + 120}
+
+    with patch.object(session_cache.kc_auth, "a_userinfo", userinfo):
+        await session_cache.a_userinfo_groups_cached("token", claims)
+        await session_cache.invalidate_user_grants("user-2")
+        assert await fake_redis.keys("cache:kc-groups:user-2:*") == []
+
+        userinfo.return_value = {"groups": []}
+        groups = await session_cache.a_userinfo_groups_cached("token", claims)
+
+    assert groups == []
+    assert userinfo.await_count == 2
+
+
+@pytest.mark.asyncio
+async def test_groups_cache_falls_back_to_keycloak_when_redis_is_down() -> None:
+    session_cache._groups_cache.clear_local()
+    userinfo = AsyncMock(return_value={"groups": ["/vlab/x/member"]})
+    claims = {"sub": "user-3", "sid": "session-3", "exp": time.time() + 120}
+
+    with (
+        patch(
+            "virtual_labs.infrastructure.cache.tiered.get_redis",
+            AsyncMock(side_effect=ConnectionError("redis down")),
+        ),
+        patch.object(session_cache.kc_auth, "a_userinfo", userinfo),
+    ):
+        groups = await session_cache.a_userinfo_groups_cached("token", claims)
+
+    assert groups == ["/vlab/x/member"]
+
+
+def group_member(user_id: str) -> dict[str, Any]:
+    return {
+        "id": user_id,
+        "username": user_id,
+        "email": f"{user_id}@example.com",
+        "emailVerified": True,
+        "createdTimestamp": 0,
+        "enabled": True,
+        "totp": False,
+        "disableableCredentialTypes": [],
+        "requiredActions": [],
+        "notBefore": 0,
+    }
+
+
+@pytest.mark.asyncio
+async def test_group_members_are_read_through_the_cache(
+    fake_redis: FakeRedis,
+) -> None:
+    group_members_cache.clear_local()
+    before = group_members_cache.stats()
+    repo = GroupQueryRepository()
+    repo.Kc = AsyncMock()
+    repo.Kc.a_get_group_members.return_value = [group_member("user-1")]
+
+    first = await repo.a_retrieve_group_user_ids("group-1")
+    group_members_cache.clear_local()
+    second = await repo.a_retrieve_group_user_ids("group-1")
+    third = await repo.a_retrieve_group_user_ids("group-1")
+
+    assert first == second == third == ["user-1"]
+    assert repo.Kc.a_get_group_members.await_count == 1
+    after = group_members_cache.stats()
+    assert (after.hits - before.hits, after.misses - before.misses) == (2, 1)
+
+
+@pytest.mark.asyncio
+async def test_group_members_of_a_page_are_resolved_in_bulk(
+    fake_redis: FakeRedis,
+) -> None:
+    group_members_cache.clear_local()
+    repo = GroupQueryRepository()
+    repo.Kc = AsyncMock()
+    repo.Kc.a_get_group_members.side_effect = lambda group_id: [
+        group_member(f"admin-of-{group_id}")
+    ]
+    await repo.a_retrieve_group_user_ids("page-group-1")
+    group_members_cache.clear_local()
+    repo.Kc.a_get_group_members.reset_mock()
+
+    admins = await repo.a_retrieve_groups_user_ids(
+        ["page-group-1", "page-group-2", "page-group-1", "page-group-3"]
+    )
+
+    assert admins == {
+        "page-group-1": ["admin-of-page-group-1"],
+        "page-group-2": ["admin-of-page-group-2"],
+        "page-group-3": ["admin-of-page-group-3"],
+    }
+    # page-group-1 came from redis, the others were fetched once each
+    fetched = sorted(
+        call.kwargs["group_id"] for call in repo.Kc.a_get_group_members.await_args_list
+    )
+    assert fetched == ["page-group-2", "page-group-3"]
+    assert await group_members_cache.get_many(
+        [("page-group-2", "page-group-2"), ("page-group-4", "page-group-4")]
+    ) == [[group_member("admin-of-page-group-2")], None]
+
+
+@pytest.mark.asyncio
+async def test_membership_writes_invalidate_group_members(
+    fake_redis: FakeRedis,
+) -> None:
+    group_members_cache.clear_local()
+    query_repo = GroupQueryRepository()
+    query_repo.Kc = AsyncMock()
+    query_repo.Kc.a_get_group_members.return_value = [group_member("user-1")]
+    mutation_repo = UserMutationRepository()
+    mutation_repo.Kc = AsyncMock()
+    new_member = uuid4()
+
+    await query_repo.a_retrieve_group_users("group-2")
+    query_repo.Kc.a_get_group_members.return_value = [
+        group_member("user-1"),
+        group_member(str(new_member)),
+    ]
+    await mutation_repo.a_attach_user_to_group(user_id=new_member, group_id="group-2")
+    assert await fake_redis.keys("cache:kc-group-members:group-2:*") == []
+
+    members = await query_repo.a_retrieve_group_user_ids("group-2")
+
+    assert members == ["user-1", str(new_member)]
+    assert query_repo.Kc.a_get_group_members.await_count == 2
+
+
+class FakeKeycloakClient:
+    def __init__(self) -> None:
+        self.calls = 0
+
+    def get_users(self) -> list[str]:
+        self.calls += 1
+        return ["user"]
+
+    async def a_get_users(self) -> list[str]:
+        return ["user"]
+
+    def sync_only(self) -> str:
+        return "untouched"
+
+
+def test_blocking_call_detector_only_wraps_methods_with_async_twin() -> None:
+    client = FakeKeycloakClient()
+
+    assert blocking.guard_blocking_methods(client, "fake") == 1
+    assert blocking.guard_blocking_methods(client, "fake") == 0
+    assert client.get_users() == ["user"]
+    assert client.sync_only() == "untouched"
+
+
+@pytest.mark.asyncio
+async def test_blocking_call_detector_flags_calls_on_the_event_loop() -> None:
+    client = FakeKeycloakClient()
+    blocking.guard_blocking_methods(client, "fake")
+
+    with patch.object(blocking.settings, "KC_BLOCKING_CALL_DETECTION", "raise"):
+        with pytest.raises(blocking.BlockingKeycloakCall, match="a_get_users"):
+            client.get_users()
+        assert client.calls == 0
+
+        # the same call from a worker thread is allowed
+        assert await asyncio.to_thread(client.get_users) == ["user"]
+        assert client.calls == 1
@@ -0,0 +1,160 @@
+"""Keyset pagination helpers (no database)."""
+
+import json
+from datetime import datetime, timezone
+from typing import Any
+from uuid import uuid4
+
+import pytest
+from sqlalchemy import select
+from sqlalchemy.dialects import postgresql
+
+from virtual_labs.core.exceptions.api_error import VliError
+from virtual_labs.core.keyset import (
+    _sort_keys,
+    after_cursor,
+    count_rows,
+    decode_cursor,
+    encode_cursor,
+    paginate,
+)
+from virtual_labs.core.ordering import order_clauses
+from virtual_labs.domain.common import CountMode, OrderBy, OrderDirection
+from virtual_labs.infrastructure.db.models import Project, SubscriptionPayment
+
+NEWEST_PAYMENTS = (
+    SubscriptionPayment.payment_date.desc(),
+    SubscriptionPayment.id.desc(),
+)
+
+
+def _sql(clause: Any) -> str:
+    return str(clause.compile(dialect=postgresql.dialect()))
+
+
+class _Rows:
+    def __init__(self, rows: list[tuple[Any, ...]]) -> None:
+        self._rows = rows
+
+    def all(self) -> list[tuple[Any, ...]]:
+        return self._rows
+
+
+class FakeSession:
+    def __init__(self, rows: list[tuple[Any, ...]], scalar: Any = 42) -> None:
+        self.rows = rows
+        self.scalar_result = scalar
+        self.statements: list[Any] = []
+
+    async def scalar(self, statement: Any) -> Any:
+        self.statements.append(statement)
+        return self.scalar_result
+
+    async def execute(self, statement: Any) -> _Rows:
+        self.statements.append(statement)
+        return _Rows(self.rows)
+
+
+def test_cursor_round_trips_typed_values_and_is_bound_to_its_ordering() -> None:
+    keys = _sort_keys(NEWEST_PAYMENTS)
+    values = [datetime(2026, 1, 2, 3, 4, 5, tzinfo=timezone.utc), uuid4()]
+
+    cursor = encode_cursor(keys, values)
+
+    assert decode_cursor(keys, cursor) == values
+    other = _sort_keys(order_clauses(Project, OrderBy.NAME, OrderDirection.ASC))
+    for bad in (cursor[:-4], "not-a-cursor"):
+        with pytest.raises(VliError):
+            decode_cursor(keys, bad)
+    with pytest.raises(VliError):
+        decode_cursor(other, cursor)
+
+
+def test_uniform_direction_compares_rows_and_mixed_direction_expands() -> None:
+    uniform = after_cursor(_sort_keys(NEWEST_PAYMENTS), [datetime.now(), uuid4()])
+    assert "(subscription_payment.payment_date, subscription_payment.id) < (" in _sql(
+        uniform
+    )
+
+    mixed = _sort_keys(
+        (
+            *order_clauses(Project, OrderBy.UPDATED_AT, OrderDirection.DESC),
+            Project.id.asc(),
+        )
+    )
+    sql = _sql(after_cursor(mixed, [datetime.now(), datetime.now(), uuid4()]))
+    assert "project.updated_at < " in sql
+    assert "project.created_at < " in sql
+    assert "project.id > " in sql
+    assert sql.count(" OR ") == 2
+
+
+@pytest.mark.asyncio
+async def test_paginate_continues_after_the_cursor_and_peeks_one_row_ahead() -> None:
+    page_rows = [
+        (f"payment-{i}", datetime(2026, 1, 10 - i, tzinfo=timezone.utc), uuid4())
+        for i in range(3)
+    ]
+    session = FakeSession(page_rows)
+    keys = _sort_keys(NEWEST_PAYMENTS)
+    cursor = encode_cursor(keys, [datetime(2026, 1, 11, tzinfo=timezone.utc), uuid4()])
+
+    page = await paginate(
+        session,  # type: ignore[arg-type]
+        select(SubscriptionPayment),
+        order_by=NEWEST_PAYMENTS,
+        cursor=cursor,
+        offset=40,
+        limit=2,
+        count=CountMode.NONE,
+    )
+
+    assert page.items == ["payment-0", "payment-1"]
+    assert page.total is None
+    assert decode_cursor(keys, page.next_cursor or "") == list(page_rows[1][1:])
+    (statement,) = session.statements  # no count query
+    sql = _sql(statement)
+    assert "OFFSET" not in sql
+    assert "LIMIT" in sql and statement._limit == 3
+    assert "(subscription_payment.payment_date, subscription_payment.id) < (" in sql
+
+
+@pytest.mark.asyncio
+async def test_paginate_last_page_has_no_cursor_and_counts_exactly() -> None:
+    session = FakeSession([("payment-0", datetime.now(), uuid4())])
+
+    page = await paginate(
+        session,  # type: ignore[arg-type]
+        select(SubscriptionPayment),
+        order_by=NEWEST_PAYMENTS,
+        cursor=None,
+        offset=40,
+        limit=2,
+        count=CountMode.EXACT,
+    )
+
+    assert page.items == ["payment-0"]
+    assert page.total == 42
+    assert page.next_cursor is None
+    assert session.statements[-1]._offset == 40
+
+
+PLAN = [{"Plan": {"Node Type": "Seq Scan", "Plan Rows": 1234}}]
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("plan", [PLAN, json.dumps(PLAN)], ids=["decoded", "text"])
+async def test_estimated_count_reads_the_planner_row_estimate(plan: Any) -> None:
+    session = FakeSession([], scalar=plan)
+
+    total = await count_rows(
+        session,  # type: ignore[arg-type]
+        select(SubscriptionPayment),
+        CountMode.ESTIMATED,
+    )
+
+    assert total == 1234
+    (statement,) = session.statements
+    assert _sql(statement).startswith(
+        "EXPLAIN (FORMAT JSON) SELECT subscription_payment.id"
+    )
@@ -0,0 +1,47 @@
+"""Lab and course relationships load only through explicit profiles."""
+
+from typing import Any
+
+from sqlalchemy import select
+from sqlalchemy.dialects import postgresql
+from sqlalchemy.sql import Select
+
+from virtual_labs.infrastructure.db.loading import (
+    COURSE_ADMIN,
+    ENROLMENT_COURSE,
+    LAB_DETAIL,
+    LAB_LIST,
+)
+from virtual_labs.infrastructure.db.models import Course, CourseEnrolment, VirtualLab
+
+
+def _sql(statement: Select[Any]) -> str:
+    return str(statement.compile(dialect=postgresql.dialect()))
+
+
+def test_bare_selects_read_their_own_table() -> None:
+    assert "JOIN" not in _sql(select(VirtualLab))
+    assert "JOIN" not in _sql(select(Course))
+
+
+def test_lab_list_loads_courses_in_a_separate_query() -> None:
+    assert "JOIN" not in _sql(select(VirtualLab).options(*LAB_LIST))
+
+
+def test_lab_detail_joins_the_course() -> None:
+    assert "LEFT OUTER JOIN course" in _sql(select(VirtualLab).options(*LAB_DETAIL))
+
+
+def test_course_admin_joins_lab_and_institution() -> None:
+    sql = _sql(select(Course).options(*COURSE_ADMIN))
+
+    assert "JOIN virtual_lab" in sql
+    assert "JOIN institution" in sql
+
+
+def test_enrolment_course_joins_lab_and_institution() -> None:
+    sql = _sql(select(CourseEnrolment).options(*ENROLMENT_COURSE))
+
+    assert sql.count("JOIN course") == 1
+    assert "JOIN virtual_lab" in sql
+    assert "JOIN institution" in sql
@@ -0,0 +1,107 @@
+"""Pooled SMTP mailer (no SMTP server)."""
+
+import asyncio
+from email.message import Message
+from typing import Any
+
+import aiosmtplib
+import pytest
+
+from virtual_labs.infrastructure.email.mailer import LOGO, Email, Mailer
+from virtual_labs.infrastructure.settings import settings
+
+
+class FakeSmtp:
+    def __init__(self, fail_with: list[BaseException]) -> None:
+        self.fail_with = fail_with
+        self.sent: list[Message] = []
+        self.is_connected = True
+
+    async def send_message(self, message: Message) -> Any:
+        if self.fail_with:
+            raise self.fail_with.pop(0)
+        self.sent.append(message)
+
+    async def quit(self) -> None:
+        self.is_connected = False
+
+    def close(self) -> None:
+        self.is_connected = False
+
+
+def _mailer(*failures: BaseException) -> tuple[Mailer, list[FakeSmtp]]:
+    pending = list(failures)
+    clients: list[FakeSmtp] = []
+
+    async def connect() -> Any:
+        # only the first connection fails, as a stale pooled one would
+        clients.append(FakeSmtp(pending if not clients else []))
+        return clients[-1]
+
+    return Mailer(connect=connect), clients
+
+
+def _email(recipient: str) -> Email:
+    return Email(
+        recipient=recipient,
+        subject="Enrolled",
+        html_template="course_enrolment_claim.html",
+        plain_template="course_enrolment_claim.txt",
+        context={"course_name": "Neuro 101", "claim_link": "https://x/claim"},
+    )
+
+
+def test_render_builds_related_alternative_with_inline_logo() -> None:
+    mailer, _ = _mailer()
+
+    message = mailer.render(_email("student@uni.org"))
+
+    assert [part.get_content_type() for part in message.walk()] == [
+        "multipart/related",
+        "multipart/alternative",
+        "text/plain",
+        "text/html",
+        "image/png",
+    ]
+    *_, html, logo = message.walk()
+    assert "Neuro 101" in html.get_payload(decode=True).decode()  # type: ignore[union-attr]
+    assert logo["Content-ID"] == LOGO.content_id
+    assert logo.get_filename() == "logo.png"
+    assert message["To"] == "student@uni.org"
+    assert message["X-SES-CONFIGURATION-SET"] == settings.AWS_SES_CONFIGURATION_SET
+
+
+@pytest.mark.asyncio
+async def test_concurrent_sends_reuse_pooled_connections(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    monkeypatch.setattr(settings, "MAIL_POOL_SIZE", 2)
+    mailer, clients = _mailer()
+
+    await asyncio.gather(*(mailer.send(_email(f"s{i}@uni.org")) for i in range(10)))
+    await mailer.send(_email("late@uni.org"))
+
+    assert len(clients) <= 2
+    assert sum(len(client.sent) for client in clients) == 11
+
+    await mailer.close()
+    assert not any(client.is_connected for client in clients)
+
+
+@pytest.mark.asyncio
+async def test_send_retries_on_a_dropped_connection_and_reports_other_failures() -> (
+    None
+):
+    mailer, clients = _mailer(aiosmtplib.SMTPServerDisconnected("gone"))
+
+    await mailer.send(_email("student@uni.org"))
+
+    dropped, fresh = clients
+    assert not dropped.is_connected
+    assert [message["To"] for message in fresh.sent] == ["student@uni.org"]
+
+    fresh.fail_with.append(aiosmtplib.SMTPRecipientsRefused([]))
+    with pytest.raises(aiosmtplib.SMTPRecipientsRefused):
+        await mailer.send(_email("bad@uni.org"))
+    await mailer.send(_email("ok@uni.org"))
+    assert [message["To"] for message in clients[-1].sent] == ["ok@uni.org"]
@@ -0,0 +1,47 @@
+"""Name search must stay servable by the pg_trgm indexes."""
+
+from typing import Any
+
+import pytest
+from sqlalchemy import select, text
+from sqlalchemy.dialects import postgresql
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from virtual_labs.core.search import name_contains
+from virtual_labs.infrastructure.db.models import Project, VirtualLab
+
+
+def test_name_contains_filters_the_bare_column_and_escapes_wildcards() -> None:
+    compiled = (
+        select(Project.id)
+        .where(name_contains(Project.name, " 50%_off "))
+        .compile(dialect=postgresql.dialect())
+    )
+
+    assert "lower(" not in str(compiled)
+    assert "project.name ILIKE %(name_1)s::VARCHAR ESCAPE" in str(compiled)
+    assert compiled.params["name_1"] == "%50\\%\\_off%"
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize(
+    ("model", "index"),
+    [
+        (Project, "ix_project_name_trgm"),
+        (VirtualLab, "ix_virtual_lab_name_trgm"),
+    ],
+)
+async def test_name_search_plan_uses_trigram_index(
+    async_test_session: AsyncSession, model: Any, index: str
+) -> None:
+    # tiny test tables would otherwise always be scanned sequentially
+    await async_test_session.execute(text("SET LOCAL enable_seqscan = off"))
+    statement = select(model.id).where(name_contains(model.name, "neuro"))
+    sql = statement.compile(
+        dialect=async_test_session.get_bind().dialect,
+        compile_kwargs={"literal_binds": True},
+    )
+
+    plan = (await async_test_session.execute(text(f"EXPLAIN {sql}"))).scalars()
+
+    assert any(index in line for line in plan)
@@ -0,0 +1,147 @@
+import asyncio
+from typing import Any
+from unittest.mock import AsyncMock, patch
+from uuid import uuid4
+
+import pytest
+from fakeredis.aioredis import FakeRedis
+
+from virtual_labs.core.exceptions.api_error import VliError
+from virtual_labs.infrastructure.kc.models import AuthUser
+from virtual_labs.infrastructure.redis import RateLimiter
+from virtual_labs.infrastructure.redis.promotion_limiter import (
+    rate_limit_promotion_redemption,
+)
+
+
+class CountingRedis(FakeRedis):
+    """Fake Redis that counts the commands sent to it (one per round-trip)."""
+
+    def __init__(self, *args: Any, **kwargs: Any) -> None:
+        super().__init__(*args, **kwargs)
+        self.round_trips = 0
+
+    async def execute_command(self, *args: Any, **options: Any) -> Any:
+        self.round_trips += 1
+        # yield like a network call would, so concurrent callers interleave
+        await asyncio.sleep(0)
+        return await super().execute_command(*args, **options)
+
+
+async def _legacy_hit(rl: RateLimiter, key: str, limit: int) -> bool:
+    # the get -> (set | incr) -> ttl sequence the limiters used before
+    count = await rl.get_count(key)
+    if count is None:
+        await rl.set(key, 1, ttl=60)
+        return True
+    if count >= limit:
+        await rl.get_ttl(key)
+        return False
+    await rl.increment(key)
+    return True
+
+
+@pytest.mark.asyncio
+async def test_fixed_window_counts_and_locks_in_one_round_trip() -> None:
+    redis = CountingRedis()
+    rl = RateLimiter(redis, prefix="test")
+
+    results = [await rl.hit_fixed_window("test:key", 3, 60)]
+    # the first call loads the script (EVALSHA miss, SCRIPT LOAD, EVALSHA)
+    redis.round_trips = 0
+    results += [await rl.hit_fixed_window("test:key", 3, 60) for _ in range(3)]
+    assert redis.round_trips == 3
+
+    assert [(r.allowed, r.count) for r in results] == [
+        (True, 1),
+        (True, 2),
+        (True, 3),
+        (False, 3),
+    ]
+    assert results[-1].ttl is not None and 0 < results[-1].ttl <= 60
+    # the counter stays readable by the email verification use cases
+    assert await rl.get_count("test:key") == 3
+
+
+@pytest.mark.asyncio
+async def test_fixed_window_expires_counters_left_without_ttl() -> None:
+    rl = RateLimiter(CountingRedis(), prefix="test")
+    await rl.redis.set("test:key", 5)
+
+    result = await rl.hit_fixed_window("test:key", 3, 60)
+
+    assert result.allowed is False
+    assert result.ttl == 60
+    assert await rl.get_ttl("test:key") == 60
+
+
+@pytest.mark.asyncio
+async def test_sliding_window_reports_when_the_oldest_hit_leaves() -> None:
+    rl = RateLimiter(CountingRedis(), prefix="test")
+
+    results = [await rl.hit_sliding_window("test:key", 2, 1800) for _ in range(3)]
+
+    assert [(r.allowed, r.count) for r in results] == [
+        (True, 1),
+        (True, 2),
+        (False, 2),
+    ]
+    assert results[-1].ttl is not None and 1790 < results[-1].ttl <= 1800
+
+
+@pytest.mark.asyncio
+async def test_scripted_limiter_is_atomic_and_cheaper_than_get_then_set() -> None:
+    """Benchmark: 20 concurrent hits against a limit of 3."""
+    hits, limit = 20, 3
+
+    legacy_redis = CountingRedis()
+    legacy = RateLimiter(legacy_redis, prefix="legacy")
+    legacy_allowed = await asyncio.gather(
+        *(_legacy_hit(legacy, "legacy:key", limit) for _ in range(hits))
+    )
+
+    scripted_redis = CountingRedis()
+    scripted = RateLimiter(scripted_redis, prefix="scripted")
+    await scripted.hit_fixed_window("scripted:warmup", limit, 60)
+    scripted_redis.round_trips = 0
+    scripted_results = await asyncio.gather(
+        *(scripted.hit_fixed_window("scripted:key", limit, 60) for _ in range(hits))
+    )
+
+    # every legacy caller read the empty counter before anyone wrote it
+    assert sum(legacy_allowed) > limit
+    assert sum(result.allowed for result in scripted_results) == limit
+    # 2 round-trips per hit (get + set/incr/ttl) vs 1 once the script is loaded
+    assert legacy_redis.round_trips == 2 * hits
+    assert scripted_redis.round_trips == hits
+
+
+@pytest.mark.asyncio
+async def test_redemption_limit_ignores_a_fixed_window_counter_left_over() -> None:
+    redis = FakeRedis()
+    user_id = uuid4()
+    auth = (
+        AuthUser(
+            sid="sid",
+            sub=str(user_id),
+            username="user",
+            email="user@uni.org",
+            email_verified=True,
+        ),
+        "token",
+    )
+    # the counter the fixed window kept under the former key, still live
+    await redis.set(f"promotion_code:redeem:{user_id}", 2, ex=1800)
+
+    @rate_limit_promotion_redemption(max_attempts=2)
+    async def redeem(*, auth: tuple[AuthUser, str]) -> str:
+        return "redeemed"
+
+    with patch(
+        "virtual_labs.infrastructure.redis.promotion_limiter.get_redis",
+        new=AsyncMock(return_value=redis),
+    ):
+        assert await redeem(auth=auth) == "redeemed"
+        assert await redeem(auth=auth) == "redeemed"
+        with pytest.raises(VliError):
+            await redeem(auth=auth)
@@ -0,0 +1,94 @@
+import asyncio
+from unittest.mock import AsyncMock, patch
+
+import pytest
+import pytest_asyncio
+from redis.asyncio import Redis
+
+from virtual_labs.infrastructure import redis as redis_client
+from virtual_labs.infrastructure.settings import settings
+
+
+@pytest_asyncio.fixture(autouse=True)
+async def reset_client():
+    await redis_client.close_redis()
+    yield
+    await redis_client.close_redis()
+
+
+@pytest.mark.asyncio
+async def test_get_redis_shares_one_client_without_pinging() -> None:
+    with patch.object(Redis, "ping", new_callable=AsyncMock) as ping:
+        first = await redis_client.get_redis()
+        second = await redis_client.get_redis()
+
+    assert first is second
+    ping.assert_not_awaited()
+
+
+@pytest.mark.asyncio
+async def test_health_check_records_failures_and_recovery() -> None:
+    client = await redis_client.get_redis()
+
+    with patch.object(
+        Redis, "ping", AsyncMock(side_effect=ConnectionError("redis down"))
+    ):
+        assert await redis_client.check_redis_health(client) is False
+    stats = redis_client.redis_pool_stats()
+    assert (stats.healthy, stats.failed_pings, stats.last_ping_ms) == (False, 1, None)
+
+    with patch.object(Redis, "ping", new_callable=AsyncMock):
+        assert await redis_client.check_redis_health(client) is True
+    stats = redis_client.redis_pool_stats()
+    assert stats.healthy is True
+    assert stats.failed_pings == 1
+    assert stats.last_ping_ms is not None
+
+
+@pytest.mark.asyncio
+async def test_open_redis_starts_the_background_health_check() -> None:
+    with (
+        patch.object(Redis, "ping", new_callable=AsyncMock) as ping,
+        patch.object(settings, "REDIS_HEALTH_CHECK_INTERVAL_SECONDS", 0.01),
+    ):
+        await redis_client.open_redis()
+        await redis_client.get_redis()
+        await redis_client.get_redis()
+        initial = ping.await_count
+        for _ in range(50):
+            if ping.await_count > initial:
+                break
+            await asyncio.sleep(0.01)
+
+    assert initial == 1
+    assert ping.await_count > initial
+    stats = redis_client.redis_pool_stats()
+    assert stats.max_connections == settings.REDIS_MAX_CONNECTIONS
+    assert stats.connections == 0
+
+
+@pytest.mark.asyncio
+async def test_pool_stats_count_checkouts_and_releases() -> None:
+    await redis_client.get_redis()
+    pool = redis_client._connection_pool
+    assert pool is not None
+
+    first = pool.get_available_connection()
+    pool.get_available_connection()
+    stats = redis_client.redis_pool_stats()
+    assert (stats.connections, stats.active_connections, stats.idle_connections) == (
+        2,
+        2,
+        0,
+    )
+
+    await pool.release(first)
+    stats = redis_client.redis_pool_stats()
+    assert (stats.connections, stats.active_connections, stats.idle_connections) == (
+        2,
+        1,
+        1,
+    )
+
+    assert pool.get_available_connection() is first
+    assert redis_client.redis_pool_stats().idle_connections == 0
@@ -0,0 +1,89 @@
+import asyncio
+from typing import Any, Iterator
+from unittest.mock import patch
+
+import pytest
+
+from virtual_labs.infrastructure.kc.models import UserRepresentation
+from virtual_labs.repositories import user_repo
+from virtual_labs.repositories.user_repo import UserQueryRepository
+
+
+@pytest.fixture(autouse=True)
+def empty_lookup_cache() -> Iterator[None]:
+    user_repo._users_by_email_cache.clear()
+    yield
+    user_repo._users_by_email_cache.clear()
+
+
+def make_user(email: str) -> UserRepresentation:
+    return UserRepresentation(
+        id=f"id-{email}",
+        username=email,
+        email=email,
+        emailVerified=True,
+        createdTimestamp=0,
+        enabled=True,
+        totp=False,
+        disableableCredentialTypes=[],
+        requiredActions=[],
+        notBefore=0,
+    )
+
+
+class FakeLookup:
+    def __init__(self, registered: set[str]) -> None:
+        self.registered = registered
+        self.calls: list[str] = []
+        self.in_flight = 0
+        self.max_in_flight = 0
+
+    async def __call__(self, email: str) -> UserRepresentation | None:
+        self.calls.append(email)
+        self.in_flight += 1
+        self.max_in_flight = max(self.max_in_flight, self.in_flight)
+        await asyncio.sleep(0.01)
+        self.in_flight -= 1
+        return make_user(email) if email in self.registered else None
+
+    def patch(self) -> Any:
+        async def lookup(_repo: UserQueryRepository, email: str) -> Any:
+            return await self(email)
+
+        return patch.object(UserQueryRepository, "a_retrieve_user_by_email", lookup)
+
+
+@pytest.mark.asyncio
+async def test_emails_are_resolved_concurrently_within_the_bound() -> None:
+    emails = [f"user{i}@example.com" for i in range(25)]
+    lookup = FakeLookup(registered=set(emails[:5]))
+
+    with (
+        lookup.patch(),
+        patch.object(user_repo.settings, "KC_USER_LOOKUP_CONCURRENCY", 4),
+    ):
+        users = await UserQueryRepository().a_retrieve_users_by_emails(emails)
+
+    assert len(lookup.calls) == 25
+    assert lookup.max_in_flight == 4
+    assert users["user0@example.com"] is not None
+    assert users["user24@example.com"] is None
+
+
+@pytest.mark.asyncio
+async def test_lookups_and_misses_are_cached_case_insensitively() -> None:
+    lookup = FakeLookup(registered={"known@example.com"})
+
+    with lookup.patch():
+        repo = UserQueryRepository()
+        await repo.a_retrieve_users_by_emails(
+            ["Known@Example.com", "known@example.com", "pending@example.com"]
+        )
+        users = await repo.a_retrieve_users_by_emails(
+            ["known@example.com", "PENDING@example.com"]
+        )
+
+    assert sorted(lookup.calls) == ["known@example.com", "pending@example.com"]
+    known = users["known@example.com"]
+    assert known is not None and known.email == "known@example.com"
+    assert users["pending@example.com"] is None
@@ -322,10 +322,10 @@ async def cleanup_resources(
     # 4. Delete KC groups
     group_repo = GroupMutationRepository()
     for project_group_id in project_group_ids:
-        group_repo.delete_group(group_id=project_group_id[0])
-        group_repo.delete_group(group_id=project_group_id[1])
-    group_repo.delete_group(group_id=lab_data[0])
-    group_repo.delete_group(group_id=lab_data[1])
+        await group_repo.a_delete_group(group_id=project_group_id[0])
+        await group_repo.a_delete_group(group_id=project_group_id[1])
+    await group_repo.a_delete_group(group_id=lab_data[0])
+    await group_repo.a_delete_group(group_id=lab_data[1])
 
 
 async def create_confirmed_setup_intent(customer_id: str) -> SetupIntent:
@@ -53,7 +53,7 @@ async def mock_lab_invite(
     invitee_id = (
         cast(
             UserRepresentation,
-            UserQueryRepository().retrieve_user_by_email(invitee_email),
+            await UserQueryRepository().a_retrieve_user_by_email(invitee_email),
         )
     ).id
 
@@ -53,5 +53,5 @@ async def test_virtual_lab_created(
     group_id = f"vlab/{lab_id}/admin"
 
     # Test that the keycloak admin group was created
-    group = group_repo.retrieve_group_by_name(name=group_id)
+    group = await group_repo.a_retrieve_group_by_name(name=group_id)
     assert group is not None
@@ -30,7 +30,7 @@ async def test_last_admin_cannot_be_deleted(
     admin_id = (
         cast(
             UserRepresentation,
-            UserQueryRepository().retrieve_user_by_email("test@test.com"),
+            await UserQueryRepository().a_retrieve_user_by_email("test@test.com"),
         )
     ).id
     delete_admin_response = await client.post(
@@ -50,7 +50,7 @@ async def test_last_admin_cannot_be_converted_to_member(
     admin_id = (
         cast(
             UserRepresentation,
-            UserQueryRepository().retrieve_user_by_email("test@test.com"),
+            await UserQueryRepository().a_retrieve_user_by_email("test@test.com"),
         )
     ).id
     change_role_response = await client.patch(
@@ -27,6 +27,7 @@ from virtual_labs.domain.labs import (
     VirtualLabUser,
     VirtualLabUsers,
 )
+from virtual_labs.infrastructure.db.loading import LAB_DETAIL
 from virtual_labs.infrastructure.db.models import VirtualLab
 from virtual_labs.infrastructure.kc.grant import AuthUserGrants
 from virtual_labs.repositories import labs as labs_repo
@@ -51,7 +52,7 @@ async def _enrich(
 async def list_labs(
     session: AsyncSession, params: AdminLabsListQuery
 ) -> PaginatedResponse[AdminVirtualLabDetails]:
-    rows, total = await labs_repo.admin_list_virtual_labs(
+    page = await labs_repo.admin_list_virtual_labs(
         session,
         query=params.query,
         include_deleted=params.include_deleted,
@@ -59,16 +60,16 @@ async def list_labs(
         pagination=params,
         order_by=order_clauses(VirtualLab, params.order_by, params.order_direction),
     )
-    return PaginatedResponse.build(
-        items=await _enrich(session, rows),
-        total=total,
-        page=params.page,
-        size=params.page_size,
+    return PaginatedResponse.build_keyset(
+        items=await _enrich(session, page.items),
+        total=page.total,
+        next_cursor=page.next_cursor,
+        request=params,
     )
 
 
 async def get_lab(session: AsyncSession, lab_id: UUID4) -> AdminVirtualLabDetails:
-    row = await labs_repo.get_virtual_lab_soft(session, lab_id)
+    row = await labs_repo.get_virtual_lab_soft(session, lab_id, options=LAB_DETAIL)
     if row is None:
         raise VliError(
             error_code=VliErrorCode.ENTITY_NOT_FOUND,
@@ -11,11 +11,8 @@ from pydantic import UUID4
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from virtual_labs.core.exceptions.api_error import VliError, VliErrorCode
-from virtual_labs.domain.payment import (
-    PaymentDetails,
-    PaymentFilter,
-    PaymentListResponse,
-)
+from virtual_labs.domain.admin import AdminPaymentsListQuery
+from virtual_labs.domain.payment import PaymentDetails, PaymentListResponse
 from virtual_labs.repositories.payment_repo import PaymentRepository
 from virtual_labs.repositories.stripe_user_repo import StripeUserQueryRepository
 from virtual_labs.usecases.subscription.list_payments import payment_to_details
@@ -23,7 +20,7 @@ from virtual_labs.usecases.subscription.list_payments import payment_to_details
 
 async def list_payments(
     session: AsyncSession,
-    filters: PaymentFilter,
+    filters: AdminPaymentsListQuery,
     user_id: UUID4 | None = None,
 ) -> PaymentListResponse:
     customer_id: str | None = None
@@ -38,12 +35,12 @@ async def list_payments(
             )
         customer_id = str(stripe_user.stripe_customer_id)
 
-    payments, total = await PaymentRepository(session).admin_list_payments(
-        filters, customer_id
-    )
-    return PaymentListResponse.build(
-        [payment_to_details(payment) for payment in payments],
-        total=total,
+    page = await PaymentRepository(session).admin_list_payments(filters, customer_id)
+    return PaymentListResponse.build_keyset(
+        [payment_to_details(payment) for payment in page.items],
+        total=page.total,
+        next_cursor=page.next_cursor,
+        cursor=filters.cursor,
         page=filters.page,
         page_size=filters.page_size,
     )
@@ -16,6 +16,7 @@ from sqlalchemy.exc import NoResultFound
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from virtual_labs.core.exceptions.api_error import VliError, VliErrorCode
+from virtual_labs.core.ordering import order_clauses
 from virtual_labs.core.types import UserRoleEnum
 from virtual_labs.domain.admin import AdminProjectDetails, AdminProjectsListQuery
 from virtual_labs.domain.common import PaginatedResponse
@@ -26,7 +27,6 @@ from virtual_labs.repositories.project_repo import (
     ProjectMutationRepository,
     ProjectQueryRepository,
 )
-from virtual_labs.core.ordering import order_clauses
 from virtual_labs.usecases.admin._audit import log_admin_action
 from virtual_labs.usecases.project import (
     delete_project_use_case,
@@ -62,7 +62,7 @@ async def _resolve(
 async def list_projects(
     session: AsyncSession, params: AdminProjectsListQuery
 ) -> PaginatedResponse[AdminProjectDetails]:
-    rows, total = await ProjectQueryRepository(session).admin_list_projects(
+    page = await ProjectQueryRepository(session).admin_list_projects(
         query=params.query,
         virtual_lab_id=params.virtual_lab_id,
         include_deleted=params.include_deleted,
@@ -70,11 +70,11 @@ async def list_projects(
         pagination=params,
         order_by=order_clauses(Project, params.order_by, params.order_direction),
     )
-    return PaginatedResponse.build(
-        items=[_details(project, virtual_lab) for project, virtual_lab in rows],
-        total=total,
-        page=params.page,
-        size=params.page_size,
+    return PaginatedResponse.build_keyset(
+        items=[_details(project, virtual_lab) for project, virtual_lab in page.items],
+        total=page.total,
+        next_cursor=page.next_cursor,
+        request=params,
     )
 
 
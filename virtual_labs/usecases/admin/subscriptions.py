@@ -38,19 +38,18 @@ def _details(subscription: Subscription) -> AdminSubscriptionDetails:
 async def list_subscriptions(
     session: AsyncSession, params: AdminSubscriptionsListQuery
 ) -> PaginatedResponse[AdminSubscriptionDetails]:
-    rows, total = await SubscriptionRepository(session).admin_list_subscriptions(
+    page = await SubscriptionRepository(session).admin_list_subscriptions(
         user_id=params.user_id,
         virtual_lab_id=params.virtual_lab_id,
         status=params.status,
         subscription_type=params.subscription_type,
-        offset=params.offset,
-        limit=params.page_size,
+        pagination=params,
     )
-    return PaginatedResponse.build(
-        items=[_details(subscription) for subscription in rows],
-        total=total,
-        page=params.page,
-        size=params.page_size,
+    return PaginatedResponse.build_keyset(
+        items=[_details(subscription) for subscription in page.items],
+        total=page.total,
+        next_cursor=page.next_cursor,
+        request=params,
     )
 
 
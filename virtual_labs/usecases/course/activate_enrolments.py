@@ -10,10 +10,12 @@ from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import joinedload
 
 from virtual_labs.infrastructure.db.models import (
+    Course,
     CourseEnrolment,
     CourseStatus,
 )
 from virtual_labs.infrastructure.kc.config import KeycloakRealm
+from virtual_labs.infrastructure.kc.group_cache import invalidate_membership
 
 
 async def _add_to_groups(
@@ -32,6 +34,7 @@ async def _add_to_groups(
             group_id=vlab_member_group_id,
         ),
     )
+    await invalidate_membership(user_id, project_member_group_id, vlab_member_group_id)
 
 
 async def activate_enrolments(
@@ -53,7 +56,10 @@ async def activate_enrolments(
     # Find all enrolments claimed by this user that haven't been activated yet
     result = await db.execute(
         select(CourseEnrolment)
-        .options(joinedload(CourseEnrolment.project))
+        .options(
+            joinedload(CourseEnrolment.project),
+            joinedload(CourseEnrolment.course).joinedload(Course.virtual_lab),
+        )
         .where(
             CourseEnrolment.claimed_by == user_id,
             CourseEnrolment.activated_at.is_(None),
@@ -108,7 +114,7 @@ async def activate_enrolments(
         # Project is loaded via joinedload in the query
         project = enrolment.project
 
-        # Vlab is loaded via Course.virtual_lab (lazy="joined")
+        # Vlab is loaded with the course via joinedload in the query
         vlab = course.virtual_lab
 
         # Add user to KC groups
@@ -1,5 +1,7 @@
 """Assign seats to a list of students."""
 
+import asyncio
+from dataclasses import dataclass
 from datetime import datetime, timezone
 from http import HTTPStatus
 from uuid import UUID, uuid4
@@ -10,133 +12,203 @@ from sqlalchemy import select
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from virtual_labs.core.exceptions.api_error import VliError, VliErrorCode
-from virtual_labs.core.ledger import ledger_container
+from virtual_labs.core.ledger import Ledger, ledger_container
 from virtual_labs.domain.course import SeatAssignmentEntry, SeatAssignmentResult
 from virtual_labs.domain.project import ProjectCreationBody
 from virtual_labs.infrastructure.db.models import (
     Course,
     CourseEnrolment,
     CourseStatus,
+    Project,
     Seat,
 )
+from virtual_labs.infrastructure.email.queue import EmailJob, EmailKind, email_queue
 from virtual_labs.infrastructure.email.send_enrolment_claim_email import (
     EnrolmentClaimEmailDetails,
-    send_enrolment_claim_email,
 )
 from virtual_labs.infrastructure.kc.grant import AuthUserGrants
+from virtual_labs.infrastructure.kc.models import CreatedGroup
+from virtual_labs.infrastructure.settings import settings
 from virtual_labs.usecases import accounting as accounting_cases
 from virtual_labs.usecases.project.create_new_project import (
     _make_deplete_compensation,
-    create_project_record,
     ensure_accounting_initialization,
     ensure_group_creation,
-    ensure_unique_name_within_virtual_lab,
     ensure_virtual_lab_exists,
 )
 
 
-async def _assign_seat(
-    session: AsyncSession,
+@dataclass(slots=True)
+class _ProvisionedSeat:
+    """A student whose external resources exist but are not yet persisted.
+
+    `ledger` holds the undo of everything provisioned for them, so the
+    student can be unwound on their own if persisting fails.
+    """
+
+    seat: Seat
+    student: SeatAssignmentEntry
+    payload: ProjectCreationBody
+    project_id: UUID
+    admin_group: CreatedGroup
+    member_group: CreatedGroup
+    ledger: Ledger
+
+
+async def _provision_seat(
     *,
     virtual_lab_id: UUID4,
-    course_id: UUID4,
-    student_email: str,
-    student_id: str,
+    vlab_admin_group_id: str,
+    vlab_member_group_id: str,
+    credits_per_seat: int,
+    student: SeatAssignmentEntry,
     seat: Seat,
-    payload: ProjectCreationBody,
-    auth: tuple[AuthUserGrants, str],
-) -> SeatAssignmentResult:
-    """Assign a single seat to a student.
+    user_id: UUID,
+    semaphore: asyncio.Semaphore,
+) -> _ProvisionedSeat:
+    """Provision the external side of one seat assignment.
 
-    Orchestrates the full seat-assignment flow for one student:
-    1. Creates a dedicated project inside the virtual lab.
+    1. Creates the student's project groups in Keycloak.
     2. Initialises the project's accounting ledger.
     3. Funds the project with the course's credits_per_seat.
-    4. Creates a CourseEnrolment record linking the student to the project.
-    5. Links the seat to the enrolment.
 
-    All steps run inside a compensation ledger; if any step fails, previous
-    side-effects (KC groups, accounting top-up) are automatically rolled back.
+    Runs inside a compensation ledger of its own: if any step fails, the
+    previous side-effects (KC groups, accounting top-up) are rolled back
+    before the error propagates.
     """
-    user_id = auth[0].id
-    await ensure_unique_name_within_virtual_lab(
-        session,
-        virtual_lab_id=virtual_lab_id,
-        project_name=payload.name,
-    )
-
-    virtual_lab = await ensure_virtual_lab_exists(
-        session,
-        virtual_lab_id=virtual_lab_id,
-    )
-    project_draft_id: UUID4 = uuid4()
-
-    vlab_admin_group_id = str(virtual_lab.admin_group_id)
-    vlab_member_group_id = str(virtual_lab.member_group_id)
-    await session.refresh(virtual_lab, ["course"])
-    is_course_vlab = bool(virtual_lab.course)
-    assert is_course_vlab
-    credits_per_seat = virtual_lab.course.credits_per_seat
+    payload = ProjectCreationBody(name=student.student_id)
+    project_id: UUID4 = uuid4()
 
-    async with ledger_container() as comp:
+    async with semaphore, ledger_container() as comp:
         admin_group, member_group, _ = await ensure_group_creation(
             vlab_admin_group_id=vlab_admin_group_id,
             vlab_member_group_id=vlab_member_group_id,
             virtual_lab_id=virtual_lab_id,
-            project_id=project_draft_id,
+            project_id=project_id,
             user_id=user_id,
             comp=comp,
         )
 
         await ensure_accounting_initialization(
             virtual_lab_id=virtual_lab_id,
-            project_id=project_draft_id,
+            project_id=project_id,
             project_name=payload.name,
             comp=comp,
         )
 
-        await create_project_record(
-            session,
-            project_id=project_draft_id,
-            virtual_lab_id=virtual_lab_id,
-            payload=payload,
-            admin_group=admin_group,
-            member_group=member_group,
-            user_id=user_id,
-            commit=False,
-        )
-
         funded = await accounting_cases.fund_project(
             virtual_lab_id=virtual_lab_id,
-            project_id=project_draft_id,
+            project_id=project_id,
             amount=float(credits_per_seat),
         )
         if not funded:
             raise RuntimeError("Failed to fund project")
 
-        comp.push(_make_deplete_compensation(virtual_lab_id, project_draft_id))
+        comp.push(_make_deplete_compensation(virtual_lab_id, project_id))
+
+    return _ProvisionedSeat(
+        seat=seat,
+        student=student,
+        payload=payload,
+        project_id=project_id,
+        admin_group=admin_group,
+        member_group=member_group,
+        ledger=comp,
+    )
+
+
+async def _persist_seats(
+    session: AsyncSession,
+    provisioned: list[_ProvisionedSeat],
+    *,
+    virtual_lab_id: UUID4,
+    course_id: UUID4,
+    user_id: UUID,
+) -> None:
+    """Insert the projects and enrolments of `provisioned` in two batched
+    flushes and link each seat to its enrolment."""
+    session.add_all(
+        [
+            Project(
+                id=item.project_id,
+                name=item.payload.name,
+                description=item.payload.description,
+                virtual_lab_id=virtual_lab_id,
+                admin_group_id=item.admin_group["id"],
+                member_group_id=item.member_group["id"],
+                owner_id=user_id,
+            )
+            for item in provisioned
+        ]
+    )
+    await session.flush()
 
-        enrolment = CourseEnrolment(
+    enrolments = [
+        CourseEnrolment(
+            id=uuid4(),
             course_id=course_id,
-            contact_email=student_email,
-            student_id=student_id,
-            project_id=project_draft_id,
+            contact_email=item.student.email,
+            student_id=item.student.student_id,
+            project_id=item.project_id,
         )
-        session.add(enrolment)
-        await session.flush()
+        for item in provisioned
+    ]
+    session.add_all(enrolments)
+    await session.flush()
 
-        enrolment_id = enrolment.id
-        seat.enrolment_id = enrolment_id
+    for item, enrolment in zip(provisioned, enrolments):
+        item.seat.enrolment_id = enrolment.id
+    await session.flush()
 
-        return SeatAssignmentResult(
-            student_id=student_id,
-            email=student_email,
-            assignment_successful=True,
-            seat_id=seat.id,
-            enrolment_id=enrolment_id,
-            project_id=project_draft_id,
-            credit_transferred_amount=float(credits_per_seat),
+
+def _failed_result(
+    student: SeatAssignmentEntry, seat_id: UUID, error: BaseException
+) -> SeatAssignmentResult:
+    logger.error(f"Failed to assign seat for {student.student_id}: {error}")
+    return SeatAssignmentResult(
+        student_id=student.student_id,
+        email=student.email,
+        assignment_successful=False,
+        seat_id=seat_id,
+        error=str(error),
+    )
+
+
+async def _send_claim_emails(
+    results: list[SeatAssignmentResult], *, course_name: str, requested_by: UUID
+) -> None:
+    """Best-effort: queue a claim email for every successful assignment,
+    in one batch; delivery status is tracked per `email_job_id`."""
+    claimed = [
+        result
+        for result in results
+        if result.assignment_successful and result.enrolment_id is not None
+    ]
+    if not claimed:
+        return
+    try:
+        job_ids = await email_queue.enqueue_many(
+            [
+                EmailJob(
+                    kind=EmailKind.ENROLMENT_CLAIM,
+                    recipient=result.email,
+                    details=EnrolmentClaimEmailDetails(
+                        recipient_email=result.email,
+                        enrolment_id=result.enrolment_id,
+                        course_name=course_name,
+                    ),
+                )
+                for result in claimed
+            ],
+            requested_by=requested_by,
         )
+    except Exception as ex:  # noqa: BLE001
+        logger.warning(f"Failed to queue claim emails for {course_name}: {ex}")
+        for result in claimed:
+            result.email_sent = False
+        return
+    for result, job_id in zip(claimed, job_ids):
+        result.email_job_id = job_id
 
 
 async def get_available_seats(
@@ -203,9 +275,11 @@ async def assign_seats(
     1. Pre-checks (course active, not past drop date).
     2. Check no duplicate enrolments for the given emails/student_ids.
     3. Lock available seats (FOR UPDATE SKIP LOCKED).
-    4. For each student: create project, fund it, create enrolment, link seat.
-       If funding fails → soft-delete project, report error.
-    5. Send claim emails (best-effort).
+    4. Provision every student's KC groups, accounting account and funding
+       concurrently (SEAT_ASSIGNMENT_CONCURRENCY at a time); a failing
+       student is unwound on their own and reported as an error.
+    5. Insert all projects and enrolments in one batch and link the seats.
+    6. Send claim emails concurrently (best-effort).
     """
     if course.status != CourseStatus.ACTIVE:
         raise VliError(
@@ -230,62 +304,104 @@ async def assign_seats(
 
     course_id = course.id
     virtual_lab_id = course.virtual_lab_id
-    course_name = course.virtual_lab.name
-    seat_ids = [s.id for s in seats]
+    credits_per_seat = course.credits_per_seat
+    user_id = auth[0].id
 
-    # Create projects, enrolments, and assign seats.
-    results: list[SeatAssignmentResult] = []
+    virtual_lab = await ensure_virtual_lab_exists(db, virtual_lab_id=virtual_lab_id)
+    course_name = virtual_lab.name
+    vlab_admin_group_id = str(virtual_lab.admin_group_id)
+    vlab_member_group_id = str(virtual_lab.member_group_id)
+    seat_ids = [seat.id for seat in seats]
+
+    # Provision every student's KC groups and accounting concurrently.
+    semaphore = asyncio.Semaphore(settings.SEAT_ASSIGNMENT_CONCURRENCY)
+    outcomes = await asyncio.gather(
+        *(
+            _provision_seat(
+                virtual_lab_id=virtual_lab_id,
+                vlab_admin_group_id=vlab_admin_group_id,
+                vlab_member_group_id=vlab_member_group_id,
+                credits_per_seat=credits_per_seat,
+                student=student,
+                seat=seat,
+                user_id=user_id,
+                semaphore=semaphore,
+            )
+            for seat, student in zip(seats, students)
+        ),
+        return_exceptions=True,
+    )
 
-    for seat, student, seat_id in zip(seats, students, seat_ids):
+    results: dict[UUID, SeatAssignmentResult] = {}
+    provisioned: list[_ProvisionedSeat] = []
+    for seat, student, outcome in zip(seats, students, outcomes):
+        if isinstance(outcome, BaseException):
+            results[seat.id] = _failed_result(student, seat.id, outcome)
+        else:
+            provisioned.append(outcome)
+
+    # Persist all provisioned students in one batch; if that fails, fall
+    # back to one savepoint per student so a single bad row only fails
+    # (and unwinds) its own student.
+    persisted: list[_ProvisionedSeat] = []
+    if provisioned:
         try:
             async with db.begin_nested():
-                result = await _assign_seat(
+                await _persist_seats(
                     db,
+                    provisioned,
                     virtual_lab_id=virtual_lab_id,
                     course_id=course_id,
-                    student_email=student.email,
-                    student_id=student.student_id,
-                    seat=seat,
-                    payload=ProjectCreationBody(
-                        name=student.student_id,
-                    ),
-                    auth=auth,
+                    user_id=user_id,
                 )
-
-            results.append(result)
+            persisted = provisioned
         except Exception as ex:  # noqa: BLE001
-            logger.error(f"Failed to assign seat for {student.student_id}: {ex}")
-            results.append(
-                SeatAssignmentResult(
-                    student_id=student.student_id,
-                    email=student.email,
-                    assignment_successful=False,
-                    seat_id=seat_id,
-                    error=str(ex),
-                )
+            logger.warning(
+                f"Batched seat assignment insert failed, retrying per seat: {ex}"
             )
+            for item in provisioned:
+                try:
+                    async with db.begin_nested():
+                        await _persist_seats(
+                            db,
+                            [item],
+                            virtual_lab_id=virtual_lab_id,
+                            course_id=course_id,
+                            user_id=user_id,
+                        )
+                    persisted.append(item)
+                except Exception as item_ex:  # noqa: BLE001
+                    await item.ledger.compensate(reason="seat assignment insert failed")
+                    results[item.seat.id] = _failed_result(
+                        item.student, item.seat.id, item_ex
+                    )
+
+    for item in persisted:
+        results[item.seat.id] = SeatAssignmentResult(
+            student_id=item.student.student_id,
+            email=item.student.email,
+            assignment_successful=True,
+            seat_id=item.seat.id,
+            enrolment_id=item.seat.enrolment_id,
+            project_id=item.project_id,
+            credit_transferred_amount=float(credits_per_seat),
+        )
 
     # Single commit at the end — keeps FOR UPDATE locks held for the
     # entire batch, preventing concurrent requests from stealing seats.
-    await db.commit()
-
-    # Best-effort: send claim emails after all assignments
-    for result in results:
-        if not result.assignment_successful or result.enrolment_id is None:
-            continue
-        try:
-            await send_enrolment_claim_email(
-                EnrolmentClaimEmailDetails(
-                    recipient_email=result.email,
-                    enrolment_id=result.enrolment_id,
-                    course_name=course_name,
-                )
-            )
-        except Exception as ex:  # noqa: BLE001
-            result.email_sent = False
-            logger.warning(
-                f"Failed to send claim email to {result.email} "
-                f"(enrolment_id={result.enrolment_id}): {ex}"
+    try:
+        await db.commit()
+    except BaseException:
+        await asyncio.gather(
+            *(
+                item.ledger.compensate(reason="seat assignment commit failed")
+                for item in persisted
             )
+        )
+        raise
+
+    ordered = [results[seat_id] for seat_id in seat_ids]
+
+    await _send_claim_emails(ordered, course_name=course_name, requested_by=user_id)
 
-    return results
+    return ordered
@@ -9,6 +9,7 @@ from sqlalchemy import select
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from virtual_labs.core.exceptions.api_error import VliError, VliErrorCode
+from virtual_labs.infrastructure.db.loading import ENROLMENT_COURSE
 from virtual_labs.infrastructure.db.models import CourseEnrolment, CourseStatus
 
 
@@ -75,7 +76,13 @@ async def claim_enrolment(
 
     enrolment.claimed_by = user_id
     await db.commit()
-    await db.refresh(enrolment)
+    enrolment = (
+        await db.execute(
+            select(CourseEnrolment)
+            .where(CourseEnrolment.id == enrolment_id)
+            .options(*ENROLMENT_COURSE)
+        )
+    ).scalar_one()
 
     logger.info(
         f"Enrolment {enrolment_id} claimed by user {user_id} (course={enrolment.course_id})"
@@ -17,9 +17,16 @@ from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import joinedload
 
 from virtual_labs.domain.course import DropSeatsBody, SeatDropResult
-from virtual_labs.infrastructure.db.models import Course, CourseEnrolment, Project, Seat
+from virtual_labs.infrastructure.db.models import (
+    Course,
+    CourseEnrolment,
+    Project,
+    Seat,
+    VirtualLab,
+)
 from virtual_labs.repositories.group_repo import GroupQueryRepository
 from virtual_labs.repositories.user_repo import UserMutationRepository
+from virtual_labs.shared.utils.retry import retry_async
 from virtual_labs.usecases import accounting as accounting_cases
 
 
@@ -40,8 +47,8 @@ async def _remove_all_users_from_group(group_id: str) -> list[str]:
     return failed_user_ids
 
 
-async def _clear_project_groups(project: Project) -> None:
-    failed = await _remove_all_users_from_group(project.member_group_id)
+async def _clear_project_groups(member_group_id: str) -> None:
+    failed = await _remove_all_users_from_group(member_group_id)
     if failed:
         raise RuntimeError(
             f"Failed to remove {len(failed)} user(s) from project member group: {failed}"
@@ -121,6 +128,81 @@ async def drop_seats(
     return results
 
 
+async def _detach_from_vlab(user_id: UUID, vlab_member_group_id: str) -> None:
+    """Remove a student who claimed their seat from the vlab member group;
+    failures are logged and do not block the drop."""
+    umr = UserMutationRepository()
+    try:
+        await umr.a_detach_user_from_group(
+            user_id=user_id, group_id=vlab_member_group_id
+        )
+    except Exception as ex:  # noqa: BLE001
+        logger.warning(f"Failed to remove user {user_id} from vlab member group: {ex}")
+
+
+async def _deplete_project(virtual_lab_id: UUID, project_id: UUID) -> float:
+    """Deplete the project credits and return the balance that was depleted."""
+    depleted_amount = await accounting_cases.deplete_project_budget(
+        virtual_lab_id=virtual_lab_id,
+        project_id=project_id,
+    )
+    if depleted_amount is None:
+        raise RuntimeError(
+            f"Failed to deplete credits for project {project_id}, aborting drop"
+        )
+    return depleted_amount
+
+
+async def _release_seat(
+    *,
+    virtual_lab_id: UUID,
+    vlab_member_group_id: str,
+    project_id: UUID | None,
+    project_member_group_id: str | None,
+    claimed_by: UUID | None,
+    attempts: int = 1,
+    retry_delay: float = 0.0,
+) -> float | None:
+    """Keycloak and accounting side of a drop; returns the depleted project
+    balance (`None` without a project). Group clearing and depletion are
+    each tried `attempts` times; raises when the drop must not be recorded."""
+    if project_member_group_id is not None:
+        await retry_async(
+            lambda: _clear_project_groups(project_member_group_id),
+            attempts=attempts,
+            delay=retry_delay,
+            label=f"Clearing project {project_id} groups",
+        )
+
+    if claimed_by is not None:
+        await _detach_from_vlab(claimed_by, vlab_member_group_id)
+
+    if project_id is None:
+        return None
+    return await retry_async(
+        lambda: _deplete_project(virtual_lab_id, project_id),
+        attempts=attempts,
+        delay=retry_delay,
+        label=f"Depleting project {project_id}",
+    )
+
+
+def _can_recover_seat(
+    *,
+    last_drop_date: datetime | None,
+    credits_per_seat: int,
+    previously_dropped: bool,
+    depleted_amount: float | None,
+    now: datetime,
+) -> bool:
+    is_early_drop = last_drop_date is not None and now < last_drop_date
+    min_recoverable_balance = credits_per_seat - 50
+    has_sufficient_balance = (
+        depleted_amount is not None and depleted_amount >= min_recoverable_balance
+    )
+    return is_early_drop and not previously_dropped and has_sufficient_balance
+
+
 async def _drop_single_seat(
     db: AsyncSession,
     *,
@@ -130,44 +212,22 @@ async def _drop_single_seat(
     commit: bool = True,
 ) -> None:
     project = await db.get(Project, enrolment.project_id)
-    if project:
-        await _clear_project_groups(project)
-
-    # Remove the student from the vlab member group (if they claimed)
-    if enrolment.claimed_by is not None:
-        umr = UserMutationRepository()
-        try:
-            await umr.a_detach_user_from_group(
-                user_id=enrolment.claimed_by,
-                group_id=course.virtual_lab.member_group_id,
-            )
-        except Exception as ex:  # noqa: BLE001
-            logger.warning(
-                f"Failed to remove user {enrolment.claimed_by} from vlab member group: {ex}"
-            )
-
-    now = datetime.now(timezone.utc)
-    is_early_drop = course.last_drop_date is not None and now < course.last_drop_date
-
-    # Deplete project credits — returns the balance that was depleted
-    depleted_amount: float | None = None
-    if project:
-        depleted_amount = await accounting_cases.deplete_project_budget(
-            virtual_lab_id=course.virtual_lab_id,
-            project_id=project.id,
-        )
-        if depleted_amount is None:
-            raise RuntimeError(
-                f"Failed to deplete credits for project {project.id}, aborting drop"
-            )
-
-    min_recoverable_balance = course.credits_per_seat - 50
-
-    has_sufficient_balance = (
-        depleted_amount is not None and depleted_amount >= min_recoverable_balance
+    virtual_lab = await db.get(VirtualLab, course.virtual_lab_id)
+    assert virtual_lab is not None
+    depleted_amount = await _release_seat(
+        virtual_lab_id=course.virtual_lab_id,
+        vlab_member_group_id=virtual_lab.member_group_id,
+        project_id=project.id if project else None,
+        project_member_group_id=project.member_group_id if project else None,
+        claimed_by=enrolment.claimed_by,
     )
-    can_recover = (
-        is_early_drop and not seat.previously_dropped and has_sufficient_balance
+
+    can_recover = _can_recover_seat(
+        last_drop_date=course.last_drop_date,
+        credits_per_seat=course.credits_per_seat,
+        previously_dropped=seat.previously_dropped,
+        depleted_amount=depleted_amount,
+        now=datetime.now(timezone.utc),
     )
 
     enrolment.is_dropped = True
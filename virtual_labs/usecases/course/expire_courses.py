@@ -5,123 +5,266 @@ Two independent steps:
 2. deplete_expired_courses — deplete vlab budget for courses with no remaining enrolments.
 
 expire_courses runs both in sequence.
+
+Both steps load their work in one query and process it in batches of
+COURSE_EXPIRY_BATCH_SIZE: the Keycloak / accounting calls of a batch run
+concurrently (at most COURSE_EXPIRY_CONCURRENCY at a time, each retried
+up to COURSE_EXPIRY_ATTEMPTS times), then the batch is written with a
+few set-based UPDATEs and committed. Every commit is a checkpoint: a run
+that stops halfway resumes from the first uncommitted batch, and
+`on_checkpoint` (the scheduler extends its Redis lock there) is awaited
+after each one.
 """
 
+import asyncio
+from dataclasses import dataclass
 from datetime import datetime, timezone
+from typing import Any, Awaitable, Callable, Sequence, TypeVar
 from uuid import UUID
 
 from loguru import logger
-from sqlalchemy import or_, select
+from sqlalchemy import or_, select, update
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from virtual_labs.infrastructure.db.models import (
     Course,
     CourseEnrolment,
     CourseStatus,
+    Project,
     Seat,
+    VirtualLab,
 )
+from virtual_labs.infrastructure.settings import settings
+from virtual_labs.shared.utils.retry import retry_async
 from virtual_labs.usecases import accounting as accounting_cases
-from virtual_labs.usecases.course.drop_seats import _drop_single_seat
+from virtual_labs.usecases.course.drop_seats import _can_recover_seat, _release_seat
+
+Checkpoint = Callable[[], Awaitable[Any]]
+
+T = TypeVar("T")
+
+
+@dataclass(frozen=True, slots=True)
+class _ExpiredEnrolment:
+    seat_id: UUID
+    previously_dropped: bool
+    enrolment_id: UUID
+    claimed_by: UUID | None
+    project_id: UUID
+    project_member_group_id: str
+    course_id: UUID
+    virtual_lab_id: UUID
+    vlab_member_group_id: str
+    last_drop_date: datetime | None
+    credits_per_seat: int
+
+
+def _is_expired(now: datetime) -> Any:
+    return or_(
+        # Expired: past end_date
+        (Course.end_date.is_not(None)) & (Course.end_date < now),
+        # Voided: dates don't matter
+        Course.status == CourseStatus.VOIDED,
+    )
+
+
+def _batches(items: Sequence[T]) -> list[Sequence[T]]:
+    size = max(settings.COURSE_EXPIRY_BATCH_SIZE, 1)
+    return [items[start : start + size] for start in range(0, len(items), size)]
+
+
+async def _retrying(call: Callable[[], Awaitable[T]], label: str) -> T:
+    return await retry_async(
+        call,
+        attempts=settings.COURSE_EXPIRY_ATTEMPTS,
+        delay=settings.COURSE_EXPIRY_RETRY_DELAY_SECONDS,
+        label=label,
+    )
+
+
+async def _release_enrolment(
+    item: _ExpiredEnrolment, semaphore: asyncio.Semaphore
+) -> float | None:
+    async with semaphore:
+        return await _release_seat(
+            virtual_lab_id=item.virtual_lab_id,
+            vlab_member_group_id=item.vlab_member_group_id,
+            project_id=item.project_id,
+            project_member_group_id=item.project_member_group_id,
+            claimed_by=item.claimed_by,
+            attempts=settings.COURSE_EXPIRY_ATTEMPTS,
+            retry_delay=settings.COURSE_EXPIRY_RETRY_DELAY_SECONDS,
+        )
 
 
-async def drop_expired_enrolments(db: AsyncSession) -> dict:
+async def _checkpoint(db: AsyncSession, on_checkpoint: Checkpoint | None) -> None:
+    await db.commit()
+    if on_checkpoint is not None:
+        await on_checkpoint()
+
+
+async def drop_expired_enrolments(
+    db: AsyncSession, *, on_checkpoint: Checkpoint | None = None
+) -> dict:
     """Drop all undropped enrolments in courses past end_date or voided."""
     now = datetime.now(timezone.utc)
 
     result = await db.execute(
-        select(Seat.id, CourseEnrolment.id, Course.id)
+        select(
+            Seat.id,
+            Seat.previously_dropped,
+            CourseEnrolment.id,
+            CourseEnrolment.claimed_by,
+            Project.id,
+            Project.member_group_id,
+            Course.id,
+            Course.virtual_lab_id,
+            VirtualLab.member_group_id,
+            Course.last_drop_date,
+            Course.credits_per_seat,
+        )
         .join(CourseEnrolment, CourseEnrolment.id == Seat.enrolment_id)
         .join(Course, Course.id == CourseEnrolment.course_id)
-        .where(
-            or_(
-                # Expired: past end_date
-                (Course.end_date.is_not(None)) & (Course.end_date < now),
-                # Voided: dates don't matter
-                Course.status == CourseStatus.VOIDED,
-            ),
-            CourseEnrolment.is_dropped.is_(False),
-        )
+        .join(VirtualLab, VirtualLab.id == Course.virtual_lab_id)
+        .join(Project, Project.id == CourseEnrolment.project_id)
+        .where(_is_expired(now), CourseEnrolment.is_dropped.is_(False))
     )
-    work_items: list[tuple[UUID, UUID, UUID]] = [
-        (row[0], row[1], row[2]) for row in result.all()
-    ]
+    work_items = [_ExpiredEnrolment(*row) for row in result.all()]
 
     if not work_items:
         return {"enrolments_dropped": 0, "enrolments_failed": 0}
 
+    semaphore = asyncio.Semaphore(settings.COURSE_EXPIRY_CONCURRENCY)
     total_dropped = 0
     total_failed = 0
 
-    for seat_id, enrolment_id, course_id in work_items:
-        seat = await db.get(Seat, seat_id)
-        enrolment = await db.get(CourseEnrolment, enrolment_id)
-        course = await db.get(Course, course_id)
-
-        if seat is None or enrolment is None or course is None:
-            continue
+    for batch in _batches(work_items):
+        outcomes = await asyncio.gather(
+            *(_release_enrolment(item, semaphore) for item in batch),
+            return_exceptions=True,
+        )
 
-        if enrolment.is_dropped:
-            continue
+        dropped: list[UUID] = []
+        recovered: list[UUID] = []
+        consumed: list[UUID] = []
+        for item, outcome in zip(batch, outcomes):
+            if isinstance(outcome, BaseException):
+                logger.error(
+                    f"Failed to drop enrolment {item.enrolment_id} in expired "
+                    f"course {item.course_id}: {outcome}"
+                )
+                total_failed += 1
+                continue
+            dropped.append(item.enrolment_id)
+            can_recover = _can_recover_seat(
+                last_drop_date=item.last_drop_date,
+                credits_per_seat=item.credits_per_seat,
+                previously_dropped=item.previously_dropped,
+                depleted_amount=outcome,
+                now=now,
+            )
+            (recovered if can_recover else consumed).append(item.seat_id)
 
-        try:
-            await _drop_single_seat(db, seat=seat, enrolment=enrolment, course=course)
-            total_dropped += 1
-        except Exception as ex:  # noqa: BLE001
-            logger.error(
-                f"Failed to drop enrolment {enrolment_id} in expired "
-                f"course {course_id}: {ex}"
+        if dropped:
+            await db.execute(
+                update(CourseEnrolment)
+                .where(CourseEnrolment.id.in_(dropped))
+                .values(is_dropped=True)
+                .execution_options(synchronize_session=False)
+            )
+        if recovered:
+            await db.execute(
+                update(Seat)
+                .where(Seat.id.in_(recovered))
+                .values(previously_dropped=True, enrolment_id=None, is_consumed=False)
+                .execution_options(synchronize_session=False)
             )
-            total_failed += 1
+        if consumed:
+            await db.execute(
+                update(Seat)
+                .where(Seat.id.in_(consumed))
+                .values(is_consumed=True)
+                .execution_options(synchronize_session=False)
+            )
+        await _checkpoint(db, on_checkpoint)
+        total_dropped += len(dropped)
+        logger.info(
+            f"expire_courses: dropped {total_dropped}/{len(work_items)} enrolments "
+            f"({total_failed} failed)"
+        )
 
     return {"enrolments_dropped": total_dropped, "enrolments_failed": total_failed}
 
 
-async def deplete_expired_courses(db: AsyncSession) -> dict:
+async def _deplete_vlab(virtual_lab_id: UUID) -> None:
+    if (
+        await accounting_cases.deplete_vlab_budget(virtual_lab_id=virtual_lab_id)
+        is None
+    ):
+        raise RuntimeError(f"Failed to deplete vlab {virtual_lab_id}")
+
+
+async def deplete_expired_courses(
+    db: AsyncSession, *, on_checkpoint: Checkpoint | None = None
+) -> dict:
     """Deplete vlab budget for expired or voided courses."""
     now = datetime.now(timezone.utc)
 
     result = await db.execute(
-        select(Course.id).where(
-            or_(
-                # Expired: past end_date
-                (Course.end_date.is_not(None)) & (Course.end_date < now),
-                # Voided: dates don't matter
-                Course.status == CourseStatus.VOIDED,
-            ),
-            Course.budget_depleted.is_(False),
+        select(Course.id, Course.virtual_lab_id).where(
+            _is_expired(now), Course.budget_depleted.is_(False)
         )
     )
-    candidate_ids: list[UUID] = [row[0] for row in result.all()]
+    candidates: list[tuple[UUID, UUID]] = [(row[0], row[1]) for row in result.all()]
 
-    if not candidate_ids:
+    if not candidates:
         return {"vlabs_depleted": 0}
 
+    semaphore = asyncio.Semaphore(settings.COURSE_EXPIRY_CONCURRENCY)
     vlabs_depleted = 0
 
-    for course_id in candidate_ids:
-        course = await db.get(Course, course_id)
-        if course is None or course.budget_depleted:
-            continue
+    async def deplete(virtual_lab_id: UUID) -> None:
+        async with semaphore:
+            await _retrying(
+                lambda: _deplete_vlab(virtual_lab_id),
+                f"Depleting vlab {virtual_lab_id}",
+            )
 
-        success = await accounting_cases.deplete_vlab_budget(
-            virtual_lab_id=course.virtual_lab_id,
+    for batch in _batches(candidates):
+        outcomes = await asyncio.gather(
+            *(deplete(virtual_lab_id) for _, virtual_lab_id in batch),
+            return_exceptions=True,
         )
-        if success is None:
-            logger.error(f"Failed to deplete vlab budget for course {course_id}")
-            continue
 
-        course.budget_depleted = True
-        await db.commit()
-        vlabs_depleted += 1
-        logger.info(f"Depleted vlab budget for expired course {course_id}")
+        depleted: list[UUID] = []
+        for (course_id, _), outcome in zip(batch, outcomes):
+            if isinstance(outcome, BaseException):
+                logger.error(f"Failed to deplete vlab budget for course {course_id}")
+                continue
+            depleted.append(course_id)
+
+        if depleted:
+            await db.execute(
+                update(Course)
+                .where(Course.id.in_(depleted))
+                .values(budget_depleted=True)
+                .execution_options(synchronize_session=False)
+            )
+        await _checkpoint(db, on_checkpoint)
+        vlabs_depleted += len(depleted)
+        logger.info(
+            f"expire_courses: depleted {vlabs_depleted}/{len(candidates)} vlab budgets"
+        )
 
     return {"vlabs_depleted": vlabs_depleted}
 
 
-async def expire_courses(db: AsyncSession) -> dict:
+async def expire_courses(
+    db: AsyncSession, *, on_checkpoint: Checkpoint | None = None
+) -> dict:
     """Run both steps: drop enrolments, then deplete budgets."""
-    drop_result = await drop_expired_enrolments(db)
-    deplete_result = await deplete_expired_courses(db)
+    drop_result = await drop_expired_enrolments(db, on_checkpoint=on_checkpoint)
+    deplete_result = await deplete_expired_courses(db, on_checkpoint=on_checkpoint)
 
     return {
         "expired_courses_found": (
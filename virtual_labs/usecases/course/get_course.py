@@ -7,10 +7,12 @@ from uuid import UUID
 
 from sqlalchemy import select
 from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import contains_eager, joinedload
 
 from virtual_labs.core.exceptions.api_error import VliError, VliErrorCode
 from virtual_labs.core.types import VliAppResponse
 from virtual_labs.domain.course import CourseDetailOut
+from virtual_labs.infrastructure.db.loading import COURSE_ADMIN
 from virtual_labs.infrastructure.db.models import Course, VirtualLab
 
 
@@ -35,7 +37,9 @@ async def get_course_by_id(
     course_id: UUID,
 ) -> VliAppResponse[CourseDetailOut]:
     """Fetch a single course by its ID."""
-    result = await db.execute(select(Course).where(Course.id == course_id))
+    result = await db.execute(
+        select(Course).where(Course.id == course_id).options(*COURSE_ADMIN)
+    )
     course = result.scalar_one_or_none()
 
     if course is None:
@@ -60,6 +64,7 @@ async def search_courses_by_vlab_name(
         select(Course)
         .join(Course.virtual_lab)
         .where(VirtualLab.name.ilike(f"%{vlab_name}%"))
+        .options(contains_eager(Course.virtual_lab), joinedload(Course.institution))
     )
     courses = result.unique().scalars().all()
 
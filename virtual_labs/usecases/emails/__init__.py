@@ -0,0 +1,4 @@
+# ruff: noqa
+from .get_email_job import get_email_job
+
+__all__ = ["get_email_job"]
@@ -0,0 +1,20 @@
+from http import HTTPStatus
+
+from pydantic import UUID4
+
+from virtual_labs.core.exceptions.api_error import VliError, VliErrorCode
+from virtual_labs.domain.email import EmailJobOut
+from virtual_labs.infrastructure.email.queue import email_queue
+
+
+async def get_email_job(job_id: UUID4, user_id: UUID4) -> EmailJobOut:
+    """Delivery status of an email the user queued; other users' jobs and
+    expired ones are reported as not found."""
+    job = await email_queue.get(job_id)
+    if job is None or job[1] != str(user_id):
+        raise VliError(
+            error_code=VliErrorCode.ENTITY_NOT_FOUND,
+            http_status_code=HTTPStatus.NOT_FOUND,
+            message="Email job not found",
+        )
+    return job[0]
@@ -23,8 +23,11 @@ from sqlalchemy import and_, func, select
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.sql import ColumnElement
 
-from virtual_labs.domain.common import PaginationRequest
+from virtual_labs.core.keyset import KeysetPage, paginate
+from virtual_labs.core.search import name_contains
+from virtual_labs.domain.common import CursorPaginationRequest
 from virtual_labs.domain.labs import VirtualLabDetails
+from virtual_labs.infrastructure.db.loading import LAB_LIST
 from virtual_labs.infrastructure.db.models import Project, VirtualLab
 
 
@@ -87,14 +90,15 @@ async def list_vlabs_by_id(
     *,
     vlab_ids: set[UUID],
     query: str | None,
-    pagination: PaginationRequest,
+    pagination: CursorPaginationRequest,
     extra_conditions: list[ColumnElement[bool]] | None = None,
     order_by: tuple[ColumnElement[Any], ...] | None = None,
-) -> tuple[list[VirtualLab], int]:
-    """Paginated, optionally filtered SELECT restricted to a UUID set.
+) -> KeysetPage[VirtualLab]:
+    """Paginated (by offset or keyset, see `core.keyset`), optionally
+    filtered SELECT restricted to a UUID set.
 
-    Returns ``(rows, total)``. Empty access set short-circuits to
-    ``([], 0)`` without emitting SQL.
+    Empty access set short-circuits to an empty page without emitting
+    SQL.
 
     * ``extra_conditions`` is appended to the ``WHERE`` clause as-is.
     * ``order_by`` overrides the default ``updated_at DESC,
@@ -103,36 +107,30 @@ async def list_vlabs_by_id(
       same-timestamp rows would shuffle between requests.
     """
     if not vlab_ids:
-        return [], 0
+        return KeysetPage(items=[], total=0, next_cursor=None)
 
     conditions: list[ColumnElement[bool]] = [
         VirtualLab.deleted.is_(False),
         VirtualLab.id.in_(vlab_ids),
     ]
     if query:
-        conditions.append(
-            func.lower(VirtualLab.name).ilike(f"%{query.strip().lower()}%")
-        )
+        conditions.append(name_contains(VirtualLab.name, query))
     if extra_conditions:
         conditions.extend(extra_conditions)
 
-    base = select(VirtualLab).where(and_(*conditions))
-
-    total = (
-        await session.scalar(select(func.count()).select_from(base.subquery()))
-    ) or 0
+    base = select(VirtualLab).where(and_(*conditions)).options(*LAB_LIST)
 
     order_clauses: tuple[ColumnElement[Any], ...] = (
         *(order_by or _DEFAULT_ORDER),
         VirtualLab.id.asc(),
     )
 
-    rows = (
-        await session.scalars(
-            base.order_by(*order_clauses)
-            .offset(pagination.offset)
-            .limit(pagination.page_size)
-        )
-    ).all()
-
-    return list(rows), total
+    return await paginate(
+        session,
+        base,
+        order_by=order_clauses,
+        cursor=pagination.cursor,
+        offset=pagination.offset,
+        limit=pagination.page_size,
+        count=pagination.count,
+    )
@@ -44,7 +44,7 @@ async def change_user_role_for_lab(
                 http_status_code=HTTPStatus.UNPROCESSABLE_ENTITY,
             )
 
-        if not is_user_in_lab(UUID(user.id), virtual_lab):
+        if not await is_user_in_lab(UUID(user.id), virtual_lab):
             raise VliError(
                 message="Cannot change role of user that does not belong in lab",
                 error_code=VliErrorCode.ENTITY_NOT_FOUND,
@@ -73,7 +73,7 @@ async def change_user_role_for_lab(
             else (virtual_lab.member_group_id, virtual_lab.admin_group_id)
         )
 
-        if uqr.is_user_in_group(user_id, str(attach_group_id)):
+        if await uqr.a_is_user_in_group(user_id, str(attach_group_id)):
             # User already has `new_role`. Nothing else to do
             return LabResponse[VirtualLabUser](
                 message="User already has this role",
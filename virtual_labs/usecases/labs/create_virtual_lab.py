@@ -31,6 +31,7 @@ from loguru import logger
 from pydantic import UUID4
 from sqlalchemy import select
 from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm.attributes import set_committed_value
 
 from virtual_labs.core.exceptions.identity_error import IdentityError
 from virtual_labs.core.ledger import (
@@ -57,9 +58,14 @@ from virtual_labs.core.ledger.modules.virtual_lab import (
 from virtual_labs.core.types import UserRoleEnum
 from virtual_labs.domain import labs as domain
 from virtual_labs.infrastructure.db import models
-from virtual_labs.infrastructure.email.send_welcome_email import send_welcome_email
+from virtual_labs.infrastructure.email.queue import EmailJob, EmailKind, email_queue
+from virtual_labs.infrastructure.email.send_welcome_email import WelcomeEmailDetails
 from virtual_labs.infrastructure.kc.config import KeycloakRealm
 from virtual_labs.infrastructure.kc.grant import AuthUserGrants
+from virtual_labs.infrastructure.kc.group_cache import (
+    invalidate_group_members,
+    invalidate_membership,
+)
 from virtual_labs.infrastructure.kc.models import CreatedGroup
 from virtual_labs.infrastructure.settings import settings
 from virtual_labs.infrastructure.stripe import get_stripe_repository
@@ -120,6 +126,7 @@ async def _make_kc_groups_compensation(
         for created in (groups["admin_group"], groups["member_group"]):
             try:
                 await KeycloakRealm.a_delete_group(group_id=created["id"])
+                await invalidate_group_members(created["id"])
             except Exception as exc:  # noqa: BLE001
                 logger.error(f"Failed to delete KC group {created['id']}: {exc}")
 
@@ -169,6 +176,7 @@ async def _provision_keycloak(
             await KeycloakRealm.a_group_user_add(
                 user_id=owner_id, group_id=groups["admin_group"]["id"]
             )
+            await invalidate_membership(owner_id, groups["admin_group"]["id"])
         except IdentityError as err:
             raise UserNotAuthorizedToCreateVirtualLabError(
                 owner_id=str(owner_id)
@@ -283,6 +291,8 @@ async def _insert_virtual_lab(
     session.add(db_lab)
     await session.flush()
     await session.refresh(db_lab)
+    # a new lab has no course yet, no need to load the lazy relationship
+    set_committed_value(db_lab, "course", None)
     return db_lab
 
 
@@ -365,7 +375,14 @@ async def _run_post_commit(
     if owner_email:
 
         async def _welcome() -> None:
-            await send_welcome_email(owner_email)
+            await email_queue.enqueue(
+                EmailJob(
+                    kind=EmailKind.WELCOME,
+                    recipient=owner_email,
+                    details=WelcomeEmailDetails(recipient=owner_email),
+                ),
+                requested_by=owner_id,
+            )
 
         deferred.add(_welcome)
 
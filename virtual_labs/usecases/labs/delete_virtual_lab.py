@@ -7,6 +7,7 @@ from sqlalchemy.ext.asyncio import AsyncSession
 
 from virtual_labs.core.exceptions.api_error import VliError, VliErrorCode
 from virtual_labs.domain.labs import VirtualLabDetails, VirtualLabOut
+from virtual_labs.infrastructure.db.loading import LAB_DETAIL
 from virtual_labs.infrastructure.kc.models import AuthUser
 from virtual_labs.repositories import labs as repository
 from virtual_labs.shared.utils.auth import get_user_id_from_auth
@@ -25,7 +26,7 @@ async def delete_virtual_lab(
     db: AsyncSession, lab_id: UUID4, auth: tuple[AuthUser, str]
 ) -> VirtualLabOut:
     try:
-        db_lab = await repository.get_virtual_lab_async(db, lab_id)
+        db_lab = await repository.get_virtual_lab_async(db, lab_id, options=LAB_DETAIL)
         user_id = get_user_id_from_auth(auth)
 
         response = VirtualLabOut(virtual_lab=VirtualLabDetails.model_validate(db_lab))
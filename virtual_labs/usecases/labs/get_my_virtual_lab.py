@@ -17,6 +17,7 @@ from sqlalchemy.ext.asyncio import AsyncSession
 
 from virtual_labs.core.exceptions.api_error import VliError, VliErrorCode
 from virtual_labs.domain.labs import VirtualLabDetails
+from virtual_labs.infrastructure.db.loading import LAB_DETAIL
 from virtual_labs.infrastructure.db.models import VirtualLab
 from virtual_labs.infrastructure.kc.grant import AuthUserGrants
 from virtual_labs.usecases.labs._user_labs_helpers import enrich_many
@@ -30,10 +31,12 @@ async def get_my_virtual_lab_use_case(
     user, _token = auth
     try:
         owned = await session.scalar(
-            select(VirtualLab).where(
+            select(VirtualLab)
+            .where(
                 VirtualLab.owner_id == user.id,
                 ~VirtualLab.deleted,
             )
+            .options(*LAB_DETAIL)
         )
     except SQLAlchemyError as exc:
         logger.exception(f"DB error fetching owned vlab for {user.id}: {exc}")
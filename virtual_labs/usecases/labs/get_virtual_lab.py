@@ -12,9 +12,11 @@ from virtual_labs.domain.labs import (
     VirtualLabWithAdmins,
 )
 from virtual_labs.domain.user import ShortenedUser
+from virtual_labs.infrastructure.db.loading import LAB_DETAIL
 from virtual_labs.infrastructure.db.models import VirtualLab
 from virtual_labs.infrastructure.kc.config import KeycloakRealm
 from virtual_labs.infrastructure.kc.models import UserRepresentation
+from virtual_labs.repositories.group_repo import GroupQueryRepository
 
 
 async def get_virtual_lab(
@@ -26,19 +28,21 @@ async def get_virtual_lab(
     try:
         virtual_lab = (
             await db.scalars(
-                select(VirtualLab).where(
+                select(VirtualLab)
+                .where(
                     VirtualLab.id == lab_id,
                     VirtualLab.deleted.is_(False),
                 )
+                .options(*LAB_DETAIL)
             )
         ).one()
 
         admins: list[UUID4] | None = None
         if VirtualLabDetailExpand.admins in requested:
-            members = await KeycloakRealm.a_get_group_members(
-                group_id=str(virtual_lab.admin_group_id)
+            members = await GroupQueryRepository().a_retrieve_group_users(
+                str(virtual_lab.admin_group_id)
             )
-            admins = [UUID(UserRepresentation(**member).id) for member in members]
+            admins = [UUID(member.id) for member in members]
 
         owner: ShortenedUser | None = None
         if VirtualLabDetailExpand.owner in requested:
@@ -3,6 +3,7 @@ from uuid import UUID
 
 from loguru import logger
 from pydantic import UUID4, EmailStr
+from redis.exceptions import RedisError
 from sqlalchemy.exc import SQLAlchemyError
 from sqlalchemy.ext.asyncio import AsyncSession
 
@@ -10,7 +11,9 @@ from virtual_labs.core.exceptions.api_error import VliError, VliErrorCode
 from virtual_labs.core.exceptions.email_error import EmailError
 from virtual_labs.core.exceptions.generic_exceptions import ForbiddenOperation
 from virtual_labs.domain.invite import InvitePayload
-from virtual_labs.infrastructure.email.invite_email import EmailDetails, send_invite
+from virtual_labs.domain.labs import InvitationResponse
+from virtual_labs.infrastructure.email.invite_email import EmailDetails
+from virtual_labs.infrastructure.email.queue import EmailJob, EmailKind, email_queue
 from virtual_labs.repositories import labs as lab_repo
 from virtual_labs.repositories.invite_repo import (
     InviteMutationRepository,
@@ -26,21 +29,25 @@ async def send_email_to_user_or_rollback(
     lab_name: str,
     lab_id: UUID,
     invite_repo: InviteMutationRepository,
-) -> None:
+    requested_by: UUID,
+) -> UUID:
     try:
-        await send_invite(
-            payload=EmailDetails(
+        return await email_queue.enqueue(
+            EmailJob(
+                kind=EmailKind.INVITE,
                 recipient=email,
-                invite_id=invite_id,
-                lab_id=lab_id,
-                lab_name=lab_name,
-                inviter_name=inviter_name,
-            )
-        )
-    except EmailError as error:
-        logger.error(
-            f"Error when sending email invite to user {email} {error.message} {error.detail}"
+                details=EmailDetails(
+                    recipient=email,
+                    invite_id=invite_id,
+                    lab_id=lab_id,
+                    lab_name=lab_name,
+                    inviter_name=inviter_name,
+                ),
+            ),
+            requested_by=requested_by,
         )
+    except (EmailError, RedisError) as error:
+        logger.error(f"Error when sending email invite to user {email} {error!r}")
         await invite_repo.delete_lab_invite(invite_id=UUID(str(invite_id)))
         raise VliError(
             message=f"There was an error while emailing virtual lab invite to {email}. Please try sending the invite again.",
@@ -54,14 +61,14 @@ async def invite_user_to_lab(
     inviter_id: UUID4,
     invite_details: InvitePayload,
     db: AsyncSession,
-) -> UUID4:
+) -> InvitationResponse:
     user_repo = UserQueryRepository()
     invite_query_repo = InviteQueryRepository(db)
     invite_mutation_repo = InviteMutationRepository(db)
     try:
         lab = await lab_repo.get_undeleted_virtual_lab(db, lab_id)
 
-        inviting_user = user_repo.retrieve_user_from_kc(str(inviter_id))
+        inviting_user = await user_repo.a_retrieve_user_from_kc(str(inviter_id))
         existing_invite = await invite_query_repo.get_lab_invite_by_params(
             lab_id=UUID(str(lab.id)),
             email=invite_details.email,
@@ -89,15 +96,16 @@ async def invite_user_to_lab(
 
             invite_id = existing_invite.id
 
-        await send_email_to_user_or_rollback(
+        email_job_id = await send_email_to_user_or_rollback(
             invite_id=UUID(str(invite_id)),
             inviter_name=f"{inviting_user.firstName} {inviting_user.lastName}",
             email=invite_details.email,
             lab_name=str(lab.name),
             lab_id=UUID(str(lab.id)),
             invite_repo=invite_mutation_repo,
+            requested_by=inviter_id,
         )
-        return invite_id
+        return InvitationResponse(id=invite_id, email_job_id=email_job_id)
     except ForbiddenOperation as e:
         logger.error(
             f"ForbiddenOperation when inviting user {invite_details.email} {e}"
@@ -25,6 +25,7 @@ from virtual_labs.domain.common import (
     PaginationResponse,
 )
 from virtual_labs.domain.labs import VirtualLabDetails, VirtualLabWithInviteDetails
+from virtual_labs.infrastructure.db.loading import LAB_LIST
 from virtual_labs.infrastructure.db.models import VirtualLab, VirtualLabInvite
 from virtual_labs.infrastructure.kc.grant import AuthUserGrants
 from virtual_labs.shared.utils.auth import get_user_email_from_auth
@@ -48,6 +49,7 @@ async def list_pending_virtual_labs_use_case(
         select(VirtualLab, VirtualLabInvite.id.label("invite_id"))
         .join(VirtualLabInvite, VirtualLabInvite.virtual_lab_id == VirtualLab.id)
         .where(conditions)
+        .options(*LAB_LIST)
     )
 
     try:
@@ -38,10 +38,10 @@ from sqlalchemy.sql import ColumnElement
 from virtual_labs.core.exceptions.api_error import VliError, VliErrorCode
 from virtual_labs.core.ordering import order_clauses
 from virtual_labs.domain.common import (
+    CursorPaginationRequest,
     ListResponse,
     OrderBy,
     OrderDirection,
-    PaginationRequest,
     PaginationResponse,
     WorkspaceOrderBy,
 )
@@ -68,7 +68,7 @@ class Scope(StrEnum):
     EXTERNAL = "external"
 
 
-class ListVirtualLabsQuery(PaginationRequest):
+class ListVirtualLabsQuery(CursorPaginationRequest):
     scope: Scope = Scope.ALL
     admin_access_only: bool = False
     order_by: WorkspaceOrderBy = WorkspaceOrderBy.UPDATED_AT
@@ -173,7 +173,7 @@ async def list_virtual_labs_use_case(
     order_by: WorkspaceOrderBy,
     order_direction: OrderDirection,
     query: str | None,
-    pagination: PaginationRequest,
+    pagination: CursorPaginationRequest,
 ) -> ListResponse[VirtualLabDetails]:
     user, _token = auth
 
@@ -193,7 +193,7 @@ async def list_virtual_labs_use_case(
     ordering = _build_order_clauses(order_by, order_direction, user.id)
 
     try:
-        rows, total = await list_vlabs_by_id(
+        page = await list_vlabs_by_id(
             session,
             vlab_ids=candidate_ids,
             query=query,
@@ -209,12 +209,13 @@ async def list_virtual_labs_use_case(
             message="Failed to list virtual labs",
         )
 
-    items = await enrich_many(rows, session)
+    items = await enrich_many(page.items, session)
     return ListResponse[VirtualLabDetails](
         data=items,
         pagination=PaginationResponse(
             page=pagination.page,
             page_size=len(items),
-            total_items=total,
+            total_items=page.total,
+            next_cursor=page.next_cursor,
         ),
     )
@@ -28,9 +28,9 @@ async def remove_user_from_lab(lab_id: UUID4, user_id: UUID4, db: AsyncSession)
         user_repository = UserMutationRepository()
         group_repository = GroupQueryRepository()
 
-        admins = group_repository.retrieve_group_users(str(lab.admin_group_id))
+        admins = await group_repository.a_retrieve_group_users(str(lab.admin_group_id))
 
-        if len(admins) == 1 and is_user_admin_of_lab(user_id, lab):
+        if len(admins) == 1 and await is_user_admin_of_lab(user_id, lab):
             raise VliError(
                 message=f"Last admin of lab {lab_id} cannot be removed",
                 error_code=VliErrorCode.NOT_ALLOWED_OP,
@@ -38,10 +38,10 @@ async def remove_user_from_lab(lab_id: UUID4, user_id: UUID4, db: AsyncSession)
                 details="Lab needs to have at least 1 admin.",
             )
 
-        user_repository.detach_user_from_group(
+        await user_repository.a_detach_user_from_group(
             user_id=user_id, group_id=str(lab.admin_group_id)
         )
-        user_repository.detach_user_from_group(
+        await user_repository.a_detach_user_from_group(
             user_id=user_id, group_id=str(lab.member_group_id)
         )
 
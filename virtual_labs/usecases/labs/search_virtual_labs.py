@@ -17,7 +17,8 @@ async def search_virtual_labs_by_name(
 ) -> SearchLabResponse:
     try:
         user_repo = UserQueryRepository()
-        group_ids = [group.id for group in user_repo.retrieve_user_groups(user_id)]
+        groups = await user_repo.a_retrieve_user_groups(user_id)
+        group_ids = [group.id for group in groups]
 
         matching_labs = [
             VirtualLabDetails.model_validate(lab)
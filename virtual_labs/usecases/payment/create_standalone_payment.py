@@ -229,7 +229,7 @@ async def _validate_lab_admin(
     virtual_lab = await get_virtual_lab_soft(db=session, lab_id=virtual_lab_id)
     if virtual_lab is None:
         raise EntityNotFound("Virtual lab not found")
-    if not UserQueryRepository().is_user_in_group(
+    if not await UserQueryRepository().a_is_user_in_group(
         user_id=user_id, group_id=str(virtual_lab.admin_group_id)
     ):
         raise ForbiddenOperation()
@@ -30,7 +30,7 @@ from virtual_labs.services.attach_user_groups import (
     manage_user_groups,
     send_project_emails,
 )
-from virtual_labs.shared.utils.auth import get_user_metadata
+from virtual_labs.shared.utils.auth import get_user_id_from_auth, get_user_metadata
 
 
 async def attach_users_to_project(
@@ -115,6 +115,7 @@ async def attach_users_to_project(
                 virtual_lab_id=virtual_lab_id,
                 virtual_lab_name=str(virtual_lab.name),
                 inviter_name=inviter_name,
+                requested_by=get_user_id_from_auth(auth),
             )
     except EntityNotFound as ex:
         raise VliError(
@@ -26,17 +26,21 @@ from virtual_labs.domain.project import (
     ProjectCreateOut,
     ProjectCreationBody,
 )
+from virtual_labs.infrastructure.db.loading import LAB_DETAIL
 from virtual_labs.infrastructure.db.models import (
     Project,
     VirtualLab,
 )
 from virtual_labs.infrastructure.kc.config import KeycloakRealm
 from virtual_labs.infrastructure.kc.grant import AuthUserGrants
-from virtual_labs.infrastructure.kc.models import (
-    CreatedGroup,
-    UserRepresentation,
+from virtual_labs.infrastructure.kc.group_cache import (
+    invalidate_group_members,
+    invalidate_membership,
 )
+from virtual_labs.infrastructure.kc.models import CreatedGroup
+from virtual_labs.infrastructure.kc.session_cache import invalidate_user_grants
 from virtual_labs.infrastructure.settings import settings
+from virtual_labs.repositories.group_repo import GroupQueryRepository
 from virtual_labs.shared.group_namespace import make_project_group_name
 from virtual_labs.usecases import accounting as accounting_cases
 
@@ -54,6 +58,7 @@ async def _make_kc_group_compensation(
     async def _undo() -> None:
         try:
             await KeycloakRealm.a_delete_group(group_id=group["id"])
+            await invalidate_group_members(group["id"])
         except Exception as exc:  # noqa: BLE001
             logger.error(f"Failed to delete KC group {group['id']}: {exc}")
 
@@ -84,11 +89,6 @@ def _make_deplete_compensation(
     return _undo
 
 
-async def _retrieve_group_user_ids(group_id: str) -> list[str]:
-    members = await KeycloakRealm.a_get_group_members(group_id=group_id)
-    return [UserRepresentation(**member).id for member in members]
-
-
 async def ensure_unique_name_within_virtual_lab(
     session: AsyncSession,
     *,
@@ -134,10 +134,12 @@ async def ensure_virtual_lab_exists(
     try:
         return (
             await session.scalars(
-                select(VirtualLab).where(
+                select(VirtualLab)
+                .where(
                     VirtualLab.id == virtual_lab_id,
                     VirtualLab.deleted.is_(False),
                 )
+                .options(*LAB_DETAIL)
             )
         ).one()
     except NoResultFound:
@@ -216,7 +218,7 @@ async def ensure_group_creation(
             KeycloakRealm.a_create_group(
                 {"name": member_group_name},
             ),
-            _retrieve_group_user_ids(
+            GroupQueryRepository().a_retrieve_group_user_ids(
                 group_id=vlab_admin_group_id,
             ),
         )
@@ -257,6 +259,16 @@ async def ensure_group_creation(
                 )
             )
         await asyncio.gather(*attach_tasks)
+        await asyncio.gather(
+            invalidate_membership(
+                user_id, admin_group["id"], member_group["id"], vlab_member_group_id
+            ),
+            *(
+                invalidate_user_grants(admin_uid)
+                for admin_uid in vlab_admin_users or []
+                if str(admin_uid) != str(user_id)
+            ),
+        )
         return admin_group, member_group, vlab_admin_users
     # compensation is driven by the enclosing `ledger_container` scope: any
     # undo already pushed onto `comp` is unwound automatically when these
@@ -435,8 +447,7 @@ async def create_new_project_use_case(
 
     vlab_admin_group_id = str(virtual_lab.admin_group_id)
     vlab_member_group_id = str(virtual_lab.member_group_id)
-    # Resolve the course relationship before rollback expires the instance
-    await session.refresh(virtual_lab, ["course"])
+    # Read the course (loaded with the lab) before rollback expires the instance
     is_course_vlab = bool(virtual_lab.course)
 
     # release the read-only transaction held by the pre-checks above before
@@ -23,9 +23,9 @@ from sqlalchemy.ext.asyncio import AsyncSession
 from virtual_labs.core.exceptions.api_error import VliError, VliErrorCode
 from virtual_labs.domain.labs import VirtualLabDetails
 from virtual_labs.domain.project import ProjectDetailExpand, ProjectDetailOut
+from virtual_labs.infrastructure.db.loading import LAB_DETAIL
 from virtual_labs.infrastructure.db.models import Project, VirtualLab
-from virtual_labs.infrastructure.kc.config import KeycloakRealm
-from virtual_labs.infrastructure.kc.models import UserRepresentation
+from virtual_labs.repositories.group_repo import GroupQueryRepository
 
 
 async def get_project_detail_use_case(
@@ -47,6 +47,7 @@ async def get_project_detail_use_case(
                     Project.id == project_id,
                     Project.virtual_lab_id == virtual_lab_id,
                 )
+                .options(*LAB_DETAIL)
             )
         ).one()
     except NoResultFound:
@@ -98,5 +99,4 @@ async def get_project_detail_use_case(
 
 
 async def _retrieve_group_user_ids(group_id: str) -> list[str]:
-    members = await KeycloakRealm.a_get_group_members(group_id=group_id)
-    return [UserRepresentation(**member).id for member in members]
+    return await GroupQueryRepository().a_retrieve_group_user_ids(group_id)
@@ -4,6 +4,7 @@ from uuid import UUID
 from fastapi import Response
 from loguru import logger
 from pydantic import UUID4, EmailStr
+from redis.exceptions import RedisError
 from sqlalchemy.exc import SQLAlchemyError
 from sqlalchemy.ext.asyncio import AsyncSession
 
@@ -13,7 +14,8 @@ from virtual_labs.core.exceptions.generic_exceptions import ForbiddenOperation
 from virtual_labs.core.response.api_response import VliResponse
 from virtual_labs.domain.invite import InvitePayload
 from virtual_labs.domain.labs import InvitationResponse
-from virtual_labs.infrastructure.email.invite_email import EmailDetails, send_invite
+from virtual_labs.infrastructure.email.invite_email import EmailDetails
+from virtual_labs.infrastructure.email.queue import EmailJob, EmailKind, email_queue
 from virtual_labs.repositories.invite_repo import (
     InviteMutationRepository,
     InviteQueryRepository,
@@ -31,23 +33,27 @@ async def send_email_to_user_or_rollback(
     project_name: str,
     project_id: UUID,
     invite_repo: InviteMutationRepository,
-) -> None:
+    requested_by: UUID,
+) -> UUID:
     try:
-        await send_invite(
-            payload=EmailDetails(
+        return await email_queue.enqueue(
+            EmailJob(
+                kind=EmailKind.INVITE,
                 recipient=email,
-                invite_id=invite_id,
-                lab_id=lab_id,
-                lab_name=lab_name,
-                inviter_name=inviter_name,
-                project_name=project_name,
-                project_id=project_id,
-            )
-        )
-    except EmailError as error:
-        logger.error(
-            f"Error when sending email invite to user {email} {error.message} {error.detail}"
+                details=EmailDetails(
+                    recipient=email,
+                    invite_id=invite_id,
+                    lab_id=lab_id,
+                    lab_name=lab_name,
+                    inviter_name=inviter_name,
+                    project_name=project_name,
+                    project_id=project_id,
+                ),
+            ),
+            requested_by=requested_by,
         )
+    except (EmailError, RedisError) as error:
+        logger.error(f"Error when sending email invite to user {email} {error!r}")
         await invite_repo.delete_lab_invite(invite_id=UUID(str(invite_id)))
         raise VliError(
             message=f"There was an error while emailing virtual lab invite to {email}. Please try sending the invite again.",
@@ -73,7 +79,7 @@ async def invite_user_to_project(
             virtual_lab_id=virtual_lab_id, project_id=project_id
         )
 
-        inviting_user = user_repo.retrieve_user_from_kc(str(inviter_id))
+        inviting_user = await user_repo.a_retrieve_user_from_kc(str(inviter_id))
         invite = await invite_query_repo.get_project_invite_by_params(
             project_id=UUID(str(project_id)),
             email=invite_details.email,
@@ -103,7 +109,7 @@ async def invite_user_to_project(
         await session.refresh(project)
         await session.refresh(invite)
 
-        await send_email_to_user_or_rollback(
+        email_job_id = await send_email_to_user_or_rollback(
             invite_id=UUID(str(invite.id)),
             inviter_name=f"{inviting_user.firstName} {inviting_user.lastName}",
             email=invite_details.email,
@@ -112,10 +118,11 @@ async def invite_user_to_project(
             project_id=project_id,
             project_name=project.name,
             invite_repo=invite_mutation_repo,
+            requested_by=inviter_id,
         )
         return VliResponse.new(
             message="Invite sent successfully",
-            data=InvitationResponse(id=invite.id),
+            data=InvitationResponse(id=invite.id, email_job_id=email_job_id),
         )
     except ForbiddenOperation as e:
         logger.error(
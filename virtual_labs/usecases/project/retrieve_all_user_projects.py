@@ -40,14 +40,15 @@ async def retrieve_all_user_projects_use_case(
             pagination=pagination,
         )
 
+        admins_by_group = await gqr.a_retrieve_groups_user_ids(
+            p.admin_group_id for p, _ in results.rows
+        )
         projects = [
             ProjectVlOut.model_validate(
                 {
                     **p.__dict__,
                     "user_count": 0,
-                    "admins": await gqr.a_retrieve_group_user_ids(
-                        group_id=p.admin_group_id
-                    ),
+                    "admins": admins_by_group[p.admin_group_id],
                 }
             )
             for p, _ in results.rows
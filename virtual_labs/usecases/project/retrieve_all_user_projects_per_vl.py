@@ -1,3 +1,4 @@
+import asyncio
 from http import HTTPStatus as status
 from typing import Tuple
 
@@ -42,8 +43,10 @@ async def retrieve_all_user_projects_per_vl_use_case(
         projects = []
         for project, vl in results.rows:
             # Get users from admin and member groups
-            admins = gqr.retrieve_group_users(group_id=str(project.admin_group_id))
-            members = gqr.retrieve_group_users(group_id=str(project.member_group_id))
+            admins, members = await asyncio.gather(
+                gqr.a_retrieve_group_users(group_id=str(project.admin_group_id)),
+                gqr.a_retrieve_group_users(group_id=str(project.member_group_id)),
+            )
 
             # count unique users
             unique_users = uniq_list([u.id for u in admins + members])
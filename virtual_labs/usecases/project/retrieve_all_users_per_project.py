@@ -69,10 +69,13 @@ async def retrieve_all_users_per_project_use_case(
         invites = await invite_repo.get_pending_users_for_project(
             project_id=project_id,
         )
+        invited_users = await user_repo.a_retrieve_users_by_emails(
+            str(invite.user_email) for invite in invites
+        )
         pending_users = [
             UserWithInviteStatus(
                 **get_pending_user(
-                    user=(user_repo.retrieve_user_by_email(str(invite.user_email))),
+                    user=invited_users[str(invite.user_email).lower()],
                     user_email=str(invite.user_email),
                 ).model_dump(),
                 invite_accepted=False,
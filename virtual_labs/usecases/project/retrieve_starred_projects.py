@@ -1,3 +1,4 @@
+import asyncio
 from http import HTTPStatus as status
 from typing import Tuple
 
@@ -28,14 +29,17 @@ async def retrieve_starred_projects_use_case(
             pagination=pagination,
         )
 
+        admins = await asyncio.gather(
+            *(get_one_project_admin(project) for _, project in results.rows)
+        )
         projects = [
             {
                 **Project(**project.__dict__).model_dump(),
                 "starred_at": star_p.created_at,
                 "virtual_lab_id": project.virtual_lab_id,
-                "admin": get_one_project_admin(project),
+                "admin": admin,
             }
-            for star_p, project in results.rows
+            for (star_p, project), admin in zip(results.rows, admins)
         ]
 
     except SQLAlchemyError:
@@ -1,3 +1,4 @@
+import asyncio
 from http import HTTPStatus as status
 from typing import Tuple
 
@@ -25,20 +26,23 @@ async def search_projects_by_name_use_case(
     user_id = get_user_id_from_auth(auth)
 
     try:
-        groups = gqr.retrieve_user_groups(user_id=str(user_id))
+        groups = await gqr.a_retrieve_user_groups(user_id=str(user_id))
         group_ids = [g.id for g in groups]
         projects_vl_tuple = await pr.search(
             query_term=query_term or "",
             groups_ids=group_ids,
         )
 
+        admins = await asyncio.gather(
+            *(get_one_project_admin(p) for p, _ in projects_vl_tuple)
+        )
         projects = [
             {
                 **Project(**p.__dict__).model_dump(),
                 "virtual_lab_id": v.id,
-                "admin": get_one_project_admin(p),
+                "admin": admin,
             }
-            for p, v in projects_vl_tuple
+            for (p, v), admin in zip(projects_vl_tuple, admins)
         ]
 
     except SQLAlchemyError:
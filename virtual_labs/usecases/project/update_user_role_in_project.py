@@ -57,10 +57,10 @@ async def update_user_role_in_project(
                 message="Update project owner role is not allowed",
             )
 
-        if not uqr.is_user_in_group(
+        if not await uqr.a_is_user_in_group(
             user_id=user_id,
             group_id=str(project.admin_group_id),
-        ) and not uqr.is_user_in_group(
+        ) and not await uqr.a_is_user_in_group(
             user_id=user_id,
             group_id=str(project.member_group_id),
         ):
@@ -72,7 +72,7 @@ async def update_user_role_in_project(
             else (project.member_group_id, project.admin_group_id)
         )
 
-        if uqr.is_user_in_group(user_id=user_id, group_id=str(attach_group_id)):
+        if await uqr.a_is_user_in_group(user_id=user_id, group_id=str(attach_group_id)):
             return VliResponse.new(
                 http_status_code=status.OK,
                 message="User already in this group",
@@ -12,7 +12,11 @@ from virtual_labs.domain.promotion import (
     PromotionCodeUsageStats,
     PromotionUsageFilters,
 )
-from virtual_labs.repositories import promotion_repo, promotion_usage_repo
+from virtual_labs.repositories import (
+    promotion_analytics_repo,
+    promotion_repo,
+    promotion_usage_repo,
+)
 
 
 async def get_promotion_usage_statistics(
@@ -40,7 +44,7 @@ async def get_promotion_usage_statistics(
     )
 
     # Get statistics
-    stats = await promotion_usage_repo.get_promotion_usage_stats(
+    stats = await promotion_analytics_repo.get_promotion_usage_stats(
         db=db,
         promotion_code_id=promotion_id,
         filters=filters,
@@ -89,30 +93,5 @@ async def get_system_analytics(db: AsyncSession) -> PromotionAnalytics:
     Returns:
         PromotionAnalytics with system-wide statistics
     """
-    # Get total promotions count
-    from virtual_labs.domain.promotion import PromotionCodeListFilters
-
-    all_filters = PromotionCodeListFilters(limit=1, offset=0)
-    _, total_promotions = await promotion_repo.list_promotions(
-        db=db, filters=all_filters
-    )
-
-    # Get active promotions count
-    active_count = await promotion_repo.get_active_promotions_count(db=db)
-
-    # Get expired promotions count
-    expired_count = await promotion_repo.get_expired_promotions_count(db=db)
-
-    # Get total redemptions
-    total_redemptions = await promotion_usage_repo.get_total_redemptions_count(db=db)
-
-    # Get total credits distributed
-    total_credits = await promotion_usage_repo.get_total_credits_distributed(db=db)
-
-    return PromotionAnalytics(
-        total_promotions=total_promotions,
-        active_promotions=active_count,
-        expired_promotions=expired_count,
-        total_redemptions=total_redemptions,
-        total_credits_distributed=total_credits,
-    )
+    analytics = await promotion_analytics_repo.get_system_analytics(db=db)
+    return PromotionAnalytics(**analytics)
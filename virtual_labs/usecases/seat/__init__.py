@@ -1,8 +1,10 @@
 from virtual_labs.usecases.seat.list_seats import list_seats
 from virtual_labs.usecases.seat.provision_seats import provision_seats
 from virtual_labs.usecases.seat.search_seat_batches import (
+    SeatBatchSearchQuery,
     get_seat_batch_by_id,
     search_seat_batches,
+    search_seat_batches_page,
 )
 from virtual_labs.usecases.seat.transfer_seats import transfer_seats
 
@@ -11,5 +13,7 @@ __all__ = [
     "provision_seats",
     "get_seat_batch_by_id",
     "search_seat_batches",
+    "search_seat_batches_page",
+    "SeatBatchSearchQuery",
     "transfer_seats",
 ]
@@ -10,7 +10,7 @@ import uuid
 from datetime import datetime, timedelta, timezone
 from http import HTTPStatus
 
-from sqlalchemy import select
+from sqlalchemy import Insert, false, func, insert, literal, select
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from virtual_labs.core.exceptions.api_error import VliError, VliErrorCode
@@ -20,6 +20,52 @@ from virtual_labs.infrastructure.db.models import Course, CourseStatus, Seat
 from virtual_labs.infrastructure.settings import settings
 
 
+def _insert_seats(
+    course: Course,
+    *,
+    batch_id: uuid.UUID,
+    expiry_date: datetime,
+    number_of_seats: int,
+) -> Insert:
+    """Insert `number_of_seats` seats of one batch in a single statement.
+
+    The rows are generated server-side with `generate_series`, so the
+    statement and its `RETURNING` rows make one round-trip whatever the
+    batch size. The seat stores the course credit value to block
+    transfers to courses of higher credit value per seat.
+    """
+    rows = select(
+        func.gen_random_uuid(),
+        literal(course.id, Seat.course_id.type),
+        literal(course.institution_id, Seat.institution_id.type),
+        literal(batch_id, Seat.batch_id.type),
+        literal(expiry_date, Seat.expiry_date.type),
+        literal(course.credits_per_seat, Seat.credit_value.type),
+        false(),
+        false(),
+        func.now(),
+    ).select_from(func.generate_series(1, number_of_seats))
+    return (
+        insert(Seat)
+        .from_select(
+            [
+                Seat.id,
+                Seat.course_id,
+                Seat.institution_id,
+                Seat.batch_id,
+                Seat.expiry_date,
+                Seat.credit_value,
+                Seat.is_consumed,
+                Seat.previously_dropped,
+                Seat.created_at,
+            ],
+            rows,
+            include_defaults=False,
+        )
+        .returning(*Seat.__table__.c)
+    )
+
+
 async def provision_seats(
     db: AsyncSession,
     payload: ProvisionSeatsBody,
@@ -46,30 +92,19 @@ async def provision_seats(
         )
 
     # 3. Create seat records
-    batch_id = uuid.uuid4()
     expiry_date = datetime.now(timezone.utc) + timedelta(days=settings.SEAT_EXPIRY_DAYS)
-    credit_value = course.credits_per_seat
-    seats: list[Seat] = []
-    for _ in range(payload.number_of_seats):
-        seat = Seat(
-            course_id=course.id,
-            institution_id=course.institution_id,
-            batch_id=batch_id,
+    inserted = await db.execute(
+        _insert_seats(
+            course,
+            batch_id=uuid.uuid4(),
             expiry_date=expiry_date,
-            credit_value=credit_value,  # Store to block transfers to courses of higher credit value per seat
+            number_of_seats=payload.number_of_seats,
         )
-        db.add(seat)
-        seats.append(seat)
-
-    await db.flush()
+    )
+    seat_outputs = [SeatOut.model_validate(row) for row in inserted.all()]
 
     await db.commit()
 
-    for s in seats:
-        await db.refresh(s)
-
-    seat_outputs = [SeatOut.model_validate(s) for s in seats]
-
     return VliAppResponse(
         message=f"Successfully provisioned {payload.number_of_seats} seats",
         data=ProvisionSeatsResponse(
@@ -1,4 +1,10 @@
-"""Search seat batches with filtering."""
+"""Search seat batches with filtering.
+
+`search_seat_batches_page` pages through batch summaries whose seat
+counts are aggregated in SQL, so a page costs the same whatever the
+number of seats behind it. The seats of a batch are fetched on demand
+with `get_seat_batch_by_id`.
+"""
 
 from __future__ import annotations
 
@@ -9,16 +15,24 @@ from operator import attrgetter
 from typing import Optional
 
 from pydantic import UUID4
-from sqlalchemy import select
+from sqlalchemy import func, select
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import joinedload
 
 from virtual_labs.core.exceptions.api_error import VliError, VliErrorCode
+from virtual_labs.core.keyset import paginate
+from virtual_labs.core.search import name_contains
+from virtual_labs.domain.common import (
+    CursorPaginationRequest,
+    ListResponse,
+    PaginationResponse,
+)
 from virtual_labs.domain.seat import (
     CourseSummary,
     InstitutionSummary,
     SeatBatchOut,
     SeatBatchSearchResponse,
+    SeatBatchSummaryOut,
     SeatOut,
 )
 from virtual_labs.infrastructure.db.models import Course, Institution, Seat, VirtualLab
@@ -160,3 +174,92 @@ async def search_seat_batches(
         course=course_summary,
         batches=batches,
     )
+
+
+class SeatBatchSearchQuery(CursorPaginationRequest):
+    course_id: Optional[UUID4] = None
+    institution_id: Optional[UUID4] = None
+    vlab_name: Optional[str] = None
+    institution_name: Optional[str] = None
+    created_after: Optional[datetime] = None
+    created_before: Optional[datetime] = None
+
+
+async def search_seat_batches_page(
+    db: AsyncSession,
+    params: SeatBatchSearchQuery,
+) -> ListResponse[SeatBatchSummaryOut]:
+    """One page of seat batch summaries, newest batch first.
+
+    Seats are grouped per batch and course in SQL, since a transfer moves
+    part of a batch to another course. The seat filters apply before the
+    grouping, the name filters to the grouped rows.
+    """
+    seats = select(
+        Seat.batch_id,
+        Seat.course_id,
+        Seat.institution_id,
+        func.min(Seat.created_at).label("created_at"),
+        func.min(Seat.expiry_date).label("expiry_date"),
+        func.count().label("number_of_seats"),
+        func.count().filter(Seat.is_consumed.is_(True)).label("consumed_seats"),
+    ).group_by(Seat.batch_id, Seat.course_id, Seat.institution_id)
+
+    if params.course_id is not None:
+        seats = seats.where(Seat.course_id == params.course_id)
+    if params.institution_id is not None:
+        seats = seats.where(Seat.institution_id == params.institution_id)
+    if params.created_after is not None:
+        seats = seats.where(Seat.created_at >= params.created_after)
+    if params.created_before is not None:
+        seats = seats.where(Seat.created_at <= params.created_before)
+
+    batches = seats.subquery("batches")
+    query = (
+        select(
+            batches.c.batch_id,
+            batches.c.course_id,
+            Course.virtual_lab_id,
+            VirtualLab.name.label("virtual_lab_name"),
+            batches.c.institution_id,
+            Institution.name.label("institution_name"),
+            batches.c.created_at,
+            batches.c.expiry_date,
+            batches.c.number_of_seats,
+            batches.c.consumed_seats,
+        )
+        .join(Course, Course.id == batches.c.course_id)
+        .join(VirtualLab, VirtualLab.id == Course.virtual_lab_id)
+        .join(Institution, Institution.id == batches.c.institution_id)
+    )
+    if params.vlab_name is not None:
+        query = query.where(name_contains(VirtualLab.name, params.vlab_name))
+    if params.institution_name is not None:
+        query = query.where(name_contains(Institution.name, params.institution_name))
+
+    page = await paginate(
+        db,
+        query,
+        # a transferred part of a batch shares its created_at and batch_id
+        order_by=(
+            batches.c.created_at.desc(),
+            batches.c.batch_id.desc(),
+            batches.c.course_id.desc(),
+        ),
+        cursor=params.cursor,
+        offset=params.offset,
+        limit=params.page_size,
+        count=params.count,
+    )
+
+    fields = query.selected_columns.keys()
+    items = [SeatBatchSummaryOut(**dict(zip(fields, row))) for row in page.items]
+    return ListResponse[SeatBatchSummaryOut](
+        data=items,
+        pagination=PaginationResponse(
+            page=params.page,
+            page_size=len(items),
+            total_items=page.total,
+            next_cursor=page.next_cursor,
+        ),
+    )
@@ -28,6 +28,9 @@ from virtual_labs.usecases.subscription.list_subscriptions import (
 from virtual_labs.usecases.subscription.list_user_subscriptions_history import (
     list_user_subscriptions_history as list_user_subscriptions_history_usecase,
 )
+from virtual_labs.usecases.subscription.list_user_subscriptions_history import (
+    list_user_subscriptions_history_page as list_user_subscriptions_history_page_usecase,
+)
 
 __all__ = [
     "create_subscription_usecase",
@@ -40,4 +43,5 @@ __all__ = [
     "list_subscriptions_usecase",
     "list_payments_usecase",
     "list_user_subscriptions_history_usecase",
+    "list_user_subscriptions_history_page_usecase",
 ]
@@ -489,9 +489,15 @@ def _queue_post_commit_side_effects(
     PaidSubscription row commits successfully.
     """
     if stripe_status != "active":
-        deferred.add(_wrap_downgrade(subscription_repo, user_id))
+        deferred.add(
+            _wrap_downgrade(subscription_repo, user_id),
+            serial=subscription_repo.db_session,
+        )
     else:
-        deferred.add(_wrap_deactivate_free(subscription_repo, user_id))
+        deferred.add(
+            _wrap_deactivate_free(subscription_repo, user_id),
+            serial=subscription_repo.db_session,
+        )
 
     if payload.sync_billing_address_to_profile:
         deferred.add(_wrap_save_billing_profile(user_id, payload.billing_address))
@@ -1,29 +1,92 @@
 from http import HTTPStatus
-from typing import List, Tuple
+from typing import Dict, List, Tuple
+from uuid import UUID
 
 from fastapi import Response
 from loguru import logger
-from sqlalchemy import select
 from sqlalchemy.exc import SQLAlchemyError
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from virtual_labs.core.exceptions.api_error import VliError, VliErrorCode
 from virtual_labs.core.response.api_response import VliResponse
+from virtual_labs.domain.common import CursorPaginationRequest, PaginatedResponse
 from virtual_labs.domain.subscription import (
     SubscriptionPaymentItem,
     UserSubscriptionAndPaymentsHistory,
     UserSubscriptionsResponse,
 )
 from virtual_labs.infrastructure.db.models import (
+    PaidSubscription,
     SubscriptionPayment,
     SubscriptionStatus,
     SubscriptionType,
 )
 from virtual_labs.infrastructure.kc.models import AuthUser
+from virtual_labs.repositories.payment_repo import PaymentRepository
 from virtual_labs.repositories.subscription_repo import SubscriptionRepository
 from virtual_labs.shared.utils.auth import get_user_id_from_auth
 
 
+def _paid_amount(payment: SubscriptionPayment) -> float:
+    return payment.amount_paid / 100 if payment.status.value == "succeeded" else 0.0
+
+
+def _payment_item(payment: SubscriptionPayment) -> SubscriptionPaymentItem:
+    return SubscriptionPaymentItem(
+        id=payment.id,
+        amount_paid=payment.amount_paid,
+        amount_subtotal=payment.amount_subtotal,
+        amount_tax=payment.amount_tax,
+        amount_total=payment.amount_total,
+        currency=payment.currency,
+        tax_country=payment.tax_country,
+        tax_behavior=payment.tax_behavior,
+        tax_status=payment.tax_status,
+        credits_purchased=payment.credits_purchased,
+        status=payment.status.value,
+        payment_date=payment.payment_date,
+        card_brand=payment.card_brand,
+        card_last4=payment.card_last4,
+        invoice_pdf=payment.invoice_pdf,
+        receipt_url=payment.receipt_url,
+        period_start=payment.period_start,
+        period_end=payment.period_end,
+        is_standalone=payment.standalone,
+    )
+
+
+def _history_item(
+    subscription: PaidSubscription, payments: List[SubscriptionPayment]
+) -> UserSubscriptionAndPaymentsHistory:
+    return UserSubscriptionAndPaymentsHistory(
+        id=subscription.id,
+        type=subscription.type,
+        subscription_type=SubscriptionType(subscription.subscription_type),
+        status=SubscriptionStatus(subscription.status.value),
+        current_period_start=subscription.current_period_start,
+        current_period_end=subscription.current_period_end,
+        created_at=subscription.created_at,
+        cancel_at_period_end=subscription.cancel_at_period_end,
+        total_paid=round(sum(_paid_amount(payment) for payment in payments), 2),
+        payments=[_payment_item(payment) for payment in payments],
+    )
+
+
+async def _payments_by_subscription(
+    session: AsyncSession, subscription_ids: List[UUID]
+) -> Dict[UUID, List[SubscriptionPayment]]:
+    """payments of all the subscriptions in one query, grouped per subscription"""
+    grouped: Dict[UUID, List[SubscriptionPayment]] = {
+        subscription_id: [] for subscription_id in subscription_ids
+    }
+    payments = await PaymentRepository(session).list_by_subscription_ids(
+        subscription_ids
+    )
+    for payment in payments:
+        grouped[payment.subscription_id].append(payment)
+    return grouped
+
+
 async def list_user_subscriptions_history(
     session: AsyncSession,
     auth: Tuple[AuthUser, str],
@@ -60,69 +123,18 @@ async def list_user_subscriptions_history(
                 },
             )
 
-        subscription_list: List[UserSubscriptionAndPaymentsHistory] = []
-        total_paid_all_subscriptions = 0.0
-
-        for subscription in subscriptions:
-            subscription_type_value = SubscriptionType(subscription.subscription_type)
-            status_value = SubscriptionStatus(subscription.status.value)
-
-            # Create payment details for this subscription
-            payment_stmt = (
-                select(SubscriptionPayment)
-                .where(SubscriptionPayment.subscription_id == subscription.id)
-                .order_by(SubscriptionPayment.payment_date.desc())
-            )
-
-            payment_result = await session.execute(payment_stmt)
-            payments = payment_result.scalars().all()
-
-            payment_details: List[SubscriptionPaymentItem] = []
-            subscription_total_paid = 0.0
-
-            for payment in payments:
-                payment_detail = SubscriptionPaymentItem(
-                    id=payment.id,
-                    amount_paid=payment.amount_paid,
-                    amount_subtotal=payment.amount_subtotal,
-                    amount_tax=payment.amount_tax,
-                    amount_total=payment.amount_total,
-                    currency=payment.currency,
-                    tax_country=payment.tax_country,
-                    tax_behavior=payment.tax_behavior,
-                    tax_status=payment.tax_status,
-                    credits_purchased=payment.credits_purchased,
-                    status=payment.status.value,
-                    payment_date=payment.payment_date,
-                    card_brand=payment.card_brand,
-                    card_last4=payment.card_last4,
-                    invoice_pdf=payment.invoice_pdf,
-                    receipt_url=payment.receipt_url,
-                    period_start=payment.period_start,
-                    period_end=payment.period_end,
-                    is_standalone=payment.standalone,
-                )
-                payment_details.append(payment_detail)
-
-                if payment.status.value == "succeeded":
-                    payment_amount = payment.amount_paid / 100
-                    subscription_total_paid += payment_amount
-                    total_paid_all_subscriptions += payment_amount
-
-            # Create subscription with payments
-            subscription_with_payments = UserSubscriptionAndPaymentsHistory(
-                id=subscription.id,
-                type=subscription.type,
-                subscription_type=subscription_type_value,
-                status=status_value,
-                current_period_start=subscription.current_period_start,
-                current_period_end=subscription.current_period_end,
-                created_at=subscription.created_at,
-                cancel_at_period_end=subscription.cancel_at_period_end,
-                total_paid=round(subscription_total_paid, 2),
-                payments=payment_details,
-            )
-            subscription_list.append(subscription_with_payments)
+        payments_by_subscription = await _payments_by_subscription(
+            session, [subscription.id for subscription in subscriptions]
+        )
+        subscription_list = [
+            _history_item(subscription, payments_by_subscription[subscription.id])
+            for subscription in subscriptions
+        ]
+        total_paid_all_subscriptions = sum(
+            _paid_amount(payment)
+            for payments in payments_by_subscription.values()
+            for payment in payments
+        )
 
         response_data = UserSubscriptionsResponse(
             subscriptions=subscription_list,
@@ -148,3 +160,65 @@ async def list_user_subscriptions_history(
             http_status_code=HTTPStatus.INTERNAL_SERVER_ERROR,
             message="An unexpected error occurred while listing user subscriptions",
         )
+
+
+async def list_user_subscriptions_history_page(
+    session: AsyncSession,
+    auth: Tuple[AuthUser, str],
+    pagination: CursorPaginationRequest,
+) -> Response:
+    """
+    one page of the authenticated user's subscriptions with their payments.
+
+    paged variant of `list_user_subscriptions_history` for users with long
+    histories: subscriptions newest first, by `page` or by the `next_cursor`
+    of the previous page, with the payments of the whole page loaded in one
+    query.
+
+    Args:
+        session: database session
+        auth: Auth header
+        pagination: page, page size, cursor and count mode
+
+    Returns:
+        Response: paginated list of subscriptions with payments
+    """
+    try:
+        user_id = get_user_id_from_auth(auth)
+        page = await SubscriptionRepository(
+            db_session=session
+        ).list_user_paid_subscriptions_page(user_id=user_id, pagination=pagination)
+
+        payments_by_subscription = await _payments_by_subscription(
+            session, [subscription.id for subscription in page.items]
+        )
+        response = PaginatedResponse.build_keyset(
+            items=[
+                _history_item(subscription, payments_by_subscription[subscription.id])
+                for subscription in page.items
+            ],
+            total=page.total,
+            next_cursor=page.next_cursor,
+            request=pagination,
+        )
+
+        return VliResponse.new(
+            message="User subscriptions retrieved successfully",
+            data=response.model_dump(),
+        )
+    except VliError:
+        raise
+    except SQLAlchemyError as e:
+        logger.exception(f"Database error while listing user subscriptions: {str(e)}")
+        raise VliError(
+            error_code=VliErrorCode.DATABASE_ERROR,
+            http_status_code=HTTPStatus.INTERNAL_SERVER_ERROR,
+            message="Failed to list user subscriptions due to database error",
+        )
+    except Exception as e:
+        logger.exception(f"Unexpected error while listing user subscriptions: {str(e)}")
+        raise VliError(
+            error_code=VliErrorCode.INTERNAL_SERVER_ERROR,
+            http_status_code=HTTPStatus.INTERNAL_SERVER_ERROR,
+            message="An unexpected error occurred while listing user subscriptions",
+        )
@@ -11,9 +11,10 @@ from virtual_labs.repositories.user_repo import UserQueryRepository
 async def get_count_of_all_users() -> LabResponse[AllUsersCount]:
     try:
         user_repo = UserQueryRepository()
+        total = await user_repo.a_get_all_users_count()
         return LabResponse(
             message="Total users in BBP",
-            data=AllUsersCount(total=user_repo.get_all_users_count()),
+            data=AllUsersCount(total=total),
         )
     except Exception as error:
         logger.warning(f"Error when retrieving total users {error}")
@@ -17,6 +17,7 @@ from virtual_labs.domain.workspace import (
     RecentWorkspaceOutWithDetails,
     RecentWorkspaceResponseWithDetails,
 )
+from virtual_labs.infrastructure.db.loading import LAB_DETAIL
 from virtual_labs.infrastructure.db.models import Project, VirtualLab
 from virtual_labs.infrastructure.kc.models import AuthUser
 from virtual_labs.repositories.group_repo import GroupQueryRepository
@@ -61,7 +62,9 @@ async def set_recent_workspace(
         project = None
 
         vl_result = await session.execute(
-            select(VirtualLab).where(VirtualLab.id == request.workspace.virtual_lab_id)
+            select(VirtualLab)
+            .where(VirtualLab.id == request.workspace.virtual_lab_id)
+            .options(*LAB_DETAIL)
         )
         vl_obj = vl_result.scalar_one_or_none()
         if vl_obj: